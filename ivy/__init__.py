@@ -7,6 +7,7 @@ import numpy as np
 import sys
 import inspect
 import os
+import importlib
 
 
 import ivy.utils.backend.handler
@@ -608,11 +609,13 @@ locks = {"backend_setter": threading.Lock()}
 from .func_wrapper import *
 from .data_classes.array import Array, add_ivy_array_instance_methods
 from .data_classes.array.conversions import *
+from .data_classes.array.meta import MetaArray
 from .data_classes.array import conversions as arr_conversions
 from .data_classes.container import conversions as cont_conversions
 from .data_classes.container import (
     ContainerBase,
     Container,
+    PackedContainer,
     add_ivy_container_instance_methods,
 )
 from .data_classes.nested_array import NestedArray
@@ -637,11 +640,55 @@ from .utils import assertions, exceptions, verbosity
 from .utils.backend import handler
 from . import functional
 from .functional import *
-from . import stateful
-from .stateful import *
 from ivy.utils.inspection import fn_array_spec, add_array_specs
 
-add_array_specs()
+
+# Lazy Import #
+# ----------- #
+
+# when IVY_LAZY_IMPORT is set, the stateful API and the array specs of the functional
+# API are only loaded on first use, which cuts the startup time of `import ivy` for
+# short-lived processes. Packages loaded locally through `ivy.with_backend` are always
+# initialised eagerly, as their imports can't be resolved outside of the local importer
+lazy_import = os.environ.get("IVY_LAZY_IMPORT", "false").lower() in ("1", "true")
+lazy_import &= getattr(sys.modules.get(__name__), "__dict__", None) is globals()
+_deferred_modules_loaded = not lazy_import
+
+
+def _load_deferred_modules():
+    """Load the modules whose import was deferred by the lazy import mode."""
+    global _deferred_modules_loaded
+    if _deferred_modules_loaded:
+        return
+    _deferred_modules_loaded = True
+    stateful = importlib.import_module("ivy.stateful")
+    ivy_dict = globals()
+    # mirrors `from .stateful import *`, without shadowing the functional
+    # submodules (activations, layers, norms) which are re-bound below in eager mode
+    for k, v in stateful.__dict__.items():
+        if not k.startswith("_") and k not in ivy_dict:
+            ivy_dict[k] = v
+    ivy_dict["stateful"] = stateful
+    add_array_specs()
+
+
+def __getattr__(name):
+    if not _deferred_modules_loaded:
+        _load_deferred_modules()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if not lazy_import:
+    from . import stateful
+    from .stateful import *
+
+    add_array_specs()
+else:
+    # `from .functional import *` binds `ivy` to the `ivy.functional.ivy` subpackage,
+    # which is otherwise re-bound to this module by `from .stateful import *`
+    ivy = sys.modules[__name__]
 
 _imported_frameworks_before_compiler = list(sys.modules.keys())
 try:
@@ -655,6 +702,8 @@ finally:
             if backend_framework not in _imported_frameworks_before_compiler:
                 _not_imported_backends.remove(backend_framework)
 
+from .compiler.replay import ReplayGraph, trace_graph
+
 
 # add instance methods to Ivy Array and Container
 from ivy.functional.ivy import (
@@ -703,32 +752,6 @@ add_ivy_array_instance_methods(
     ],
 )
 
-add_ivy_container_instance_methods(
-    Container,
-    [
-        activations,
-        cont_conversions,
-        creation,
-        data_type,
-        device,
-        elementwise,
-        general,
-        gradients,
-        layers,
-        linear_algebra,
-        losses,
-        manipulation,
-        norms,
-        random,
-        searching,
-        set,
-        sorting,
-        statistical,
-        utility,
-    ],
-)
-
-
 add_ivy_container_instance_methods(
     Container,
     [
@@ -792,6 +815,8 @@ globals_vars = GlobalsDict(
         "warning_level_stack": warning_level_stack,
         "queue_timeout_stack": general.queue_timeout_stack,
         "array_mode_stack": general.array_mode_stack,
+        "deferred_elementwise_mode_stack": general.deferred_elementwise_mode_stack,
+        "deferred_init_mode_stack": general.deferred_init_mode_stack,
         "shape_array_mode_stack": general.shape_array_mode_stack,
         "show_func_wrapper_trace_mode_stack": (
             general.show_func_wrapper_trace_mode_stack
@@ -832,6 +857,8 @@ backend_version = "none"
 
 native_inplace_support = None
 
+native_weak_scalars = None
+
 supports_gradients = None
 
 
@@ -1266,6 +1293,8 @@ GLOBAL_PROPS = [
     "warning_level",
     "nan_policy",
     "array_mode",
+    "deferred_elementwise_mode",
+    "deferred_init_mode",
     "nestable_mode",
     "exception_trace_mode",
     "show_func_wrapper_trace_mode",
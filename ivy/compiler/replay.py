@@ -0,0 +1,512 @@
+"""
+A pure-Python graph executor, recording the backend functions called by one run of
+a function and replaying them directly on the later calls with the same inputs.
+"""
+
+# global
+import functools
+import inspect
+from collections import OrderedDict
+
+# local
+import ivy
+from ivy.func_wrapper import FN_DECORATORS, _wrap_function
+from ivy.functional.ivy import random as _random
+from ivy.functional.ivy.experimental import random as _experimental_random
+from ivy.utils.backend import handler
+
+# functions whose outputs differ from one call to the next, which are never folded
+# into constants nor pruned from the graph
+_RANDOM_FUNCTIONS = frozenset(
+    [
+        name
+        for module in (_random, _experimental_random)
+        for name, fn in vars(module).items()
+        if inspect.isfunction(fn) and fn.__module__ == module.__name__
+    ]
+    + ["dropout", "dropout1d", "dropout2d", "dropout3d"]
+)
+
+# functions reading the values of arrays into python objects, whose uses can't be
+# replayed
+_VALUE_FUNCTIONS = frozenset(["to_list", "to_numpy", "to_scalar"])
+
+# methods of ivy.Array reading its values, without going through the ivy functions
+_VALUE_METHODS = ("__array__", "__bool__", "__float__", "__int__", "__iter__")
+
+
+class _State:
+    """The instrumented ivy functions and the recorder of the trace in progress."""
+
+    def __init__(self):
+        self.key = None
+        self.originals = None
+        self.instrumented = None
+        self.recorder = None
+
+
+_state = _State()
+
+
+# Recording #
+# --------- #
+
+
+class _Node:
+    __slots__ = ("name", "kernel", "args", "kwargs", "ret", "keep")
+
+    def __init__(self, name, kernel, args, kwargs, ret, keep):
+        self.name = name
+        self.kernel = kernel
+        self.args = args
+        self.kwargs = kwargs
+        self.ret = ret
+        self.keep = keep
+
+
+class _Recorder:
+    """
+    Recorder of the backend functions called with arrays depending on the inputs.
+
+    The native arrays are identified by their id, which is unique while the trace is
+    in progress as every array seen is kept alive until then.
+    """
+
+    def __init__(self, inputs):
+        self.depth = 0
+        self.failure = None
+        self.nodes = []
+        self.seen = list(inputs)
+        self.num_inputs = len(inputs)
+        # the expression computing each native array depending on the inputs
+        self.exprs = {id(x): "x{}".format(i) for i, x in enumerate(inputs)}
+        self.producers = {}
+
+    def fail(self, reason):
+        if self.failure is None:
+            self.failure = reason
+
+    def is_dynamic(self, x):
+        if isinstance(x, (list, tuple)):
+            return any(self.is_dynamic(v) for v in x)
+        if isinstance(x, dict):
+            return any(self.is_dynamic(v) for v in x.values())
+        return id(x) in self.exprs
+
+    def record(self, name, kernel, args, kwargs, ret):
+        if name.startswith("inplace_") or kwargs.get("out") is not None:
+            self.fail("{} updates an array inplace".format(name))
+        if any(_contains(x, ivy.Array) for x in (*args, *kwargs.values())):
+            self.fail("the backend implementation of {} takes ivy arrays".format(name))
+        dynamic = self.is_dynamic(args) or self.is_dynamic(kwargs)
+        if not (dynamic or name in _RANDOM_FUNCTIONS):
+            # only depends on constants, so the output is a constant itself
+            return
+        if name in _VALUE_FUNCTIONS:
+            self.fail("{} reads the values of an array".format(name))
+        node = _Node(name, kernel, args, kwargs, ret, name in _RANDOM_FUNCTIONS)
+        self.seen.append((args, kwargs, ret))
+        self.nodes.append(node)
+        expr = "t{}".format(len(self.nodes) - 1)
+        self._add_outputs(ret, expr, node)
+
+    def _add_outputs(self, ret, expr, node):
+        if isinstance(ret, ivy.Array):
+            # some backend implementations are written with ivy functions
+            ret, expr = ret._data, expr + "._data"
+        if _is_array_like(ret):
+            # including the scalars returned by some backends, such as numpy
+            self.exprs[id(ret)] = expr
+            self.producers[id(ret)] = node
+        elif isinstance(ret, (list, tuple)):
+            for i, x in enumerate(ret):
+                self._add_outputs(x, "{}[{}]".format(expr, i), node)
+        elif not _is_metadata(ret, node.name):
+            # a value computed from the arrays, which would be folded into a constant
+            self.fail("the output of {} can't be traced".format(node.name))
+
+
+def _is_array_like(x):
+    return isinstance(x, ivy.NativeArray) or (
+        hasattr(x, "shape") and hasattr(x, "dtype") and not isinstance(x, type)
+    )
+
+
+def _is_metadata(x, name):
+    """
+    Whether x only depends on the types, shapes, dtypes and devices of the arrays,
+    which are guarded, rather than on their values.
+    """
+    if isinstance(x, bool):
+        # the predicates such as ivy.is_native_array, as opposed to ivy.all_equal
+        return name.startswith("is_")
+    return x is None or isinstance(
+        x,
+        (
+            int,
+            str,
+            type,
+            ivy.Shape,
+            ivy.Dtype,
+            ivy.Device,
+            ivy.NativeDtype,
+            ivy.NativeDevice,
+        ),
+    )
+
+
+def _contains(x, types):
+    if isinstance(x, types):
+        return True
+    if isinstance(x, (list, tuple)):
+        return any(_contains(v, types) for v in x)
+    if isinstance(x, dict):
+        return any(_contains(v, types) for v in x.values())
+    return False
+
+
+def _recording(name, kernel):
+    @functools.wraps(kernel)
+    def _recorded_kernel(*args, **kwargs):
+        recorder = _state.recorder
+        if recorder is None or recorder.depth:
+            return kernel(*args, **kwargs)
+        # the ivy functions called by the backend implementation are part of it
+        recorder.depth += 1
+        try:
+            ret = kernel(*args, **kwargs)
+        finally:
+            recorder.depth -= 1
+        recorder.record(name, kernel, args, kwargs, ret)
+        return ret
+
+    return _recorded_kernel
+
+
+def _reading(name, method):
+    @functools.wraps(method)
+    def _read_method(self, *args, **kwargs):
+        recorder = _state.recorder
+        if recorder is not None and not recorder.depth:
+            if recorder.is_dynamic(ivy.Array.__dict__["_data"].__get__(self)):
+                recorder.fail("ivy.Array.{} reads the values of an array".format(name))
+        return method(self, *args, **kwargs)
+
+    return _read_method
+
+
+def _instrumented():
+    """
+    Return the ivy functions of the current backend, wrapped around backend
+    implementations recording their calls.
+    """
+    key = ivy.__dict__.get("add")
+    if _state.key is not key:
+        backend = ivy.current_backend()
+        _state.originals = {}
+        _state.instrumented = {}
+        for name, original in handler.ivy_original_dict.items():
+            kernel = backend.__dict__.get(name)
+            if (
+                not inspect.isfunction(original)
+                or not any(hasattr(original, attr) for attr in FN_DECORATORS)
+                or kernel is None
+                or kernel is original
+                or name not in ivy.__dict__
+            ):
+                # compositional functions call other ivy functions, which are recorded
+                continue
+            _state.originals[name] = ivy.__dict__[name]
+            _state.instrumented[name] = _wrap_function(
+                name, _recording(name, kernel), original
+            )
+        _state.key = key
+    return _state.instrumented
+
+
+def _record(fn, args, kwargs, inputs):
+    recorder = _Recorder(inputs)
+    methods = {
+        name: ivy.Array.__dict__[name]
+        for name in _VALUE_METHODS
+        if name in ivy.Array.__dict__
+    }
+    ivy.__dict__.update(_instrumented())
+    for name, method in methods.items():
+        setattr(ivy.Array, name, _reading(name, method))
+    _state.recorder = recorder
+    try:
+        ret = fn(*args, **kwargs)
+    finally:
+        _state.recorder = None
+        for name, method in methods.items():
+            setattr(ivy.Array, name, method)
+        ivy.__dict__.update(_state.originals)
+    return recorder, ret
+
+
+# Compilation #
+# ----------- #
+
+_ARRAY = object()
+_NATIVE = object()
+_CONSTANT = object()
+
+
+def _flatten(x, arrays):
+    """Append the native arrays in x to arrays, and return the key guarding x."""
+    if isinstance(x, ivy.Array):
+        x = x._data
+        arrays.append(x)
+        return _ARRAY, type(x), x.shape, x.dtype, getattr(x, "device", None)
+    if isinstance(x, ivy.NativeArray):
+        arrays.append(x)
+        return _NATIVE, type(x), x.shape, x.dtype, getattr(x, "device", None)
+    if isinstance(x, (list, tuple)):
+        return type(x), tuple([_flatten(v, arrays) for v in x])
+    if isinstance(x, dict):
+        return type(x), tuple([(k, _flatten(v, arrays)) for k, v in x.items()])
+    return _CONSTANT, type(x), x
+
+
+class _Program:
+    """The backend functions replaying one trace, and the structure of its outputs."""
+
+    __slots__ = ("replay", "outputs", "source", "num_nodes", "num_recorded")
+
+    def __init__(self, recorder, ret):
+        constants = {}
+        names = {}
+
+        def _constant(x):
+            # constants are referred to by name, whatever their value
+            key = id(x)
+            if key not in names:
+                names[key] = "c{}".format(len(names))
+                constants[names[key]] = x
+            return names[key]
+
+        def _render(x):
+            if id(x) in recorder.exprs:
+                return recorder.exprs[id(x)]
+            if isinstance(x, (list, tuple)) and recorder.is_dynamic(x):
+                items = ", ".join(_render(v) for v in x)
+                if isinstance(x, list):
+                    return "[{}]".format(items)
+                if type(x) is tuple:
+                    return "({},)".format(items)
+                return "{}({})".format(_constant(type(x)), items)
+            if isinstance(x, dict) and recorder.is_dynamic(x):
+                items = ", ".join(
+                    "{}: {}".format(_constant(k), _render(v)) for k, v in x.items()
+                )
+                return "{}({{{}}})".format(_constant(type(x)), items)
+            return _constant(x)
+
+        output_exprs = []
+        self.outputs = self._template(ret, recorder, output_exprs)
+        # prune the functions whose outputs aren't used, such as the ones called by
+        # the ivy wrappers, going backwards from the outputs
+        used = set()
+        for expr, _ in output_exprs:
+            if expr is not None:
+                used.add(_node_name(expr))
+        nodes = recorder.nodes
+        for i in reversed(range(len(nodes))):
+            node = nodes[i]
+            if not (node.keep or "t{}".format(i) in used):
+                continue
+            node.keep = True
+            for x in _leaves((node.args, node.kwargs)):
+                expr = recorder.exprs.get(id(x))
+                if expr is not None:
+                    used.add(_node_name(expr))
+
+        inputs = ", ".join("x{}".format(i) for i in range(recorder.num_inputs))
+        lines = ["def _replay({}):".format(inputs)]
+        self.num_nodes = 0
+        for i, node in enumerate(nodes):
+            if not node.keep:
+                continue
+            args = [_render(x) for x in node.args]
+            args += [
+                "{}={}".format(k, _render(x))
+                for k, x in node.kwargs.items()
+                if k != "out"
+            ]
+            lines.append(
+                "    t{} = {}({})".format(i, _constant(node.kernel), ", ".join(args))
+            )
+            self.num_nodes += 1
+        outs = [_render_output(expr, _constant) for expr in output_exprs]
+        lines.append("    return ({})".format("".join(x + ", " for x in outs)))
+        self.source = "\n".join(lines)
+        self.num_recorded = len(nodes)
+        namespace = dict(constants)
+        exec(compile(self.source, "<ivy.trace_graph>", "exec"), namespace)
+        self.replay = namespace["_replay"]
+
+    @staticmethod
+    def _template(x, recorder, exprs):
+        if isinstance(x, ivy.Array):
+            exprs.append((recorder.exprs.get(id(x._data)), x._data))
+            return _ARRAY
+        if isinstance(x, ivy.NativeArray):
+            exprs.append((recorder.exprs.get(id(x)), x))
+            return _NATIVE
+        if isinstance(x, (list, tuple)):
+            return type(x), [_Program._template(v, recorder, exprs) for v in x]
+        if isinstance(x, dict):
+            return type(x), [
+                (k, _Program._template(v, recorder, exprs)) for k, v in x.items()
+            ]
+        return _CONSTANT, x
+
+    def rebuild(self, outputs):
+        return _rebuild(self.outputs, iter(outputs))
+
+
+def _node_name(expr):
+    return expr.split("[")[0].split(".")[0]
+
+
+def _render_output(expr, constant):
+    expr, x = expr
+    return constant(x) if expr is None else expr
+
+
+def _leaves(x):
+    if isinstance(x, (list, tuple)):
+        for v in x:
+            yield from _leaves(v)
+    elif isinstance(x, dict):
+        for v in x.values():
+            yield from _leaves(v)
+    else:
+        yield x
+
+
+def _rebuild(template, outputs):
+    if template is _ARRAY:
+        return ivy.Array._from_native(next(outputs))
+    if template is _NATIVE:
+        return next(outputs)
+    kind, items = template
+    if kind is _CONSTANT:
+        return items
+    if issubclass(kind, dict):
+        return kind({k: _rebuild(v, outputs) for k, v in items})
+    if kind is list or kind is tuple:
+        return kind([_rebuild(v, outputs) for v in items])
+    return kind(*[_rebuild(v, outputs) for v in items])
+
+
+# Graph #
+# ----- #
+
+
+class ReplayGraph:
+    """
+    A function recorded as the backend functions it calls, which are replayed
+    directly on later calls.
+
+    The first call with each input signature, made of the types, shapes, dtypes and
+    devices of the input arrays and of the values of every other input, runs the
+    function and records the backend implementations of the ivy functions which it
+    calls with arrays depending on the inputs. These are compiled into a single
+    python function calling the backend implementations, skipping the ivy wrappers,
+    with the arrays computed from constants alone folded into constants, and the
+    functions whose outputs aren't used pruned. Later calls with the same signature
+    only run this function.
+
+    Like any tracing executor, the python control flow of the function is frozen
+    for each signature. Traces reading the values of arrays depending on the inputs,
+    such as ``bool(x)`` or ivy.to_scalar, or updating arrays inplace, can't be
+    replayed, so the calls with their signatures keep running the function.
+
+    Parameters
+    ----------
+    fn
+        the function to trace.
+    max_cache_size
+        the number of traces kept, the least recently used trace being discarded
+        when tracing a new signature beyond it.
+    """
+
+    def __init__(self, fn, /, *, max_cache_size=16):
+        self._fn = fn
+        self.max_cache_size = max_cache_size
+        self._cache = OrderedDict()
+        self.num_traces = 0
+        functools.update_wrapper(self, fn)
+
+    def __call__(self, *args, **kwargs):
+        if _state.recorder is not None:
+            # traced as part of an enclosing trace
+            return self._fn(*args, **kwargs)
+        arrays = []
+        try:
+            key = _flatten((args, kwargs), arrays)
+            program = self._cache.get(key, _CONSTANT)
+        except TypeError:
+            # unhashable inputs, which can't be guarded
+            return self._fn(*args, **kwargs)
+        if program is _CONSTANT:
+            return self._trace(key, args, kwargs, arrays)
+        self._cache.move_to_end(key)
+        if program is None:
+            return self._fn(*args, **kwargs)
+        return program.rebuild(program.replay(*arrays))
+
+    def _trace(self, key, args, kwargs, arrays):
+        recorder, ret = _record(self._fn, args, kwargs, arrays)
+        self.num_traces += 1
+        program = None
+        if recorder.failure is None:
+            program = _Program(recorder, ret)
+        self._cache[key] = program
+        if len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+        return ret
+
+    @property
+    def traces(self):
+        """
+        The source of the function replaying each trace, or None for the traces which
+        can't be replayed.
+        """
+        return [None if p is None else p.source for p in self._cache.values()]
+
+    def clear_cache(self):
+        """Discard the traces, so that the next calls trace the function again."""
+        self._cache.clear()
+
+
+def trace_graph(fn, /, *, max_cache_size=16):
+    """
+    Trace a function into an ivy.ReplayGraph, replaying the backend functions
+    called by the function on later calls with the same input signature.
+
+    Parameters
+    ----------
+    fn
+        the function to trace, calling ivy functions.
+    max_cache_size
+        the number of input signatures whose traces are kept.
+
+    Returns
+    -------
+    ret
+        the ivy.ReplayGraph of the function.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> graph = ivy.trace_graph(lambda x: ivy.tanh(x * 2 + 1).sum(axis=-1))
+    >>> x = ivy.ones((2, 3))
+    >>> y = graph(x)  # traced
+    >>> y = graph(x + 1)  # replayed
+    >>> print(graph.num_traces, y)
+    1 ivy.array([2.9997277, 2.9997277])
+    """
+    return ReplayGraph(fn, max_cache_size=max_cache_size)
@@ -29,6 +29,7 @@ from .sorting import _ArrayWithSorting
 from .statistical import _ArrayWithStatistical
 from .utility import _ArrayWithUtility
 from ivy.func_wrapper import handle_view_indexing
+from ivy.utils.memory import register as register_array
 from .experimental import (
     _ArrayWithSearchingExperimental,
     _ArrayWithActivationsExperimental,
@@ -53,6 +54,24 @@ from .experimental import (
 )
 
 
+def _handle_deferred_elementwise(op, reflected=False):
+    """Defer the elementwise operator when ivy.deferred_elementwise_mode is set."""
+
+    def _decorator(fn):
+        @functools.wraps(fn)
+        def _deferred_fn(self, *args):
+            if ivy.deferred_elementwise_mode:
+                operands = (*args, self) if reflected else (self, *args)
+                ret = _deferred.defer(op, *operands)
+                if ret is not NotImplemented:
+                    return ret
+            return fn(self, *args)
+
+        return _deferred_fn
+
+    return _decorator
+
+
 class Array(
     _ArrayWithActivations,
     _ArrayWithCreation,
@@ -94,60 +113,56 @@ class Array(
     _ArrayWithStatisticalExperimental,
     _ArrayWithUtilityExperimental,
 ):
+    # the attributes set on every array are stored in slots, everything else (such
+    # as the view bookkeeping below) only goes in the instance dict when it's set
+    __slots__ = (
+        "_data",
+        "_size",
+        "_strides",
+        "_itemsize",
+        "_dtype",
+        "_device",
+        "_dev_str",
+        "_pre_repr",
+        "_post_repr",
+        "backend",
+        "_dynamic_backend",
+        "weak_type",
+    )
+
+    # view bookkeeping, only set on the instance once it's part of a view
+    _base = None
+    _view_refs = ()
+    _manipulation_stack = ()
+    _torch_base = None
+    _torch_view_refs = ()
+    _torch_manipulation = None
+
     def __init__(self, data, dynamic_backend=None):
-        _ArrayWithActivations.__init__(self)
-        _ArrayWithCreation.__init__(self)
-        _ArrayWithDataTypes.__init__(self)
-        _ArrayWithDevice.__init__(self)
-        _ArrayWithElementwise.__init__(self)
-        _ArrayWithGeneral.__init__(self)
-        _ArrayWithGradients.__init__(self)
-        _ArrayWithImage.__init__(self)
-        _ArrayWithLayers.__init__(self)
-        _ArrayWithLinearAlgebra.__init__(self)
-        _ArrayWithLosses.__init__(self)
-        _ArrayWithManipulation.__init__(self)
-        _ArrayWithNorms.__init__(self)
-        _ArrayWithRandom.__init__(self)
-        _ArrayWithSearching.__init__(self)
-        _ArrayWithSet.__init__(self)
-        _ArrayWithSorting.__init__(self)
-        _ArrayWithStatistical.__init__(self)
-        _ArrayWithUtility.__init__(self)
-        _ArrayWithActivationsExperimental.__init__(self),
-        _ArrayWithConversionsExperimental.__init__(self),
-        _ArrayWithCreationExperimental.__init__(self),
-        _ArrayWithData_typeExperimental.__init__(self),
-        _ArrayWithDeviceExperimental.__init__(self),
-        _ArrayWithElementWiseExperimental.__init__(self),
-        _ArrayWithGeneralExperimental.__init__(self),
-        _ArrayWithGradientsExperimental.__init__(self),
-        _ArrayWithImageExperimental.__init__(self),
-        _ArrayWithLayersExperimental.__init__(self),
-        _ArrayWithLinearAlgebraExperimental.__init__(self),
-        _ArrayWithLossesExperimental.__init__(self),
-        _ArrayWithManipulationExperimental.__init__(self),
-        _ArrayWithNormsExperimental.__init__(self),
-        _ArrayWithRandomExperimental.__init__(self),
-        _ArrayWithSearchingExperimental.__init__(self),
-        _ArrayWithSetExperimental.__init__(self),
-        _ArrayWithSortingExperimental.__init__(self),
-        _ArrayWithStatisticalExperimental.__init__(self),
-        _ArrayWithUtilityExperimental.__init__(self),
         self._init(data, dynamic_backend)
-        self._view_attributes(data)
+
+    @classmethod
+    def _from_native(cls, data, dynamic_backend=None):
+        """Construct an array from `data`, which must already be a native array."""
+        ret = cls.__new__(cls)
+        ret._init_from_native(data, dynamic_backend)
+        return ret
 
     def _init(self, data, dynamic_backend=None):
         if ivy.is_ivy_array(data):
-            self._data = data.data
+            data = data.data
         elif ivy.is_native_array(data):
-            self._data = data
+            pass
         elif isinstance(data, np.ndarray):
-            self._data = ivy.asarray(data)._data
+            data = ivy.asarray(data)._data
         else:
             raise ivy.utils.exceptions.IvyException(
                 "data must be ivy array, native array or ndarray"
             )
+        self._init_from_native(data, dynamic_backend)
+
+    def _init_from_native(self, data, dynamic_backend=None):
+        self._data = data
         self._size = None
         self._strides = None
         self._itemsize = None
@@ -162,14 +177,7 @@ class Array(
         else:
             self._dynamic_backend = ivy.dynamic_backend
         self.weak_type = False  # to handle 0-D jax front weak typed arrays
-
-    def _view_attributes(self, data):
-        self._base = None
-        self._view_refs = []
-        self._manipulation_stack = []
-        self._torch_base = None
-        self._torch_view_refs = []
-        self._torch_manipulation = None
+        register_array(self)
 
     # Properties #
     # ---------- #
@@ -251,7 +259,10 @@ class Array(
     @property
     def shape(self) -> ivy.Shape:
         """Array dimensions."""
-        return ivy.Shape(self._data.shape)
+        # the native shape needs no validation, so ivy.Shape.__init__ is bypassed
+        shape = ivy.Shape.__new__(ivy.Shape)
+        shape._shape = self._data.shape
+        return shape
 
     @property
     def size(self) -> Optional[int]:
@@ -441,7 +452,9 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.previous_backend()
 
-        self.__dict__ = ivy_array.__dict__
+        for attr in Array.__slots__:
+            setattr(self, attr, getattr(ivy_array, attr))
+        self.__dict__.update(ivy_array.__dict__)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -450,9 +463,11 @@ class Array(
     def __pos__(self):
         return ivy.positive(self._data)
 
+    @_handle_deferred_elementwise("negative")
     def __neg__(self):
         return ivy.negative(self._data)
 
+    @_handle_deferred_elementwise("pow")
     def __pow__(self, power):
         """
         ivy.Array special method variant of ivy.pow. This method simply wraps the
@@ -489,12 +504,15 @@ class Array(
         """
         return ivy.pow(self._data, power)
 
+    @_handle_deferred_elementwise("pow", reflected=True)
     def __rpow__(self, power):
         return ivy.pow(power, self._data)
 
+    @_handle_deferred_elementwise("pow")
     def __ipow__(self, power):
         return ivy.pow(self._data, power)
 
+    @_handle_deferred_elementwise("add")
     def __add__(self, other):
         """
         ivy.Array special method variant of ivy.add. This method simply wraps the
@@ -525,6 +543,7 @@ class Array(
         """
         return ivy.add(self._data, other)
 
+    @_handle_deferred_elementwise("add", reflected=True)
     def __radd__(self, other):
         """
         ivy.Array reverse special method variant of ivy.add. This method simply wraps
@@ -555,9 +574,11 @@ class Array(
         """
         return ivy.add(other, self._data)
 
+    @_handle_deferred_elementwise("add")
     def __iadd__(self, other):
         return ivy.add(self._data, other)
 
+    @_handle_deferred_elementwise("subtract")
     def __sub__(self, other):
         """
         ivy.Array special method variant of ivy.subtract. This method simply wraps the
@@ -590,6 +611,7 @@ class Array(
         """
         return ivy.subtract(self._data, other)
 
+    @_handle_deferred_elementwise("subtract", reflected=True)
     def __rsub__(self, other):
         """
         ivy.Array reverse special method variant of ivy.subtract. This method simply
@@ -620,15 +642,19 @@ class Array(
         """
         return ivy.subtract(other, self._data)
 
+    @_handle_deferred_elementwise("subtract")
     def __isub__(self, other):
         return ivy.subtract(self._data, other)
 
+    @_handle_deferred_elementwise("multiply")
     def __mul__(self, other):
         return ivy.multiply(self._data, other)
 
+    @_handle_deferred_elementwise("multiply", reflected=True)
     def __rmul__(self, other):
         return ivy.multiply(other, self._data)
 
+    @_handle_deferred_elementwise("multiply")
     def __imul__(self, other):
         return ivy.multiply(self._data, other)
 
@@ -647,6 +673,7 @@ class Array(
     def __rdivmod__(self, other):
         return tuple([ivy.divide(other, self._data), ivy.remainder(other, self._data)])
 
+    @_handle_deferred_elementwise("divide")
     def __truediv__(self, other):
         """
         ivy.Array reverse special method variant of ivy.divide. This method simply wraps
@@ -677,9 +704,11 @@ class Array(
         """
         return ivy.divide(self._data, other)
 
+    @_handle_deferred_elementwise("divide", reflected=True)
     def __rtruediv__(self, other):
         return ivy.divide(other, self._data)
 
+    @_handle_deferred_elementwise("divide")
     def __itruediv__(self, other):
         return ivy.divide(self._data, other)
 
@@ -1160,3 +1189,6 @@ class Array(
             elif self.ndim == 1:
                 return iter([to_ivy(i).squeeze(0) for i in self._data])
         return iter([to_ivy(i) for i in self._data])
+
+
+from . import deferred as _deferred
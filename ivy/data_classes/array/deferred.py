@@ -0,0 +1,240 @@
+# global
+import numpy as np
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# local
+import ivy
+from ivy.utils.memory import register as register_array
+from .array import Array
+
+# number of elements evaluated per block, chosen so that the block of every
+# intermediate result of an expression comfortably fits in the L2 cache
+_BLOCK_SIZE = 16384
+
+# expressions with more operators than this are evaluated straight away, which keeps
+# both the recursion during evaluation and the memory held by pending leaves bounded
+_MAX_NUM_OPS = 32
+
+_FLOAT_DTYPES = (np.dtype("float16"), np.dtype("float32"), np.dtype("float64"))
+
+_UFUNCS = {
+    "add": np.add,
+    "subtract": np.subtract,
+    "multiply": np.multiply,
+    "divide": np.divide,
+    "pow": np.power,
+    "negative": np.negative,
+}
+
+_NUMEXPR_FORMATS = {
+    "add": "({} + {})",
+    "subtract": "({} - {})",
+    "multiply": "({} * {})",
+    "divide": "({} / {})",
+    "pow": "({} ** {})",
+    "negative": "(-{})",
+}
+
+
+class _Node:
+    """A single deferred elementwise operator."""
+
+    __slots__ = ("op", "inputs", "shape", "dtype", "num_ops")
+
+    def __init__(self, op, inputs, shape, dtype, num_ops):
+        self.op = op
+        self.inputs = inputs
+        self.shape = shape
+        self.dtype = dtype
+        self.num_ops = num_ops
+
+
+class DeferredArray(Array):
+    """
+    An ivy.Array holding an elementwise expression which is only evaluated once its
+    data is accessed.
+
+    Only the shape and dtype of the result are known up front, any other use of the
+    array goes through ``_data`` and evaluates the whole expression in one pass.
+    """
+
+    __slots__ = ("_node",)
+
+    @classmethod
+    def _from_node(cls, node):
+        ret = cls.__new__(cls)
+        ret._init_from_native(None)
+        ret._node = node
+        # accounted for again, now that the size of its data is known
+        register_array(ret, site=node.op)
+        return ret
+
+    @property
+    def _data(self):
+        if self._node is not None:
+            _DATA_SLOT.__set__(self, _evaluate(self))
+            self._node = None
+        return _DATA_SLOT.__get__(self)
+
+    @_data.setter
+    def _data(self, data):
+        self._node = None
+        _DATA_SLOT.__set__(self, data)
+
+    @property
+    def shape(self) -> ivy.Shape:
+        """Array dimensions."""
+        if self._node is None:
+            return super().shape
+        shape = ivy.Shape.__new__(ivy.Shape)
+        shape._shape = self._node.shape
+        return shape
+
+    @property
+    def dtype(self) -> ivy.Dtype:
+        """Data type of the array elements."""
+        if self._dtype is None and self._node is not None:
+            self._dtype = ivy.FloatDtype(self._node.dtype.name)
+        return super().dtype
+
+
+_DATA_SLOT = Array.__dict__["_data"]
+
+
+def _is_pending(x):
+    return isinstance(x, DeferredArray) and x._node is not None
+
+
+def defer(op, *operands):
+    """
+    Build the deferred result of applying ``op`` to ``operands``.
+
+    Returns NotImplemented whenever the operator can't be deferred with the exact
+    semantics of the eager function, in which case the caller falls back to it.
+    """
+    inputs = []
+    shapes = []
+    dtype = None
+    num_ops = 1
+    for x in operands:
+        if _is_pending(x):
+            x_dtype = x._node.dtype
+            shapes.append(x._node.shape)
+            num_ops += x._node.num_ops
+        elif isinstance(x, (Array, np.ndarray)):
+            if isinstance(x, Array):
+                x = x._data
+            if not isinstance(x, np.ndarray):
+                return NotImplemented
+            x_dtype = x.dtype
+            shapes.append(x.shape)
+        elif isinstance(x, (int, float)) and not isinstance(x, bool):
+            inputs.append(x)
+            continue
+        else:
+            return NotImplemented
+        if x_dtype not in _FLOAT_DTYPES or (dtype is not None and x_dtype != dtype):
+            return NotImplemented
+        dtype = x_dtype
+        inputs.append(x)
+    if dtype is None:
+        return NotImplemented
+    try:
+        shape = np.broadcast_shapes(*shapes)
+    except ValueError:
+        return NotImplemented
+    # python scalars take the dtype of the array operand, as in the eager functions
+    inputs = tuple(dtype.type(x) if isinstance(x, (int, float)) else x for x in inputs)
+    ret = DeferredArray._from_node(_Node(op, inputs, shape, dtype, num_ops))
+    if num_ops >= _MAX_NUM_OPS:
+        ret._data
+    return ret
+
+
+def _compile(root):
+    """
+    Flatten the expression of ``root`` into a list of leaves and a program of
+    ``(op, refs)`` steps, each ref being ``(is_leaf, index)``.
+
+    Sub-expressions shared within the expression are only computed once, and
+    sub-expressions which have been evaluated in the meantime are used as leaves.
+    """
+    leaves = []
+    program = []
+    refs = {}
+
+    def _visit(x):
+        key = id(x)
+        if key in refs:
+            return refs[key]
+        if _is_pending(x):
+            node = x._node
+            step = (node.op, [_visit(i) for i in node.inputs])
+            program.append(step)
+            ref = (False, len(program) - 1)
+        else:
+            leaves.append(x._data if isinstance(x, Array) else x)
+            ref = (True, len(leaves) - 1)
+        refs[key] = ref
+        return ref
+
+    _visit(root)
+    return leaves, program
+
+
+def _evaluate_numexpr(leaves, program, out):
+    exprs = []
+    for op, refs in program:
+        args = ["v{}".format(i) if is_leaf else exprs[i] for is_leaf, i in refs]
+        exprs.append(_NUMEXPR_FORMATS[op].format(*args))
+    local_dict = {"v{}".format(i): leaf for i, leaf in enumerate(leaves)}
+    numexpr.evaluate(exprs[-1], local_dict=local_dict, out=out, casting="same_kind")
+
+
+def _run(leaves, program, out, buffers):
+    temps = []
+    last = len(program) - 1
+    for k, (op, refs) in enumerate(program):
+        args = [leaves[i] if is_leaf else temps[i] for is_leaf, i in refs]
+        dst = out if k == last else buffers[k]
+        temps.append(_UFUNCS[op](*args, out=dst))
+
+
+def _evaluate(root):
+    node = root._node
+    leaves, program = _compile(root)
+    out = np.empty(node.shape, dtype=node.dtype)
+    if numexpr is not None and node.dtype != np.float16:
+        _evaluate_numexpr(leaves, program, out)
+        return out
+    if out.ndim == 0 or out.size <= _BLOCK_SIZE:
+        _run(leaves, program, out, [None] * len(program))
+        return out
+    # evaluate the expression in blocks along the leading axis, so that every
+    # intermediate result lives in a small scratch buffer reused across blocks
+    num_rows = out.shape[0]
+    row_size = out.size // num_rows
+    block_rows = max(1, _BLOCK_SIZE // max(row_size, 1))
+    buffers = [
+        np.empty((block_rows,) + out.shape[1:], dtype=node.dtype) for _ in program[:-1]
+    ]
+    blocked = [
+        isinstance(leaf, np.ndarray)
+        and leaf.ndim == out.ndim
+        and leaf.shape[0] == num_rows
+        for leaf in leaves
+    ]
+    for start in range(0, num_rows, block_rows):
+        stop = min(start + block_rows, num_rows)
+        size = stop - start
+        _run(
+            [leaf[start:stop] if b else leaf for leaf, b in zip(leaves, blocked)],
+            program,
+            out[start:stop],
+            [buffer[:size] for buffer in buffers],
+        )
+    return out
@@ -76,6 +76,7 @@ class _ArrayWithLayers(abc.ABC):
         training: bool = True,
         seed: Optional[int] = None,
         noise_shape: Optional[Sequence[int]] = None,
+        rng: Optional["ivy.random.Generator"] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -102,6 +103,9 @@ class _ArrayWithLayers(abc.ABC):
         noise_shape
             a sequence representing the shape of the binary dropout mask that will be
             multiplied with the input.
+        rng
+            random number generator to draw the mask from, in place of the global random
+            state, in which case seed is ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have
             a shape that the inputs broadcast to.
@@ -145,6 +149,7 @@ class _ArrayWithLayers(abc.ABC):
             training=training,
             seed=seed,
             noise_shape=noise_shape,
+            rng=rng,
             out=out,
         )
 
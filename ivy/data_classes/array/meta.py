@@ -0,0 +1,561 @@
+# global
+import functools
+import inspect
+import math
+import warnings
+from numbers import Integral
+
+import numpy as np
+
+# local
+import ivy
+from ivy.func_wrapper import FN_DECORATORS
+from ivy.functional.ivy import activations as _activations
+from ivy.functional.ivy import elementwise as _elementwise
+from .array import Array
+
+
+class MetaArray(Array):
+    """
+    An ivy.Array which only carries a shape, dtype and device.
+
+    Meta arrays are what :func:`ivy.eval_shape` propagates through a function in
+    place of its input arrays. Whenever their data is needed, they are backed by a
+    dummy array of zeros broadcast to their shape, which on backends supporting views
+    (such as numpy and torch) allocates a single element.
+    """
+
+    __slots__ = ("_meta_shape",)
+
+    def __init__(self, shape, dtype=None, device=None):
+        self._init_from_native(None)
+        self._meta_shape = tuple(int(d) for d in shape)
+        # the conversions are skipped for the dtypes and devices of other arrays
+        if not isinstance(dtype, ivy.Dtype):
+            dtype = ivy.as_ivy_dtype(ivy.default(dtype, ivy.default_float_dtype()))
+        if not isinstance(device, ivy.Device):
+            device = ivy.as_ivy_dev(ivy.default(device, ivy.default_device()))
+        self._dtype = dtype
+        self._device = device
+
+    @property
+    def _data(self):
+        data = _DATA_SLOT.__get__(self)
+        if data is None:
+            data = _dummy(self._meta_shape, self._dtype, self._device)
+            _DATA_SLOT.__set__(self, data)
+        if _state.active:
+            # ivy functions receive the dummy, which maps them back to this array
+            _state.metas[id(data)] = self
+        return data
+
+    @_data.setter
+    def _data(self, data):
+        _DATA_SLOT.__set__(self, data)
+        if data is not None:
+            self._meta_shape = tuple(data.shape)
+            self._dtype = None
+
+    @property
+    def shape(self) -> ivy.Shape:
+        """Array dimensions."""
+        shape = ivy.Shape.__new__(ivy.Shape)
+        shape._shape = self._meta_shape
+        return shape
+
+    @property
+    def ndim(self) -> int:
+        """Number of array dimensions (axes)."""
+        return len(self._meta_shape)
+
+    @property
+    def size(self) -> int:
+        """Number of elements in the array."""
+        return math.prod(self._meta_shape)
+
+    def __repr__(self):
+        return "ivy.MetaArray(shape={}, dtype={}, dev={})".format(
+            self._meta_shape, self.dtype, self.device
+        )
+
+
+_DATA_SLOT = Array.__dict__["_data"]
+
+
+def _dummy(shape, dtype, device):
+    backend = ivy.current_backend()
+    key = (ivy.current_backend_str(), dtype, device)
+    zero = _state.zeros.get(key)
+    if zero is None:
+        zero = _state.zeros[key] = backend.zeros(
+            (),
+            dtype=backend.as_native_dtype(dtype),
+            device=backend.as_native_dev(device),
+        )
+    # the backend function without the ivy wrappers, as its arguments are native
+    return inspect.unwrap(backend.broadcast_to)(zero, shape)
+
+
+class _State:
+    """The state of the shape-only evaluation in progress."""
+
+    def __init__(self):
+        self.active = False
+        # the number of ivy functions being executed on dummy arrays, whose own calls
+        # to other ivy functions are left alone
+        self.depth = 0
+        self.metas = dict()
+        # the zero of each dtype and device, which the dummy arrays are views of
+        self.zeros = dict()
+        # the ivy functions of the current backend, their shape-only versions and
+        # the dtypes probed for them
+        self.key = None
+        self.originals = None
+        self.shims = None
+        self.array_types = (Array,)
+        self.probes = dict()
+
+
+_state = _State()
+
+
+# Helpers #
+# ------- #
+
+
+def _is_array(x):
+    return isinstance(x, _state.array_types)
+
+
+def _shape(x):
+    return x._meta_shape if type(x) is MetaArray else tuple(x.shape)
+
+
+def to_meta(x):
+    """Convert the arrays in ``x``, including ivy.VariableSpec, to meta arrays."""
+    if isinstance(x, MetaArray):
+        return x
+    if isinstance(x, ivy.Container):
+        return x.cont_map(lambda v, kc: to_meta(v))
+    if isinstance(x, (list, tuple)):
+        return type(x)(to_meta(v) for v in x)
+    if isinstance(x, dict):
+        return {k: to_meta(v) for k, v in x.items()}
+    if not isinstance(x, (str, type)) and hasattr(x, "shape") and hasattr(x, "dtype"):
+        return MetaArray(x.shape, x.dtype, getattr(x, "device", None))
+    return x
+
+
+def _map_metas(x, metas):
+    """Return ``x`` with the dummy arrays in it mapped to their meta arrays."""
+    if isinstance(x, (list, tuple)):
+        mapped = [_map_metas(v, metas) for v in x]
+        if any(m is not v for m, v in zip(mapped, x)):
+            return type(x)(mapped)
+        return x
+    return metas.get(id(x), x)
+
+
+def _has_meta(x):
+    if isinstance(x, (list, tuple)):
+        return any(isinstance(v, MetaArray) for v in x)
+    return isinstance(x, MetaArray)
+
+
+def _first_meta(args, kwargs):
+    for x in (*args, *kwargs.values()):
+        if isinstance(x, (list, tuple)):
+            x = next((v for v in x if isinstance(v, MetaArray)), None)
+        if isinstance(x, MetaArray):
+            return x
+
+
+def _as_shape(shape):
+    if isinstance(shape, Integral):
+        return (int(shape),)
+    if isinstance(shape, (ivy.Shape, list, tuple)):
+        shape = tuple(shape)
+        if all(isinstance(d, Integral) for d in shape):
+            return tuple(int(d) for d in shape)
+    raise ValueError("the shape {} isn't known".format(shape))
+
+
+def _normalize_axes(axis, ndim):
+    axes = (axis,) if isinstance(axis, Integral) else tuple(axis)
+    axes = tuple(int(a) + ndim if a < 0 else int(a) for a in axes)
+    if len(set(axes)) != len(axes) or not all(0 <= a < ndim for a in axes):
+        raise ValueError("invalid axes {} for {} dimensions".format(axis, ndim))
+    return axes
+
+
+def _execute(fn, args, kwargs):
+    _state.depth += 1
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _state.depth -= 1
+
+
+def _probe_key(x):
+    if _is_array(x):
+        return ("array", str(x.dtype), len(_shape(x)))
+    if isinstance(x, (list, tuple)):
+        return tuple(_probe_key(v) for v in x)
+    if isinstance(x, dict):
+        return tuple(sorted((k, _probe_key(v)) for k, v in x.items()))
+    return type(x), x
+
+
+def _probe_value(x):
+    if _is_array(x):
+        return _state.originals["ones"]((1,) * len(_shape(x)), dtype=x.dtype)
+    if isinstance(x, (list, tuple)):
+        return type(x)(_probe_value(v) for v in x)
+    if isinstance(x, dict):
+        return {k: _probe_value(v) for k, v in x.items()}
+    return x
+
+
+def _probe_dtype(fn, args, kwargs):
+    """
+    Find the dtype returned by ``fn``, by calling it on arrays with a single element
+    and as many dimensions as the given arrays.
+    """
+    try:
+        key = (fn, _probe_key(args), _probe_key(kwargs))
+        dtype = _state.probes.get(key)
+    except TypeError:
+        key = dtype = None
+    if dtype is None:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                ret = _execute(fn, _probe_value(args), _probe_value(kwargs))
+        except Exception as e:
+            raise ValueError("the dtype couldn't be probed") from e
+        dtype = ret.dtype
+        if key is not None:
+            _state.probes[key] = dtype
+    return dtype
+
+
+# Rules #
+# ----- #
+
+# Each rule computes the meta array returned by an ivy function from its arguments,
+# in which meta arrays stand for the dummy arrays. Whenever a rule raises one of
+# these, the function is executed on the dummy arrays instead, which also raises
+# the same error as the function for invalid arguments.
+_NO_RULE = (ValueError, TypeError, IndexError)
+
+
+def _broadcast_rule(fn, args, kwargs):
+    shapes = [_shape(x) for x in (*args, *kwargs.values()) if _is_array(x)]
+    return MetaArray(
+        np.broadcast_shapes(*shapes),
+        _probe_dtype(fn, args, kwargs),
+        _first_meta(args, kwargs).device,
+    )
+
+
+def _reduction_rule(fn, args, kwargs):
+    (x,) = args
+    ndim = len(_shape(x))
+    axis = kwargs.get("axis")
+    axes = range(ndim) if axis is None else _normalize_axes(axis, ndim)
+    if kwargs.get("keepdims", False):
+        shape = tuple(1 if i in axes else d for i, d in enumerate(_shape(x)))
+    else:
+        shape = tuple(d for i, d in enumerate(_shape(x)) if i not in axes)
+    return MetaArray(shape, _probe_dtype(fn, args, kwargs), x.device)
+
+
+def _matmul_rule(fn, args, kwargs):
+    x1, x2 = args
+    shape1, shape2 = list(_shape(x1)), list(_shape(x2))
+    if len(shape1) > 1 and (kwargs.get("transpose_a") or kwargs.get("adjoint_a")):
+        shape1[-2:] = shape1[:-3:-1]
+    if len(shape2) > 1 and (kwargs.get("transpose_b") or kwargs.get("adjoint_b")):
+        shape2[-2:] = shape2[:-3:-1]
+    rows = shape1[-2:-1]
+    cols = shape2[-1:] if len(shape2) > 1 else []
+    if shape1[-1] != shape2[max(len(shape2) - 2, 0)]:
+        raise ValueError("mismatching inner dimensions")
+    batch = np.broadcast_shapes(tuple(shape1[:-2]), tuple(shape2[:-2]))
+    return MetaArray(
+        batch + tuple(rows + cols),
+        _probe_dtype(fn, args, kwargs),
+        _first_meta(args, kwargs).device,
+    )
+
+
+def _linear_rule(fn, args, kwargs):
+    x, weight = args
+    if len(_shape(weight)) != 2 or _shape(x)[-1] != _shape(weight)[-1]:
+        raise ValueError("mismatching input features")
+    shape = tuple(_shape(x)[:-1]) + (_shape(weight)[0],)
+    bias = kwargs.get("bias")
+    if bias is not None:
+        shape = np.broadcast_shapes(shape, _shape(bias))
+    return MetaArray(
+        shape, _probe_dtype(fn, args, kwargs), _first_meta(args, kwargs).device
+    )
+
+
+def _reshape_rule(fn, args, kwargs):
+    x = args[0]
+    shape = list(_as_shape(args[1] if len(args) > 1 else kwargs["shape"]))
+    size = math.prod(_shape(x))
+    if shape.count(-1) == 1:
+        known = -math.prod(shape)
+        if known == 0 or size % known:
+            raise ValueError("can't infer the size of the -1 dimension")
+        shape[shape.index(-1)] = size // known
+    if math.prod(shape) != size or (0 in shape and not kwargs.get("allowzero", True)):
+        raise ValueError("can't reshape {} into {}".format(_shape(x), shape))
+    return MetaArray(shape, x.dtype, x.device)
+
+
+def _expand_dims_rule(fn, args, kwargs):
+    (x,) = args
+    axis = kwargs.get("axis", 0)
+    shape = list(_shape(x))
+    ndim = len(shape) + (1 if isinstance(axis, Integral) else len(axis))
+    for a in sorted(_normalize_axes(axis, ndim)):
+        shape.insert(a, 1)
+    return MetaArray(shape, x.dtype, x.device)
+
+
+def _squeeze_rule(fn, args, kwargs):
+    x = args[0]
+    axis = args[1] if len(args) > 1 else kwargs.get("axis")
+    if axis is None:
+        axes = tuple(i for i, d in enumerate(_shape(x)) if d == 1)
+    else:
+        axes = _normalize_axes(axis, len(_shape(x)))
+    if any(_shape(x)[a] != 1 for a in axes):
+        raise ValueError("can't squeeze dimensions which aren't of size 1")
+    shape = tuple(d for i, d in enumerate(_shape(x)) if i not in axes)
+    return MetaArray(shape, x.dtype, x.device)
+
+
+def _permute_dims_rule(fn, args, kwargs):
+    x = args[0]
+    axes = args[1] if len(args) > 1 else kwargs["axes"]
+    axes = _normalize_axes(axes, len(_shape(x)))
+    if len(axes) != len(_shape(x)):
+        raise ValueError("the axes aren't a permutation of the dimensions")
+    return MetaArray(tuple(_shape(x)[a] for a in axes), x.dtype, x.device)
+
+
+def _swapaxes_rule(fn, args, kwargs):
+    x, axis0, axis1 = args
+    shape = list(_shape(x))
+    (axis0,), (axis1,) = (_normalize_axes(a, len(shape)) for a in (axis0, axis1))
+    shape[axis0], shape[axis1] = shape[axis1], shape[axis0]
+    return MetaArray(shape, x.dtype, x.device)
+
+
+def _concat_rule(fn, args, kwargs):
+    (xs,) = args
+    shapes = [_shape(x) for x in xs]
+    (axis,) = _normalize_axes(kwargs.get("axis", 0), len(shapes[0]))
+    rest = {s[:axis] + s[axis + 1 :] for s in shapes}
+    if len(rest) != 1 or len({len(s) for s in shapes}) != 1:
+        raise ValueError("mismatching shapes {}".format(shapes))
+    shape = list(shapes[0])
+    shape[axis] = sum(s[axis] for s in shapes)
+    return MetaArray(
+        shape, _probe_dtype(fn, args, kwargs), _first_meta(args, kwargs).device
+    )
+
+
+def _stack_rule(fn, args, kwargs):
+    (arrays,) = args
+    shapes = {_shape(x) for x in arrays}
+    if len(shapes) != 1:
+        raise ValueError("mismatching shapes {}".format(shapes))
+    shape = list(shapes.pop())
+    (axis,) = _normalize_axes(kwargs.get("axis", 0), len(shape) + 1)
+    shape.insert(axis, len(arrays))
+    return MetaArray(
+        shape, _probe_dtype(fn, args, kwargs), _first_meta(args, kwargs).device
+    )
+
+
+def _broadcast_to_rule(fn, args, kwargs):
+    x = args[0]
+    shape = _as_shape(args[1] if len(args) > 1 else kwargs["shape"])
+    if np.broadcast_shapes(_shape(x), shape) != shape:
+        raise ValueError("can't broadcast {} to {}".format(_shape(x), shape))
+    return MetaArray(shape, x.dtype, x.device)
+
+
+def _creation_rule(fn, args, kwargs):
+    if args:
+        shape, args = args[0], ((),) + args[1:]
+    else:
+        shape = kwargs.pop("shape")
+        kwargs["shape"] = ()
+    return MetaArray(
+        _as_shape(shape), _probe_dtype(fn, args, kwargs), kwargs.get("device")
+    )
+
+
+def _random_rule(fn, args, kwargs):
+    params = [
+        x
+        for k, x in kwargs.items()
+        if k in ("low", "high", "mean", "std") and _is_array(x)
+    ]
+    shape = kwargs.get("shape")
+    if shape is None:
+        shape = np.broadcast_shapes(*(_shape(x) for x in params))
+    dtype = kwargs.get("dtype")
+    if dtype is None and params:
+        dtype = params[0].dtype
+    return MetaArray(_as_shape(shape), dtype, kwargs.get("device"))
+
+
+_RULES = {
+    **{
+        name: _broadcast_rule
+        for module in (_elementwise, _activations)
+        for name, fn in vars(module).items()
+        if inspect.isfunction(fn)
+        and fn.__module__ == module.__name__
+        and not name.startswith("_")
+        and name not in ("trapz", "deserialize", "get")
+    },
+    **dict.fromkeys(
+        (
+            "astype",
+            "clip",
+            "copy_array",
+            "cumprod",
+            "cumsum",
+            "empty_like",
+            "full_like",
+            "ones_like",
+            "stop_gradient",
+            "tril",
+            "triu",
+            "where",
+            "zeros_like",
+        ),
+        _broadcast_rule,
+    ),
+    **dict.fromkeys(
+        (
+            "all",
+            "any",
+            "argmax",
+            "argmin",
+            "max",
+            "mean",
+            "min",
+            "prod",
+            "std",
+            "sum",
+            "var",
+            "vector_norm",
+        ),
+        _reduction_rule,
+    ),
+    "matmul": _matmul_rule,
+    "linear": _linear_rule,
+    "reshape": _reshape_rule,
+    "expand_dims": _expand_dims_rule,
+    "squeeze": _squeeze_rule,
+    "permute_dims": _permute_dims_rule,
+    "swapaxes": _swapaxes_rule,
+    "concat": _concat_rule,
+    "stack": _stack_rule,
+    "broadcast_to": _broadcast_to_rule,
+}
+
+# creation functions, which return meta arrays even when given no meta array
+_CREATION_RULES = {
+    **dict.fromkeys(("empty", "full", "ones", "zeros"), _creation_rule),
+    **dict.fromkeys(("random_normal", "random_uniform"), _random_rule),
+}
+
+
+# Shape-only Evaluation #
+# --------------------- #
+
+
+def _shim(fn, rule, creation):
+    @functools.wraps(fn)
+    def _shape_only_fn(*args, **kwargs):
+        if _state.depth:
+            return fn(*args, **kwargs)
+        metas = _state.metas
+        args = tuple(_map_metas(x, metas) for x in args)
+        kwargs = {k: _map_metas(x, metas) for k, x in kwargs.items()}
+        if not (creation or any(map(_has_meta, (*args, *kwargs.values())))):
+            return _execute(fn, args, kwargs)
+        out = kwargs.get("out")
+        if rule is not None and (out is None or isinstance(out, MetaArray)):
+            kwargs.pop("out", None)
+            try:
+                ret = rule(fn, args, dict(kwargs))
+            except _NO_RULE:
+                ret = None
+            if ret is not None:
+                if out is None:
+                    return ret
+                out._meta_shape, out._dtype = ret._meta_shape, ret._dtype
+                return out
+            if out is not None:
+                kwargs["out"] = out
+        # no rule applies, so the function is executed on the dummy arrays
+        return to_meta(_execute(fn, args, kwargs))
+
+    return _shape_only_fn
+
+
+def _shims():
+    """Return the shape-only versions of the ivy functions of the current backend."""
+    key = ivy.__dict__.get("add")
+    if _state.key is not key:
+        _state.originals = {
+            name: fn
+            for name, fn in ivy.__dict__.items()
+            if inspect.isfunction(fn)
+            and name != "eval_shape"
+            and any(hasattr(fn, attr) for attr in FN_DECORATORS)
+        }
+        _state.shims = {
+            name: _shim(
+                fn,
+                _CREATION_RULES.get(name, _RULES.get(name)),
+                name in _CREATION_RULES,
+            )
+            for name, fn in _state.originals.items()
+        }
+        _state.probes.clear()
+        _state.array_types = (Array, ivy.NativeArray)
+        _state.key = key
+    return _state.shims
+
+
+def evaluating():
+    """Return whether an ivy.eval_shape is in progress."""
+    return _state.active
+
+
+def eval_shape(fn, *args, **kwargs):
+    """Evaluate ``fn`` on meta arrays, see :func:`ivy.eval_shape`."""
+    args, kwargs = to_meta(args), to_meta(kwargs)
+    if _state.active:
+        return to_meta(fn(*args, **kwargs))
+    ivy.__dict__.update(_shims())
+    _state.active = True
+    try:
+        ret = fn(*args, **kwargs)
+    finally:
+        _state.active = False
+        _state.metas.clear()
+        ivy.__dict__.update(_state.originals)
+    return to_meta(ret)
@@ -361,6 +361,7 @@ class _ArrayWithRandom(abc.ABC):
         /,
         *,
         seed: Optional[int] = None,
+        rng: Optional["ivy.random.Generator"] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -376,6 +377,9 @@ class _ArrayWithRandom(abc.ABC):
             The axis which x is shuffled along. Default is 0.
         seed
             A python integer. Used to create a random seed distribution
+        rng
+            random number generator to draw the permutation from, in place of the global
+            random state, in which case seed is ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a
             shape that the inputs broadcast to.
@@ -392,4 +396,4 @@ class _ArrayWithRandom(abc.ABC):
         >>> print(y)
         ivy.array([2, 5, 9])
         """
-        return ivy.shuffle(self, axis, seed=seed, out=out)
+        return ivy.shuffle(self, axis, seed=seed, rng=rng, out=out)
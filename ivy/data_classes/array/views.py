@@ -0,0 +1,86 @@
+# local
+import ivy
+from .array import Array
+
+# the backends whose arrays are immutable, on which a view holds a copy of its
+# elements that has to be refreshed whenever its base is updated inplace
+FUNCTIONAL_BACKENDS = ("jax", "tensorflow")
+
+
+class ViewArray(Array):
+    """
+    A view of an ivy.Array on a functional backend.
+
+    An inplace update of the base only marks its views as stale, and each view
+    gathers its elements from the base again the next time its data is read. The
+    manipulations between the base and the view are composed into a single index
+    array the first time it's needed, so refreshing a view is one gather however
+    long its chain of manipulations.
+    """
+
+    __slots__ = ()
+
+    # only set on the instance once the view goes stale or its index is computed
+    _stale = False
+    _view_index = None
+
+    @property
+    def _data(self):
+        if self._stale:
+            self._stale = False
+            _DATA_SLOT.__set__(self, _gather_view(self))
+        return _DATA_SLOT.__get__(self)
+
+    @_data.setter
+    def _data(self, data):
+        if self._stale:
+            self._stale = False
+        _DATA_SLOT.__set__(self, data)
+
+
+_DATA_SLOT = Array.__dict__["_data"]
+
+
+def _view_index(view):
+    """
+    Return the flat index into the base of each element of the view.
+
+    The index is computed by applying the manipulation stack of the view to the flat
+    indices of the base, and is cached on the view.
+    """
+    if view._view_index is None:
+        base = view._base
+        index = ivy.to_native(ivy.reshape(ivy.arange(base.size), base.shape))
+        for fn, args, kwargs, i in view._manipulation_stack:
+            # the manipulations are applied to native arrays, which don't create views
+            index = ivy.__dict__[fn](index, *args, **kwargs)
+            index = ivy.to_native(index[i] if ivy.exists(i) else index)
+        view._view_index = index
+    return view._view_index
+
+
+def _gather_view(view):
+    base_flat = ivy.reshape(view._base.data, (-1,))
+    return ivy.to_native(ivy.gather(base_flat, _view_index(view)))
+
+
+def _mark_views_stale(base, updated=None):
+    """
+    Mark all the live views of the base as stale, other than the updated one, and
+    drop the references to views which no longer exist.
+
+    Parameters
+    ----------
+    base
+        the array whose data has changed.
+    updated
+        the view through which base was updated, which is already up to date.
+    """
+    refs = []
+    for ref in base._view_refs:
+        view = ref()
+        if view is not None:
+            refs.append(ref)
+            if view is not updated:
+                view._stale = True
+    base._view_refs = refs
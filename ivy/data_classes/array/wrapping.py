@@ -42,7 +42,12 @@ def _wrap_function(function_name: str) -> Callable:
         """
         function = ivy.__dict__[function_name]
         # gives us the position and name of the array argument
-        data_idx = function.array_spec[0]
+        try:
+            data_idx = function.array_spec[0]
+        except AttributeError:
+            # the array specs are deferred in lazy import mode
+            ivy._load_deferred_modules()
+            data_idx = function.array_spec[0]
         if len(args) >= data_idx[0][0]:
             args = ivy.copy_nest(args, to_mutable=True)
             data_idx = [data_idx[0][0]] + [
@@ -21,7 +21,7 @@ except ModuleNotFoundError:
 import pickle
 import random
 from operator import mul
-from functools import reduce as _reduce
+from functools import lru_cache, reduce as _reduce
 from typing import Union, Tuple
 from builtins import set
 
@@ -47,6 +47,79 @@ def _repr(x):
         return str(x)
 
 
+@lru_cache(maxsize=None)
+def _cached_has_out_arg(fn):
+    return inspect.signature(fn).parameters.get("out") is not None
+
+
+def _has_out_arg(fn):
+    try:
+        return _cached_has_out_arg(fn)
+    except TypeError:
+        # unhashable callables can't be cached
+        return inspect.signature(fn).parameters.get("out") is not None
+
+
+def _contains_container(x):
+    if isinstance(x, ivy.Container):
+        return True
+    if isinstance(x, (list, tuple)):
+        return any(_contains_container(v) for v in x)
+    if isinstance(x, dict):
+        return any(_contains_container(v) for v in x.values())
+    return False
+
+
+def _identical_structure_leaves(conts, leaves):
+    """
+    Append the leaves of the containers to ``leaves``, each as the list of the values
+    at that leaf across all containers, and return the keys of the structure they
+    share, or None if the containers aren't structured identically.
+    """
+    cont0 = conts[0]
+    num_keys = len(cont0)
+    for cont in conts[1:]:
+        if len(cont) != num_keys:
+            return None
+    skeleton = []
+    for key, value0 in dict.items(cont0):
+        values = [value0]
+        for cont in conts[1:]:
+            value = dict.get(cont, key, _missing)
+            if value is _missing:
+                return None
+            values.append(value)
+        if isinstance(value0, ivy.Container):
+            if not all(isinstance(v, ivy.Container) for v in values):
+                return None
+            sub_skeleton = _identical_structure_leaves(values, leaves)
+            if sub_skeleton is None:
+                return None
+            skeleton.append((key, sub_skeleton))
+        else:
+            if any(isinstance(v, ivy.Container) for v in values):
+                return None
+            leaves.append(values)
+            skeleton.append((key, None))
+    return skeleton
+
+
+def _build_from_skeleton(skeleton, rets, config):
+    return_dict = dict()
+    for key, sub_skeleton in skeleton:
+        if sub_skeleton is None:
+            return_dict[key] = next(rets)
+        else:
+            ret = _build_from_skeleton(sub_skeleton, rets, config)
+            # empty sub-containers are dropped, as in cont_multi_map
+            if ret:
+                return_dict[key] = ret
+    return ivy.Container(return_dict, **config)
+
+
+_missing = object()
+
+
 # noinspection PyMissingConstructor
 
 
@@ -178,6 +251,11 @@ class ContainerBase(dict, abc.ABC):
         inspect_fn = fn
         if isinstance(fn, str):
             inspect_fn = ivy.__dict__[fn]
+        with_out = out is not None and _has_out_arg(inspect_fn)
+        if key_chains is None and not map_sequences and not with_out:
+            ret = ContainerBase._cont_multi_map_identical_in_function(fn, args, kwargs)
+            if ret is not NotImplemented:
+                return ret
         # retrieve indices where leaves of args are also nested
         arg_cont_idxs = ivy.nested_argwhere(
             args, ivy.is_ivy_container, to_ignore=ivy.Container
@@ -194,10 +272,6 @@ class ContainerBase(dict, abc.ABC):
         # retrieve all the containers in kwargs
         kwarg_conts = ivy.multi_index_nest(kwargs, kwarg_cont_idxs)
         # Combine the retrieved containers from args and kwargs into a single list
-        with_out = (
-            inspect.signature(inspect_fn).parameters.get("out") is not None
-            and out is not None
-        )
         if with_out:
             out_conts = [out]
             num_out_conts = 1
@@ -265,6 +339,59 @@ class ContainerBase(dict, abc.ABC):
 
         return ret
 
+    @staticmethod
+    def _cont_multi_map_identical_in_function(fn, args, kwargs):
+        """
+        Map fn over identically structured containers passed directly as args or
+        kwargs, or return NotImplemented if the inputs are not of this form.
+
+        The argument template and the leaves of all the containers are only gathered
+        once per call, so each leaf is a plain call of fn with the template filled in.
+        The leaves aren't cached across calls, as the containers and their
+        sub-containers can be mutated in place without their parents knowing.
+        """
+        args = list(args)
+        arg_idxs = []
+        for i, arg in enumerate(args):
+            if isinstance(arg, ivy.Container):
+                arg_idxs.append(i)
+            elif _contains_container(arg):
+                return NotImplemented
+        kwarg_keys = []
+        for key, kwarg in kwargs.items():
+            if isinstance(kwarg, ivy.Container):
+                kwarg_keys.append(key)
+            elif _contains_container(kwarg):
+                return NotImplemented
+        conts = [args[i] for i in arg_idxs] + [kwargs[key] for key in kwarg_keys]
+        if not conts or any(ivy.exists(cont._queues) for cont in conts):
+            return NotImplemented
+        leaves = []
+        skeleton = _identical_structure_leaves(conts, leaves)
+        if skeleton is None:
+            return NotImplemented
+        cont0 = conts[0]
+        if isinstance(fn, str):
+            fn = cont0.cont_ivy.__dict__[fn]
+        kwargs = dict(kwargs)
+        num_arg_conts = len(arg_idxs)
+        rets = []
+        for values in leaves:
+            for i, value in zip(arg_idxs, values):
+                args[i] = value
+            for key, value in zip(kwarg_keys, values[num_arg_conts:]):
+                kwargs[key] = value
+            rets.append(fn(*args, **kwargs))
+        ret = _build_from_skeleton(skeleton, iter(rets), cont0.cont_config)
+
+        # Multiple containers for functions returning multiple arrays
+        for values in ret.values():
+            if isinstance(values, (tuple, list)):
+                for v in values:
+                    if ivy.is_ivy_array(v):
+                        return ret.cont_unstack_conts(0)
+        return ret
+
     @staticmethod
     def cont_handle_inplace(ret, out):
         """
@@ -2177,6 +2304,32 @@ class ContainerBase(dict, abc.ABC):
             else:
                 yield kc
 
+    def cont_pack(self):
+        """
+        Pack the array leaves into one contiguous flat buffer per dtype and device, so
+        that elementwise operations, casts and reductions over all the leaves each run
+        as a single backend operation per buffer.
+
+        Returns
+        -------
+        ret
+            the packed container, from which the container can be recovered with
+            :meth:`ivy.PackedContainer.unpack`.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+        >>> packed = x.cont_pack()
+        >>> print((packed * 2.).unpack())
+        {
+            a: ivy.array([2., 4.]),
+            b: {
+                c: ivy.array([[6.]])
+            }
+        }
+        """
+        return ivy.PackedContainer.pack(self)
+
     def cont_to_flat_list(self):
         """
         Summary.
@@ -196,6 +196,7 @@ class _ContainerWithLayers(ContainerBase):
         training: bool = True,
         seed: Optional[int] = None,
         noise_shape: Optional[Sequence[int]] = None,
+        rng: Optional["ivy.random.Generator"] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -226,6 +227,9 @@ class _ContainerWithLayers(ContainerBase):
         noise_shape
             a sequence representing the shape of the binary dropout mask that will be
             multiplied with the input.
+        rng
+            random number generator to draw the mask from, in place of the global random
+            state, in which case seed is ignored. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -267,6 +271,7 @@ class _ContainerWithLayers(ContainerBase):
             training=training,
             seed=seed,
             noise_shape=noise_shape,
+            rng=rng,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -284,6 +289,7 @@ class _ContainerWithLayers(ContainerBase):
         training: bool = True,
         seed: Optional[int] = None,
         noise_shape: Optional[Sequence[int]] = None,
+        rng: Optional["ivy.random.Generator"] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -314,6 +320,9 @@ class _ContainerWithLayers(ContainerBase):
         noise_shape
             a sequence representing the shape of the binary dropout mask that will be
             multiplied with the input.
+        rng
+            random number generator to draw the mask from, in place of the global random
+            state, in which case seed is ignored. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -354,6 +363,7 @@ class _ContainerWithLayers(ContainerBase):
             training=training,
             seed=seed,
             noise_shape=noise_shape,
+            rng=rng,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -0,0 +1,418 @@
+"""Packed Container Object."""
+
+# global
+import math
+from numbers import Number
+
+# local
+import ivy
+
+
+def _native_reshape(x, shape):
+    if hasattr(x, "reshape"):
+        return x.reshape(shape)
+    return ivy.to_native(ivy.reshape(x, shape))
+
+
+def _group_key(x):
+    if ivy.is_ivy_array(x):
+        # the dtype and device are cached on ivy arrays
+        return str(x.dtype), str(x.device)
+    return str(ivy.dtype(x)), str(ivy.dev(x))
+
+
+def _concat_groups(grouped):
+    """Concatenate the lists of flat native arrays in ``grouped`` into one buffer per
+    group, returning the buffers and the offset of each array in its buffer."""
+    buffers = dict()
+    offsets = dict()
+    for key, flat_arrays in grouped.items():
+        start = 0
+        for i, x in enumerate(flat_arrays):
+            offsets[(key, i)] = start
+            start += x.shape[0]
+        if len(flat_arrays) == 1:
+            buffers[key] = ivy.to_ivy(flat_arrays[0])
+        else:
+            # the arrays are already native and of one dtype, so the backend
+            # function is called directly rather than through the ivy wrappers
+            buffers[key] = ivy.to_ivy(
+                ivy.current_backend(flat_arrays[0]).concat(flat_arrays, axis=0)
+            )
+    return buffers, offsets
+
+
+def _rebuild(template, leaves):
+    new_dict = dict()
+    for key, value in template.items():
+        if isinstance(value, ivy.Container):
+            new_dict[key] = _rebuild(value, leaves)
+        else:
+            new_dict[key] = next(leaves)
+    return ivy.Container(new_dict, **template.cont_config)
+
+
+class PackedContainer:
+    """
+    A container whose array leaves are packed into one contiguous flat buffer per
+    dtype and device.
+
+    Elementwise operations, casts and reductions over all of the leaves then run as a
+    single backend operation per buffer, rather than one per leaf. The packed
+    container is created with :meth:`ivy.Container.cont_pack`, and
+    :meth:`PackedContainer.unpack` returns a container of the same structure, whose
+    array leaves are views into the buffers wherever the backend supports views.
+    """
+
+    def __init__(self, buffers, leaves, template, key_chains=None):
+        """
+        Construct a packed container directly from its buffers. Use
+        :meth:`ivy.Container.cont_pack` to pack an existing container instead.
+
+        Parameters
+        ----------
+        buffers
+            dict mapping each (dtype, device) key to its flat buffer.
+        leaves
+            list with an entry for each leaf of the container in iteration order,
+            either None for leaves which are not arrays, or the tuple
+            ``(key, start, stop, shape, is_native)`` locating the leaf in its buffer.
+        template
+            container with the structure of the packed container, holding the leaves
+            which are not arrays.
+        key_chains
+            the key chains of the leaves of the template, computed if not given.
+        """
+        self._buffers = buffers
+        self._leaves = leaves
+        self._template = template
+        if key_chains is None:
+            key_chains = tuple(template.cont_to_iterator_keys())
+        self._key_chains = key_chains
+        self._layout_cache = None
+
+    @classmethod
+    def pack(cls, container):
+        """
+        Pack the array leaves of the container into flat buffers.
+
+        Parameters
+        ----------
+        container
+            container to pack.
+
+        Returns
+        -------
+        ret
+            the packed container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+        >>> packed = ivy.PackedContainer.pack(x)
+        >>> packed.buffers
+        {('float32', 'cpu'): ivy.array([1., 2., 3.])}
+        """
+        grouped = dict()
+        located = []
+        other_values = []
+        for value in container.cont_to_iterator_values():
+            if not ivy.is_array(value):
+                located.append(None)
+                other_values.append(value)
+                continue
+            key = _group_key(value)
+            flat_arrays = grouped.setdefault(key, [])
+            located.append(
+                (key, len(flat_arrays), tuple(value.shape), ivy.is_native_array(value))
+            )
+            flat_arrays.append(_native_reshape(ivy.to_native(value), (-1,)))
+            other_values.append(None)
+        buffers, offsets = _concat_groups(grouped)
+        leaves = []
+        for loc in located:
+            if loc is None:
+                leaves.append(None)
+                continue
+            key, i, shape, is_native = loc
+            start = offsets[(key, i)]
+            leaves.append((key, start, start + math.prod(shape), shape, is_native))
+        template = _rebuild(container, iter(other_values))
+        return cls(buffers, leaves, template)
+
+    # Properties #
+    # ---------- #
+
+    @property
+    def buffers(self):
+        """The flat buffer for each (dtype, device) key."""
+        return self._buffers
+
+    @property
+    def num_leaves(self):
+        """Number of array leaves packed into the buffers."""
+        return sum(leaf is not None for leaf in self._leaves)
+
+    # Methods #
+    # ------- #
+
+    def unpack(self):
+        """
+        Return the container, with each array leaf a view into its buffer.
+
+        Returns
+        -------
+        ret
+            container with the structure and leaves of the packed container.
+        """
+        natives = {key: ivy.to_native(buffer) for key, buffer in self._buffers.items()}
+        template_values = self._template.cont_to_iterator_values()
+        values = []
+        for leaf in self._leaves:
+            value = next(template_values)
+            if leaf is not None:
+                key, start, stop, shape, is_native = leaf
+                value = _native_reshape(natives[key][start:stop], shape)
+                if not is_native:
+                    value = ivy.Array(value)
+            values.append(value)
+        return _rebuild(self._template, iter(values))
+
+    def map_buffers(self, fn, *others):
+        """
+        Apply an elementwise function to each of the buffers.
+
+        Parameters
+        ----------
+        fn
+            elementwise function, called with each buffer of this packed container,
+            followed by the corresponding buffers of ``others``, or with scalar
+            ``others`` as they are.
+        others
+            scalars, or packed containers with the same layout as this one.
+
+        Returns
+        -------
+        ret
+            packed container with the results of fn as buffers.
+        """
+        # the buffers of the others are matched with these by position, as their
+        # dtypes may differ
+        others = [
+            (
+                list(self._matching_buffers(other))
+                if isinstance(other, PackedContainer)
+                else other
+            )
+            for other in others
+        ]
+        results = {
+            key: fn(
+                buffer,
+                *[o[i] if isinstance(o, list) else o for o in others],
+            )
+            for i, (key, buffer) in enumerate(self._buffers.items())
+        }
+        return self._with_buffers(results)
+
+    def astype(self, dtype, /, *, copy=True):
+        """
+        Cast all of the packed leaves to the dtype.
+
+        Parameters
+        ----------
+        dtype
+            data type to cast to.
+        copy
+            whether to copy buffers which already have the dtype.
+
+        Returns
+        -------
+        ret
+            packed container with the cast buffers.
+        """
+        return self.map_buffers(lambda x: ivy.astype(x, dtype, copy=copy))
+
+    def sum(self):
+        """
+        Sum all of the elements of all the packed leaves.
+
+        Returns
+        -------
+        ret
+            scalar array with the sum, which is zero without any packed leaves.
+        """
+        sums = [ivy.sum(buffer) for buffer in self._buffers.values()]
+        if not sums:
+            return ivy.zeros(())
+        return sums[0] if len(sums) == 1 else ivy.sum(ivy.stack(sums))
+
+    def mean(self):
+        """
+        Compute the mean of all of the elements of all the packed leaves.
+
+        Returns
+        -------
+        ret
+            scalar array with the mean.
+        """
+        size = sum(buffer.shape[0] for buffer in self._buffers.values())
+        return ivy.divide(self.sum(), size)
+
+    def vector_norm(self, ord=2):
+        """
+        Compute the norm of all of the elements of all the packed leaves, as if they
+        were concatenated into a single vector, such as the global norm of the
+        gradients.
+
+        Parameters
+        ----------
+        ord
+            order of the norm, as for :func:`ivy.vector_norm`.
+
+        Returns
+        -------
+        ret
+            scalar array with the norm, which is zero without any packed leaves.
+        """
+        norms = [ivy.vector_norm(buffer, ord=ord) for buffer in self._buffers.values()]
+        if not norms:
+            return ivy.zeros(())
+        if len(norms) == 1:
+            return norms[0]
+        norms = ivy.stack([ivy.astype(n, norms[0].dtype) for n in norms])
+        if ord == float("inf"):
+            return ivy.max(norms)
+        if ord == -float("inf"):
+            return ivy.min(norms)
+        if ord == 0:
+            return ivy.sum(norms)
+        return ivy.vector_norm(norms, ord=ord)
+
+    # Helpers #
+    # ------- #
+
+    def _layout(self):
+        """The structure, and location of each leaf relative to the order of the
+        buffers, which two packed containers need to share to be combined."""
+        if self._layout_cache is None:
+            index = {key: i for i, key in enumerate(self._buffers)}
+            self._layout_cache = (
+                self._key_chains,
+                tuple(
+                    leaf if leaf is None else (index[leaf[0]],) + leaf[1:4]
+                    for leaf in self._leaves
+                ),
+            )
+        return self._layout_cache
+
+    def _matching_buffers(self, other):
+        if other is self or other._layout() == self._layout():
+            return other._buffers.values()
+        if other._key_chains != self._key_chains or [
+            leaf and leaf[3] for leaf in other._leaves
+        ] != [leaf and leaf[3] for leaf in self._leaves]:
+            raise ivy.utils.exceptions.IvyException(
+                "packed containers must have identical structures and shapes to be "
+                "combined"
+            )
+        # the leaves are grouped differently, e.g. after a change of dtype, so the
+        # buffers of other are gathered into the grouping of these ones
+        natives = {key: ivy.to_native(buffer) for key, buffer in other._buffers.items()}
+        grouped = {key: [] for key in self._buffers}
+        for leaf, other_leaf in zip(self._leaves, other._leaves):
+            if leaf is not None:
+                other_key, start, stop = other_leaf[:3]
+                grouped[leaf[0]].append(natives[other_key][start:stop])
+        return _concat_groups(grouped)[0].values()
+
+    def _with_buffers(self, results):
+        # the keys may no longer be distinct once the buffers change dtype, in which
+        # case the buffers sharing a key are concatenated and the leaves relocated
+        new_keys = {key: _group_key(buffer) for key, buffer in results.items()}
+        if len(set(new_keys.values())) == len(new_keys):
+            buffers = {new_keys[key]: buffer for key, buffer in results.items()}
+            leaves = [
+                leaf if leaf is None else (new_keys[leaf[0]],) + leaf[1:]
+                for leaf in self._leaves
+            ]
+            if buffers.keys() == self._buffers.keys() and leaves == self._leaves:
+                leaves = self._leaves
+            return PackedContainer(buffers, leaves, self._template, self._key_chains)
+        grouped = dict()
+        positions = dict()
+        for key, buffer in results.items():
+            flat_arrays = grouped.setdefault(new_keys[key], [])
+            positions[key] = len(flat_arrays)
+            flat_arrays.append(ivy.to_native(buffer))
+        buffers, offsets = _concat_groups(grouped)
+        shifts = {key: offsets[(new_keys[key], i)] for key, i in positions.items()}
+        leaves = [
+            (
+                leaf
+                if leaf is None
+                else (
+                    new_keys[leaf[0]],
+                    leaf[1] + shifts[leaf[0]],
+                    leaf[2] + shifts[leaf[0]],
+                )
+                + leaf[3:]
+            )
+            for leaf in self._leaves
+        ]
+        return PackedContainer(buffers, leaves, self._template, self._key_chains)
+
+    # Built-ins #
+    # ----------#
+
+    def __repr__(self):
+        return "PackedContainer({} leaves in buffers {})".format(
+            self.num_leaves,
+            {key: tuple(buffer.shape) for key, buffer in self._buffers.items()},
+        )
+
+    def __getitem__(self, key_chain):
+        return self.unpack()[key_chain]
+
+    def _binary(self, fn, other, reverse=False):
+        if not isinstance(other, (Number, PackedContainer)) or isinstance(other, bool):
+            return NotImplemented
+        if reverse:
+            return self.map_buffers(lambda x, y: fn(y, x), other)
+        return self.map_buffers(fn, other)
+
+    def __neg__(self):
+        return self.map_buffers(ivy.negative)
+
+    def __abs__(self):
+        return self.map_buffers(ivy.abs)
+
+    def __add__(self, other):
+        return self._binary(ivy.add, other)
+
+    def __radd__(self, other):
+        return self._binary(ivy.add, other, reverse=True)
+
+    def __sub__(self, other):
+        return self._binary(ivy.subtract, other)
+
+    def __rsub__(self, other):
+        return self._binary(ivy.subtract, other, reverse=True)
+
+    def __mul__(self, other):
+        return self._binary(ivy.multiply, other)
+
+    def __rmul__(self, other):
+        return self._binary(ivy.multiply, other, reverse=True)
+
+    def __truediv__(self, other):
+        return self._binary(ivy.divide, other)
+
+    def __rtruediv__(self, other):
+        return self._binary(ivy.divide, other, reverse=True)
+
+    def __pow__(self, other):
+        return self._binary(ivy.pow, other)
+
+    def __rpow__(self, other):
+        return self._binary(ivy.pow, other, reverse=True)
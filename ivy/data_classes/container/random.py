@@ -1032,6 +1032,7 @@ class _ContainerWithRandom(ContainerBase):
         /,
         *,
         seed: Optional[int] = None,
+        rng: Optional["ivy.random.Generator"] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -1051,6 +1052,9 @@ class _ContainerWithRandom(ContainerBase):
             The axis which input array or container is shuffled along. Default is 0.
         seed
             A python integer. Used to create a random seed distribution
+        rng
+            random number generator to draw the permutation from, in place of the global
+            random state, in which case seed is ignored. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -1086,6 +1090,7 @@ class _ContainerWithRandom(ContainerBase):
             x,
             axis,
             seed=seed,
+            rng=rng,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -1099,6 +1104,7 @@ class _ContainerWithRandom(ContainerBase):
         /,
         *,
         seed: Optional[int] = None,
+        rng: Optional["ivy.random.Generator"] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -1118,6 +1124,9 @@ class _ContainerWithRandom(ContainerBase):
             The axis which input container is shuffled along. Default is 0.
         seed
             A python integer. Used to create a random seed distribution
+        rng
+            random number generator to draw the permutation from, in place of the global
+            random state, in which case seed is ignored. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -1152,6 +1161,7 @@ class _ContainerWithRandom(ContainerBase):
             self,
             axis,
             seed=seed,
+            rng=rng,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
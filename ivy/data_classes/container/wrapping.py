@@ -35,7 +35,12 @@ def _wrap_function(function_name: str, static: bool) -> Callable:
         **kwargs
     ):
         function = ivy.__dict__[function_name]
-        data_idx = function.array_spec[0]
+        try:
+            data_idx = function.array_spec[0]
+        except AttributeError:
+            # the array specs are deferred in lazy import mode
+            ivy._load_deferred_modules()
+            data_idx = function.array_spec[0]
         if (
             not (data_idx[0][0] == 0 and len(data_idx[0]) == 1)
             and args
@@ -2,12 +2,22 @@
 import abc
 from typing import List
 
+import numpy as np
+
 # local
 import ivy
 
 
 class NestedArrayBase(abc.ABC):
-    """Base class for nested array objects."""
+    """
+    Base class for nested array objects.
+
+    A nested array is stored either as a list of independent arrays, or packed as a
+    single flat values buffer holding the arrays concatenated along their first
+    dimension, with the offsets of each array in it. Packed nested arrays can only be
+    ragged along that dimension, but elementwise operations run once on the values
+    and reductions along the ragged dimension are segment reductions.
+    """
 
     def __init__(self, data, dtype, device, internal=False):
         if not internal:
@@ -17,15 +27,43 @@ class NestedArrayBase(abc.ABC):
                 "Please use one of the factory methods instead"
             )
         self._data = data
+        self._values = None
+        self._offsets = None
+        self._row_splits = None
+        self._row_ids = None
         self._shape = self._generate_shape()
         self._dtype = dtype
         self._device = device
         self._pre_repr = "ivy."
 
+    @classmethod
+    def _from_packed(cls, values, offsets, row_splits=None):
+        """
+        Construct a packed nested array from its flat values and the offsets of each
+        of its arrays in them, which start at zero and end at the length of values.
+        """
+        ret = cls.__new__(cls)
+        ret._data = None
+        ret._values = values
+        ret._offsets = ivy.astype(offsets, "int64", copy=False)
+        if row_splits is None:
+            row_splits = ivy.to_numpy(ret._offsets).tolist()
+        ret._row_splits = row_splits
+        ret._row_ids = None
+        ret._shape = ret._generate_shape()
+        ret._dtype = values.dtype
+        ret._device = values.device
+        ret._pre_repr = "ivy."
+        return ret
+
     @classmethod
     def nested_array(cls, data, dtype=None, device=None):
-        dtype = ivy.default_dtype(dtype=dtype, item=data)
-        device = ivy.default_device(device, item=data)
+        if isinstance(data, cls):
+            dtype = data.dtype if dtype is None else ivy.as_ivy_dtype(dtype)
+            device = data.device if device is None else ivy.as_ivy_dev(device)
+        else:
+            dtype = ivy.default_dtype(dtype=dtype, item=data)
+            device = ivy.default_device(device, item=data)
         if ivy.is_ivy_array(data):
             data = [data]
         elif isinstance(data, (list, tuple)):
@@ -33,86 +71,243 @@ class NestedArrayBase(abc.ABC):
         elif ivy.is_native_array(data):
             data = [ivy.to_ivy(data)]
         elif isinstance(data, cls):
-            data = data._data
+            if data.is_packed:
+                values = ivy.astype(data.values, dtype, copy=False)
+                if values.device != device:
+                    values = ivy.to_device(values, device)
+                return cls._from_packed(values, data.offsets, data._row_splits)
+            data = data._list()
         else:
             raise TypeError(
                 "Input data must be ivy.Array, ivy.NativeArray"
                 " or a list of either, got: {}".format(type(data))
             )
+        data = list(data)
         for i in range(len(data)):
-            data[i] = ivy.astype(data[i], dtype)
-            data[i] = ivy.to_device(data[i], device)
+            # arrays which already have the dtype and device are used as they are
+            if data[i].dtype != dtype:
+                data[i] = ivy.astype(data[i], dtype)
+            if data[i].device != device:
+                data[i] = ivy.to_device(data[i], device)
         return cls(data, dtype, device, internal=True)
 
     def _generate_shape(
         self,
     ):
-        final_shape = [len(self._data)]
-        shapes = list()
-        ndims = list()
-        for arr in self._data:
-            shapes.append(arr.shape)
-            ndims.append(arr.ndim)
-        if ndims.count(ndims[0]) != len(ndims):
+        if self.is_packed:
+            lengths = np.diff(self._row_splits)
+            if len(lengths) and np.all(lengths == lengths[0]):
+                length = int(lengths[0])
+            else:
+                length = None
+            return [len(lengths), length] + list(self._values.shape[1:])
+        shapes = [tuple(arr.shape) for arr in self._data]
+        if len(set(len(shape) for shape in shapes)) != 1:
             raise RuntimeError(
                 "All arrays in a nested array must have the same number of dimensions."
             )
-        for i in range(ndims[0]):
-            same_shape = True
-            current_shape = shapes[0][i]
-            for j in range(final_shape[0]):
-                if shapes[j][i] != current_shape:
-                    same_shape = False
-                    break
-            if same_shape:
-                final_shape.append(current_shape)
-            else:
-                final_shape.append(None)
-        return final_shape
+        shapes = np.array(shapes, dtype=np.int64).reshape(len(shapes), -1)
+        same_shape = np.all(shapes == shapes[0], axis=0)
+        return [len(self._data)] + [
+            int(dim) if same else None for dim, same in zip(shapes[0], same_shape)
+        ]
+
+    def _list(self):
+        """Return the arrays of the nested array, which for a packed nested array are
+        slices of its values, computed the first time they're needed."""
+        if self._data is None:
+            splits = self._row_splits
+            self._data = [
+                self._values[start:stop] for start, stop in zip(splits[:-1], splits[1:])
+            ]
+        return self._data
+
+    def _segment_ids(self):
+        """Return the index of the array which each row of the values belongs to."""
+        if self._row_ids is None:
+            lengths = self._offsets[1:] - self._offsets[:-1]
+            self._row_ids = ivy.repeat(
+                ivy.arange(lengths.shape[0], dtype="int64"), lengths
+            )
+        return self._row_ids
 
     @staticmethod
     def nested_multi_map_in_static_method(fn_name, *args, **kwargs):
-        arg_nest_idxs = ivy.nested_argwhere(
-            args, ivy.is_ivy_nested_array, to_ignore=ivy.Container
-        )
-        kwarg_nest_idxs = ivy.nested_argwhere(
-            kwargs, ivy.is_ivy_nested_array, to_ignore=ivy.Container
-        )
-        # retrieve all the nested_array in args and kwargs
-        arg_nest = ivy.multi_index_nest(args, arg_nest_idxs)
-        kwarg_nest = ivy.multi_index_nest(kwargs, kwarg_nest_idxs)
-        num_nest = len(arg_nest) + len(kwarg_nest)
+        """
+        Apply the ivy function to the nested arrays in args and kwargs.
+
+        When all of the nested arrays are packed with the same offsets, the function
+        is applied once to their values. Otherwise it's applied to each of their
+        arrays in turn, with any other arguments passed to every call as they are.
+        """
+        nests = []
+
+        def _find(x):
+            if ivy.is_ivy_nested_array(x):
+                nests.append(x)
+            return x
+
+        ivy.nested_map([args, kwargs], _find, to_ignore=ivy.Container, shallow=False)
         fn = ivy.__dict__[fn_name]
+        if not nests:
+            return fn(*args, **kwargs)
 
-        if num_nest == 1:
+        def _replace(get):
             return ivy.nested_map(
-                fn,
+                [args, kwargs],
+                lambda x: get(x) if ivy.is_ivy_nested_array(x) else x,
+                to_ignore=ivy.Container,
+                shallow=False,
             )
 
+        first = nests[0]
+        if all(
+            nest.is_packed
+            and (
+                nest._offsets is first._offsets or nest._row_splits == first._row_splits
+            )
+            for nest in nests
+        ):
+            fn_args, fn_kwargs = _replace(lambda x: x._values)
+            return ivy.NestedArray._from_packed(
+                fn(*fn_args, **fn_kwargs), first._offsets, first._row_splits
+            )
+        ret = []
+        for i in range(first.shape[0]):
+            fn_args, fn_kwargs = _replace(lambda x: x._list()[i])
+            ret.append(fn(*fn_args, **fn_kwargs))
+        return ivy.NestedArray.nested_array(ret)
+
     def unbind(self):
-        return tuple(ivy.copy_nest(self._data))
+        return tuple(ivy.copy_nest(self._list()))
 
     def reshape(self, shape):
         assert shape[0] == self._shape[0], "batch dimension is not changeable"
+        data = self._list()
         for i in range(0, shape[0]):
             new_shape = list()
             for j in range(1, len(shape)):
                 if shape[j] == -1:
-                    new_shape.append(self._data[i].shape[j - 1])
+                    new_shape.append(data[i].shape[j - 1])
                 else:
                     new_shape.append(shape[j])
-            self._data[i] = self._data[i].reshape(new_shape)
-            print(self._data[i].shape)
+            data[i] = data[i].reshape(new_shape)
+        # the arrays may no longer be ragged along their first dimension only
+        self._values = None
+        self._offsets = None
+        self._row_splits = None
+        self._row_ids = None
         self._shape = self._generate_shape()
         return self
 
+    def pack(self):
+        """
+        Pack the arrays into a single flat values buffer.
+
+        Returns
+        -------
+        ret
+            the packed nested array, which is self if it's already packed.
+        """
+        if self.is_packed:
+            return self
+        data = self._list()
+        ivy.utils.assertions.check_true(
+            all(dim is not None for dim in self._shape[2:]),
+            message=(
+                "only nested arrays ragged along their first dimension can be packed"
+            ),
+        )
+        row_splits = np.cumsum([0] + [arr.shape[0] for arr in data]).tolist()
+        ret = self._from_packed(
+            ivy.concat(data, axis=0),
+            ivy.array(row_splits, dtype="int64", device=self._device),
+            row_splits,
+        )
+        return ret
+
+    def to_padded(self, padding_value=0, *, return_mask=False):
+        """
+        Convert the nested array to a dense array, padding each array along its
+        first dimension to the length of the longest.
+
+        Parameters
+        ----------
+        padding_value
+            value of the padding elements.
+        return_mask
+            whether to also return a boolean mask of shape (batch, max_length),
+            which is True for the elements of the arrays and False for the padding.
+
+        Returns
+        -------
+        ret
+            the padded array, and the mask if return_mask is True.
+
+        Examples
+        --------
+        >>> x = ivy.NestedArray.from_row_lengths(ivy.array([1, 2, 3]), [2, 1])
+        >>> x.to_padded()
+        ivy.array([[1, 2],
+                   [3, 0]])
+        """
+        packed = self.pack()
+        lengths = packed._offsets[1:] - packed._offsets[:-1]
+        max_length = int(max(np.diff(packed._row_splits), default=0))
+        row_ids = packed._segment_ids()
+        if ivy.is_float_dtype(packed._values) and isinstance(padding_value, int):
+            padding_value = float(padding_value)
+        positions = ivy.arange(packed._values.shape[0], dtype="int64") - ivy.gather(
+            packed._offsets, row_ids
+        )
+        padded = ivy.full(
+            [packed._shape[0], max_length] + list(packed._values.shape[1:]),
+            padding_value,
+            dtype=packed._values.dtype,
+            device=packed._device,
+        )
+        padded = ivy.scatter_nd(
+            ivy.stack([row_ids, positions], axis=-1),
+            packed._values,
+            reduction="replace",
+            out=padded,
+        )
+        if not return_mask:
+            return padded
+        mask = ivy.less(
+            ivy.expand_dims(ivy.arange(max_length, dtype="int64"), axis=0),
+            ivy.expand_dims(lengths, axis=-1),
+        )
+        return padded, mask
+
     # Properties #
     # ---------- #
 
     @property
-    def data(self) -> ivy.NativeArray:
-        """The native array being wrapped in self."""
-        return self._data
+    def data(self) -> List[ivy.Array]:
+        """The arrays held in the nested array."""
+        return self._list()
+
+    @property
+    def is_packed(self) -> bool:
+        """Whether the arrays are stored packed in a single flat values buffer."""
+        return self._values is not None
+
+    @property
+    def values(self) -> ivy.Array:
+        """The arrays concatenated along their first dimension."""
+        return self.pack()._values
+
+    @property
+    def offsets(self) -> ivy.Array:
+        """The offset of each array in the values, followed by their length."""
+        return self.pack()._offsets
+
+    @property
+    def row_lengths(self) -> ivy.Array:
+        """The length of each array along its first dimension."""
+        offsets = self.offsets
+        return offsets[1:] - offsets[:-1]
 
     @property
     def dtype(self) -> ivy.Dtype:
@@ -138,11 +333,16 @@ class NestedArrayBase(abc.ABC):
     # ----------#
 
     def __repr__(self):
+        data = self._list()
         arrays_repr = "\t"
         for i in range(self._shape[0] - 1):
-            arrays_repr += repr(self._data[i]) + "\n\t"
-        arrays_repr += repr(self._data[-1])
+            arrays_repr += repr(data[i]) + "\n\t"
+        arrays_repr += repr(data[-1])
         return self._pre_repr + self.__class__.__name__ + "([\n" + arrays_repr + "\n])"
 
     def __getitem__(self, query):
-        return self._data[query]
+        if self._data is None and isinstance(query, int):
+            # a single array is sliced from the values without splitting them all
+            query = range(self._shape[0])[query]
+            return self._values[self._row_splits[query] : self._row_splits[query + 1]]
+        return self._list()[query]
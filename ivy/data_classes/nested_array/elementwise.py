@@ -9,12 +9,120 @@ from .base import NestedArrayBase
 class NestedArrayElementwise(NestedArrayBase):
     @staticmethod
     def static_add(
-        x1: Union[NestedArrayBase, ivy.Array, ivy.NestedArray],
-        x2: Union[NestedArrayBase, ivy.Array, ivy.NestedArray],
+        x1: Union[NestedArrayBase, ivy.Array],
+        x2: Union[NestedArrayBase, ivy.Array],
         /,
         *,
         alpha: Optional[Union[int, float]] = None,
         out: Optional[ivy.Array] = None,
     ) -> NestedArrayBase:
-        pass
-        # return self._elementwise_op(other, ivy.add)
+        """
+        ivy.NestedArray static method variant of ivy.add. Packed nested arrays with
+        the same offsets are added with a single call on their values.
+
+        Examples
+        --------
+        >>> x = ivy.NestedArray.from_row_lengths(ivy.array([1., 2., 3.]), [2, 1])
+        >>> ivy.NestedArray.static_add(x, 1.).values
+        ivy.array([2., 3., 4.])
+        """
+        return NestedArrayBase.nested_multi_map_in_static_method(
+            "add", x1, x2, alpha=alpha, out=out
+        )
+
+    def add(self, x2, /, *, alpha=None, out=None):
+        return self.static_add(self, x2, alpha=alpha, out=out)
+
+    @staticmethod
+    def static_subtract(x1, x2, /, *, alpha=None, out=None):
+        """ivy.NestedArray static method variant of ivy.subtract."""
+        return NestedArrayBase.nested_multi_map_in_static_method(
+            "subtract", x1, x2, alpha=alpha, out=out
+        )
+
+    def subtract(self, x2, /, *, alpha=None, out=None):
+        return self.static_subtract(self, x2, alpha=alpha, out=out)
+
+    @staticmethod
+    def static_multiply(x1, x2, /, *, out=None):
+        """ivy.NestedArray static method variant of ivy.multiply."""
+        return NestedArrayBase.nested_multi_map_in_static_method(
+            "multiply", x1, x2, out=out
+        )
+
+    def multiply(self, x2, /, *, out=None):
+        return self.static_multiply(self, x2, out=out)
+
+    @staticmethod
+    def static_divide(x1, x2, /, *, out=None):
+        """ivy.NestedArray static method variant of ivy.divide."""
+        return NestedArrayBase.nested_multi_map_in_static_method(
+            "divide", x1, x2, out=out
+        )
+
+    def divide(self, x2, /, *, out=None):
+        return self.static_divide(self, x2, out=out)
+
+    @staticmethod
+    def static_pow(x1, x2, /, *, out=None):
+        """ivy.NestedArray static method variant of ivy.pow."""
+        return NestedArrayBase.nested_multi_map_in_static_method("pow", x1, x2, out=out)
+
+    def pow(self, x2, /, *, out=None):
+        return self.static_pow(self, x2, out=out)
+
+    def abs(self, *, out=None):
+        return NestedArrayBase.nested_multi_map_in_static_method("abs", self, out=out)
+
+    def negative(self, *, out=None):
+        return NestedArrayBase.nested_multi_map_in_static_method(
+            "negative", self, out=out
+        )
+
+    def exp(self, *, out=None):
+        return NestedArrayBase.nested_multi_map_in_static_method("exp", self, out=out)
+
+    def log(self, *, out=None):
+        return NestedArrayBase.nested_multi_map_in_static_method("log", self, out=out)
+
+    def sqrt(self, *, out=None):
+        return NestedArrayBase.nested_multi_map_in_static_method("sqrt", self, out=out)
+
+    # Built-ins #
+    # ----------#
+
+    def __add__(self, other):
+        return self.static_add(self, other)
+
+    def __radd__(self, other):
+        return self.static_add(other, self)
+
+    def __sub__(self, other):
+        return self.static_subtract(self, other)
+
+    def __rsub__(self, other):
+        return self.static_subtract(other, self)
+
+    def __mul__(self, other):
+        return self.static_multiply(self, other)
+
+    def __rmul__(self, other):
+        return self.static_multiply(other, self)
+
+    def __truediv__(self, other):
+        return self.static_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return self.static_divide(other, self)
+
+    def __pow__(self, other):
+        return self.static_pow(self, other)
+
+    def __rpow__(self, other):
+        return self.static_pow(other, self)
+
+    def __neg__(self):
+        return self.negative()
+
+    def __abs__(self):
+        return self.abs()
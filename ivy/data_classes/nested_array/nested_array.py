@@ -1,22 +1,77 @@
 # local
+import ivy
 from .base import NestedArrayBase
+from .elementwise import NestedArrayElementwise
+from .statistical import NestedArrayStatistical
 
 
-class NestedArray(NestedArrayBase):
+class NestedArray(NestedArrayElementwise, NestedArrayStatistical, NestedArrayBase):
     def __init__(self, data, dtype, device, internal=False):
         NestedArrayBase.__init__(self, data, dtype, device, internal)
 
     @classmethod
     def from_row_lengths(cls, values, row_lengths):
-        ivy_arrays = list()
-        for i in range(len(row_lengths)):
-            ivy_arrays.append(values[: row_lengths[i]])
-            values = values[row_lengths[i] :]
-        return cls.nested_array(ivy_arrays)
+        """
+        Create a packed nested array from the flat values and the length of each of
+        its arrays along their first dimension.
+
+        Examples
+        --------
+        >>> x = ivy.NestedArray.from_row_lengths(ivy.array([1, 2, 3]), [2, 1])
+        >>> x.shape
+        [2, None]
+        """
+        row_lengths = ivy.array(row_lengths, dtype="int64")
+        offsets = ivy.concat(
+            [ivy.zeros((1,), dtype="int64"), ivy.cumsum(row_lengths)], axis=0
+        )
+        return cls.from_row_splits(values, offsets)
 
     @classmethod
     def from_row_splits(cls, values, row_split):
-        row_lengths = list()
-        for i in range(1, len(row_split)):
-            row_lengths.append(row_split[i] - row_split[i - 1])
-        return cls.from_row_lengths(values, row_lengths)
+        """
+        Create a packed nested array from the flat values and the offset of each of
+        its arrays in them, followed by the length of values.
+        """
+        values = ivy.array(values)
+        offsets = ivy.array(row_split, dtype="int64")
+        row_splits = ivy.to_numpy(offsets).tolist()
+        if not row_splits or row_splits[0] != 0 or row_splits[-1] != values.shape[0]:
+            raise ivy.utils.exceptions.IvyException(
+                "row splits must start at zero and end at the length of values"
+            )
+        return cls._from_packed(values, offsets, row_splits)
+
+    @classmethod
+    def from_padded(cls, x, lengths):
+        """
+        Create a packed nested array from a dense array padded along its second
+        dimension, keeping the given number of leading elements of each row.
+
+        Parameters
+        ----------
+        x
+            padded array of shape (batch, max_length, *inner_shape).
+        lengths
+            number of elements of each row of x to keep.
+
+        Returns
+        -------
+        ret
+            the packed nested array.
+
+        Examples
+        --------
+        >>> x = ivy.array([[1, 2], [3, 0]])
+        >>> ivy.NestedArray.from_padded(x, [2, 1]).values
+        ivy.array([1, 2, 3])
+        """
+        x = ivy.array(x)
+        lengths = ivy.array(lengths, dtype="int64")
+        mask = ivy.less(
+            ivy.expand_dims(ivy.arange(x.shape[1], dtype="int64"), axis=0),
+            ivy.expand_dims(lengths, axis=-1),
+        )
+        # the nonzero coordinates of the mask are ordered by row, then position
+        values = ivy.gather_nd(x, ivy.stack(ivy.nonzero(mask), axis=-1))
+        return cls.from_row_lengths(values, lengths)
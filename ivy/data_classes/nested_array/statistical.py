@@ -0,0 +1,155 @@
+# global
+from typing import Optional
+
+# local
+import ivy
+from .base import NestedArrayBase
+
+
+class NestedArrayStatistical(NestedArrayBase):
+    def _reduce(self, fn_name, axis, segment_reduce):
+        """
+        Reduce the nested array along the axis with the ivy function.
+
+        Reducing all of the elements, or the dimensions following the ragged one,
+        reduces the packed values directly. Reducing the ragged dimension is a
+        segment reduction of the values, giving a dense array of shape
+        (batch, *inner_shape), unless the arrays are also ragged along their other
+        dimensions.
+        """
+        fn = ivy.__dict__[fn_name]
+        if axis is None:
+            if self.is_packed:
+                return fn(self._values)
+            return fn(ivy.concat([ivy.reshape(x, (-1,)) for x in self._list()]))
+        axis = axis % self.ndim
+        if axis == 0:
+            raise ivy.utils.exceptions.IvyException(
+                "nested arrays can't be reduced along their batch dimension"
+            )
+        if axis > 1:
+            return NestedArrayBase.nested_multi_map_in_static_method(
+                fn_name, self, axis=axis - 1
+            )
+        if not self.is_packed and any(dim is None for dim in self._shape[2:]):
+            # the reductions are themselves ragged
+            return ivy.NestedArray.nested_array([fn(x, axis=0) for x in self._list()])
+        packed = self.pack()
+        return segment_reduce(packed._values, packed._segment_ids(), packed._shape[0])
+
+    def sum(self, *, axis: Optional[int] = None) -> ivy.Array:
+        """
+        Sum the elements of the nested array.
+
+        Parameters
+        ----------
+        axis
+            axis to reduce, or None to sum all of the elements. Reducing axis 1
+            sums each array along its ragged dimension.
+
+        Returns
+        -------
+        ret
+            the sums, as a dense array unless the reduced axis follows the ragged
+            one, in which case the result is a nested array.
+
+        Examples
+        --------
+        >>> x = ivy.NestedArray.from_row_lengths(ivy.array([1., 2., 3.]), [2, 1])
+        >>> x.sum(axis=1)
+        ivy.array([3., 3.])
+        """
+        return self._reduce("sum", axis, _segment_sum)
+
+    def mean(self, *, axis: Optional[int] = None) -> ivy.Array:
+        """
+        Compute the mean of the elements of the nested array.
+
+        Parameters
+        ----------
+        axis
+            axis to reduce, or None to average all of the elements.
+
+        Returns
+        -------
+        ret
+            the means, as for :meth:`NestedArray.sum`.
+        """
+
+        def _segment_mean(values, segment_ids, num_segments):
+            sums = _segment_sum(values, segment_ids, num_segments)
+            lengths = _segment_sum(
+                ivy.ones_like(segment_ids, dtype=sums.dtype), segment_ids, num_segments
+            )
+            return ivy.divide(
+                sums, ivy.reshape(lengths, (-1,) + (1,) * (len(sums.shape) - 1))
+            )
+
+        return self._reduce("mean", axis, _segment_mean)
+
+    def max(self, *, axis: Optional[int] = None) -> ivy.Array:
+        """
+        Compute the maximum of the elements of the nested array.
+
+        Parameters
+        ----------
+        axis
+            axis to reduce, or None to reduce all of the elements.
+
+        Returns
+        -------
+        ret
+            the maxima, as for :meth:`NestedArray.sum`. Empty arrays reduce to the
+            lowest value of the dtype.
+        """
+        return self._reduce(
+            "max",
+            axis,
+            lambda *args: _segment_extremum(*args, reduction="max"),
+        )
+
+    def min(self, *, axis: Optional[int] = None) -> ivy.Array:
+        """
+        Compute the minimum of the elements of the nested array.
+
+        Parameters
+        ----------
+        axis
+            axis to reduce, or None to reduce all of the elements.
+
+        Returns
+        -------
+        ret
+            the minima, as for :meth:`NestedArray.sum`. Empty arrays reduce to the
+            highest value of the dtype.
+        """
+        return self._reduce(
+            "min",
+            axis,
+            lambda *args: _segment_extremum(*args, reduction="min"),
+        )
+
+
+def _segment_sum(values, segment_ids, num_segments):
+    out = ivy.zeros(
+        (num_segments,) + tuple(values.shape[1:]),
+        dtype=values.dtype,
+        device=values.device,
+    )
+    return ivy.scatter_nd(
+        ivy.expand_dims(segment_ids, axis=-1), values, reduction="sum", out=out
+    )
+
+
+def _segment_extremum(values, segment_ids, num_segments, reduction):
+    info = (ivy.finfo if ivy.is_float_dtype(values) else ivy.iinfo)(values.dtype)
+    fill_value = info.min if reduction == "max" else info.max
+    out = ivy.full(
+        (num_segments,) + tuple(values.shape[1:]),
+        fill_value,
+        dtype=values.dtype,
+        device=values.device,
+    )
+    return ivy.scatter_nd(
+        ivy.expand_dims(segment_ids, axis=-1), values, reduction=reduction, out=out
+    )
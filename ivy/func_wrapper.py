@@ -4,7 +4,6 @@ import functools
 import logging
 import weakref
 import warnings
-import copy as python_copy
 from types import FunctionType
 from typing import Callable
 import inspect
@@ -236,20 +235,24 @@ def _get_first_array(*args, **kwargs):
 
 
 def _build_view(original, view, fn, args, kwargs, index=None):
+    from ivy.data_classes.array.views import FUNCTIONAL_BACKENDS, ViewArray
+
     if ivy.exists(original._base):
-        if ivy.backend in ("jax", "tensorflow"):
-            warnings.warn(
-                "Creating many views will lead to overhead "
-                "when performing inplace updates with this backend"
-            )
         base = original._base
-        view._base = base
-        view._manipulation_stack = python_copy.copy(original._manipulation_stack)
+        manipulation_stack = original._manipulation_stack
     else:
         base = original
-        view._base = base
+        manipulation_stack = ()
+    if ivy.backend in FUNCTIONAL_BACKENDS:
+        # the view is a copy on these backends, which is refreshed from its base
+        # lazily after inplace updates
+        view = ViewArray._from_native(view.data, view.dynamic_backend)
+    view._base = base
+    view._manipulation_stack = manipulation_stack + ((fn, args[1:], kwargs, index),)
+    # the view bookkeeping is only stored on arrays once they're part of a view
+    if not isinstance(base._view_refs, list):
+        base._view_refs = []
     base._view_refs.append(weakref.ref(view))
-    view._manipulation_stack.append((fn, args[1:], kwargs, index))
 
     # Handle attributes for torch functions without native view functionality
     if ivy.exists(original._torch_base):
@@ -262,6 +265,8 @@ def _build_view(original, view, fn, args, kwargs, index=None):
         view._torch_base = base
     if fn in _torch_non_native_view_functions:
         view._torch_manipulation = (original, (fn, args[1:], kwargs))
+        if not isinstance(view._torch_base._torch_view_refs, list):
+            view._torch_base._torch_view_refs = []
         view._torch_base._torch_view_refs.append(weakref.ref(view))
     return view
 
@@ -543,6 +548,9 @@ def outputs_to_ivy_arrays(fn: Callable) -> Callable:
         """
         # call unmodified function
         ret = fn(*args, **kwargs)
+        # fast path for the common case of a single native array being returned
+        if isinstance(ret, ivy.NativeArray) and ivy.array_mode:
+            return ivy.Array._from_native(ret)
         # convert all arrays in the return to `ivy.Array` instances
         return (
             ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
@@ -636,7 +644,9 @@ def handle_view(fn: Callable) -> Callable:
     the first arg is a view, then the returned array copies its base and
     manipulation stack, appends the new operation to the manipulation
     stack and appends its reference to the base array's view_refs
-    attribute.
+    attribute. On functional backends the returned array is a ViewArray,
+    which is only refreshed from its base when it's read after the base
+    was updated inplace.
     """
 
     @functools.wraps(fn)
@@ -646,8 +656,10 @@ def handle_view(fn: Callable) -> Callable:
             return ret
         original = args[0]
         if isinstance(ret, (list, tuple)):
-            for i, view in enumerate(ret):
-                ret[i] = _build_view(original, view, fn.__name__, args, kwargs, i)
+            ret = type(ret)(
+                _build_view(original, view, fn.__name__, args, kwargs, i)
+                for i, view in enumerate(ret)
+            )
         else:
             ret = _build_view(original, ret, fn.__name__, args, kwargs, None)
         return ret
@@ -897,7 +909,7 @@ def handle_out_argument(fn: Callable) -> Callable:
 
 
 def _update_torch_views(x, visited_view=None):
-    if x._torch_view_refs != []:
+    if x._torch_view_refs:
         _update_torch_references(x, visited_view)
     if ivy.exists(x._torch_manipulation):
         parent_tensor, fn_args_kwargs = x._torch_manipulation
@@ -921,7 +933,7 @@ def _update_torch_references(x, visited_view=None):
             fn, args, kwargs = fn_args_kwargs
             kwargs["copy"] = True
             view.data[()] = ivy.__dict__[fn](parent_tensor, *args, **kwargs).data
-            if view._torch_view_refs != []:
+            if view._torch_view_refs:
                 _update_torch_references(view)
 
 
@@ -1037,6 +1049,17 @@ def _wrap_function(
         mixed_fn = hasattr(original, "mixed_backend_wrappers") and original != to_wrap
         partial_mixed = mixed_fn and hasattr(to_wrap, "partial_mixed_handler")
         add_wrappers, skip_wrappers = [], []
+
+        # the functions are only instrumented while tracing, at no cost otherwise
+        from ivy.utils.profiler import active_tracer
+
+        tracer = active_tracer()
+        if tracer is not None and not (
+            tracer.traces(key) and any(hasattr(original, a) for a in FN_DECORATORS)
+        ):
+            tracer = None
+        if tracer is not None and to_wrap is not original:
+            to_wrap = tracer.wrap_kernel(key, to_wrap)
         if mixed_fn:
             backend_wrappers = getattr(original, "mixed_backend_wrappers")
             add_wrappers = backend_wrappers.get("to_add")
@@ -1070,6 +1093,8 @@ def _wrap_function(
                 if hasattr(to_wrap.compos, attr):
                     to_wrap.compos = to_wrap.compos.__wrapped__
             to_wrap.compos.__dict__["array_spec"] = array_spec
+        if tracer is not None:
+            to_wrap = tracer.wrap_call(key, to_wrap)
     return to_wrap
 
 
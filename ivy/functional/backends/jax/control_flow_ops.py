@@ -1,5 +1,7 @@
 import jax
 
+from ivy.utils.exceptions import is_tracer_error
+
 
 def if_else(cond, body_fn, orelse_fn, vars):
     # back-compatibility
@@ -22,6 +24,15 @@ def while_loop(test_fn, body_fn, vars):
     def test_fn_wrapper(loop_vars):
         return test_fn(*loop_vars)
 
+    leaves = jax.tree_util.tree_leaves(vars)
+    if leaves and all(isinstance(x, jax.Array) for x in leaves):
+        # the loop is traced and runs natively, unless the functions need concrete
+        # values, in which case it runs in python
+        try:
+            return jax.lax.while_loop(test_fn_wrapper, body_fn_wrapper, tuple(vars))
+        except Exception as e:
+            if not is_tracer_error(e):
+                raise
     with jax.disable_jit():
         final_loop_vars = jax.lax.while_loop(test_fn_wrapper, body_fn_wrapper, vars)
     return final_loop_vars
@@ -1,4 +1,7 @@
 import logging
+import jax.numpy as jnp
+from jax.experimental import sparse as jsparse
+
 import ivy
 from ivy.functional.ivy.experimental.sparse_array import (
     _is_valid_format,
@@ -86,6 +89,13 @@ def native_sparse_array(
     return None
 
 
+def sparse_dense_matmul(coordinates, values, dense_shape, x):
+    """Multiply the sparse matrix holding values at coordinates by a dense array."""
+    dtype = jnp.promote_types(values.dtype, x.dtype)
+    sparse = jsparse.BCOO((values.astype(dtype), coordinates), shape=dense_shape)
+    return sparse @ x.astype(dtype)
+
+
 def native_sparse_array_to_indices_values_and_shape(x):
     logging.warning(
         "Jax does not support sparse array natively, None is returned for        "
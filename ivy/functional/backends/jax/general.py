@@ -15,6 +15,7 @@ import importlib
 # local
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
+from ivy.data_classes.array.views import _mark_views_stale, _view_index
 from ivy.functional.backends.jax.device import _to_device, _to_array
 from ivy.functional.backends.jax import JaxArray, NativeArray
 from . import backend_version
@@ -228,41 +229,19 @@ def inplace_update(
             # Handle view updates
             if ivy.exists(x._base):
                 base = x._base
-                base_idx = ivy.arange(base.size).reshape(base.shape)
-                for fn, args, kwargs, index in x._manipulation_stack:
-                    kwargs["copy"] = True
-                    base_idx = ivy.__dict__[fn](base_idx, *args, **kwargs)
-                    base_idx = base_idx[index] if ivy.exists(index) else base_idx
                 base_flat = base.data.flatten()
-                base_flat = base_flat.at[base_idx.data.flatten()].set(
+                base_flat = base_flat.at[_view_index(x).flatten()].set(
                     val_native.flatten()
                 )
-
                 base.data = base_flat.reshape(base.shape)
-
-                for ref in base._view_refs:
-                    view = ref()
-                    if ivy.exists(view) and view is not x:
-                        _update_view(view, base)
-
+                _mark_views_stale(base, x)
             else:
-                for ref in x._view_refs:
-                    view = ref()
-                    if ivy.exists(view):
-                        _update_view(view, x)
+                _mark_views_stale(x)
         return x
     else:
         return val
 
 
-def _update_view(view, base):
-    for fn, args, kwargs, index in view._manipulation_stack:
-        base = ivy.__dict__[fn](base, *args, **kwargs)
-        base = base[index] if ivy.exists(index) else base
-    view.data = base.data
-    return view
-
-
 def inplace_variables_supported():
     return False
 
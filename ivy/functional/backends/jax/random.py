@@ -177,6 +177,7 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
     if x.shape == ():
@@ -190,3 +191,6 @@ def shuffle(
     # jax.random.shuffle is deprecated; identical behaviour reproduced with
     # jax.random.permutation
     return jax.random.permutation(key=rng_input, x=x, axis=axis, independent=True)
+
+
+shuffle.partial_mixed_handler = lambda x, *args, **kwargs: kwargs.get("rng") is None
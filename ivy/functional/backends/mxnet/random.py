@@ -76,6 +76,10 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[Union[(None, mx.ndarray.NDArray)]] = None,
 ) -> Union[(None, mx.ndarray.NDArray)]:
     raise IvyNotImplementedException()
+
+
+shuffle.partial_mixed_handler = lambda x, *args, **kwargs: kwargs.get("rng") is None
@@ -132,6 +132,9 @@ invalid_complex_dtypes = _dtype_from_version(invalid_complex_dtypes, backend_ver
 
 native_inplace_support = False
 
+# python scalars keep the dtype of the arrays they're combined with since numpy 2
+native_weak_scalars = int(np.__version__.split(".")[0]) >= 2
+
 supports_gradients = False
 
 
@@ -52,7 +52,7 @@ def add(
     alpha: Optional[Union[int, float]] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=alpha in (1, None))
     if alpha not in (1, None):
         with ivy.ArrayMode(False):
             x2 = multiply(x2, alpha)
@@ -257,7 +257,7 @@ def equal(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=True)
     return np.equal(x1, x2, out=out)
 
 
@@ -352,7 +352,7 @@ def greater(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=True)
     return np.greater(x1, x2, out=out)
 
 
@@ -367,7 +367,7 @@ def greater_equal(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=True)
     return np.greater_equal(x1, x2, out=out)
 
 
@@ -435,7 +435,7 @@ def less(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=True)
     return np.less(x1, x2, out=out)
 
 
@@ -450,7 +450,7 @@ def less_equal(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=True)
     return np.less_equal(x1, x2, out=out)
 
 
@@ -564,7 +564,7 @@ def multiply(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=True)
     return np.multiply(x1, x2, out=out)
 
 
@@ -589,7 +589,7 @@ def not_equal(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=True)
     return np.not_equal(x1, x2, out=out)
 
 
@@ -721,7 +721,7 @@ def subtract(
     alpha: Optional[Union[int, float]] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2, weak_scalars=alpha in (1, None))
     if alpha not in (1, None):
         ivy.set_array_mode(False)
         x2 = multiply(x2, alpha)
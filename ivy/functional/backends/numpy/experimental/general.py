@@ -5,6 +5,17 @@ import numpy as np
 # local
 from . import backend_version
 from ivy import with_unsupported_dtypes
+from ivy.functional.ivy.experimental.general import _native_reduction_name
+
+
+_UFUNCS = {
+    "add": np.add,
+    "multiply": np.multiply,
+    "maximum": np.maximum,
+    "minimum": np.minimum,
+    "logical_and": np.logical_and,
+    "logical_or": np.logical_or,
+}
 
 
 @with_unsupported_dtypes({"1.24.3 and below": ("complex",)}, backend_version)
@@ -22,10 +33,20 @@ def reduce(
         if isinstance(axes, int)
         else tuple(axes) if isinstance(axes, list) else axes
     )
-    reduced_func = np.frompyfunc(computation, 2, 1).reduce
+    ufunc = _UFUNCS[_native_reduction_name(computation)]
     op_dtype = operand.dtype
-    for axis in axes:
-        operand = reduced_func(operand, axis=axis, initial=init_value, keepdims=True)
+    # the axes are reduced in the same order as in the compositional implementation
+    for axis in sorted([axis % operand.ndim for axis in axes], reverse=True):
+        if operand.shape[axis] == 0:
+            shape = operand.shape[:axis] + (1,) + operand.shape[axis + 1 :]
+            operand = np.full(shape, init_value)
+        else:
+            operand = ufunc(init_value, ufunc.reduce(operand, axis=axis, keepdims=True))
     if not keepdims:
         operand = np.squeeze(operand, axis=axes)
     return operand.astype(op_dtype)
+
+
+reduce.partial_mixed_handler = lambda operand, init_value, computation, **kwargs: (
+    _native_reduction_name(computation) is not None
+)
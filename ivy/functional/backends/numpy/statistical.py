@@ -7,6 +7,7 @@ from typing import Union, Optional, Sequence, Tuple
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
+from ivy.utils.einsum_path import contract
 from . import backend_version
 
 
@@ -373,7 +374,17 @@ def __get_index(lst, indices=None, prefix=None):
 def einsum(
     equation: str, *operands: np.ndarray, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    return np.einsum(equation, *operands, out=out)
+    if out is not None:
+        return np.einsum(equation, *operands, out=out)
+    return contract(
+        equation,
+        *operands,
+        transpose=np.transpose,
+        reshape=np.reshape,
+        matmul=np.matmul,
+        multiply=np.multiply,
+        einsum=np.einsum,
+    )
 
 
 einsum.support_native_out = True
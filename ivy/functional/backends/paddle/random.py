@@ -139,6 +139,7 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[paddle.Tensor] = None,
 ) -> paddle.Tensor:
     if seed:
@@ -160,3 +161,6 @@ def shuffle(
             return paddle.complex(shuffled_real, shuffled_imag)
         return paddle.index_select(x.cast("float32"), indices).cast(x.dtype)
     return paddle.index_select(x, indices)
+
+
+shuffle.partial_mixed_handler = lambda x, *args, **kwargs: kwargs.get("rng") is None
@@ -148,6 +148,8 @@ invalid_complex_dtypes = _dtype_from_version(invalid_complex_dtypes, backend_ver
 
 native_inplace_support = False
 
+native_weak_scalars = False
+
 supports_gradients = True
 
 
@@ -613,6 +613,7 @@ def dropout(
     training: bool = True,
     seed: Optional[int] = None,
     noise_shape: Optional[Sequence[int]] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     x = ivy.astype(x, dtype) if dtype else x
@@ -621,6 +622,9 @@ def dropout(
     return res
 
 
+dropout.partial_mixed_handler = lambda x, prob, **kwargs: kwargs.get("rng") is None
+
+
 def dropout1d(
     x: Union[tf.Tensor, tf.Variable],
     prob: float,
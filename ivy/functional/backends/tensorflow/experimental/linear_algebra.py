@@ -1,12 +1,12 @@
 from typing import Union, Optional, Tuple, List, Sequence
 import tensorflow as tf
-from functools import reduce as _reduce
 
 import ivy
 
 from ivy.functional.ivy.experimental.linear_algebra import _check_valid_dimension_size
 
 from ivy.func_wrapper import with_unsupported_dtypes, with_supported_dtypes
+from ivy.utils.einsum_path import multi_dot as _multi_dot
 from .. import backend_version
 
 
@@ -142,12 +142,12 @@ def multi_dot(
     *,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> tf.Tensor:
-    # This implementation simply chains tf.tensordot multiple times
+    # the matrices are multiplied in the order with the fewest operations, as
+    # np.linalg.multi_dot and torch.linalg.multi_dot do
     # TODO: reimplement this function once tf adds multi_dot or inplace updates
     if len(x) < 2:
         raise ValueError("Expecting at least two tensors.")
-    dot_out = _reduce(tf.matmul, x)
-    return dot_out
+    return _multi_dot(x, matmul=tf.matmul)
 
 
 def cond(
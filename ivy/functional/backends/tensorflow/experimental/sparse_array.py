@@ -54,13 +54,10 @@ def native_sparse_array(
             values,
             dense_shape,
         )
-        all_coordinates = []
-        for i in range(values.shape[0]):
-            coordinate = ivy.gather(coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
         return tf.SparseTensor(
-            indices=all_coordinates, values=values, dense_shape=dense_shape
+            indices=tf.transpose(tf.cast(coo_indices, tf.int64)),
+            values=values,
+            dense_shape=dense_shape,
         )
     elif format == "csr":
         _verify_csr_components(
@@ -102,3 +99,18 @@ def native_sparse_array_to_indices_values_and_shape(x):
     if isinstance(x, tf.SparseTensor):
         return {"coo_indices": x.indices}, x.values, x.dense_shape
     raise ivy.utils.exceptions.IvyException("not a SparseTensor")
+
+
+def sparse_dense_matmul(coordinates, values, dense_shape, x):
+    """Multiply the sparse matrix holding values at coordinates by a dense array."""
+    dtype = ivy.as_native_dtype(ivy.promote_types(values.dtype, x.dtype))
+    sparse = tf.sparse.reorder(
+        tf.SparseTensor(
+            indices=tf.cast(coordinates, tf.int64),
+            values=tf.cast(values, dtype),
+            dense_shape=dense_shape,
+        )
+    )
+    x_2d = tf.cast(x if len(x.shape) == 2 else tf.expand_dims(x, -1), dtype)
+    ret = tf.sparse.sparse_dense_matmul(sparse, x_2d)
+    return tf.reshape(ret, (dense_shape[0],) + tuple(x.shape[1:]))
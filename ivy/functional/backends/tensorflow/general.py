@@ -17,6 +17,7 @@ import ivy
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.functional.ivy.general import _parse_ellipsis, _parse_index
 from ivy.func_wrapper import with_unsupported_dtypes
+from ivy.data_classes.array.views import _mark_views_stale, _view_index
 from . import backend_version
 
 
@@ -201,28 +202,16 @@ def inplace_update(
             # Handle view updates
             if ivy.exists(x._base):
                 base = x._base
-                base_idx = ivy.arange(base.size).reshape(base.shape)
-                for fn, args, kwargs, index in x._manipulation_stack:
-                    kwargs["copy"] = True
-                    base_idx = ivy.__dict__[fn](base_idx, *args, **kwargs)
-                    base_idx = base_idx[index] if ivy.exists(index) else base_idx
                 base_flat = tf.reshape(base.data, -1)
                 base_flat = tf.tensor_scatter_nd_update(
                     base_flat,
-                    tf.reshape(base_idx.data, (-1, 1)),
+                    tf.reshape(_view_index(x), (-1, 1)),
                     tf.reshape(val_native, -1),
                 )
-
                 base.data = tf.reshape(base_flat, base.shape)
-                for ref in base._view_refs:
-                    view = ref()
-                    if ivy.exists(view) and view is not x:
-                        _update_view(view, base)
+                _mark_views_stale(base, x)
             else:
-                for ref in x._view_refs:
-                    view = ref()
-                    if ivy.exists(view):
-                        _update_view(view, x)
+                _mark_views_stale(x)
         else:
             x = ivy.to_ivy(x_native)
         return x
@@ -230,14 +219,6 @@ def inplace_update(
         return val
 
 
-def _update_view(view, base):
-    for fn, args, kwargs, index in view._manipulation_stack:
-        base = ivy.__dict__[fn](base, *args, **kwargs)
-        base = base[index] if ivy.exists(index) else base
-    view.data = base.data
-    return view
-
-
 def inplace_variables_supported():
     return True
 
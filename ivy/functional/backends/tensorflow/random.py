@@ -161,8 +161,12 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     if seed:
         tf.random.set_seed(seed)
     return tf.random.shuffle(x, seed=seed)
+
+
+shuffle.partial_mixed_handler = lambda x, *args, **kwargs: kwargs.get("rng") is None
@@ -7,6 +7,7 @@ from typing import Union, Optional, Sequence, Tuple
 import ivy
 from ivy.functional.ivy.statistical import _get_promoted_type_of_operands
 from ivy.func_wrapper import with_unsupported_dtypes
+from ivy.utils.einsum_path import contract
 from . import backend_version
 
 # Array API Standard #
@@ -371,4 +372,13 @@ def einsum(
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     dtype = _get_promoted_type_of_operands(operands)
-    return tf.cast(tf.einsum(equation, *operands), dtype)
+    ret = contract(
+        equation,
+        *operands,
+        transpose=tf.transpose,
+        reshape=tf.reshape,
+        matmul=tf.linalg.matmul,
+        multiply=tf.multiply,
+        einsum=tf.einsum,
+    )
+    return tf.cast(ret, dtype)
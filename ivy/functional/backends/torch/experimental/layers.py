@@ -671,6 +671,7 @@ def dropout(
     training: bool = True,
     seed: Optional[int] = None,
     noise_shape: Optional[Sequence[int]] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     x = ivy.astype(x, dtype) if dtype else x
@@ -680,7 +681,9 @@ def dropout(
 
 
 dropout.partial_mixed_handler = lambda x, prob, **kwargs: (
-    kwargs.get("noise_shape") is None and kwargs.get("seed") is None
+    kwargs.get("noise_shape") is None
+    and kwargs.get("seed") is None
+    and kwargs.get("rng") is None
 )
 
 
@@ -15,8 +15,8 @@ def is_native_sparse_array(x):
         torch.sparse_coo,
         torch.sparse_csr,
         torch.sparse_csc,
+        torch.sparse_bsr,
         torch.sparse_bsc,
-        torch.sparse_csc,
     ]
 
 
@@ -110,8 +110,17 @@ def native_sparse_array_to_indices_values_and_shape(x):
         )
     elif x.layout == torch.sparse_bsc or x.layout == torch.sparse_csc:
         return (
-            {"ccol_indices": x.crow_indices(), "row_indices": x.col_indices()},
+            {"ccol_indices": x.ccol_indices(), "row_indices": x.row_indices()},
             x.values(),
             x.size(),
         )
     raise ivy.utils.exceptions.IvyException("not a sparse COO/CSR/CSC/BSC/BSR Tensor")
+
+
+def sparse_dense_matmul(coordinates, values, dense_shape, x):
+    """Multiply the sparse matrix holding values at coordinates by a dense array."""
+    dtype = torch.promote_types(values.dtype, x.dtype)
+    sparse = torch.sparse_coo_tensor(coordinates.T, values.to(dtype), dense_shape)
+    x_2d = x if x.dim() == 2 else x.unsqueeze(-1)
+    ret = torch.sparse.mm(sparse, x_2d.to(dtype))
+    return ret.reshape((dense_shape[0],) + tuple(x.shape[1:]))
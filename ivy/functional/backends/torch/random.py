@@ -127,6 +127,7 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     if len(x.shape) == 0:
@@ -138,3 +139,4 @@ def shuffle(
 
 
 shuffle.support_native_out = True
+shuffle.partial_mixed_handler = lambda x, *args, **kwargs: kwargs.get("rng") is None
@@ -8,6 +8,7 @@ import torch
 import ivy
 from ivy.functional.ivy.statistical import _get_promoted_type_of_operands
 from ivy.func_wrapper import with_unsupported_dtypes
+from ivy.utils.einsum_path import contract
 from . import backend_version
 
 # Array API Standard #
@@ -397,4 +398,13 @@ def einsum(
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     dtype = _get_promoted_type_of_operands(operands)
-    return ivy.astype(torch.einsum(equation, *operands), dtype, copy=False)
+    ret = contract(
+        equation,
+        *operands,
+        transpose=torch.permute,
+        reshape=torch.reshape,
+        matmul=torch.matmul,
+        multiply=torch.multiply,
+        einsum=torch.einsum,
+    )
+    return ivy.astype(ret, dtype, copy=False)
@@ -1,6 +1,34 @@
 # global
 import ivy
+from ivy.func_wrapper import frontend_outputs_to_ivy_arrays
 from ivy.functional.frontends.jax.func_wrapper import to_ivy_arrays_and_back
+from ivy.functional.ivy.control_flow_ops import _NATIVE_LOOPS
+from ivy.utils.exceptions import is_tracer_error
+
+# backends whose vmap is a native vectorizing transform rather than a python loop
+_NATIVE_VMAPS = ("jax", "torch")
+
+
+def _native_loop_fn(fn):
+    # the loop variables are kept as native arrays by the native loops, and are only
+    # wrapped as ivy arrays for each call of the frontend function
+    fn = frontend_outputs_to_ivy_arrays(fn)
+
+    def _fn(*args):
+        return ivy.to_native(fn(*ivy.to_ivy(args, nested=True)), nested=True)
+
+    return _fn
+
+
+def _stack_outputs(outputs):
+    first = outputs[0]
+    if isinstance(first, (list, tuple)):
+        return type(first)(
+            _stack_outputs([output[i] for output in outputs]) for i in range(len(first))
+        )
+    if isinstance(first, dict):
+        return {k: _stack_outputs([output[k] for output in outputs]) for k in first}
+    return ivy.stack(outputs)
 
 
 @to_ivy_arrays_and_back
@@ -19,7 +47,25 @@ def cond(pred, true_fun, false_fun, *operands, operand=None, linear=None):
 
 @to_ivy_arrays_and_back
 def map(f, xs):
-    return ivy.stack([f(x) for x in xs])
+    if ivy.is_array(xs):
+        if ivy.current_backend_str() in _NATIVE_VMAPS:
+            try:
+                return ivy.to_ivy(
+                    ivy.vmap(frontend_outputs_to_ivy_arrays(f))(xs), nested=True
+                )
+            except Exception as e:
+                if not is_tracer_error(e):
+                    raise
+                # f can't be vectorized, so it is mapped over xs in a loop instead
+        return _stack_outputs([f(x) for x in xs])
+    # xs is a nest of arrays, sliced together along their leading axis
+    leaf = ivy.index_nest(xs, ivy.nested_argwhere(xs, ivy.is_array)[0])
+    return _stack_outputs(
+        [
+            f(ivy.nested_map(xs, lambda x: x[i], shallow=False))
+            for i in range(leaf.shape[0])
+        ]
+    )
 
 
 @to_ivy_arrays_and_back
@@ -42,6 +88,14 @@ def fori_loop(lower, upper, body_fun, init_val):
         raise ivy.exceptions.IvyException(
             "jax.lax.fori_loop: Argument body_fun should be callable."
         )
+    if ivy.current_backend_str() in _NATIVE_LOOPS:
+        body_fun = frontend_outputs_to_ivy_arrays(body_fun)
+        return ivy.for_loop(
+            range(lower, upper),
+            lambda i, val: (body_fun(i, val[0]),),
+            (init_val,),
+            native=True,
+        )[0]
     val = init_val
     for i in range(lower, upper):
         val = body_fun(i, val)
@@ -54,6 +108,18 @@ def while_loop(cond_fun, body_fun, init_val):
         raise ivy.exceptions.IvyException(
             "jax.lax.while_loop: Arguments body_fun and cond_fun should be callable."
         )
+    if ivy.current_backend_str() in _NATIVE_LOOPS:
+        body_fun = _native_loop_fn(body_fun)
+        return ivy.to_ivy(
+            ivy.while_loop(
+                _native_loop_fn(cond_fun),
+                lambda val: (body_fun(val),),
+                (ivy.to_native(init_val, nested=True),),
+            )[0],
+            nested=True,
+        )
+    # the condition is unwrapped so that its truth value is that of the array
+    cond_fun = frontend_outputs_to_ivy_arrays(cond_fun)
     val = init_val
     while cond_fun(val):
         val = body_fun(val)
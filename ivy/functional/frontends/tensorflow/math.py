@@ -7,6 +7,7 @@ from ivy.functional.frontends.tensorflow.func_wrapper import (
     handle_tf_dtype,
     to_ivy_dtype,
 )
+from ivy.functional.frontends.tensorflow.ragged import RaggedTensor
 
 
 @with_supported_dtypes(
@@ -310,11 +311,15 @@ def reduce_logsumexp(input_tensor, axis=None, keepdims=False, name="reduce_logsu
 
 @to_ivy_arrays_and_back
 def reduce_max(input_tensor, axis=None, keepdims=False, name="reduce_max"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("max", axis=axis, keepdims=keepdims)
     return ivy.max(input_tensor, axis=axis, keepdims=keepdims)
 
 
 @to_ivy_arrays_and_back
 def reduce_mean(input_tensor, axis=None, keepdims=False, name="reduce_mean"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("mean", axis=axis, keepdims=keepdims)
     if ivy.exists(axis):
         axis = ivy.to_list(axis)
     return ivy.mean(input_tensor, axis=axis, keepdims=keepdims)
@@ -322,6 +327,8 @@ def reduce_mean(input_tensor, axis=None, keepdims=False, name="reduce_mean"):
 
 @to_ivy_arrays_and_back
 def reduce_min(input_tensor, axis=None, keepdims=False, name="reduce_min"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("min", axis=axis, keepdims=keepdims)
     return ivy.min(input_tensor, axis=axis, keepdims=keepdims)
 
 
@@ -339,6 +346,8 @@ def reduce_std(input_tensor, axis=None, keepdims=False, name="reduce_std"):
 
 @to_ivy_arrays_and_back
 def reduce_sum(input_tensor, axis=None, keepdims=False, name="reduce_sum"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("sum", axis=axis, keepdims=keepdims)
     input_tensor = ivy.array(input_tensor)
     return ivy.sum(input_tensor, axis=axis, keepdims=keepdims).astype(
         input_tensor.dtype
@@ -1 +1,2 @@
 from . import ragged
+from .ragged import RaggedTensor, row_splits_to_segment_ids, segment_ids_to_row_splits
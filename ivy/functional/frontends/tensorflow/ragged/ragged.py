@@ -1,14 +1,66 @@
+import numpy as np
+
 import ivy
+import ivy.functional.frontends.tensorflow as tf_frontend
+from ivy.functional.frontends.tensorflow.func_wrapper import (
+    _to_ivy_array,
+    to_ivy_arrays_and_back,
+    to_ivy_dtype,
+)
+
+
+def _to_values(values):
+    if isinstance(values, RaggedTensor):
+        return values
+    values = _to_ivy_array(values)
+    return values if isinstance(values, ivy.Array) else ivy.array(values)
+
+
+def _to_partition(x):
+    x = _to_ivy_array(x)
+    return ivy.astype(ivy.array(x), "int64", copy=False)
+
+
+def _nvals(values):
+    return values._nrows() if isinstance(values, RaggedTensor) else values.shape[0]
+
+
+def _row_splits_from_lengths(row_lengths):
+    return ivy.concat(
+        [ivy.zeros((1,), dtype="int64"), ivy.cumsum(row_lengths, dtype="int64")],
+        axis=0,
+    )
+
 
+def _segment_ids_to_row_splits(segment_ids, num_segments=None):
+    if num_segments is None:
+        num_segments = int(segment_ids[-1]) + 1 if segment_ids.shape[0] else 0
+    # the ids are sorted, so the rows start where the ids first reach them
+    return ivy.searchsorted(
+        segment_ids, ivy.arange(int(num_segments) + 1, dtype="int64")
+    )
 
-# TODO: Align behavior with tensorflow, modify so that the elements of the raggedTensor
-#  object are of type EagerTensor
-# ensure that the values and row_splits are of type EagerTensor too
-# add more initializer methods
+
+def _row_splits_to_segment_ids(row_splits):
+    nrows = row_splits.shape[0] - 1
+    return ivy.repeat(
+        ivy.arange(nrows, dtype="int64"), row_splits[1:] - row_splits[:-1]
+    )
 
 
 class RaggedTensor:
-    def __init__(self, values, row_partition, internal=False, data=None):
+    """
+    Tensor ragged along one or more of its dimensions.
+
+    The ragged tensor is stored as its values, concatenated along their first
+    dimension, which are either a tensor or another ragged tensor, and the row
+    splits of the outer dimension, holding the offset in the values of each of its
+    rows followed by the number of values. The rows are never materialized
+    separately, so that constructors, conversions and reductions are all vectorized
+    over the values.
+    """
+
+    def __init__(self, values, row_partition, internal=False):
         if not internal:
             raise ivy.utils.exceptions.IvyException(
                 "RaggedTensor constructor is private; please use one of the "
@@ -16,120 +68,379 @@ class RaggedTensor:
                 "(e.g., RaggedTensor.from_row_lengths())"
             )
         self._values = values
-        self.data = data
         self._row_partition = row_partition
+        self._host_row_splits = None
+        self._nested = None
+
+    # Factory Methods #
+    # --------------- #
 
     @classmethod
     def from_row_splits(cls, values, row_splits, name=None, validate=True):
-        # TODO : modify this, if necessary, to accept raggedTensor inputs too
-
-        if values.shape[0] != row_splits[-1] or row_splits[0] != 0:
-            if values.shape[0] != row_splits[-1]:
-                ivy.utils.exceptions.IvyException(
-                    "first dimension of shape of values should be equal to the"
-                    " last dimension of row_splits"
+        values = _to_values(values)
+        row_splits = _to_partition(row_splits)
+        if validate:
+            splits = ivy.to_numpy(row_splits)
+            if splits.ndim != 1 or splits.shape[0] == 0:
+                raise ivy.utils.exceptions.IvyException(
+                    "row_splits must be a non-empty vector"
                 )
-            else:
-                ivy.utils.exceptions.IvyException(
+            if splits[0] != 0:
+                raise ivy.utils.exceptions.IvyException(
                     "first value of row_splits should be equal to zero."
                 )
-        data = [
-            values[row_splits[i] : row_splits[i + 1], :]
-            for i in range(len(row_splits) - 1)
-        ]
+            if np.any(splits[1:] < splits[:-1]):
+                raise ivy.utils.exceptions.IvyException(
+                    "row_splits must be sorted in ascending order"
+                )
+            if splits[-1] != _nvals(values):
+                raise ivy.utils.exceptions.IvyException(
+                    "first dimension of shape of values should be equal to the"
+                    " last value of row_splits"
+                )
+        return cls(values=values, row_partition=row_splits, internal=True)
 
-        return cls(values=values, row_partition=row_splits, internal=True, data=data)
+    @classmethod
+    def from_row_lengths(cls, values, row_lengths, name=None, validate=True):
+        row_splits = _row_splits_from_lengths(_to_partition(row_lengths))
+        return cls.from_row_splits(values, row_splits, validate=validate)
 
     @classmethod
-    def from_row_lengths(
-        cls,
-        values,
-        row_lengths,
-        name=None,
+    def from_value_rowids(
+        cls, values, value_rowids, nrows=None, name=None, validate=True
     ):
-        # TODO : modify this, if necessary, to accept raggedTensor inputs too
-        if sum(row_lengths) != values.shape[0]:
-            ivy.utils.exceptions.IvyException(
-                "first dimension of values should be equal to sum(row_lengths) "
-            )
-        data = []
-        z = 0
-        for length in row_lengths:
-            temp = []
-            for i in range(length):
-                temp.append(values[z, :])
-                z += 1
+        row_splits = _segment_ids_to_row_splits(_to_partition(value_rowids), nrows)
+        return cls.from_row_splits(values, row_splits, validate=validate)
 
-            data.append(ivy.asarray(temp))
+    @classmethod
+    def from_row_starts(cls, values, row_starts, name=None, validate=True):
+        values = _to_values(values)
+        row_starts = _to_partition(row_starts)
+        nvals = ivy.array([_nvals(values)], dtype="int64")
+        row_splits = ivy.concat([row_starts, nvals], axis=0)
+        return cls.from_row_splits(values, row_splits, validate=validate)
 
-        # data =[[values[0+i,:] for i in range(length)]
-        #   for length in row_lengths]
-        return cls(values=values, row_partition=row_lengths, internal=True, data=data)
+    @classmethod
+    def from_row_limits(cls, values, row_limits, name=None, validate=True):
+        row_limits = _to_partition(row_limits)
+        row_splits = ivy.concat([ivy.zeros((1,), dtype="int64"), row_limits], axis=0)
+        return cls.from_row_splits(values, row_splits, validate=validate)
 
     @classmethod
-    def from_value_rowids(
-        cls,
-        values,
-        value_rowids,
-        nrows=None,
-        name=None,
+    def from_nested_row_splits(
+        cls, flat_values, nested_row_splits, name=None, validate=True
     ):
-        if not nrows:
-            nrows = value_rowids[-1] + 1
-        data = []
-        for row in range(nrows):
-            temp = []
-            for i in range(len(values)):
-                if value_rowids[i] == row:
-                    temp.append(values[i, :])
-            data.append(ivy.asarray(temp))
-
-        # data= [[values[i,:] for i in range(len(values)) if value_rowids[i] == row]
-        #   for row in range(nrows)]
-        return cls(values=values, row_partition=value_rowids, internal=True, data=data)
+        result = _to_values(flat_values)
+        for row_splits in reversed(nested_row_splits):
+            result = cls.from_row_splits(result, row_splits, validate=validate)
+        return result
 
     @classmethod
-    def from_row_starts(
+    def from_nested_row_lengths(
+        cls, flat_values, nested_row_lengths, name=None, validate=True
+    ):
+        result = _to_values(flat_values)
+        for row_lengths in reversed(nested_row_lengths):
+            result = cls.from_row_lengths(result, row_lengths, validate=validate)
+        return result
+
+    @classmethod
+    def from_nested_value_rowids(
         cls,
-        values,
-        row_starts,
+        flat_values,
+        nested_value_rowids,
+        nested_nrows=None,
         name=None,
+        validate=True,
     ):
-        # TODO since row_starts will be a tensor try appending using concat after
-        #  ensuring row_starts
-        # is a tensor
-        row_starts.append(len(values))
-        return cls.from_row_splits(values, row_starts)
+        if nested_nrows is None:
+            nested_nrows = [None] * len(nested_value_rowids)
+        result = _to_values(flat_values)
+        for value_rowids, nrows in reversed(
+            list(zip(nested_value_rowids, nested_nrows))
+        ):
+            result = cls.from_value_rowids(
+                result, value_rowids, nrows=nrows, validate=validate
+            )
+        return result
 
-    def to_list(self):
-        vals = []
-        for i in self:
-            if isinstance(i, RaggedTensor):
-                vals.append(i.to_list())
+    @classmethod
+    def from_tensor(cls, tensor, lengths=None, padding=None, name=None):
+        tensor = _to_ivy_array(tensor)
+        tensor = tensor if isinstance(tensor, ivy.Array) else ivy.array(tensor)
+        if lengths is None:
+            if padding is None:
+                lengths = ivy.full((tensor.shape[0],), tensor.shape[1], dtype="int64")
             else:
-                vals.append(ivy.to_list(i))
-        return vals
+                # each row ends after its last element which isn't padding
+                is_value = ivy.not_equal(tensor, _to_ivy_array(padding))
+                is_value = ivy.reshape(is_value, tuple(tensor.shape[:2]) + (-1,))
+                is_value = ivy.any(is_value, axis=-1)
+                positions = ivy.arange(1, tensor.shape[1] + 1, dtype="int64")
+                lengths = ivy.max(
+                    ivy.where(is_value, positions, ivy.zeros_like(positions)),
+                    axis=-1,
+                )
+        nested = ivy.NestedArray.from_padded(tensor, _to_partition(lengths))
+        ret = cls(values=nested.values, row_partition=nested.offsets, internal=True)
+        ret._nested = nested
+        return ret
+
+    # Properties #
+    # ---------- #
 
     @property
     def values(self):
-        return self._values
+        return _to_frontend(self._values)
 
     @property
     def flat_values(self):
-        values = self.values
+        values = self._values
         while isinstance(values, RaggedTensor):
-            values = values.values
-        return values
+            values = values._values
+        return _to_frontend(values)
 
     @property
     def row_splits(self):
-        return self._row_partition
+        return _to_frontend(self._row_partition)
 
     @property
     def nested_row_splits(self):
         rt_nested_splits = [self.row_splits]
-        rt_values = self.values
+        rt_values = self._values
         while isinstance(rt_values, RaggedTensor):
             rt_nested_splits.append(rt_values.row_splits)
-            rt_values = rt_values.values
+            rt_values = rt_values._values
         return tuple(rt_nested_splits)
+
+    @property
+    def ragged_rank(self):
+        values = self._values
+        return values.ragged_rank + 1 if isinstance(values, RaggedTensor) else 1
+
+    @property
+    def dtype(self):
+        return self.flat_values.dtype
+
+    @property
+    def shape(self):
+        if isinstance(self._values, RaggedTensor):
+            inner_shape = self._values.shape[1:]
+        else:
+            inner_shape = list(self._values.shape[1:])
+        lengths = np.diff(self._splits())
+        row_length = (
+            int(lengths[0]) if len(lengths) and np.all(lengths == lengths[0]) else None
+        )
+        return [self._nrows(), row_length] + inner_shape
+
+    # Instance Methods #
+    # ---------------- #
+
+    def _splits(self):
+        if self._host_row_splits is None:
+            self._host_row_splits = ivy.to_numpy(self._row_partition).tolist()
+        return self._host_row_splits
+
+    def _nrows(self):
+        return self._row_partition.shape[0] - 1
+
+    def _nested_array(self, values=None):
+        """Return the rows as a packed ivy.NestedArray, with the dense values, or the
+        given dense values replacing ragged ones."""
+        if values is not None:
+            return ivy.NestedArray.from_row_splits(values, self._row_partition)
+        if self._nested is None:
+            self._nested = ivy.NestedArray.from_row_splits(
+                self._values, self._row_partition
+            )
+        return self._nested
+
+    def nrows(self, out_type="int64", name=None):
+        return _to_frontend(ivy.array(self._nrows(), dtype=to_ivy_dtype(out_type)))
+
+    def row_lengths(self, axis=1, name=None):
+        if axis == 1:
+            splits = self._row_partition
+            return _to_frontend(splits[1:] - splits[:-1])
+        if not isinstance(self._values, RaggedTensor):
+            raise ivy.utils.exceptions.IvyException(
+                f"axis={axis} out of bounds: expected 1 <= axis <= {self.ragged_rank}"
+            )
+        return self.with_values(self._values.row_lengths(axis=axis - 1))
+
+    def nested_row_lengths(self, name=None):
+        lengths = []
+        rt = self
+        while isinstance(rt, RaggedTensor):
+            lengths.append(rt.row_lengths())
+            rt = rt._values
+        return tuple(lengths)
+
+    def value_rowids(self, name=None):
+        return _to_frontend(_row_splits_to_segment_ids(self._row_partition))
+
+    def row_starts(self, name=None):
+        return _to_frontend(self._row_partition[:-1])
+
+    def row_limits(self, name=None):
+        return _to_frontend(self._row_partition[1:])
+
+    def with_values(self, new_values):
+        return RaggedTensor(_to_values(new_values), self._row_partition, internal=True)
+
+    def with_flat_values(self, new_values):
+        if isinstance(self._values, RaggedTensor):
+            return self.with_values(self._values.with_flat_values(new_values))
+        return self.with_values(new_values)
+
+    def to_tensor(self, default_value=None, name=None, shape=None):
+        values = self._values
+        if isinstance(values, RaggedTensor):
+            values = _to_ivy_array(values.to_tensor(default_value))
+        if default_value is None:
+            default_value = 0
+        default_value = _to_ivy_array(default_value)
+        if ivy.is_array(default_value):
+            default_value = ivy.to_scalar(default_value)
+        padded = self._nested_array(values).to_padded(padding_value=default_value)
+        if shape is not None:
+            # crop, or pad further, to the given shape
+            shape = [
+                padded.shape[i] if dim is None or dim == -1 else int(dim)
+                for i, dim in enumerate(shape)
+            ]
+            padded = padded[tuple(slice(0, dim) for dim in shape)]
+            padded = ivy.constant_pad(
+                padded,
+                [(0, dim - padded.shape[i]) for i, dim in enumerate(shape)],
+                value=default_value,
+            )
+        return _to_frontend(padded)
+
+    def to_list(self):
+        flat_values = ivy.to_numpy(_to_ivy_array(self.flat_values)).tolist()
+        for row_splits in reversed(self.nested_row_splits):
+            splits = ivy.to_numpy(_to_ivy_array(row_splits)).tolist()
+            flat_values = [
+                flat_values[start:stop] for start, stop in zip(splits[:-1], splits[1:])
+            ]
+        return flat_values
+
+    def numpy(self):
+        return np.array(self.to_list(), dtype=object)
+
+    def _reduce(self, fn_name, axis=None, keepdims=False):
+        """
+        Reduce the ragged tensor with the ivy reduction, as the TensorFlow reductions
+        do when given a ragged tensor.
+
+        Reducing along the rows or within them is a segment reduction of the values,
+        by the row, or by the position in the row, of each value. Reducing along the
+        dimensions of the values is a reduction of the values.
+        """
+        if axis is None:
+            ret = getattr(ivy, fn_name)(_to_ivy_array(self.flat_values))
+            if keepdims:
+                ret = ivy.reshape(ret, (1,) * len(self.shape))
+            return _to_frontend(ret)
+        if isinstance(axis, (list, tuple)):
+            ret = self
+            for ax in sorted((a % len(self.shape) for a in axis), reverse=True):
+                ret = ret._reduce(fn_name, axis=ax, keepdims=keepdims)
+            return ret
+        axis = axis % len(self.shape)
+        if axis > 1:
+            values = self._values
+            if isinstance(values, RaggedTensor):
+                values = values._reduce(fn_name, axis=axis - 1, keepdims=keepdims)
+            else:
+                values = getattr(ivy, fn_name)(values, axis=axis - 1, keepdims=keepdims)
+            return self.with_values(values)
+        if isinstance(self._values, RaggedTensor):
+            raise ivy.utils.exceptions.IvyException(
+                "only the dimensions following the ragged ones can be reduced when "
+                "the ragged tensor has more than one ragged dimension"
+            )
+        if axis == 1:
+            ret = getattr(self._nested_array(), fn_name)(axis=1)
+        else:
+            # group the values by their position in the rows instead of by row
+            row_ids = _row_splits_to_segment_ids(self._row_partition)
+            positions = ivy.arange(self._values.shape[0], dtype="int64") - ivy.gather(
+                self._row_partition, row_ids
+            )
+            order = ivy.argsort(positions, stable=True)
+            lengths = np.diff(self._splits())
+            columns = RaggedTensor.from_value_rowids(
+                ivy.gather(self._values, order, axis=0),
+                ivy.gather(positions, order),
+                nrows=int(lengths.max(initial=0)),
+                validate=False,
+            )
+            ret = getattr(columns._nested_array(), fn_name)(axis=1)
+        if keepdims:
+            ret = ivy.expand_dims(ret, axis=axis)
+        return _to_frontend(ret)
+
+    # Built-ins #
+    # --------- #
+
+    def __repr__(self):
+        return (
+            f"ivy.frontends.tensorflow.RaggedTensor(values={self.values}, "
+            f"row_splits={self.row_splits})"
+        )
+
+    def __len__(self):
+        return self._nrows()
+
+    def __iter__(self):
+        for i in range(self._nrows()):
+            yield self[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            key = range(self._nrows())[key]
+            splits = self._splits()
+            values = self._values
+            if isinstance(values, RaggedTensor):
+                return values._slice_rows(splits[key], splits[key + 1])
+            return _to_frontend(values[splits[key] : splits[key + 1]])
+        if isinstance(key, slice) and key.step in (None, 1):
+            start, stop, _ = key.indices(self._nrows())
+            return self._slice_rows(start, max(start, stop))
+        raise ivy.utils.exceptions.IvyException(
+            "RaggedTensors can only be indexed by an integer or a contiguous slice of "
+            "their rows"
+        )
+
+    def _slice_rows(self, start, stop):
+        splits = self._row_partition[start : stop + 1]
+        first, last = self._splits()[start], self._splits()[stop]
+        values = self._values
+        if isinstance(values, RaggedTensor):
+            values = values._slice_rows(first, last)
+        else:
+            values = values[first:last]
+        return RaggedTensor(values, splits - first, internal=True)
+
+
+def _to_frontend(x):
+    if isinstance(x, ivy.Array):
+        return tf_frontend.EagerTensor(x)
+    return x
+
+
+@to_ivy_arrays_and_back
+def row_splits_to_segment_ids(splits, name=None, out_type=None):
+    ret = _row_splits_to_segment_ids(_to_partition(splits))
+    return ret if out_type is None else ivy.astype(ret, to_ivy_dtype(out_type))
+
+
+@to_ivy_arrays_and_back
+def segment_ids_to_row_splits(segment_ids, num_segments=None, out_type=None, name=None):
+    if num_segments is not None:
+        num_segments = int(num_segments)
+    ret = _segment_ids_to_row_splits(_to_partition(segment_ids), num_segments)
+    return ret if out_type is None else ivy.astype(ret, to_ivy_dtype(out_type))
@@ -7,6 +7,19 @@ from ivy.func_wrapper import (
     to_ivy_arrays_and_back,
 )
 
+# backends with loop primitives which can run natively, rather than as python loops
+_NATIVE_LOOPS = ("jax", "tensorflow")
+
+
+def _cast_like(x, like):
+    if isinstance(x, (list, tuple)):
+        return type(x)([_cast_like(v, w) for v, w in zip(x, like)])
+    if isinstance(x, dict):
+        return type(x)({k: _cast_like(v, like[k]) for k, v in x.items()})
+    if ivy.is_array(x) and ivy.is_array(like) and x.dtype != like.dtype:
+        return ivy.astype(x, like.dtype)
+    return x
+
 
 def if_else(
     cond: Callable,
@@ -125,6 +138,8 @@ def for_loop(
     iterable: Iterable[Any],
     body_fn: Callable,
     vars: Iterable[Union[ivy.Array, ivy.NativeArray]],
+    *,
+    native: bool = False,
 ):
     """
     Loops over an iterable, passing the current iteration along with a tuple of
@@ -139,6 +154,11 @@ def for_loop(
         and then a tuple of extra parameters.
     vars
         Extra parameters to be passed to body_fn.
+    native
+        Whether to lower loops over a range to the native loop of the backend, where
+        one is available (jax and tensorflow). The index is then passed to body_fn as
+        a native array rather than a python int, and the variables keep their dtypes
+        between the iterations. Default is ``False``.
 
     Returns
     -------
@@ -159,34 +179,37 @@ def for_loop(
     >>> 6
     ```
     """
-    iterator = iterable.__iter__()
-
-    vars_dict = _tuple_to_dict(vars)
-
-    def test_fn(iterator, original_body, vars_dict):
-        try:
-            val = iterator.__next__()
-        except StopIteration:
-            return False
-
-        vars_tuple = original_body(val, _dict_to_tuple(vars_dict))
-
-        for k in range(len(vars_tuple)):
-            vars_dict[k] = vars_tuple[k]
-
-        return True
-
-    def empty_function(iterator, original_body, vars_dict):
-        return (iterator, original_body, vars_dict)
-
-    packed_vars = (iterator, body_fn, vars_dict)
-
-    return _dict_to_tuple(while_loop(test_fn, empty_function, packed_vars)[2])
-
-
-def _tuple_to_dict(t):
-    return {k: t[k] for k in range(len(t))}
-
-
-def _dict_to_tuple(d):
-    return tuple([d[k] for k in d])
+    vars = tuple(vars)
+    if (
+        native
+        and isinstance(iterable, range)
+        and ivy.current_backend_str() in _NATIVE_LOOPS
+    ):
+        # the loop over the range is lowered to the native loop of the backend, with
+        # the index carried along with the variables
+        step = iterable.step
+
+        def test_fn(i, *loop_vars):
+            return i < iterable.stop if step > 0 else i > iterable.stop
+
+        def range_body_fn(i, *loop_vars):
+            # the native loops carry the variables with fixed dtypes
+            return (i + step,) + _cast_like(tuple(body_fn(i, loop_vars)), loop_vars)
+
+        start = ivy.to_native(ivy.asarray(iterable.start))
+        return tuple(while_loop(test_fn, range_body_fn, (start,) + vars)[1:])
+
+    # the variables are converted to ivy arrays once, and then carried between the
+    # iterations as the body function returns them
+    loop_vars = ivy.nested_map(
+        vars,
+        lambda x: ivy.Array(x) if ivy.is_native_array(x) else x,
+        shallow=False,
+    )
+    for val in iterable:
+        loop_vars = tuple(body_fn(val, loop_vars))
+    return ivy.nested_map(
+        loop_vars,
+        lambda x: ivy.Array(x) if ivy.is_native_array(x) else x,
+        shallow=False,
+    )
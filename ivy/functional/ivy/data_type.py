@@ -206,6 +206,126 @@ def _get_dtypes(fn, complement=True):
     return tuple(supported)
 
 
+# Promotion Lattice #
+# ------------------#
+
+# the dtypes of the promotion tables are given small integer ids, so that promoting
+# two dtypes is an index into a precomputed matrix rather than sorting, hashing and
+# looking up a tuple in a table
+_dtype_ids = {}
+_dtype_kinds = []
+
+# the ids of the dtypes, and of the native dtypes, supported by each backend
+_native_dtype_ids = {}
+
+# the promotion matrices of each table, along with the table they're built from and
+# its length, to notice when a table is replaced or extended
+_promotion_matrices = {}
+
+# python scalars which keep the dtype of the array they're combined with, for each
+# kind of array dtype
+_weak_scalar_kinds = {
+    "int": (int,),
+    "float": (int, float),
+    "complex": (int, float, complex),
+}
+
+
+def _add_dtype_id(dtype):
+    dtype = str(dtype)
+    if dtype not in _dtype_ids:
+        _dtype_ids[dtype] = len(_dtype_ids)
+        kind = "".join(c for c in dtype if c.isalpha())
+        _dtype_kinds.append(
+            {"uint": "int", "bfloat": "float"}.get(kind, kind) if kind else None
+        )
+        # the existing matrices are out of range of the new id, and the native
+        # dtypes may have been found not to have one
+        _promotion_matrices.clear()
+        _native_dtype_ids.clear()
+
+
+def _dtype_id(dtype):
+    # the id of the dtype, or None if it isn't in any of the promotion tables or
+    # isn't supported by the backend
+    if not _dtype_ids:
+        _promotion_matrix(ivy.promotion_table)
+    dtype_ids = _native_dtype_ids.get(ivy.backend)
+    if dtype_ids is None:
+        dtype_ids = _native_dtype_ids[ivy.backend] = {}
+    try:
+        return dtype_ids[dtype]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    try:
+        ivy_dtype = str(ivy.as_ivy_dtype(dtype))
+    except Exception:
+        return None
+    dtype_id = _dtype_ids.get(ivy_dtype)
+    # other strings, such as "float", and the python types are resolved with the
+    # default dtypes, which can change (numpy dtypes compare equal to the types)
+    if isinstance(dtype, str):
+        resolved = dtype != ivy_dtype
+    else:
+        resolved = any(dtype is t for t in (int, float, complex))
+    if not resolved:
+        dtype_ids[dtype] = dtype_id
+    return dtype_id
+
+
+def _lookup_promotion(table, type1, type2):
+    query = [type1, type2]
+    query.sort(key=lambda x: str(x))
+    query = tuple(query)
+    try:
+        return table[query]
+    except KeyError:
+        # try again with the dtypes swapped
+        return table.get((query[1], query[0]))
+
+
+def _promotion_matrix(table):
+    entry = _promotion_matrices.get(id(table))
+    if entry is not None and entry[0] is table and entry[1] == len(table):
+        return entry[2]
+    for query, promoted in table.items():
+        for dtype in (*query, promoted):
+            _add_dtype_id(dtype)
+    dtypes = [ivy.Dtype(dtype) for dtype in _dtype_ids]
+    matrix = [
+        [_lookup_promotion(table, type1, type2) for type2 in dtypes] for type1 in dtypes
+    ]
+    if len(_promotion_matrices) > 8:
+        # tables which were replaced, such as when toggling the precise mode
+        _promotion_matrices.clear()
+    _promotion_matrices[id(table)] = (table, len(table), matrix)
+    return matrix
+
+
+def _promote_dtypes(type1, type2, array_api_promotion):
+    # the promoted dtype, or None to look it up in the table as usual
+    table = (
+        ivy.array_api_promotion_table if array_api_promotion else ivy.promotion_table
+    )
+    matrix = _promotion_matrix(table)
+    id1 = _dtype_id(type1)
+    id2 = _dtype_id(type2)
+    if id1 is None or id2 is None:
+        return None
+    return matrix[id1][id2]
+
+
+def _is_weak_scalar(x, dtype):
+    # whether the backend combines the python scalar with an array of the dtype
+    # without changing the dtype, as creating an array of the dtype from it would
+    dtype_id = _dtype_id(dtype)
+    if dtype_id is None:
+        return False
+    return type(x) in _weak_scalar_kinds.get(_dtype_kinds[dtype_id], ())
+
+
 # Array API Standard #
 # -------------------#
 
@@ -2022,6 +2142,10 @@ def promote_types(
     ret
         The type that both input types promote to
     """
+    ret = _promote_dtypes(type1, type2, array_api_promotion)
+    if ret is not None:
+        return ret
+
     query = [ivy.as_ivy_dtype(type1), ivy.as_ivy_dtype(type2)]
     query.sort(key=lambda x: str(x))
     query = tuple(query)
@@ -2371,6 +2495,7 @@ def promote_types_of_inputs(
     /,
     *,
     array_api_promotion: bool = False,
+    weak_scalars: bool = False,
 ) -> Tuple[ivy.NativeArray, ivy.NativeArray]:
     """
     Promote the dtype of the given native array inputs to a common dtype based on type
@@ -2381,12 +2506,27 @@ def promote_types_of_inputs(
     array-like object. Therefore, outputs from this function should be
     used as inputs only for those functions that expect an array-like or
     tensor-like objects, otherwise it might give unexpected results.
+
+    With ``weak_scalars``, a python scalar combined with an array is returned as it
+    is rather than as an array, when the backend combines it with the array without
+    changing the dtype of the array (``ivy.native_weak_scalars``), and the scalar
+    would be created with the dtype of the array anyway. This is for the backend
+    functions which pass the inputs straight to a native function, sparing them the
+    creation of an array for each call.
     """
 
     def _special_case(a1, a2):
         # check for float number and integer array case
         return isinstance(a1, float) and "int" in str(a2.dtype)
 
+    if weak_scalars and ivy.native_weak_scalars:
+        if hasattr(x1, "dtype") and _is_weak_scalar(x2, x1.dtype):
+            ivy.utils.assertions._check_jax_x64_flag(x1.dtype)
+            return ivy.to_native(x1), x2
+        if hasattr(x2, "dtype") and _is_weak_scalar(x1, x2.dtype):
+            ivy.utils.assertions._check_jax_x64_flag(x2.dtype)
+            return x1, ivy.to_native(x2)
+
     if hasattr(x1, "dtype") and not hasattr(x2, "dtype"):
         device = ivy.default_device(item=x1, as_native=True)
         if x1.dtype == bool and not isinstance(x2, bool):
@@ -2423,8 +2563,12 @@ def promote_types_of_inputs(
         promoted = promote_types(
             x1.dtype, x2.dtype, array_api_promotion=array_api_promotion
         )
-        x1 = ivy.astype(x1, promoted, copy=False)
-        x2 = ivy.astype(x2, promoted, copy=False)
+        # only the input which doesn't have the promoted dtype already is cast
+        promoted_id = _dtype_id(promoted)
+        if promoted_id is None or _dtype_id(x1.dtype) != promoted_id:
+            x1 = ivy.astype(x1, promoted, copy=False)
+        if promoted_id is None or _dtype_id(x2.dtype) != promoted_id:
+            x2 = ivy.astype(x2, promoted, copy=False)
 
     ivy.utils.assertions._check_jax_x64_flag(x1.dtype)
     return ivy.to_native(x1), ivy.to_native(x2)
@@ -8,6 +8,7 @@ import math
 import psutil
 import warnings
 import types
+from concurrent.futures import ThreadPoolExecutor
 from typing import Type, Optional, Tuple
 
 # noinspection PyUnresolvedReferences
@@ -42,6 +43,7 @@ default_device_stack = list()
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
+memory_chunk_sizes = dict()
 
 
 # Extra #
@@ -158,6 +160,9 @@ def get_all_ivy_arrays_on_dev(
     """
     Get all ivy arrays which are currently alive on the specified device.
 
+    The arrays are read from the registry which every ivy array adds itself to, so
+    that the garbage collector doesn't have to be scanned.
+
     Parameters
     ----------
     device
@@ -177,14 +182,11 @@ def get_all_ivy_arrays_on_dev(
     {139740789224448:ivy.array([1,0,2])},
     """
     device = ivy.as_ivy_dev(device)
-    all_arrays = list()
-    for obj in gc.get_objects():
-        if (
-            type(obj) == ivy.data_classes.array.array.Array
-            and ivy.is_ivy_array(obj)
-            and ivy.dev(obj) == device
-        ):
-            all_arrays.append(obj)
+    all_arrays = [
+        x
+        for x in ivy.utils.memory.live_arrays()
+        if ivy.is_ivy_array(x) and ivy.dev(x) == device
+    ]
 
     return ivy.Container(dict(zip([str(id(a)) for a in all_arrays], all_arrays)))
 
@@ -194,6 +196,9 @@ def num_ivy_arrays_on_dev(device: Union[ivy.Device, ivy.NativeDevice], /) -> int
     """
     Return the number of arrays which are currently alive on the specified device.
 
+    While an :class:`ivy.utils.memory.MemoryTracker` is active, the count is read
+    from it in constant time.
+
     Parameters
     ----------
     device
@@ -223,6 +228,11 @@ def num_ivy_arrays_on_dev(device: Union[ivy.Device, ivy.NativeDevice], /) -> int
     >>> print(y)
     1
     """
+    tracker = ivy.utils.memory.active_tracker()
+    if tracker is not None:
+        # the tracker already counts the arrays on each device
+        usage = tracker.devices.get(ivy.as_ivy_dev(device))
+        return 0 if usage is None else usage.count
     return len(ivy.get_all_ivy_arrays_on_dev(device))
 
 
@@ -955,6 +965,41 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _is_oom_error(e):
+    if isinstance(e, MemoryError):
+        return True
+    # out of memory errors of the backends, possibly wrapped by ivy
+    msg = str(e).lower()
+    return any(
+        m in msg for m in ("out of memory", "resource exhausted", "resource_exhausted")
+    )
+
+
+def _split_inputs(inputs, sizes, input_axes):
+    return [
+        (
+            ivy.split(inp, num_or_size_splits=sizes, axis=axis, with_remainder=True)
+            if ivy.is_array(inp)
+            else inp.split(num_or_size_splits=sizes, axis=axis, with_remainder=True)
+        )
+        for inp, axis in zip(inputs, input_axes)
+    ]
+
+
+def _chunk_sizes(dim_size, chunk_size):
+    num_chunks_floored = dim_size // chunk_size
+    chunk_sizes = [chunk_size] * num_chunks_floored
+    if dim_size != chunk_size * num_chunks_floored:
+        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
+    return chunk_sizes
+
+
+def _nbytes(x):
+    if ivy.is_array(x):
+        return math.prod(x.shape) * ivy.dtype_bits(x.dtype) // 8
+    return 0
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -968,12 +1013,20 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    num_workers: int = 1,
+    memory_fraction: Optional[float] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
     Call a function by splitting its inputs along a given axis, and calling the function
     in chunks, rather than feeding the entire input array at once. This can be useful to
     reduce memory usage of the device the arrays are on.
 
+    Chunks which run out of memory are split in half and retried, and the smaller
+    chunk size is then used for later calls with inputs of the same shapes, unless
+    chunk_size is specified. In concat mode, when the backend supports inplace updates,
+    the outputs of the chunks are written into preallocated arrays rather than
+    concatenated at the end.
+
     Parameters
     ----------
     func
@@ -998,6 +1051,16 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    num_workers
+        The number of threads calling the function on different chunks concurrently.
+        Backends release the GIL in their kernels, so this speeds up functions which
+        spend their time in these. Default is ``1``.
+    memory_fraction
+        If specified and chunk_size is not, the first chunk is used to measure the
+        memory used per element along the split axis on the device, and the remaining
+        chunks are sized so that the device's used memory stays within this fraction
+        of its total memory. The chunk size found is then reused for later calls of the
+        same function with inputs of the same shapes. Default is ``None``.
 
     Returns
     -------
@@ -1006,14 +1069,27 @@ def split_func_call(
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
+    shape_key = "_".join([str(inp.shape) for inp in inputs])
+    # the chunk sizes found depend on the function and on the memory fraction, and are
+    # only cached for the calls which don't specify one
+    cache_key = (func, shape_key, memory_fraction)
+    cache_chunk_size = not ivy.exists(chunk_size)
+    probe_memory = False
+    if not ivy.exists(chunk_size):
+        if cache_key in memory_chunk_sizes:
+            chunk_size = memory_chunk_sizes[cache_key]
+        elif memory_fraction is not None:
+            probe_memory = True
     if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
-        shape_key = "_".join([str(inp.shape) for inp in inputs])
         if shape_key in max_chunk_sizes:
             max_chunk_size = max_chunk_sizes[shape_key]
         else:
             max_chunk_size = 0
         max_dim = max(
-            [inp.cont_shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)]
+            [
+                inp.shape[inp_ax] if ivy.is_array(inp) else inp.cont_shape[inp_ax]
+                for inp, inp_ax in zip(inputs, input_axes)
+            ]
         )
         if max_dim > max_chunk_size:
             max_chunk_sizes[shape_key] = max_dim
@@ -1028,63 +1104,158 @@ def split_func_call(
     )
     dim_size = inputs[0].shape[input_axes[0]]
     if chunk_size >= dim_size:
-        return func(*inputs)
-    num_chunks = dim_size / chunk_size
-    num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
-    chunk_sizes = [chunk_size] * num_chunks_floored
-    if num_chunks != num_chunks_floored:
-        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
-    inputs_split = [
-        (
-            ivy.split(
-                inp,
-                num_or_size_splits=chunk_sizes,
-                axis=input_axes[i],
-                with_remainder=True,
-            )
-            if ivy.is_array(inp)
-            else inp.split(
-                num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-            )
-        )
-        for i, inp in enumerate(inputs)
-    ]
+        try:
+            return func(*inputs)
+        except Exception as e:
+            if dim_size < 2 or not _is_oom_error(e):
+                raise
+        gc.collect()
+        chunk_size = dim_size // 2
+        if cache_chunk_size:
+            memory_chunk_sizes[cache_key] = chunk_size
+        probe_memory = False
     is_mean = mode == "mean"
     is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
-    if is_mean or is_sum:
-        sums = None
-        for inps in zip(*inputs_split):
-            if not sums:
-                sums = func(*inps)
-                sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
-                )
-            else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
+    num_outputs = None
+
+    def _output_axes():
+        if output_axes is None:
+            return [input_axes[0]] * num_outputs
+        elif isinstance(output_axes, int):
+            return [output_axes] * num_outputs
+        return output_axes
+
+    def _call(inps, size):
+        # call the function on one chunk, splitting it in half on running out of memory
+        nonlocal num_outputs
+        try:
+            ret = func(*inps)
+        except Exception as e:
+            if size < 2 or not _is_oom_error(e):
+                raise
+        else:
+            ret = (
+                tuple([post_fn(r) for r in ret])
+                if isinstance(ret, tuple)
+                else (post_fn(ret),)
+            )
+            num_outputs = len(ret)
+            return ret
+        gc.collect()
+        sizes = [size // 2, size - size // 2]
+        if cache_chunk_size:
+            memory_chunk_sizes[cache_key] = min(
+                memory_chunk_sizes.get(cache_key, sizes[0]), sizes[0]
+            )
+        rets = [
+            _call(half, half_size)
+            for half, half_size in zip(
+                zip(*_split_inputs(inps, sizes, input_axes)), sizes
+            )
+        ]
+        if is_sum:
+            return tuple([r0 + r1 for r0, r1 in zip(*rets)])
+        if is_mean:
+            return tuple(
+                [(r0 * sizes[0] + r1 * sizes[1]) / size for r0, r1 in zip(*rets)]
+            )
+        return tuple(
+            [
+                ivy.concat([r0, r1], axis=axis)
+                for r0, r1, axis in zip(*rets, _output_axes())
+            ]
+        )
+
+    sums = None
+    outputs = None
+
+    def _consume(ret, start, size):
+        # accumulate the outputs of the chunks in order
+        nonlocal sums, outputs
+        if is_mean or is_sum:
+            if is_mean:
+                # weighted by the chunk sizes, as the last chunk can be smaller
+                ret = [r * size for r in ret]
+            sums = list(ret) if sums is None else [s + r for s, r in zip(sums, ret)]
+            return
+        if outputs is None:
+            outputs = []
+            preallocate = ivy.inplace_arrays_supported()
+            for r, axis in zip(ret, _output_axes()):
+                if (
+                    preallocate
+                    and ivy.is_array(r, exclusive=True)
+                    and r.shape[axis] == size
+                ):
+                    shape = list(r.shape)
+                    shape[axis] = dim_size
+                    outputs.append(
+                        ivy.empty(shape, dtype=ivy.dtype(r), device=ivy.dev(r))
+                    )
                 else:
-                    sums[0] = sums[0] + post_fn(ret)
-        sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
-        return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple([post_fn(r) for r in ret]) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
+                    outputs.append([])
+        for i, (r, axis) in enumerate(zip(ret, _output_axes())):
+            out = outputs[i]
+            if isinstance(out, list):
+                out.append(r)
+            elif ivy.is_array(r) and r.shape[axis] == size:
+                idx = (slice(None),) * axis + (slice(start, start + size),)
+                ivy.to_native(out)[idx] = ivy.to_native(r)
+            else:
+                # the output doesn't match the chunk along the axis, so the remaining
+                # outputs are concatenated
+                idx = (slice(None),) * axis + (slice(0, start),)
+                outputs[i] = [ivy.to_ivy(ivy.to_native(out)[idx]), r]
+
+    start = 0
+    if probe_memory:
+        device = ivy.as_ivy_dev(ivy.default_device(device))
+        chunk, inputs = zip(
+            *_split_inputs(inputs, [chunk_size, dim_size - chunk_size], input_axes)
+        )
+        used_before = used_mem_on_dev(device, process_specific=True)
+        ret = _call(chunk, chunk_size)
+        used = used_mem_on_dev(device, process_specific=True) - used_before
+        # the memory per element along the split axis, which is at least the memory
+        # of the outputs
+        per_element = max(used * 1e9, sum(_nbytes(r) for r in ret)) / chunk_size
+        _consume(ret, start, chunk_size)
+        start = chunk_size
+        budget = (
+            (memory_fraction * total_mem_on_dev(device) - used_before)
+            * 1e9
+            / max(num_workers, 1)
+        )
+        if budget > 0:
+            chunk_size = max(1, int(budget / max(per_element, 1)))
+        else:
+            # the device already uses more than the fraction, so the probed chunk
+            # size is kept rather than falling back to single elements
+            warnings.warn(
+                "the memory used on {} already exceeds memory_fraction={}, keeping "
+                "the chunk size of {}".format(device, memory_fraction, chunk_size)
+            )
+        memory_chunk_sizes[cache_key] = chunk_size
+    chunk_sizes = _chunk_sizes(dim_size - start, chunk_size)
+    chunks = list(zip(*_split_inputs(inputs, chunk_sizes, input_axes)))
+    starts = [start + sum(chunk_sizes[:i]) for i in range(len(chunk_sizes))]
+    if num_workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            rets = executor.map(_call, chunks, chunk_sizes)
+            for ret, chunk_start, size in zip(rets, starts, chunk_sizes):
+                _consume(ret, chunk_start, size)
+    else:
+        for chunk, chunk_start, size in zip(chunks, starts, chunk_sizes):
+            _consume(_call(chunk, size), chunk_start, size)
+
+    if is_mean or is_sum:
+        if is_mean:
+            sums = [s / dim_size for s in sums]
+        return sums[0] if len(sums) == 1 else tuple(sums)
     ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
+        ivy.concat(out, axis=axis) if isinstance(out, list) else out
+        for out, axis in zip(outputs, _output_axes())
     ]
     return ret[0] if len(ret) == 1 else ret
 
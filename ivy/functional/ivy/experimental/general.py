@@ -1,5 +1,4 @@
 # global
-import functools
 from typing import Callable, Union, Sequence
 
 # local
@@ -13,13 +12,67 @@ def _correct_ivy_callable(func):
     if ivy.nested_any(
         func,
         lambda x: hasattr(x, "__module__")
-        and x.__module__.startswith("ivy")
+        and x.__module__.startswith("ivy.")
         and not x.__module__.startswith("ivy.functional.frontends"),
     ):
         return ivy.__dict__[func.__name__]
     return func
 
 
+# binary computations with a native reduction, mapped to the name of the reduction
+_NATIVE_REDUCTIONS = {
+    "add": "sum",
+    "multiply": "prod",
+    "maximum": "max",
+    "minimum": "min",
+    "logical_and": "all",
+    "logical_or": "any",
+}
+
+# names of the same binary computations in the frontends
+_FRONTEND_ALIASES = {
+    "ivy.functional.frontends.jax.lax": {
+        "mul": "multiply",
+        "max": "maximum",
+        "min": "minimum",
+    },
+    "ivy.functional.frontends.torch": {"mul": "multiply"},
+}
+
+
+def _native_reduction_name(computation):
+    """
+    Return the name of the ivy function equivalent to ``computation``, if it is one
+    of the binary computations with a native reduction, and otherwise None.
+
+    Ivy functions, and their equivalents in the frontends, are recognised by their
+    module and name.
+    """
+    module = getattr(computation, "__module__", None) or ""
+    name = getattr(computation, "__name__", None)
+    if not module.startswith("ivy.") or not isinstance(name, str):
+        return None
+    for frontend, aliases in _FRONTEND_ALIASES.items():
+        if module.startswith(frontend):
+            name = aliases.get(name, name)
+    return name if name in _NATIVE_REDUCTIONS else None
+
+
+def _tree_reduce(operand, init_value, computation):
+    # adjacent slices along the leading axis are combined pairwise and in order, so
+    # that an associative computation is called log2(n) times on whole slices
+    # rather than n times on single rows
+    while operand.shape[0] > 1:
+        num_pairs = operand.shape[0] // 2
+        paired = computation(
+            operand[0 : 2 * num_pairs : 2], operand[1 : 2 * num_pairs : 2]
+        )
+        if operand.shape[0] % 2:
+            paired = ivy.concat([paired, operand[-1:]], axis=0)
+        operand = paired
+    return computation(init_value, operand[0])
+
+
 @handle_exceptions
 @handle_nestable
 @inputs_to_ivy_arrays
@@ -35,6 +88,12 @@ def reduce(
     """
     Reduces the input array's dimensions by applying a function along one or more axes.
 
+    The standard computations ``ivy.add``, ``ivy.multiply``, ``ivy.maximum``,
+    ``ivy.minimum``, ``ivy.logical_and`` and ``ivy.logical_or``, and their frontend
+    equivalents, are lowered to the native reduction along each axis. Any other
+    computation is applied pairwise to whole slices of the operand, in a tree of
+    logarithmic depth, and so must be associative.
+
     Parameters
     ----------
     operand
@@ -67,13 +126,31 @@ def reduce(
     axes = (axes,) if isinstance(axes, int) else axes
     axes = [a + operand.ndim if a < 0 else a for a in axes]
     axes = sorted(axes, reverse=True)
-    init_value = ivy.array(init_value)
+    reduced_shape = tuple(d for i, d in enumerate(operand.shape) if i not in axes)
     op_dtype = operand.dtype
-    computation = _correct_ivy_callable(computation)
-    for axis in axes:
-        temp = ivy.moveaxis(operand, axis, 0).reshape((operand.shape[axis], -1))
-        temp = functools.reduce(computation, temp, init_value)
-        operand = ivy.reshape(temp, operand.shape[:axis] + operand.shape[axis + 1 :])
+    if any(operand.shape[axis] == 0 for axis in axes):
+        operand = ivy.full(reduced_shape, init_value, dtype=op_dtype)
+    else:
+        init_value = ivy.array(init_value)
+        computation = _correct_ivy_callable(computation)
+        name = _native_reduction_name(computation)
+        for axis in axes:
+            if name is not None:
+                reduced = ivy.__dict__[_NATIVE_REDUCTIONS[name]](operand, axis=axis)
+                operand = ivy.__dict__[name](init_value, reduced)
+            else:
+                operand = _tree_reduce(
+                    ivy.moveaxis(operand, axis, 0), init_value, computation
+                )
     if keepdims:
         operand = ivy.expand_dims(operand, axis=axes)
     return operand.astype(op_dtype)
+
+
+reduce.mixed_backend_wrappers = {
+    "to_add": (
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
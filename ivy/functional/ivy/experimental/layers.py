@@ -2118,55 +2118,48 @@ def adaptive_avg_pool2d(
     return pooled_output
 
 
-def _conv_view(lhs, rhs_shape, window_strides, pads, pad_value):
-    def _pad(arr, pads, pad_value):
-        out = ivy.astype(
-            ivy.pad(
-                arr,
-                ivy.maximum(0, pads).to_list(),
-                mode="constant",
-                constant_values=ivy.to_scalar(pad_value),
-            ),
-            arr.dtype,
-        )
-        slices = tuple(
-            _slice(abs(lo) if lo < 0 else 0, hi % dim if hi < 0 else None)
-            for (lo, hi), dim in zip(pads, arr.shape)
-        )
-        return out[slices]
-
-    if (
-        _min(lhs.ndim, len(rhs_shape)) < 2
-        or lhs.ndim != len(rhs_shape)
-        or lhs.shape[1] != rhs_shape[1]
-    ):
-        raise ValueError("Dimension mismatch")
-    if len(window_strides) != len(rhs_shape) - 2:
-        raise ValueError("Wrong number of strides for spatial dimensions")
-    if len(pads) != len(rhs_shape) - 2:
-        raise ValueError("Wrong number of pads for spatial dimensions")
-
-    lhs = _pad(lhs, [(0, 0)] * 2 + list(pads), pad_value)
-    in_shape = lhs.shape[2:]
-    filter_shape = rhs_shape[2:]
-    dim = len(filter_shape)
-
-    out_strides = ivy.multiply(window_strides, lhs.strides[2:]).to_list()
-    view_strides = lhs.strides[:1] + tuple(out_strides) + lhs.strides[1:]
+def _pad_with_value(arr, pads, pad_value):
+    if all(lo == 0 and hi == 0 for lo, hi in pads):
+        return arr
+    out = ivy.astype(
+        ivy.pad(
+            arr,
+            ivy.maximum(0, pads).to_list(),
+            mode="constant",
+            constant_values=ivy.to_scalar(pad_value),
+        ),
+        arr.dtype,
+    )
+    slices = tuple(
+        _slice(abs(lo) if lo < 0 else 0, hi if hi < 0 else None) for lo, hi in pads
+    )
+    return out[slices]
 
+
+def _window_slices(operand, window_shape, window_strides, window_dilation):
+    """
+    Return a strided slice of the operand for each position within the window, which
+    holds the element at that position of every window, so that reducing over the
+    slices reduces each window.
+    """
     out_shape = [
-        (in_shape[i] - filter_shape[i]) // s + 1 for i, s in enumerate(window_strides)
+        _max((size - (window - 1) * dilation - 1) // stride + 1, 0)
+        for size, window, stride, dilation in zip(
+            operand.shape, window_shape, window_strides, window_dilation
+        )
     ]
-    view_shape = list(lhs.shape[:1]) + out_shape + rhs_shape[1:]
-
-    view = ivy.as_strided(lhs, view_shape, view_strides)
-
-    view_axes = list(range(view.ndim))
-    sum_axes = view_axes[-dim - 1 :]
-    rhs_axes = [view.ndim] + sum_axes
-    out_axes = [0, view.ndim] + list(range(1, dim + 1))
-
-    return view, view_axes, rhs_axes, out_axes
+    slices = []
+    for position in itertools.product(*[range(window) for window in window_shape]):
+        starts = [p * dilation for p, dilation in zip(position, window_dilation)]
+        slices.append(
+            operand[
+                tuple(
+                    _slice(start, start + (size - 1) * stride + 1, stride)
+                    for start, size, stride in zip(starts, out_shape, window_strides)
+                )
+            ]
+        )
+    return slices
 
 
 def _dilate(operand, factors, fill_value):
@@ -2204,6 +2197,8 @@ def _padtype_to_pads(in_shape, filter_shape, window_strides, padding):
 identities = {
     "max": -float("inf"),
     "min": float("inf"),
+    "maximum": -float("inf"),
+    "minimum": float("inf"),
     "add": 0,
     "mul": 1,
     "multiply": 1,
@@ -2299,7 +2294,6 @@ def reduce_window(
     >>> ivy.reduce_window(x, 0, ivy.sum, (2, 2))
     ivy.array([[32.]])
     """
-    # ToDo: add support for window_dilation
     computation = _correct_ivy_callable(computation)
     op = operand
 
@@ -2319,16 +2313,18 @@ def reduce_window(
 
     init_value = _cast_init(init_value, op.dtype)
     identity = _get_identity(computation, operand.dtype, init_value)
+    if any(d > 1 for d in base_dilation):
+        op = _dilate(op.reshape((1, 1) + op.shape), base_dilation, identity)[0, 0]
+    dilated_dims = [(d - 1) * wd + 1 for d, wd in zip(dims, window_dilation)]
     if isinstance(padding, str):
-        pads = _padtype_to_pads(op.shape, dims, strides, padding)
+        pads = _padtype_to_pads(op.shape, dilated_dims, strides, padding)
     else:
         pads = padding
-    op = op.reshape((1, 1) + op.shape)
-    if base_dilation:
-        op = _dilate(op, base_dilation, identity)
-    view = _conv_view(op, [1, 1] + list(dims), strides, pads, identity)[0]
-    view = ivy.reshape(view, (*view.shape[1 : 1 + len(dims)], -1))
-    ret = ivy.reduce(view, init_value, computation, axes=-1)
+    op = _pad_with_value(op, pads, identity)
+    # each window is gathered from strided slices of the operand, and the windows are
+    # then reduced along a single axis, natively for the standard computations
+    windows = ivy.stack(_window_slices(op, dims, strides, window_dilation), axis=-1)
+    ret = ivy.reduce(windows, init_value, computation, axes=-1)
     return ret.astype(operand.dtype)
 
 
@@ -11,7 +11,6 @@ from typing import (
     List,
 )
 from numbers import Number
-from functools import partial
 import math
 
 # local
@@ -28,6 +27,7 @@ from ivy.func_wrapper import (
 )
 from ivy.utils.backend import current_backend
 from ivy.utils.exceptions import handle_exceptions
+from ivy.functional.ivy.experimental.general import _native_reduction_name
 
 
 @handle_exceptions
@@ -1935,37 +1935,195 @@ def _interior_pad(operand, padding_value, padding_config):
     return padded
 
 
-def _interleave(a, b, axis):
-    assert a.shape[axis] == b.shape[axis] or a.shape[axis] == b.shape[axis] + 1
-    a_pad = [(0, 0, 0)] * a.ndim
-    b_pad = [(0, 0, 0)] * b.ndim
-    a_pad[axis] = (0, 1 if a.shape[axis] == b.shape[axis] else 0, 1)
-    b_pad[axis] = (1, 0 if a.shape[axis] == b.shape[axis] else 1, 1)
-    a = _interior_pad(a, 0.0, a_pad)
-    b = _interior_pad(b, 0.0, b_pad)
-    return ivy.add(a, b)
+# the cumulative functions with which the binary functions are scanned natively
+_NATIVE_SCANS = {
+    "add": "cumsum",
+    "multiply": "cumprod",
+    "maximum": "cummax",
+    "minimum": "cummin",
+}
+
+# number of elements scanned sequentially within each block, with the blocks scanned
+# side by side, which keeps the total work within a small factor of a sequential
+# scan while calling the function only O(log(n)) times
+_SCAN_BLOCK_SIZE = 16
+
+
+def _tree_leaves(tree, leaves):
+    if isinstance(tree, dict):
+        for value in tree.values():
+            _tree_leaves(value, leaves)
+    elif isinstance(tree, (list, tuple)):
+        for value in tree:
+            _tree_leaves(value, leaves)
+    else:
+        leaves.append(tree)
+    return leaves
+
+
+def _tree_unflatten(tree, leaves):
+    if isinstance(tree, dict):
+        return type(tree)({k: _tree_unflatten(v, leaves) for k, v in tree.items()})
+    if isinstance(tree, (list, tuple)):
+        values = [_tree_unflatten(value, leaves) for value in tree]
+        if hasattr(tree, "_fields"):
+            return type(tree)(*values)
+        return type(tree)(values)
+    return next(leaves)
+
+
+def _slice_leaves(leaves, axes, start=0, stop=None, stride=1):
+    return [
+        _slice_along_axis(x, start, stop, stride, axis) for x, axis in zip(leaves, axes)
+    ]
+
+
+def _write_along_axis(out, x, start, stop=None, stride=1, axis=0):
+    slices = [slice(None)] * axis + [slice(start, stop, stride)]
+    ivy.to_native(out)[tuple(slices)] = ivy.to_native(x)
+
+
+def _blocked_scan(leaves, combine, axes):
+    """
+    Scan the leaves along their axes with the associative function ``combine`` of
+    two lists of leaves.
+
+    The elements are split into blocks which are first scanned sequentially, all of
+    the blocks at once. The totals of the blocks are then scanned recursively, and
+    combined with the elements of every block after the first. The remainder of the
+    elements which don't fill a block are scanned sequentially at the end.
+
+    On backends supporting inplace updates, the outputs are preallocated and each
+    scanned slice is written into them, otherwise they are stacked and concatenated.
+    """
+    num_elems = leaves[0].shape[axes[0]]
+    if num_elems < 2:
+        return leaves
+    block_size = min(num_elems, _SCAN_BLOCK_SIZE)
+    num_blocks = num_elems // block_size
+    num_blocked = num_blocks * block_size
+
+    # the j-th elements of all the blocks, with the scan of each block
+    prefixes = [_slice_leaves(leaves, axes, 0, num_blocked, block_size)]
+    for j in range(1, block_size):
+        prefixes.append(
+            combine(
+                prefixes[-1], _slice_leaves(leaves, axes, j, num_blocked, block_size)
+            )
+        )
+
+    # the j-th elements of the blocks after the first, offset by the scan of the
+    # blocks before them
+    offset = None
+    if num_blocks > 1:
+        carries = _slice_leaves(_blocked_scan(prefixes[-1], combine, axes), axes, 0, -1)
+        offset = [
+            combine(carries, _slice_leaves(prefix, axes, 1)) for prefix in prefixes
+        ]
+
+    if ivy.inplace_arrays_supported():
+        # the j-th elements of the blocks are written at a stride of the block size
+        scanned = []
+        for i, axis in enumerate(axes):
+            last = prefixes[-1][i]
+            shape = list(last.shape)
+            shape[axis] = num_elems
+            out = ivy.empty(shape, dtype=ivy.dtype(last), device=ivy.dev(last))
+            for j, prefix in enumerate(prefixes):
+                _write_along_axis(
+                    out,
+                    _slice_along_axis(prefix[i], 0, 1, axis=axis),
+                    j,
+                    j + 1,
+                    axis=axis,
+                )
+                if offset is not None:
+                    _write_along_axis(
+                        out,
+                        offset[j][i],
+                        j + block_size,
+                        num_blocked,
+                        block_size,
+                        axis=axis,
+                    )
+            scanned.append(out)
+
+        # the remaining elements are scanned on from the last of the blocked elements
+        last = _slice_leaves(scanned, axes, num_blocked - 1, num_blocked)
+        for j in range(num_blocked, num_elems):
+            last = combine(last, _slice_leaves(leaves, axes, j, j + 1))
+            for out, x, axis in zip(scanned, last, axes):
+                _write_along_axis(out, x, j, j + 1, axis=axis)
+        return scanned
+
+    # each of the j-th elements is stacked after its block, so that the blocks are
+    # laid out in order in a single output once the two axes are merged
+    if offset is not None:
+        blocks = [
+            ivy.concat(
+                [
+                    ivy.stack(
+                        [_slice_along_axis(p[i], 0, 1, axis=axis) for p in prefixes],
+                        axis=axis + 1,
+                    ),
+                    ivy.stack([o[i] for o in offset], axis=axis + 1),
+                ],
+                axis=axis,
+            )
+            for i, axis in enumerate(axes)
+        ]
+    else:
+        blocks = [
+            ivy.stack([p[i] for p in prefixes], axis=axis + 1)
+            for i, axis in enumerate(axes)
+        ]
+    scanned = []
+    for x, block, axis in zip(leaves, blocks, axes):
+        shape = list(block.shape)
+        scanned.append(
+            ivy.reshape(block, shape[:axis] + [num_blocked] + shape[axis + 2 :])
+        )
+    if num_blocked == num_elems:
+        return scanned
+
+    # the remaining elements are scanned on from the last of the blocked elements
+    remainder = [_slice_leaves(scanned, axes, -1)]
+    for j in range(num_blocked, num_elems):
+        remainder.append(combine(remainder[-1], _slice_leaves(leaves, axes, j, j + 1)))
+    return [
+        ivy.concat([x] + [r[i] for r in remainder[1:]], axis=axis)
+        for i, (x, axis) in enumerate(zip(scanned, axes))
+    ]
 
 
 @handle_exceptions
 @handle_nestable
 @inputs_to_ivy_arrays
 def associative_scan(
-    x: Union[ivy.Array, ivy.NativeArray],
+    x: Union[ivy.Array, ivy.NativeArray, Sequence, dict],
     fn: Callable,
     /,
     *,
     reverse: bool = False,
     axis: int = 0,
-) -> ivy.Array:
+) -> Union[ivy.Array, Sequence, dict]:
     """
     Perform an associative scan over the given array.
 
+    Standard binary functions, such as :func:`ivy.add` and :func:`ivy.maximum`, are
+    scanned with the native cumulative function, such as :func:`ivy.cumsum` and
+    :func:`ivy.cummax`. Any other function is scanned in blocks, calling it on
+    slices of all of the elements at once a logarithmic number of times.
+
     Parameters
     ----------
     x
-        The array to scan over.
+        The array to scan over, or a nested sequence or dict of arrays, which are
+        scanned together along the same axis.
     fn
-        The associative function to apply.
+        The associative function to apply. It receives two arrays, or two nests with
+        the same structure as ``x``, holding slices of earlier and later elements
+        along the axis, and returns their combination with the same structure.
     reverse
         Whether to scan in reverse with respect to the given axis.
     axis
@@ -1974,56 +2132,47 @@ def associative_scan(
     Returns
     -------
     ret
-        The result of the scan.
-    """
-    elems = [x]
+        The result of the scan, with the same structure as ``x``.
 
-    if reverse:
-        elems = [ivy.flip(elem, axis=[axis]) for elem in elems]
-
-    def _combine(a, b):
-        a = a[0]
-        b = b[0]
-        if a.shape[axis] == 0:
-            return [a]
-        c = fn(a, b)
-        return [c]
+    Examples
+    --------
+    >>> x = ivy.array([1., 2., 3., 4.])
+    >>> ivy.associative_scan(x, ivy.add)
+    ivy.array([ 1.,  3.,  6., 10.])
 
-    def _scan(elems):
-        num_elems = elems[0].shape[axis]
+    >>> ivy.associative_scan(x, lambda a, b: a * b, reverse=True)
+    ivy.array([24., 24., 12.,  4.])
+    """
+    if ivy.is_array(x):
+        name = _native_reduction_name(fn)
+        if name in _NATIVE_SCANS and x.size > 0:
+            ret = ivy.__dict__[_NATIVE_SCANS[name]](x, axis=axis, reverse=reverse)
+            if isinstance(ret, tuple):
+                # cummax returns the indices of the maxima as well
+                ret = ret[0]
+            return ret.astype(x.dtype, copy=False)
+        leaves = [x]
+    else:
+        leaves = _tree_leaves(x, [])
+    axes = [axis % leaf.ndim for leaf in leaves]
 
-        if num_elems < 2:
-            return elems
+    if reverse:
+        leaves = [ivy.flip(leaf, axis=a) for leaf, a in zip(leaves, axes)]
 
-        reduced_elems = _combine(
-            [_slice_along_axis(elem, 0, -1, stride=2, axis=axis) for elem in elems],
-            [_slice_along_axis(elem, 1, None, stride=2, axis=axis) for elem in elems],
+    if ivy.is_array(x):
+        combine = lambda a, b: [fn(a[0], b[0])]
+    else:
+        combine = lambda a, b: _tree_leaves(
+            fn(_tree_unflatten(x, iter(a)), _tree_unflatten(x, iter(b))), []
         )
-
-        odd_elems = _scan(reduced_elems)
-
-        if num_elems % 2 == 0:
-            even_elems = _combine(
-                [_slice_along_axis(e, 0, -1, axis=axis) for e in odd_elems],
-                [_slice_along_axis(e, 2, None, stride=2, axis=axis) for e in elems],
-            )
-        else:
-            even_elems = _combine(
-                odd_elems,
-                [_slice_along_axis(e, 2, None, stride=2, axis=axis) for e in elems],
-            )
-        even_elems = [
-            ivy.concat([_slice_along_axis(elem, 0, 1, axis=axis), result], axis=axis)
-            for (elem, result) in zip(elems, even_elems)
-        ]
-        return list(map(partial(_interleave, axis=axis), even_elems, odd_elems))
-
-    scans = _scan(elems)
+    scans = _blocked_scan(leaves, combine, axes)
 
     if reverse:
-        scans = [ivy.flip(scanned, axis=[axis]) for scanned in scans]
+        scans = [ivy.flip(scanned, axis=a) for scanned, a in zip(scans, axes)]
 
-    return ivy.reshape(ivy.asarray(scans), elems[0].shape)
+    if ivy.is_array(x):
+        return scans[0]
+    return _tree_unflatten(x, iter(scans))
 
 
 @handle_exceptions
@@ -398,23 +398,11 @@ class SparseArray:
                     crow_indices, col_indices, values, dense_shape, format
                 )
             else:
-                print(format)
                 self._init_compressed_column_components(
                     ccol_indices, row_indices, values, dense_shape, format
                 )
 
         else:
-            print(
-                format,
-                ccol_indices,
-                row_indices,
-                values,
-                dense_shape,
-                crow_indices,
-                col_indices,
-                values,
-            )
-
             raise ivy.utils.exceptions.IvyException(
                 "specify all coo components (coo_indices, values and "
                 " dense_shape), all csr components (crow_indices, "
@@ -680,99 +668,420 @@ class SparseArray:
     # Instance Methods #
     # ---------------- #
 
-    def _coo_to_dense_coordinates(self):
-        all_coordinates = []
-        for i in range(self._values.shape[0]):
-            coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
-        return all_coordinates
-
-    def _csr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._col_indices.to_list()
-        all_cols = self._crow_indices.to_list()
-        for row in range(total_rows):
-            cols = all_rows[all_cols[row] : all_cols[row + 1]]
-            for col in cols:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _csc_to_dense_coordinates(self):
-        # CSC sparse array
-        all_coordinates = []
-        total_rows = self._dense_shape[1]
-        all_cols = self._row_indices.to_list()
-        all_rows = self._ccol_indices.to_list()
-        for col in range(total_rows):
-            rows = all_cols[all_rows[col] : all_rows[col + 1]]
-            for row in rows:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _bsr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._crow_indices.to_list()
-        all_cols = self._col_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for row in range(total_rows // nblockrows):
-            cols = all_cols[all_rows[row] : all_rows[row + 1]]
-            for col in cols:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
-    def _bsc_to_dense_coordinates(self):
-        all_coordinates = []
-        total_cols = self._dense_shape[1]
-        all_rows = self._row_indices.to_list()
-        all_cols = self._ccol_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for col in range(total_cols // nblockcols):
-            rows = all_rows[all_cols[col] : all_cols[col + 1]]
-            for row in rows:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
-    def to_dense_array(self, *, native=False):
+    def _block_coordinates(self):
+        """Return the row and column index of each entry of a compressed array."""
+        if self._format in ("csr", "bsr"):
+            rows = _expand_compressed_indices(self._crow_indices)
+            return rows, self._col_indices
+        cols = _expand_compressed_indices(self._ccol_indices)
+        return self._row_indices, cols
+
+    def _element_coordinates(self):
+        """Return the coordinates in the dense array of each element of the
+        flattened values, as an array of shape (num_elements, num_dims)."""
         if self._format == "coo":
-            all_coordinates = self._coo_to_dense_coordinates()
-        elif self._format == "csr":
-            all_coordinates = self._csr_to_dense_coordinates()
-        elif self._format == "csc":
-            all_coordinates = self._csc_to_dense_coordinates()
-        elif self._format == "bsc":
-            all_coordinates = self._bsc_to_dense_coordinates()
-        else:
-            all_coordinates = self._bsr_to_dense_coordinates()
+            return ivy.permute_dims(self._coo_indices, axes=(1, 0))
+        rows, cols = self._block_coordinates()
+        if self._format in ("csr", "csc"):
+            return ivy.stack([rows, cols], axis=-1)
+        block_rows, block_cols = self._values.shape[-2:]
+        rows = ivy.reshape(rows, (-1, 1, 1)) * block_rows + ivy.reshape(
+            ivy.arange(block_rows, dtype="int64"), (-1, 1)
+        )
+        cols = ivy.reshape(cols, (-1, 1, 1)) * block_cols + ivy.arange(
+            block_cols, dtype="int64"
+        )
+        rows, cols = ivy.broadcast_arrays(rows, cols)
+        return ivy.stack([ivy.reshape(rows, (-1,)), ivy.reshape(cols, (-1,))], axis=-1)
 
-        # make dense array
+    def to_dense_array(self, *, native=False):
         ret = ivy.scatter_nd(
-            ivy.array(all_coordinates),
+            self._element_coordinates(),
             ivy.flatten(self._values),
             ivy.array(self._dense_shape),
         )
         return ret.to_native() if native else ret
 
+    @classmethod
+    def from_dense_array(cls, x, *, format="coo", blocksize=None):
+        """
+        Create a sparse array holding the nonzero elements of a dense array.
+
+        Parameters
+        ----------
+        x
+            dense array to convert, which must be 2D unless the format is COO.
+        format
+            sparse format of the result, one of coo, csr, csc, bsr or bsc.
+        blocksize
+            (rows, cols) of each block, for the bsr and bsc formats.
+
+        Returns
+        -------
+        ret
+            the sparse array.
+
+        Examples
+        --------
+        >>> x = ivy.array([[0., 2.], [3., 0.]])
+        >>> ivy.SparseArray.from_dense_array(x, format="csr").crow_indices
+        ivy.array([0, 1, 2])
+        """
+        x = ivy.array(x)
+        coordinates = ivy.stack(ivy.nonzero(x), axis=-1)
+        values = ivy.gather_nd(x, coordinates)
+        return _from_coordinates(coordinates, values, x.shape, format, blocksize)
+
+    def to_format(self, format, *, blocksize=None):
+        """
+        Convert the sparse array to another sparse format.
+
+        Parameters
+        ----------
+        format
+            sparse format to convert to, one of coo, csr, csc, bsr or bsc.
+        blocksize
+            (rows, cols) of each block, for the bsr and bsc formats. Defaults to
+            the block size of this array, if it has one.
+
+        Returns
+        -------
+        ret
+            sparse array with the same dense array in the new format. The explicit
+            values of this array are all kept, including any zeros in its blocks.
+        """
+        format = format.lower()
+        if self._format in ("bsr", "bsc"):
+            blocksize = ivy.default(blocksize, tuple(self._values.shape[-2:]))
+        if format == self._format and (
+            format not in ("bsr", "bsc")
+            or tuple(blocksize) == tuple(self._values.shape[-2:])
+        ):
+            return self
+        return _from_coordinates(
+            self._element_coordinates(),
+            ivy.flatten(self._values),
+            self._dense_shape,
+            format,
+            blocksize,
+        )
+
+    def transpose(self):
+        """
+        Reverse the dimensions of the sparse array.
+
+        A compressed array is transposed without moving any of its values, by
+        reinterpreting a CSR array as CSC and BSR as BSC, and vice versa.
+
+        Returns
+        -------
+        ret
+            the transposed sparse array.
+        """
+        shape = tuple(self._dense_shape)[::-1]
+        if self._format == "coo":
+            return SparseArray(
+                coo_indices=ivy.flip(self._coo_indices, axis=0),
+                values=self._values,
+                dense_shape=shape,
+                format="coo",
+            )
+        if self._format in ("csr", "bsr"):
+            return SparseArray(
+                ccol_indices=self._crow_indices,
+                row_indices=self._col_indices,
+                values=_transpose_blocks(self._values),
+                dense_shape=shape,
+                format="csc" if self._format == "csr" else "bsc",
+            )
+        return SparseArray(
+            crow_indices=self._ccol_indices,
+            col_indices=self._row_indices,
+            values=_transpose_blocks(self._values),
+            dense_shape=shape,
+            format="csr" if self._format == "csc" else "bsr",
+        )
+
+    def matmul(self, x):
+        """
+        Multiply the 2D sparse array by a dense vector or matrix.
+
+        The product is computed natively on the backends with sparse tensors, and
+        with gathers and segment sums over the stored values otherwise, blocks
+        being multiplied as dense matrices.
+
+        Parameters
+        ----------
+        x
+            dense array of shape (n,) or (n, k), where n is the number of columns of
+            the sparse array.
+
+        Returns
+        -------
+        ret
+            dense array of shape (m,) or (m, k), where m is the number of rows of
+            the sparse array.
+
+        Examples
+        --------
+        >>> a = ivy.SparseArray.from_dense_array(ivy.array([[0., 2.], [3., 0.]]))
+        >>> a.matmul(ivy.array([1., 1.]))
+        ivy.array([2., 3.])
+        """
+        ivy.utils.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D sparse arrays can be multiplied",
+            as_array=False,
+        )
+        x = ivy.array(x)
+        num_rows = self._dense_shape[0]
+        native_matmul = getattr(ivy.current_backend(), "sparse_dense_matmul", None)
+        if native_matmul is not None:
+            return ivy.array(
+                native_matmul(
+                    ivy.to_native(self._element_coordinates()),
+                    ivy.to_native(ivy.flatten(self._values)),
+                    tuple(self._dense_shape),
+                    ivy.to_native(x),
+                )
+            )
+        x_2d = x if x.ndim == 2 else ivy.reshape(x, (-1, 1))
+        if self._format in ("bsr", "bsc"):
+            block_rows, block_cols = self._values.shape[-2:]
+            rows, cols = self._block_coordinates()
+            x_blocks = ivy.gather(
+                ivy.reshape(x_2d, (-1, block_cols, x_2d.shape[-1])), cols, axis=0
+            )
+            ret = _segment_sum(
+                ivy.matmul(self._values, x_blocks), rows, num_rows // block_rows
+            )
+        else:
+            coordinates = self._element_coordinates()
+            products = ivy.multiply(
+                ivy.reshape(ivy.flatten(self._values), (-1, 1)),
+                ivy.gather(x_2d, coordinates[:, 1], axis=0),
+            )
+            ret = _segment_sum(products, coordinates[:, 0], num_rows)
+        return ivy.reshape(ret, (num_rows,) + tuple(x.shape[1:]))
+
+    def multiply(self, x):
+        """
+        Multiply the sparse array elementwise by a dense array or scalar.
+
+        Parameters
+        ----------
+        x
+            dense array broadcastable to the shape of the sparse array, or scalar.
+
+        Returns
+        -------
+        ret
+            sparse array with the same indices and format, whose values are the
+            products of its values and the elements of x at their positions.
+        """
+        if ivy.is_array(x):
+            x = ivy.broadcast_to(x, tuple(self._dense_shape))
+            x = ivy.reshape(
+                ivy.gather_nd(x, self._element_coordinates()), self._values.shape
+            )
+        return self._with_values(ivy.multiply(self._values, x))
+
+    def add(self, x):
+        """
+        Add a dense array to the sparse array.
+
+        Parameters
+        ----------
+        x
+            dense array broadcastable to the shape of the sparse array.
+
+        Returns
+        -------
+        ret
+            dense array with the sum.
+        """
+        x = ivy.array(x)
+        shape = tuple(self._dense_shape)
+        if tuple(ivy.broadcast_shapes(shape, x.shape)) != shape:
+            # the sparse array itself is broadcast, so it's made dense
+            return ivy.add(self.to_dense_array(), x)
+        values = ivy.flatten(self._values)
+        dtype = ivy.promote_types(values.dtype, x.dtype)
+        return ivy.scatter_nd(
+            self._element_coordinates(),
+            ivy.astype(values, dtype),
+            reduction="sum",
+            out=ivy.astype(ivy.broadcast_to(x, shape), dtype, copy=True),
+        )
+
+    def sum(self, *, axis=None):
+        """
+        Sum the elements of the sparse array.
+
+        Parameters
+        ----------
+        axis
+            dimension to reduce, or None to sum all of the elements.
+
+        Returns
+        -------
+        ret
+            dense array with the sums, with the reduced dimension removed.
+        """
+        if axis is None:
+            return ivy.sum(self._values)
+        num_dims = len(self._dense_shape)
+        axis = axis % num_dims
+        kept = [i for i in range(num_dims) if i != axis]
+        coordinates = ivy.gather(self._element_coordinates(), kept, axis=1)
+        shape = tuple(self._dense_shape[i] for i in kept)
+        values = ivy.flatten(self._values)
+        out = ivy.zeros(shape, dtype=values.dtype)
+        return ivy.scatter_nd(coordinates, values, reduction="sum", out=out)
+
+    def _with_values(self, values):
+        if self._format == "coo":
+            components = {"coo_indices": self._coo_indices}
+        elif self._format in ("csr", "bsr"):
+            components = {
+                "crow_indices": self._crow_indices,
+                "col_indices": self._col_indices,
+            }
+        else:
+            components = {
+                "ccol_indices": self._ccol_indices,
+                "row_indices": self._row_indices,
+            }
+        return SparseArray(
+            **components,
+            values=values,
+            dense_shape=self._dense_shape,
+            format=self._format,
+        )
+
+    def __matmul__(self, other):
+        return self.matmul(other)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        return self.multiply(other)
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __radd__(self, other):
+        return self.add(other)
+
+
+def _expand_compressed_indices(compressed):
+    """Expand compressed indices, such as crow_indices, into the index of each
+    entry."""
+    counts = compressed[1:] - compressed[:-1]
+    return ivy.repeat(ivy.arange(counts.shape[0], dtype="int64"), counts)
+
+
+def _transpose_blocks(values):
+    if len(values.shape) == 3:
+        return ivy.permute_dims(values, axes=(0, 2, 1))
+    return values
+
+
+def _segment_sum(data, segment_ids, num_segments):
+    out = ivy.zeros((num_segments,) + tuple(data.shape[1:]), dtype=data.dtype)
+    return ivy.scatter_nd(
+        ivy.expand_dims(segment_ids, axis=-1), data, reduction="sum", out=out
+    )
+
+
+def _compress(indices, size):
+    """Compress the sorted indices into the offsets of each index in them."""
+    return ivy.searchsorted(indices, ivy.arange(size + 1, dtype="int64"))
+
+
+def _from_coordinates(coordinates, values, shape, format, blocksize):
+    """
+    Build a sparse array in the format from the coordinates of shape (num_elements,
+    num_dims) of each of the values.
+    """
+    format = format.lower()
+    shape = tuple(shape)
+    coordinates = ivy.astype(coordinates, "int64")
+    if format == "coo":
+        return SparseArray(
+            coo_indices=ivy.permute_dims(coordinates, axes=(1, 0)),
+            values=values,
+            dense_shape=shape,
+            format="coo",
+        )
+    ivy.utils.assertions.check_equal(
+        len(shape),
+        2,
+        message=f"only 2D arrays can be converted to {format.upper()} sparse arrays",
+        as_array=False,
+    )
+    rows, cols = coordinates[:, 0], coordinates[:, 1]
+    num_rows, num_cols = shape
+    if format in ("csr", "csc"):
+        if format == "csr":
+            order = ivy.argsort(rows * num_cols + cols, stable=True)
+        else:
+            order = ivy.argsort(cols * num_rows + rows, stable=True)
+        rows = ivy.gather(rows, order)
+        cols = ivy.gather(cols, order)
+        values = ivy.gather(values, order)
+        if format == "csr":
+            return SparseArray(
+                crow_indices=_compress(rows, num_rows),
+                col_indices=cols,
+                values=values,
+                dense_shape=shape,
+                format="csr",
+            )
+        return SparseArray(
+            ccol_indices=_compress(cols, num_cols),
+            row_indices=rows,
+            values=values,
+            dense_shape=shape,
+            format="csc",
+        )
+    ivy.utils.assertions.check_exists(
+        blocksize, message=f"blocksize must be given for {format.upper()} arrays"
+    )
+    block_rows, block_cols = blocksize
+    num_block_rows, num_block_cols = num_rows // block_rows, num_cols // block_cols
+    # each element is assigned to its block, the blocks ordered by row for BSR and
+    # by column for BSC
+    major, minor = rows // block_rows, cols // block_cols
+    num_major, num_minor = num_block_rows, num_block_cols
+    if format == "bsc":
+        major, minor = minor, major
+        num_major, num_minor = num_minor, num_major
+    blocks, block_ids = ivy.unique_inverse(major * num_minor + minor)
+    block_values = ivy.scatter_nd(
+        ivy.stack([block_ids, rows % block_rows, cols % block_cols], axis=-1),
+        values,
+        shape=(blocks.shape[0], block_rows, block_cols),
+    )
+    compressed = _compress(blocks // num_minor, num_major)
+    if format == "bsr":
+        return SparseArray(
+            crow_indices=compressed,
+            col_indices=blocks % num_minor,
+            values=block_values,
+            dense_shape=shape,
+            format="bsr",
+        )
+    return SparseArray(
+        ccol_indices=compressed,
+        row_indices=blocks % num_minor,
+        values=block_values,
+        dense_shape=shape,
+        format="bsc",
+    )
+
 
 class NativeSparseArray:
     pass
@@ -46,6 +46,8 @@ INF = float("inf")
 precise_mode_stack = list()
 queue_timeout_stack = list()
 array_mode_stack = list()
+deferred_elementwise_mode_stack = list()
+deferred_init_mode_stack = list()
 shape_array_mode_stack = list()
 nestable_mode_stack = list()
 exception_trace_mode_stack = list()
@@ -469,6 +471,165 @@ def unset_array_mode() -> None:
         ivy.__setattr__("array_mode", mode, True)
 
 
+class DeferredElementwiseMode:
+    """Deferred Elementwise Mode Context Manager."""
+
+    # noinspection PyShadowingNames
+    def __init__(self, deferred_elementwise_mode):
+        self._deferred_elementwise_mode = deferred_elementwise_mode
+
+    def __enter__(self):
+        set_deferred_elementwise_mode(self._deferred_elementwise_mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_deferred_elementwise_mode()
+        if self and (exc_type is not None):
+            print(exc_tb)
+            raise exc_val
+        return self
+
+
+ivy.deferred_elementwise_mode = False
+
+
+@handle_exceptions
+def set_deferred_elementwise_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to defer the elementwise arithmetic operators of ivy.Array.
+
+    When set, ``+``, ``-``, ``*``, ``/``, ``**`` and unary ``-`` on floating point
+    arrays with the NumPy backend build an expression which is only evaluated once the
+    data of the result is needed, e.g. by any non-elementwise function. The whole
+    expression is then evaluated in cache-sized blocks, or by numexpr if installed,
+    without allocating a full temporary array per operator. The operands must not be
+    updated inplace before the result is evaluated.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to defer the elementwise operators
+
+    Examples
+    --------
+    >>> ivy.set_deferred_elementwise_mode(True)
+    >>> ivy.deferred_elementwise_mode
+    True
+
+    >>> ivy.set_deferred_elementwise_mode(False)
+    >>> ivy.deferred_elementwise_mode
+    False
+    """
+    global deferred_elementwise_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    deferred_elementwise_mode_stack.append(mode)
+    ivy.__setattr__("deferred_elementwise_mode", mode, True)
+
+
+@handle_exceptions
+def unset_deferred_elementwise_mode() -> None:
+    """
+    Reset the mode of whether to defer the elementwise arithmetic operators of
+    ivy.Array to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_deferred_elementwise_mode(True)
+    >>> ivy.deferred_elementwise_mode
+    True
+
+    >>> ivy.unset_deferred_elementwise_mode()
+    >>> ivy.deferred_elementwise_mode
+    False
+    """
+    global deferred_elementwise_mode_stack
+    if deferred_elementwise_mode_stack:
+        deferred_elementwise_mode_stack.pop(-1)
+        mode = (
+            deferred_elementwise_mode_stack[-1]
+            if deferred_elementwise_mode_stack
+            else False
+        )
+        ivy.__setattr__("deferred_elementwise_mode", mode, True)
+
+
+class DeferredInitMode:
+    """Deferred Init Mode Context Manager."""
+
+    # noinspection PyShadowingNames
+    def __init__(self, deferred_init_mode):
+        self._deferred_init_mode = deferred_init_mode
+
+    def __enter__(self):
+        set_deferred_init_mode(self._deferred_init_mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_deferred_init_mode()
+        if self and (exc_type is not None):
+            print(exc_tb)
+            raise exc_val
+        return self
+
+
+ivy.deferred_init_mode = False
+
+
+@handle_exceptions
+def set_deferred_init_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to defer the creation of the variables of ivy.Module.
+
+    When set, the initializers return an ivy.VariableSpec recording the shape, dtype
+    and device of each variable in place of the variable, so that modules are built
+    without allocating any of their variables. These are only created once the
+    module is first called, or by ivy.Module.materialize, possibly straight from the
+    values of a checkpoint.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to defer the creation of the variables
+
+    Examples
+    --------
+    >>> ivy.set_deferred_init_mode(True)
+    >>> ivy.deferred_init_mode
+    True
+
+    >>> ivy.set_deferred_init_mode(False)
+    >>> ivy.deferred_init_mode
+    False
+    """
+    global deferred_init_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    deferred_init_mode_stack.append(mode)
+    ivy.__setattr__("deferred_init_mode", mode, True)
+
+
+@handle_exceptions
+def unset_deferred_init_mode() -> None:
+    """
+    Reset the mode of whether to defer the creation of the variables of ivy.Module
+    to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_deferred_init_mode(True)
+    >>> ivy.deferred_init_mode
+    True
+
+    >>> ivy.unset_deferred_init_mode()
+    >>> ivy.deferred_init_mode
+    False
+    """
+    global deferred_init_mode_stack
+    if deferred_init_mode_stack:
+        deferred_init_mode_stack.pop(-1)
+        mode = deferred_init_mode_stack[-1] if deferred_init_mode_stack else False
+        ivy.__setattr__("deferred_init_mode", mode, True)
+
+
 ivy.nestable_mode = True
 
 
@@ -2354,6 +2515,9 @@ def get_all_arrays_in_memory() -> List[Union[ivy.Array, ivy.NativeArray]]:
     """
     Get all arrays which are currently alive.
 
+    The arrays are read from the registry which every ivy array adds itself to, so
+    that the garbage collector doesn't have to be scanned.
+
     Returns
     -------
     ret
@@ -2370,19 +2534,7 @@ def get_all_arrays_in_memory() -> List[Union[ivy.Array, ivy.NativeArray]]:
     >>> x
     [ivy.array([0, 1, 2])]
     """
-    all_arrays = list()
-    for obj in gc.get_objects():
-        try:
-            if ivy.current_backend_str() in ["", "numpy"]:
-                if ivy.is_ivy_array(obj):
-                    all_arrays.append(obj)
-            else:
-                if ivy.is_native_array(obj):
-                    all_arrays.append(obj)
-
-        except Exception:
-            pass
-    return all_arrays
+    return ivy.utils.memory.live_arrays()
 
 
 @handle_exceptions
@@ -2406,7 +2558,7 @@ def num_arrays_in_memory() -> int:
     >>> x
     1
     """
-    return len(get_all_arrays_in_memory())
+    return ivy.utils.memory.num_live_arrays()
 
 
 @handle_exceptions
@@ -2414,9 +2566,8 @@ def print_all_arrays_in_memory():
     """
     Print all native Ivy arrays in memory to the console.
 
-    Gets all the native Ivy arrays which are currently alive(in the
-    garbage collector) from get_all_arrays_in_memory() function and
-    prints them to the console.
+    Gets all the Ivy arrays which are currently alive from
+    get_all_arrays_in_memory() function and prints them to the console.
     """
     for arr in get_all_arrays_in_memory():
         print(type(arr), arr.shape)
@@ -3821,6 +3972,47 @@ def vmap(
     return current_backend().vmap(func, in_axes, out_axes)
 
 
+@handle_exceptions
+def eval_shape(fn: Callable, /, *args: Any, **kwargs: Any) -> Any:
+    """
+    Compute the shapes, dtypes and devices of the outputs of a function, without
+    computing the outputs themselves.
+
+    The arrays passed to ``fn`` are replaced by :class:`ivy.MetaArray` instances,
+    which only carry a shape, dtype and device, and which are propagated through the
+    ivy functions called by ``fn`` using a shape rule for each function. Functions
+    without a shape rule are executed on dummy arrays of zeros, broadcast to the
+    shape of each meta array, so any control flow depending on the values of the
+    arrays sees zeros.
+
+    Parameters
+    ----------
+    fn
+        Function to evaluate.
+    args
+        Positional arguments of the function. Arrays, and any other object with a
+        ``shape`` and ``dtype`` such as :class:`ivy.VariableSpec`, are passed as
+        meta arrays, also inside of lists, tuples, dicts and containers.
+    kwargs
+        Keyword arguments of the function, passed in the same way.
+
+    Returns
+    -------
+    ret
+        The outputs of the function, with every array replaced by an
+        :class:`ivy.MetaArray`.
+
+    Examples
+    --------
+    >>> x = ivy.MetaArray((8, 3))
+    >>> w = ivy.zeros((4, 3))
+    >>> y = ivy.eval_shape(lambda x, w: ivy.relu(ivy.linear(x, w)).sum(axis=0), x, w)
+    >>> print(y.shape, y.dtype)
+    ivy.Shape(4) float32
+    """
+    return ivy.data_classes.array.meta.eval_shape(fn, *args, **kwargs)
+
+
 @handle_exceptions
 @handle_nestable
 @to_native_arrays_and_back
@@ -195,6 +195,7 @@ def dropout(
     training: bool = True,
     seed: Optional[int] = None,
     noise_shape: Optional[Sequence[int]] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -226,6 +227,9 @@ def dropout(
         mask value will be applied to each element of the input across that dimension. A
         dimension set to 1 means the same mask value will be applied to all elements of
         the input across that dimension.
+    rng
+        random number generator to draw the mask from, in place of the global random
+        state, in which case seed is ignored. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -339,18 +343,28 @@ def dropout(
         for i, v in enumerate(noise_shape):
             if v is None:
                 noise_shape[i] = x.shape[i]
-    mask = ivy.where(
-        ivy.random_uniform(shape=noise_shape, device=ivy.dev(x), dtype=dtype, seed=seed)
-        < prob,
-        0.0,
-        1.0,
-    )
+    if rng is None:
+        noise = ivy.random_uniform(
+            shape=noise_shape, device=ivy.dev(x), dtype=dtype, seed=seed
+        )
+    else:
+        noise = rng.random_uniform(shape=noise_shape, device=ivy.dev(x), dtype=dtype)
+    mask = ivy.where(noise < prob, 0.0, 1.0)
     x = x * mask
     if scale:
         x = ivy.multiply(x, 1.0 / (1.0 - prob), out=out)
     return x if not ivy.exists(out) else ivy.inplace_update(out, x)
 
 
+dropout.mixed_backend_wrappers = {
+    "to_add": (
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
+
+
 # Attention #
 
 
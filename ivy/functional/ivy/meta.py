@@ -2,7 +2,7 @@
 import ivy
 from ivy.func_wrapper import handle_array_function
 from ivy.functional.ivy.gradients import gradient_descent_update
-from ivy.utils.exceptions import handle_exceptions
+from ivy.utils.exceptions import handle_exceptions, is_tracer_error
 
 # local
 from typing import Optional, Union, Callable, Tuple, Any
@@ -12,6 +12,29 @@ from typing import Optional, Union, Callable, Tuple, Any
 
 # Private #
 
+# backends with a native vectorizing map, which the per-task cost functions of
+# unbatched meta steps are mapped with
+_VMAP_BACKENDS = ("jax", "torch")
+
+
+def _select_variables(variables, key_chains, keep):
+    if keep:
+        return variables.cont_at_key_chains(key_chains, ignore_none=True)
+    return variables.cont_prune_key_chains(key_chains, ignore_none=True)
+
+
+def _fill_missing_grads(grads, variables, key_chains):
+    # the gradients normally hold every key chain of the variables already, and the
+    # container is only rebuilt with zeros for the missing ones otherwise
+    if all(kc in grads for kc in key_chains):
+        return grads
+    return ivy.Container(
+        {
+            kc: grads[kc] if kc in grads else ivy.zeros_like(variables[kc])
+            for kc in key_chains
+        }
+    )
+
 
 def _compute_cost_and_update_grads(
     cost_fn,
@@ -25,30 +48,20 @@ def _compute_cost_and_update_grads(
     unique_outer,
     batched,
     num_tasks,
+    outer_key_chains=None,
 ):
     if order == 1:
+        var = _select_variables(variables, outer_v, keep_outer_v)
         cost, inner_grads = ivy.execute_with_gradients(
             lambda v: cost_fn(
                 batch, v=variables.cont_set_at_key_chains(v) if unique_outer else v
             ),
-            (
-                variables.cont_at_key_chains(outer_v, ignore_none=True)
-                if keep_outer_v
-                else variables.cont_prune_key_chains(outer_v, ignore_none=True)
-            ),
+            var,
             retain_grads=False,
         )
-        var = (
-            variables.cont_at_key_chains(outer_v, ignore_none=True)
-            if keep_outer_v
-            else variables.cont_prune_key_chains(outer_v, ignore_none=True)
-        )
-        inner_grads = ivy.Container(
-            {
-                k: ivy.zeros_like(v) if k not in inner_grads else inner_grads[k]
-                for k, v in var.cont_to_iterator()
-            }
-        )
+        if outer_key_chains is None:
+            outer_key_chains = list(var.cont_to_iterator_keys())
+        inner_grads = _fill_missing_grads(inner_grads, var, outer_key_chains)
         if batched:
             inner_grads = ivy.multiply(inner_grads, num_tasks)
         if average_across_steps_or_final:
@@ -85,35 +98,29 @@ def _train_task(
     unique_inner = inner_v is not None
     unique_outer = outer_v is not None
 
+    # the structure of the variables is the same at every step, so the key chains
+    # to check the gradients against are only listed once
+    inner_key_chains = list(
+        _select_variables(variables, inner_v, keep_innver_v).cont_to_iterator_keys()
+    )
+    outer_key_chains = list(
+        _select_variables(variables, outer_v, keep_outer_v).cont_to_iterator_keys()
+    )
+
     # iterate through inner loop training steps
     for i in range(inner_grad_steps):
         # compute inner gradient for update the inner variables
+        var = _select_variables(variables, inner_v, keep_innver_v)
         cost, inner_update_grads = ivy.execute_with_gradients(
             lambda v: inner_cost_fn(
                 inner_batch,
                 v=variables.cont_set_at_key_chains(v) if unique_inner else v,
             ),
-            (
-                variables.cont_at_key_chains(inner_v, ignore_none=True)
-                if keep_innver_v
-                else variables.cont_prune_key_chains(inner_v, ignore_none=True)
-            ),
+            var,
             retain_grads=order > 1,
         )
-        var = (
-            variables.cont_at_key_chains(inner_v, ignore_none=True)
-            if keep_innver_v
-            else variables.cont_prune_key_chains(inner_v, ignore_none=True)
-        )
-        inner_update_grads = ivy.Container(
-            {
-                k: (
-                    ivy.zeros_like(v)
-                    if k not in inner_update_grads
-                    else inner_update_grads[k]
-                )
-                for k, v in var.cont_to_iterator()
-            }
+        inner_update_grads = _fill_missing_grads(
+            inner_update_grads, var, inner_key_chains
         )
         if batched:
             inner_update_grads = ivy.multiply(inner_update_grads, num_tasks)
@@ -134,6 +141,7 @@ def _train_task(
                 unique_outer,
                 batched,
                 num_tasks,
+                outer_key_chains,
             )
 
         # update cost and update parameters
@@ -141,11 +149,7 @@ def _train_task(
         if unique_inner:
             variables = variables.cont_set_at_key_chains(
                 inner_optimization_step(
-                    (
-                        variables.cont_at_key_chains(inner_v)
-                        if keep_innver_v
-                        else variables.cont_prune_key_chains(inner_v)
-                    ),
+                    _select_variables(variables, inner_v, keep_innver_v),
                     inner_update_grads,
                     inner_learning_rate,
                     stop_gradients=stop_gradients,
@@ -173,6 +177,7 @@ def _train_task(
         unique_outer,
         batched,
         num_tasks,
+        outer_key_chains,
     )
 
     # update variables
@@ -277,18 +282,8 @@ def _train_tasks_with_for_loop(
     total_cost = 0
     updated_ivs_to_return = list()
     all_grads = list()
-    if isinstance(inner_v, (list, tuple)) and isinstance(
-        inner_v[0], (list, tuple, dict, type(None))
-    ):
-        inner_v_seq = True
-    else:
-        inner_v_seq = False
-    if isinstance(outer_v, (list, tuple)) and isinstance(
-        outer_v[0], (list, tuple, dict, type(None))
-    ):
-        outer_v_seq = True
-    else:
-        outer_v_seq = False
+    inner_v_seq = _is_per_task_v(inner_v)
+    outer_v_seq = _is_per_task_v(outer_v)
     for i, sub_batch in enumerate(batch.cont_unstack_conts(0, True, num_tasks)):
         if inner_sub_batch_fn is not None:
             inner_sub_batch = inner_sub_batch_fn(sub_batch)
@@ -336,6 +331,122 @@ def _train_tasks_with_for_loop(
     return total_cost / num_tasks
 
 
+def _is_per_task_v(v):
+    return isinstance(v, (list, tuple)) and isinstance(
+        v[0], (list, tuple, dict, type(None))
+    )
+
+
+def _can_vectorize_tasks(batch, inner_v, outer_v, num_tasks):
+    if _is_per_task_v(inner_v) or _is_per_task_v(outer_v):
+        return False
+    batch_size = batch.cont_shape[0]
+    return batch_size is not None and batch_size >= num_tasks
+
+
+def _mean_task_cost_fn(cost_fn, num_tasks):
+    """
+    Wrap a cost function of a single task, receiving the task sub-batch and the
+    variables, into the cost function of all of the tasks at once, which returns the
+    mean of the task costs as for batched meta steps.
+
+    The wrapped function receives the variables stacked along a leading task axis,
+    and the batch paired with the function to apply to each task sub-batch.
+    """
+    use_vmap = ivy.current_backend_str() in _VMAP_BACKENDS
+
+    def _looped_cost(batch, batch_fn, v):
+        costs = [
+            cost_fn(sub_batch if batch_fn is None else batch_fn(sub_batch), v=sub_v)
+            for sub_batch, sub_v in zip(
+                batch.cont_unstack_conts(0, True, num_tasks),
+                v.cont_unstack_conts(0, dim_size=num_tasks),
+            )
+        ]
+        return sum(costs) / num_tasks
+
+    def _vmapped_cost(batch, batch_fn, v):
+        batch_leaves = batch.cont_to_flat_list()
+        num_batch_leaves = len(batch_leaves)
+
+        def _task_cost(*leaves):
+            sub_batch = batch.cont_from_flat_list(
+                [ivy.expand_dims(x, axis=0) for x in leaves[:num_batch_leaves]]
+            )
+            if batch_fn is not None:
+                sub_batch = batch_fn(sub_batch)
+            sub_v = v.cont_from_flat_list(list(leaves[num_batch_leaves:]))
+            return cost_fn(sub_batch, v=sub_v)
+
+        return ivy.mean(ivy.vmap(_task_cost)(*batch_leaves, *v.cont_to_flat_list()))
+
+    def _cost_fn(task_batch, v):
+        nonlocal use_vmap
+        batch, batch_fn = task_batch
+        if use_vmap:
+            try:
+                return _vmapped_cost(batch, batch_fn, v)
+            except Exception as e:
+                if not is_tracer_error(e):
+                    raise
+                # the cost function can't be vectorized, for example as it converts
+                # arrays to python scalars, so the tasks are looped over instead
+                use_vmap = False
+        return _looped_cost(batch, batch_fn, v)
+
+    return _cost_fn
+
+
+def _train_tasks_vectorized(
+    batch,
+    inner_sub_batch_fn,
+    outer_sub_batch_fn,
+    inner_cost_fn,
+    outer_cost_fn,
+    variables,
+    inner_grad_steps,
+    inner_learning_rate,
+    inner_optimization_step,
+    order,
+    average_across_steps,
+    inner_v,
+    keep_innver_v,
+    outer_v,
+    keep_outer_v,
+    return_inner_v,
+    num_tasks,
+    stop_gradients,
+):
+    # the variables of every task are stacked along a leading task axis, so that the
+    # inner loops of all the tasks run together as a batched meta step, with a single
+    # gradient computation and optimization step per inner step
+    if batch.cont_shape[0] != num_tasks:
+        batch = batch[0:num_tasks]
+    stacked_variables = variables.cont_map(
+        lambda x, kc: ivy.repeat(ivy.expand_dims(x, axis=0), num_tasks, axis=0)
+    )
+    return _train_tasks_batched(
+        batch,
+        lambda b: (b, inner_sub_batch_fn),
+        lambda b: (b, outer_sub_batch_fn),
+        _mean_task_cost_fn(inner_cost_fn, num_tasks),
+        None if outer_cost_fn is None else _mean_task_cost_fn(outer_cost_fn, num_tasks),
+        stacked_variables,
+        inner_grad_steps,
+        inner_learning_rate,
+        inner_optimization_step,
+        order,
+        average_across_steps,
+        inner_v,
+        keep_innver_v,
+        outer_v,
+        keep_outer_v,
+        return_inner_v,
+        num_tasks,
+        stop_gradients,
+    )
+
+
 def _train_tasks(
     batch,
     inner_batch_fn,
@@ -378,6 +489,27 @@ def _train_tasks(
             num_tasks,
             stop_gradients,
         )
+    if _can_vectorize_tasks(batch, inner_v, outer_v, num_tasks):
+        return _train_tasks_vectorized(
+            batch,
+            inner_batch_fn,
+            outer_batch_fn,
+            inner_cost_fn,
+            outer_cost_fn,
+            variables,
+            inner_grad_steps,
+            inner_learning_rate,
+            inner_optimization_step,
+            order,
+            average_across_steps,
+            inner_v,
+            keep_innver_v,
+            outer_v,
+            keep_outer_v,
+            return_inner_v,
+            num_tasks,
+            stop_gradients,
+        )
     return _train_tasks_with_for_loop(
         batch,
         inner_batch_fn,
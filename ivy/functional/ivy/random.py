@@ -1,8 +1,12 @@
 """Collection of random Ivy functions."""
 
 # global
+import math
+import threading
 from typing import Optional, Union
 
+import numpy as np
+
 # local
 import ivy
 from ivy.func_wrapper import (
@@ -531,6 +535,7 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional["ivy.random.Generator"] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -544,6 +549,9 @@ def shuffle(
         The axis which x is shuffled along. Default is 0.
     seed
         A python integer. Used to create a random seed distribution
+    rng
+        random number generator to draw the permutation from, in place of the global
+        random state, in which case seed is ignored. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -604,4 +612,322 @@ def shuffle(
         b: ivy.array([3, 0, 9])
     }
     """
+    if rng is not None:
+        return rng.shuffle(x, axis)
     return ivy.current_backend(x).shuffle(x, axis, seed=seed, out=out)
+
+
+shuffle.mixed_backend_wrappers = {"to_add": (), "to_skip": ()}
+
+
+# Generator #
+# --------- #
+
+
+class Generator:
+    """
+    A stream of random numbers, independent of the global random state of the
+    backend.
+
+    The numbers are drawn with the counter-based Philox generator on the host, and
+    then moved to the requested device, so a stream gives the same numbers with every
+    backend. Drawing from a generator is thread-safe, but each thread or worker should
+    draw from its own stream, created with :meth:`Generator.fork`, for the numbers it
+    draws to be reproducible regardless of how the threads are scheduled.
+
+    With a ``buffer_size``, the uniform and normal numbers are drawn from the stream
+    in blocks of that many numbers, and requests for fewer numbers are served from the
+    current block, which amortises the cost of each draw over many small requests.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        /,
+        *,
+        buffer_size: int = 0,
+    ):
+        """
+        Create a random number generator.
+
+        Parameters
+        ----------
+        seed
+            seed of the stream, or a seed sequence as spawned by :meth:`fork`. A seed
+            is drawn from the operating system if not given. Default is ``None``.
+        buffer_size
+            number of uniform and normal numbers to pre-draw at a time, or 0 to draw
+            the numbers for each request separately. Default is ``0``.
+
+        Examples
+        --------
+        >>> rng = ivy.random.Generator(0)
+        >>> x = rng.random_uniform(shape=(2,))
+        >>> y = ivy.random.Generator(0).random_uniform(shape=(2,))
+        >>> print(ivy.array_equal(x, y))
+        True
+        """
+        if buffer_size < 0:
+            raise ivy.utils.exceptions.IvyException(
+                "buffer_size must be non-negative, but found {}".format(buffer_size)
+            )
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self._seed_sequence = seed
+        self._generator = np.random.Generator(np.random.Philox(seed))
+        self._buffer_size = buffer_size
+        self._buffers = {"uniform": (None, 0), "normal": (None, 0)}
+        self._lock = threading.Lock()
+
+    # Properties #
+    # ---------- #
+
+    @property
+    def buffer_size(self):
+        """Number of numbers pre-drawn at a time, 0 if the generator is unbuffered."""
+        return self._buffer_size
+
+    # Methods #
+    # ------- #
+
+    def fork(self, num_streams: Optional[int] = None, /):
+        """
+        Create independent streams from this generator, such as one for each thread
+        or worker.
+
+        The forked streams are derived from the seed of this generator, and not from
+        the numbers it has drawn so far.
+
+        Parameters
+        ----------
+        num_streams
+            number of streams to create, or None to create a single stream.
+            Default is ``None``.
+
+        Returns
+        -------
+        ret
+            the new generator, or a list of ``num_streams`` generators, with the
+            buffer size of this generator.
+
+        Examples
+        --------
+        >>> rng = ivy.random.Generator(0)
+        >>> a, b = rng.fork(2)
+        >>> x = a.random_uniform(shape=(3,))
+        >>> y = b.random_uniform(shape=(3,))
+        >>> print(ivy.array_equal(x, y))
+        False
+        """
+        with self._lock:
+            seeds = self._seed_sequence.spawn(1 if num_streams is None else num_streams)
+        streams = [Generator(s, buffer_size=self._buffer_size) for s in seeds]
+        return streams[0] if num_streams is None else streams
+
+    def random_uniform(
+        self,
+        *,
+        low: Union[float, ivy.NativeArray, ivy.Array] = 0.0,
+        high: Union[float, ivy.NativeArray, ivy.Array] = 1.0,
+        shape: Optional[Union[ivy.Array, ivy.Shape, ivy.NativeShape]] = None,
+        device: Union[ivy.Device, ivy.NativeDevice] = None,
+        dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    ) -> ivy.Array:
+        """
+        Draw samples from a uniform distribution, as for :func:`ivy.random_uniform`.
+
+        Parameters
+        ----------
+        low
+            Lower boundary of the output interval. Default is ``0.0``.
+        high
+            Upper boundary of the output interval. Default is ``1.0``.
+        shape
+            Shape of the output, the broadcast shape of low and high if not given.
+        device
+            device on which to create the array. Default is the default device.
+        dtype
+            output array data type. Default is the default float dtype.
+
+        Returns
+        -------
+        ret
+            Drawn samples from the uniform distribution.
+        """
+        low, high = _to_numpy(low), _to_numpy(high)
+        shape = _sample_shape(shape, low, high)
+        samples = self._draw("uniform", shape)
+        return _from_numpy(
+            low + (high - low) * samples, device, dtype, ivy.default_float_dtype
+        )
+
+    def random_normal(
+        self,
+        *,
+        mean: Union[float, ivy.NativeArray, ivy.Array] = 0.0,
+        std: Union[float, ivy.NativeArray, ivy.Array] = 1.0,
+        shape: Optional[Union[ivy.Shape, ivy.NativeShape]] = None,
+        device: Union[ivy.Device, ivy.NativeDevice] = None,
+        dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    ) -> ivy.Array:
+        """
+        Draw samples from a normal distribution, as for :func:`ivy.random_normal`.
+
+        Parameters
+        ----------
+        mean
+            The mean of the normal distribution. Default is ``0.0``.
+        std
+            The standard deviation of the normal distribution. Default is ``1.0``.
+        shape
+            Shape of the output, the broadcast shape of mean and std if not given.
+        device
+            device on which to create the array. Default is the default device.
+        dtype
+            output array data type. Default is the default float dtype.
+
+        Returns
+        -------
+        ret
+            Drawn samples from the normal distribution.
+        """
+        mean, std = _to_numpy(mean), _to_numpy(std)
+        shape = _sample_shape(shape, mean, std)
+        samples = self._draw("normal", shape)
+        return _from_numpy(mean + std * samples, device, dtype, ivy.default_float_dtype)
+
+    def randint(
+        self,
+        low: Union[int, ivy.NativeArray, ivy.Array],
+        high: Union[int, ivy.NativeArray, ivy.Array],
+        /,
+        *,
+        shape: Optional[Union[ivy.Shape, ivy.NativeShape]] = None,
+        device: Union[ivy.Device, ivy.NativeDevice] = None,
+        dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    ) -> ivy.Array:
+        """
+        Draw integers from the interval [low, high), as for :func:`ivy.randint`.
+
+        Parameters
+        ----------
+        low
+            Lowest integer that can be drawn from the distribution.
+        high
+            One above the highest integer that can be drawn from the distribution.
+        shape
+            Shape of the output, the broadcast shape of low and high if not given.
+        device
+            device on which to create the array. Default is the default device.
+        dtype
+            output array data type. Default is the default int dtype.
+
+        Returns
+        -------
+        ret
+            Drawn integers.
+        """
+        low, high = _to_numpy(low), _to_numpy(high)
+        shape = _sample_shape(shape, low, high)
+        with self._lock:
+            samples = self._generator.integers(low, high, size=shape)
+        return _from_numpy(samples, device, dtype, ivy.default_int_dtype)
+
+    def permutation(
+        self,
+        n: int,
+        /,
+        *,
+        device: Union[ivy.Device, ivy.NativeDevice] = None,
+        dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    ) -> ivy.Array:
+        """
+        Draw a random permutation of the integers [0, n).
+
+        Parameters
+        ----------
+        n
+            number of integers to permute.
+        device
+            device on which to create the array. Default is the default device.
+        dtype
+            output array data type. Default is the default int dtype.
+
+        Returns
+        -------
+        ret
+            The permuted integers.
+        """
+        with self._lock:
+            samples = self._generator.permutation(n)
+        return _from_numpy(samples, device, dtype, ivy.default_int_dtype)
+
+    def shuffle(
+        self,
+        x: Union[ivy.Array, ivy.NativeArray],
+        axis: Optional[int] = 0,
+        /,
+    ) -> ivy.Array:
+        """
+        Shuffle the array along the axis, as for :func:`ivy.shuffle`.
+
+        Parameters
+        ----------
+        x
+            Input array.
+        axis
+            The axis which x is shuffled along. Default is ``0``.
+
+        Returns
+        -------
+        ret
+            The shuffled array.
+        """
+        indices = self.permutation(x.shape[axis], device=ivy.dev(x), dtype="int64")
+        return ivy.gather(x, indices, axis=axis)
+
+    # Helpers #
+    # ------- #
+
+    def _draw(self, kind, shape):
+        size = math.prod(shape)
+        draw = (
+            self._generator.random
+            if kind == "uniform"
+            else self._generator.standard_normal
+        )
+        with self._lock:
+            if size > self._buffer_size:
+                return draw(shape)
+            buffer, start = self._buffers[kind]
+            if buffer is None or start + size > buffer.size:
+                # a fresh block is drawn rather than refilling the old one in place,
+                # as the numbers served from it may still be in use
+                buffer, start = draw(self._buffer_size), 0
+            self._buffers[kind] = (buffer, start + size)
+        return buffer[start : start + size].reshape(shape)
+
+
+def _to_numpy(x):
+    if ivy.is_array(x):
+        return ivy.to_numpy(x)
+    return x
+
+
+def _sample_shape(shape, *params):
+    if shape is not None:
+        return tuple(ivy.to_list(shape) if ivy.is_array(shape) else shape)
+    return np.broadcast_shapes(*[np.shape(p) for p in params])
+
+
+def _from_numpy(samples, device, dtype, default_dtype):
+    dtype = ivy.as_ivy_dtype(default_dtype() if dtype is None else dtype)
+    device = ivy.default_device() if device is None else device
+    try:
+        samples = np.asarray(samples).astype(dtype, copy=False)
+    except TypeError:
+        # dtypes unknown to numpy, such as bfloat16, are cast by the backend
+        return ivy.asarray(samples, dtype=dtype, device=device)
+    # the samples already have their dtype, so they are handed to the backend
+    # directly, as the wrappers of ivy.asarray would dominate small draws
+    return ivy.Array(ivy.current_backend().asarray(samples, device=device))
@@ -12,6 +12,47 @@ from ivy.functional.ivy.gradients import _is_variable
 from ivy.utils.backend import current_backend
 
 
+class _ParamSync:
+    """
+    Flat mapping from the key chains of the parameters of a native module to the
+    variables last pushed to them, so that only the variables which were replaced
+    since are pushed again.
+
+    The variables are compared by identity, the updates made inplace being shared
+    with the native parameters already.
+    """
+
+    __slots__ = ("paths", "pushed")
+
+    def __init__(self, params):
+        items = list(params.cont_to_iterator())
+        self.paths = [tuple(kc.split("/")) for kc, _ in items]
+        self.pushed = [x for _, x in items]
+
+    def __call__(self, v, push=None):
+        """
+        Push the variables of v which changed since the last call, with
+        ``push(idx, x)`` for the parameter at index idx of the mapping.
+
+        Returns
+        -------
+        ret
+            Whether any variable changed.
+        """
+        changed = False
+        pushed = self.pushed
+        for i, path in enumerate(self.paths):
+            x = v
+            for k in path:
+                x = dict.__getitem__(x, k)
+            if x is not pushed[i]:
+                if push is not None:
+                    push(i, x)
+                pushed[i] = x
+                changed = True
+        return changed
+
+
 def to_ivy_module(
     native_module=None,
     native_module_class=None,
@@ -169,6 +210,8 @@ class ModuleConverters:
                 # noinspection PyUnresolvedReferences
                 params_dict = _hk_flat_map_to_dict(params_hk)
                 self._hk_params = ivy.Container(params_dict, dynamic_backend=False)
+                self._params_sync = _ParamSync(self._hk_params)
+                self._params_hk = None
                 param_iterator = self._hk_params.cont_to_iterator()
                 _, param0 = next(param_iterator)
                 if hasattr(param0, "device"):
@@ -178,8 +221,10 @@ class ModuleConverters:
 
             def _forward(self, *a, **kw):
                 a, kw = ivy.args_to_native(*a, **kw)
-                params_hk = _dict_to_hk_flat_map(self.v.cont_to_dict())
-                ret = self._native_module.apply(params_hk, 0, *a, **kw)
+                # only converted again once the variables are replaced
+                if self._params_sync(self.v) or self._params_hk is None:
+                    self._params_hk = _dict_to_hk_flat_map(self.v.cont_to_dict())
+                ret = self._native_module.apply(self._params_hk, 0, *a, **kw)
                 if isinstance(ret, tuple):
                     return ivy.args_to_native(*ret)
                 return ivy.to_native(ret)
@@ -300,14 +345,18 @@ class ModuleConverters:
                 # noinspection PyUnresolvedReferences
                 params_dict = flax.core.unfreeze(params_fx)
                 self._fx_params = ivy.Container(params_dict, dynamic_backend=False)
+                self._params_sync = _ParamSync(self._fx_params)
+                self._params_fx = None
                 param_iterator = self._fx_params.cont_to_iterator()
                 _, param0 = next(param_iterator)
                 self._dev = ivy.as_ivy_dev(ivy.dev(param0))
 
             def _forward(self, *a, **kw):
                 a, kw = ivy.args_to_native(*a, **kw)
-                params_fx = flax.core.freeze(self.v.cont_to_dict())
-                ret = self._native_module.apply(params_fx, *a, **kw)
+                # only frozen again once the variables are replaced
+                if self._params_sync(self.v) or self._params_fx is None:
+                    self._params_fx = flax.core.freeze(self.v.cont_to_dict())
+                ret = self._native_module.apply(self._params_fx, *a, **kw)
                 if isinstance(ret, tuple):
                     return ivy.args_to_native(*ret)
                 return ivy.to_native(ret)
@@ -607,37 +656,37 @@ class ModuleConverters:
                     ),
                     dynamic_backend=False,
                 )
-
-            @staticmethod
-            def _inplace_update(p, v):
-                p.data = v.data
+                self._params_sync = _ParamSync(self._native_params)
+                # the parameter and the submodule owning it for each key chain
+                self._params = list(self._params_sync.pushed)
+                self._param_owners = []
+                for path in self._params_sync.paths:
+                    native = self._native_module
+                    for k in path[:-1]:
+                        # noinspection PyProtectedMember
+                        native = native._modules[k]
+                    self._param_owners.append((native, path[-1]))
 
             def _inplace_update_v(self, new_v):
-                ivy.Container.cont_multi_map(
-                    lambda xs, kc: self._inplace_update(xs[0], xs[1]),
-                    [self._native_params, new_v],
-                )
+                def _inplace_update(i, v):
+                    self._params[i].data = v.data
 
-            def _replace_update_v(self, new_v, native=None):
-                native = ivy.default(native, self._native_module)
-                for k, v in new_v.items():
-                    if isinstance(v, ivy.Container):
-                        # noinspection PyProtectedMember
-                        native._modules[k] = self._replace_update_v(
-                            v, native._modules[k]
-                        )
-                    elif _is_variable(v):
-                        # noinspection PyProtectedMember
+                self._params_sync(new_v, _inplace_update)
+
+            def _replace_update_v(self, new_v):
+                def _replace_update(i, v):
+                    native, k = self._param_owners[i]
+                    if _is_variable(v):
                         native.__setattr__(k, v)
                     elif isinstance(v, torch.Tensor):
-                        # noinspection PyProtectedMember
                         native.__setattr__(k, torch.nn.Parameter(v))
                     else:
                         raise ivy.utils.exceptions.IvyException(
                             "found item in variable container {} which was neither a "
                             "sub ivy.Container nor a variable.".format(v)
                         )
-                return native
+
+                self._params_sync(new_v, _replace_update)
 
             def _forward(self, *a, **kw):
                 a, kw = ivy.args_to_native(*a, **kw)
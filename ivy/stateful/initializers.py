@@ -1,12 +1,101 @@
 # global
 from typing import Tuple, Union, Optional
 import abc
+import functools
+import inspect
 
 # local
 import ivy
 from ivy.functional.ivy.gradients import _variable
 
 
+# Variable Spec #
+# ------------- #
+
+
+class VariableSpec:
+    """
+    A variable whose creation was deferred by ivy.deferred_init_mode.
+
+    Only records the shape, dtype and device of the variable, along with the
+    initializer call creating it, which is made once the variable is materialized.
+    """
+
+    __slots__ = ("shape", "dtype", "device", "_create", "_args", "_kwargs", "_value")
+
+    def __init__(self, create, args, kwargs):
+        arguments = inspect.signature(create).bind(*args, **kwargs).arguments
+        shape = arguments.get("var_shape", getattr(args[0], "_shape", None))
+        if shape is None:
+            shape = ()
+        elif isinstance(shape, int):
+            shape = (shape,)
+        dtype = arguments.get("dtype")
+        self.shape = tuple(int(d) for d in shape)
+        self.dtype = (
+            ivy.default_float_dtype() if dtype is None else ivy.as_ivy_dtype(dtype)
+        )
+        self.device = arguments.get("device")
+        self._create = create
+        self._args = args
+        self._kwargs = kwargs
+        self._value = None
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the variable has been created."""
+        return self._value is not None
+
+    def materialize(
+        self, value: Optional[Union[ivy.Array, ivy.NativeArray]] = None
+    ) -> ivy.Array:
+        """
+        Create the variable, unless it has been created already.
+
+        Parameters
+        ----------
+        value
+            Value of the variable, e.g. loaded from a checkpoint, which is cast to
+            the dtype and device of the variable. Default is ``None``, in which case
+            the variable is created by its initializer.
+
+        Returns
+        -------
+        ret
+            The variable.
+        """
+        if self._value is None:
+            if value is None:
+                value = self._create(*self._args, **self._kwargs)
+            else:
+                ivy.utils.assertions.check_equal(
+                    tuple(value.shape),
+                    self.shape,
+                    message="the shape of the value doesn't match the variable",
+                    as_array=False,
+                )
+                value = _variable(
+                    ivy.asarray(value, dtype=self.dtype, device=self.device)
+                )
+            self._value = value
+        return self._value
+
+    def __repr__(self):
+        return "VariableSpec(shape={}, dtype={}, initializer={})".format(
+            self.shape, self.dtype, type(self._args[0]).__name__
+        )
+
+
+def _deferrable(fn):
+    @functools.wraps(fn)
+    def _create_variables(*args, **kwargs):
+        if ivy.deferred_init_mode:
+            return VariableSpec(fn, args, kwargs)
+        return fn(*args, **kwargs)
+
+    return _create_variables
+
+
 # Initializer #
 # ----------- #
 
@@ -22,6 +111,12 @@ class Initializer(abc.ABC):
     initial weights must be picked carefully.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the variables of every initializer are deferred by ivy.deferred_init_mode
+        if "create_variables" in cls.__dict__:
+            cls.create_variables = _deferrable(cls.__dict__["create_variables"])
+
     @abc.abstractmethod
     def create_variables(
         self,
@@ -99,7 +194,7 @@ class Ones(Constant):
 
 
 class Uniform(Initializer):
-    def __init__(self, numerator, fan_mode, power, gain):
+    def __init__(self, numerator, fan_mode, power, gain, rng=None):
         """
         Initialize based on a uniform distribution, will fill in all values with values
         drawn from a uniform (all values have an equal probability) distribution.
@@ -129,6 +224,9 @@ class Uniform(Initializer):
             Sets the drop-off factor for the calculated `fan`.
         gain
             Scales the output of the distribution.
+        rng
+            random number generator to draw the values from, in place of the global
+            random state. Default is ``None``.
         """
         ivy.utils.assertions.check_elem_in_list(
             fan_mode, ["fan_in", "fan_out", "fan_sum", "fan_avg"]
@@ -137,6 +235,7 @@ class Uniform(Initializer):
         self._fan_mode = fan_mode
         self._power = power
         self._gain = gain
+        self._rng = rng
 
     def create_variables(
         self, var_shape, device, fan_out=None, fan_in=None, dtype=None
@@ -206,47 +305,70 @@ class Uniform(Initializer):
                 "fan_sum | fan_avg ] "
             )
         wlim = ((self._numerator / fan) ** self._power) * self._gain
+        rng = ivy if self._rng is None else self._rng
         return _variable(
-            ivy.random_uniform(
+            rng.random_uniform(
                 low=-wlim, high=wlim, shape=var_shape, device=device, dtype=dtype
             ),
         )
 
 
 class GlorotUniform(Uniform):
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Initialize Glorot uniform, also known as the Xavier uniform initializer.
 
         It draws values from a uniform distribtion `[-limit, limit]` where
         `limit = sqrt(6 / (fan_in + fan_out))` where `fan_in` and `fan_out` are the
         number of input and output features respectively.
+
+        Parameters
+        ----------
+        rng
+            random number generator to draw the values from, in place of the global
+            random state. Default is ``None``.
         """
-        super().__init__(numerator=6, fan_mode="fan_sum", power=0.5, gain=1)
+        super().__init__(numerator=6, fan_mode="fan_sum", power=0.5, gain=1, rng=rng)
 
 
 class FirstLayerSiren(Uniform):
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Initialize Siren uniform for the first layer.
 
         It draws values from a uniform distribtion `[-limit, limit]`
         where `limit=fan_in` where `fan_in` is the number of input
         features.
+
+        Parameters
+        ----------
+        rng
+            random number generator to draw the values from, in place of the global
+            random state. Default is ``None``.
         """
-        super().__init__(numerator=1, fan_mode="fan_in", power=1, gain=1)
+        super().__init__(numerator=1, fan_mode="fan_in", power=1, gain=1, rng=rng)
 
 
 class Siren(Uniform):
-    def __init__(self, w0=30):
+    def __init__(self, w0=30, rng=None):
         """
         Initialize Siren uniform initializer for the first layer.
 
         It draws values from a uniform distribtion `[-limit, limit]`
         where `limit=sqrt(6 / fan_in) / w0` where `fan_in` is the number
         of input features.
+
+        Parameters
+        ----------
+        w0
+            Scales down the limit of the distribution by this factor.
+        rng
+            random number generator to draw the values from, in place of the global
+            random state. Default is ``None``.
         """
-        super().__init__(numerator=6, fan_mode="fan_in", power=0.5, gain=1 / w0)
+        super().__init__(
+            numerator=6, fan_mode="fan_in", power=0.5, gain=1 / w0, rng=rng
+        )
 
 
 # Gaussian #
@@ -254,7 +376,7 @@ class Siren(Uniform):
 
 
 class KaimingNormal(Initializer):
-    def __init__(self, mean=0, fan_mode="fan_in"):
+    def __init__(self, mean=0, fan_mode="fan_in", rng=None):
         """
         Initialize Kaiming normal, also known as He Initialization.
 
@@ -276,12 +398,16 @@ class KaimingNormal(Initializer):
               output features of this neuron.
             - `fan_sum` sets `fan` to the average of the number of input features and
               output features of this neuron.
+        rng
+            random number generator to draw the values from, in place of the global
+            random state. Default is ``None``.
         """
         ivy.utils.assertions.check_elem_in_list(
             fan_mode, ["fan_in", "fan_out", "fan_sum", "fan_avg"]
         )
         self._mean = mean
         self._fan_mode = fan_mode
+        self._rng = rng
 
     def create_variables(
         self,
@@ -360,15 +486,16 @@ class KaimingNormal(Initializer):
                 "fan_sum | fan_avg ] "
             )
         std = (2 / ((1 + negative_slope**2) * fan)) ** 0.5
+        rng = ivy if self._rng is None else self._rng
         return _variable(
-            ivy.random_normal(
+            rng.random_normal(
                 mean=self._mean, std=std, shape=var_shape, device=device, dtype=dtype
             )
         )
 
 
 class RandomNormal(Initializer):
-    def __init__(self, mean=0.0, stddev=0.05, shape=None, seed=None):
+    def __init__(self, mean=0.0, stddev=0.05, shape=None, seed=None, rng=None):
         """
         Initialize with Random Normal Distribution.
 
@@ -388,11 +515,15 @@ class RandomNormal(Initializer):
             returned.
         seed
             Used to create a random seed distribution.(Default:None)
+        rng
+            random number generator to draw the values from, in place of the global
+            random state, in which case seed is ignored. Default is ``None``.
         """
         self._mean = mean
         self._stddev = stddev
         self._shape = shape
         self._seed = seed
+        self._rng = rng
 
     def create_variables(
         self,
@@ -410,6 +541,16 @@ class RandomNormal(Initializer):
         dtype
             Desired data type.
         """
+        if self._rng is not None:
+            return _variable(
+                self._rng.random_normal(
+                    mean=self._mean,
+                    std=self._stddev,
+                    shape=self._shape,
+                    device=device,
+                    dtype=dtype,
+                )
+            )
         return _variable(
             ivy.random_normal(
                 mean=self._mean,
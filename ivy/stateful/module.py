@@ -4,14 +4,17 @@
 import os
 import abc
 import copy
-from typing import Optional, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict, Union
 
 # local
 import ivy
+from ivy.data_classes.array import meta as _meta
 from ivy.data_classes.container import Container
 from ivy.func_wrapper import _get_first_array
 from ivy.stateful.helpers import ModuleHelpers
 from ivy.stateful.converters import ModuleConverters
+from ivy.stateful.initializers import VariableSpec
 
 
 # Base #
@@ -96,6 +99,7 @@ class Module(ModuleConverters, ModuleHelpers):
         self._with_partial_v = with_partial_v
         self._store_vars = store_vars
         self._built = False
+        self._deferred = False
         self._compiled = False
         self._compiled_fn = None
         self._compile_on_next_step = compile_on_next_step
@@ -109,16 +113,16 @@ class Module(ModuleConverters, ModuleHelpers):
         self._track_submod_call_order = False
         self.expected_submod_rets = None
         self.submod_dict = dict()
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        # not created within the numpy backend, which would wrap the whole backend
+        # twice for each module built
+        self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=ivy)
+        self.submod_call_order = ivy.Container(alphabetical_keys=False, ivyh=ivy)
         self._sub_mods = set()
         self._dtype = dtype
         self._args = args
         self._kwargs = kwargs
         self._module_graph = None
+        self._replay_graph = None
         self._target = None
         self._lazy_compiled = False
         if build_mode != "on_init":
@@ -140,6 +144,12 @@ class Module(ModuleConverters, ModuleHelpers):
             if "v" in kw.keys():
                 del kw["v"]
             v = v_fn(self.v)
+            if self._deferred and not _meta.evaluating():
+                # the submodule is called before this module, and only created its
+                # own variables, which are still specs in the variables of this module
+                v = v.cont_map(
+                    lambda x, kc: x.materialize() if isinstance(x, VariableSpec) else x
+                )
             return fn(*a, **kw, v=v)
 
         _fn_with_var_arg_wrapper.wrapped = True
@@ -293,6 +303,17 @@ class Module(ModuleConverters, ModuleHelpers):
                 )
         return
 
+    def _replace_variable_specs(self):
+        """Replace the materialized variable specs in the variables of the module and
+        of its submodules, which share the same specs, with their variables."""
+        self.v = self.v.cont_map(
+            lambda x, kc: x.materialize() if isinstance(x, VariableSpec) else x
+        )
+        self._deferred = False
+        for sub_mod in self._sub_mods:
+            if sub_mod._deferred:
+                sub_mod._replace_variable_specs()
+
     @staticmethod
     def _remove_duplicate_variables(vs, created, /):
         """
@@ -425,6 +446,12 @@ class Module(ModuleConverters, ModuleHelpers):
                 from_call=True,
                 dtype=_get_first_array(*args, **kwargs).dtype,
             )
+        if v is None and self._deferred:
+            if _meta.evaluating():
+                # only the shapes of the variables are needed, so they aren't created
+                v = _meta.to_meta(self.v)
+            else:
+                self.materialize()
         if v is not None:
             v_orig = self.v
             self.v = (
@@ -493,11 +520,15 @@ class Module(ModuleConverters, ModuleHelpers):
             v = v if v else self.v
             return self._module_graph(*args, v=v, **kwargs)
 
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        if self._replay_graph is not None:
+            # the variables are inputs of the traces, rather than constants
+            v = v if v else self.v
+            return self._replay_graph(*args, v=v, **kwargs)
+
+        # not created within the numpy backend, which would wrap the whole backend
+        # twice for each call, and undo any ivy.eval_shape in progress
+        self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=ivy)
+        self.submod_call_order = ivy.Container(alphabetical_keys=False, ivyh=ivy)
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -528,6 +559,83 @@ class Module(ModuleConverters, ModuleHelpers):
         os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
         self.v.cont_to_disk_as_hdf5(weights_path)
 
+    def materialize(
+        self,
+        weights: Optional[Union[str, Dict, Container]] = None,
+        /,
+        *,
+        num_threads: Optional[int] = None,
+    ):
+        """
+        Create the variables of a module built in ivy.deferred_init_mode.
+
+        Otherwise, the variables are created by their initializers when the module is
+        first called.
+
+        Parameters
+        ----------
+        weights
+            The values of the variables, or the hdf5 file they were saved to by
+            save_weights. These are used in place of the initializers, which only
+            create the variables missing from the weights. Default is ``None``.
+        num_threads
+            The number of threads creating the variables in parallel. Default is
+            ``None``, for creating them one after another.
+
+        Returns
+        -------
+        ret
+            The variables of the module.
+        """
+        if isinstance(weights, str):
+            weights = Container.cont_from_disk_as_hdf5(weights)
+        elif weights is not None and not isinstance(weights, Container):
+            weights = Container(weights)
+
+        def _materialize(kc, spec):
+            if weights is not None and weights.cont_has_key_chain(kc):
+                return spec.materialize(weights.cont_at_key_chain(kc))
+            return spec.materialize()
+
+        specs = [
+            (kc, x)
+            for kc, x in self.v.cont_to_iterator()
+            if isinstance(x, VariableSpec) and not x.materialized
+        ]
+        if num_threads is not None and num_threads > 1 and len(specs) > 1:
+            with ThreadPoolExecutor(num_threads) as executor:
+                list(executor.map(lambda item: _materialize(*item), specs))
+        else:
+            for kc, spec in specs:
+                _materialize(kc, spec)
+        self._replace_variable_specs()
+        return self.v
+
+    def eval_shape(self, *args, **kwargs):
+        """
+        Compute the shapes, dtypes and devices of the outputs of the forward pass,
+        without computing the outputs themselves, as in ivy.eval_shape.
+
+        The variables of modules built in ivy.deferred_init_mode aren't created, and
+        modules which aren't built yet are first built in ivy.deferred_init_mode, so
+        that no variable is ever allocated.
+
+        Returns
+        -------
+        ret
+            The outputs of the forward pass, with every array replaced by an
+            ivy.MetaArray.
+        """
+        if not self._built:
+            with ivy.DeferredInitMode(True):
+                self.build(
+                    *args,
+                    **kwargs,
+                    from_call=True,
+                    dtype=_get_first_array(*args, **kwargs).dtype,
+                )
+        return ivy.eval_shape(self, *args, **kwargs)
+
     def build(
         self,
         *args,
@@ -609,8 +717,12 @@ class Module(ModuleConverters, ModuleHelpers):
                 if isinstance(v, ivy.Module):
                     v._dev = self._dev
 
-            # build during forward pass
-            self._forward(*args, **kwargs)
+            # build during forward pass, only evaluating the shapes of its outputs when
+            # the creation of the variables is deferred
+            if ivy.deferred_init_mode:
+                ivy.eval_shape(self._forward, *args, **kwargs)
+            else:
+                self._forward(*args, **kwargs)
 
             # re-build variables based on additional child on-call layers, if v not
             # passed in constructor
@@ -637,6 +749,9 @@ class Module(ModuleConverters, ModuleHelpers):
 
         # flag built and remove local variables if specified
         self._built = bool(built)
+        self._deferred = any(
+            isinstance(x, VariableSpec) for x in self.v.cont_to_flat_list()
+        )
         v_ret = self.v
         if not self._store_vars:
             # ToDo: verify variables in self.v are released once this method exits
@@ -723,3 +838,16 @@ class Module(ModuleConverters, ModuleHelpers):
         )
 
         self._lazy_compiled = False
+
+    def trace_graph(self, max_cache_size: int = 16):
+        """
+        Trace the `ivy.Module`'s `_call` method into an ivy.ReplayGraph, replaying
+        the backend functions called by the forward pass on later calls with the same
+        input signature, without needing the compiler.
+
+        Parameters
+        ----------
+        max_cache_size
+            the number of input signatures whose traces are kept. Default is ``16``.
+        """
+        self._replay_graph = ivy.trace_graph(self._call, max_cache_size=max_cache_size)
@@ -252,6 +252,9 @@ def _set_backend_as_ivy(
     )
     backend_str = backend.current_backend_str() if backend_str is None else backend_str
     for k, v in original_dict.items():
+        if k == "__getattr__":
+            # the lazy import hook of the ivy module isn't part of the backend API
+            continue
         compositional = k not in backend.__dict__
         if k not in backend.__dict__:
             if k in invalid_dtypes and k in target.__dict__:
@@ -282,6 +285,14 @@ def _handle_backend_specific_vars(target, backend):
         target.set_global_attr("RNG", target.functional.backends.jax.random.RNG)
 
 
+def _is_initialized(arr):
+    try:
+        object.__getattribute__(arr, "_data")
+    except AttributeError:
+        return False
+    return True
+
+
 def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _is_variable, _variable_data
@@ -336,7 +347,7 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
     ]
 
     # filter uninitialized arrays
-    array_list = [arr for arr in array_list if arr.__dict__]
+    array_list = [arr for arr in array_list if _is_initialized(arr)]
 
     # remove numpy intermediate objects
     new_objs = _remove_intermediate_arrays(array_list, container_list)
@@ -437,6 +448,9 @@ def set_backend(backend: str, dynamic: bool = False):
             variable_ids, numpy_objs, devices
         )
 
+    # the original dict must include any modules deferred by the lazy import mode
+    ivy._load_deferred_modules()
+
     # update the global dict with the new backend
     with ivy.locks["backend_setter"]:
         global ivy_original_dict
@@ -2,6 +2,7 @@ import os
 from types import ModuleType, FunctionType
 import logging
 import importlib
+import functools
 
 import ivy
 from ivy.func_wrapper import _wrap_function
@@ -9,42 +10,38 @@ from ivy.utils.exceptions import IvyException
 
 
 _backends_subpackage_path = "ivy.functional.backends"
-_sub_backend_dict = dict()
-_backend_to_sub_backends_dict = dict()
 
 
-# dynamic sub_backend detection
-for backend in os.listdir(
-    os.path.join(
+# dynamic sub_backend detection, deferred until a sub_backend is first requested so
+# that importing ivy doesn't scan every backend's `sub_backends` directory
+@functools.lru_cache(maxsize=None)
+def _sub_backend_registry():
+    sub_backend_dict = dict()
+    backend_to_sub_backends_dict = dict()
+    backends_dir = os.path.join(
         ivy.__path__[0].rpartition(os.path.sep)[0],  # type: ignore
         _backends_subpackage_path.replace(".", os.path.sep),
     )
-):
-    if backend.startswith("__"):
-        continue
-
-    sub_backends_dir = os.path.join(
-        ivy.__path__[0].rpartition(os.path.sep)[0],
-        _backends_subpackage_path.replace(".", os.path.sep),
-        backend,
-        "sub_backends",
-    )
-    for sub_backend in os.listdir(sub_backends_dir):
-        if sub_backend.startswith("__"):
+    for backend in os.listdir(backends_dir):
+        if backend.startswith("__"):
             continue
-        _sub_backend_dict[sub_backend] = (
-            f"{_backends_subpackage_path}.{backend}.sub_backends.{sub_backend}"
-        )
-        try:
-            _backend_to_sub_backends_dict[backend].append(sub_backend)
-        except KeyError:
-            _backend_to_sub_backends_dict[backend] = [sub_backend]
-
-
-_all_sub_backends = []
-
-for v in _backend_to_sub_backends_dict.values():
-    _all_sub_backends.extend(v)
+        sub_backends_dir = os.path.join(backends_dir, backend, "sub_backends")
+        for sub_backend in os.listdir(sub_backends_dir):
+            if sub_backend.startswith("__"):
+                continue
+            sub_backend_dict[sub_backend] = (
+                f"{_backends_subpackage_path}.{backend}.sub_backends.{sub_backend}"
+            )
+            try:
+                backend_to_sub_backends_dict[backend].append(sub_backend)
+            except KeyError:
+                backend_to_sub_backends_dict[backend] = [sub_backend]
+    all_sub_backends = [
+        sub_backend
+        for sub_backends in backend_to_sub_backends_dict.values()
+        for sub_backend in sub_backends
+    ]
+    return sub_backend_dict, backend_to_sub_backends_dict, all_sub_backends
 
 
 original_backend_dict = None
@@ -55,20 +52,25 @@ def set_sub_backend(sub_backend_str: str):
         logging.warn("You must set a backend first")
         return
 
-    if ivy.current_backend_str() not in _backend_to_sub_backends_dict.keys():
+    (
+        sub_backend_dict,
+        backend_to_sub_backends_dict,
+        all_sub_backends,
+    ) = _sub_backend_registry()
+    if ivy.current_backend_str() not in backend_to_sub_backends_dict.keys():
         logging.warn(
             f"backend {ivy.current_backend_str()} does not have any"
             " supported sub_backends"
         )
         return
 
-    if sub_backend_str not in _all_sub_backends:
+    if sub_backend_str not in all_sub_backends:
         raise IvyException(
             "sub_backend must be one from"
-            f" {_backend_to_sub_backends_dict[ivy.current_backend_str()]}"
+            f" {backend_to_sub_backends_dict[ivy.current_backend_str()]}"
         )
 
-    if sub_backend_str not in _backend_to_sub_backends_dict[ivy.current_backend_str()]:
+    if sub_backend_str not in backend_to_sub_backends_dict[ivy.current_backend_str()]:
         logging.warn(
             f"{ivy.current_backend_str()} does not support"
             f" {sub_backend_str} as a sub_backend"
@@ -82,7 +84,7 @@ def set_sub_backend(sub_backend_str: str):
     if original_backend_dict is None:
         original_backend_dict = ivy.__dict__.copy()
     sub_backend = ivy.utils.dynamic_import.import_module(
-        _sub_backend_dict[sub_backend_str]
+        sub_backend_dict[sub_backend_str]
     )
     _set_sub_backend_as_ivy(ivy.__dict__.copy(), ivy, sub_backend)
     ivy.current_backend().sub_backends._current_sub_backends.append(sub_backend_str)
@@ -136,7 +138,7 @@ def unset_sub_backend(sub_backend_str: str):
 
     # The sub-backend is cached so this is fast
     sub_backend = ivy.utils.dynamic_import.import_module(
-        _sub_backend_dict[sub_backend_str]
+        _sub_backend_registry()[0][sub_backend_str]
     )
     _unset_sub_backend_from_ivy(
         original_backend_dict, ivy, sub_backend, sub_backend.name
@@ -185,7 +187,7 @@ def _clear_current_sub_backends():
 
 # this is overwritten when setting a backend
 def available_sub_backends():
-    for k, v in _backend_to_sub_backends_dict.items():
+    for k, v in _sub_backend_registry()[1].items():
         print(f"backend: {k} supports sub_backends: {v}")
 
 
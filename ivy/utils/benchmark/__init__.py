@@ -0,0 +1,8 @@
+from . import timer
+from .timer import Measurement, measure, synchronize
+from . import suites
+from .suites import dispatch_suite, kernel_suite, module_suite, run_suites
+from . import baseline
+from .baseline import compare, format_comparisons, load_baseline, save_baseline
+from . import script
+from .script import best_time, format_rows, run_script
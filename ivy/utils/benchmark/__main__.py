@@ -0,0 +1,85 @@
+"""
+Run the ivy benchmark suites, optionally saving the results as a baseline or
+comparing them with one.
+
+Example
+-------
+    python -m ivy.utils.benchmark --backends numpy torch --save baseline.json
+    python -m ivy.utils.benchmark --backends numpy torch --compare baseline.json
+"""
+
+import argparse
+import sys
+
+from .baseline import compare, environment, format_comparisons, load_baseline
+from .baseline import save_baseline
+from .suites import SUITES, run_suites
+
+
+def _print_results(suite, results):
+    print(f"\n{suite}")
+    width = max(len(name) for name in results) if results else 0
+    for name, result in results.items():
+        time = result["time"]
+        line = (
+            f"  {name:<{width}}  median {time.median / 1e3:10.2f}us"
+            f"  p5 {time.p5 / 1e3:10.2f}us  p95 {time.p95 / 1e3:10.2f}us"
+            f"  x{time.repeats * time.number}"
+        )
+        if "wrapper_ns" in result:
+            line += (
+                f"  backend {result['backend'].median / 1e3:8.2f}us"
+                f"  wrapper {result['wrapper_ns'] / 1e3:8.2f}us"
+            )
+        if "throughput" in result:
+            line += f"  {result['throughput'] / 1e9:8.2f} G{result['unit']}/s"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--suites", nargs="+", choices=list(SUITES), default=None)
+    parser.add_argument(
+        "--min-run-time",
+        type=float,
+        default=0.2,
+        help="minimum time in seconds spent sampling each case",
+    )
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--save", type=str, help="path to save the results to")
+    parser.add_argument("--compare", type=str, help="path of a baseline to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown of the median beyond which a case has regressed",
+    )
+    args = parser.parse_args(argv)
+    print(", ".join(f"{key} {value}" for key, value in environment().items()))
+    results = run_suites(
+        args.backends,
+        args.suites,
+        callback=_print_results,
+        warmup=args.warmup,
+        min_run_time=args.min_run_time,
+    )
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"\nresults saved to {args.save}")
+    if args.compare:
+        comparisons = compare(
+            results, load_baseline(args.compare), threshold=args.threshold
+        )
+        print("\n" + format_comparisons(comparisons))
+        regressions = [c for c in comparisons if c.status == "regression"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
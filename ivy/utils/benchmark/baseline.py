@@ -0,0 +1,161 @@
+"""Storage of benchmark results as JSON baselines, and detection of regressions
+against them."""
+
+import json
+import platform
+import sys
+import time
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+import ivy
+from .timer import Measurement
+
+
+def _encode(result):
+    return {
+        key: value._asdict() if isinstance(value, Measurement) else value
+        for key, value in result.items()
+    }
+
+
+def _decode(result):
+    return {
+        key: Measurement(**value) if isinstance(value, dict) else value
+        for key, value in result.items()
+    }
+
+
+def environment() -> Dict[str, str]:
+    """Describe the environment the benchmarks run in."""
+    return {
+        "ivy": ivy.__version__,
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def save_baseline(results: Dict[str, Dict], path: str, /) -> None:
+    """
+    Save benchmark results to a JSON file, along with the environment they were
+    measured in.
+
+    Parameters
+    ----------
+    results
+        results of :func:`run_suites`.
+    path
+        path of the JSON file.
+    """
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "environment": environment(),
+                "results": {name: _encode(r) for name, r in results.items()},
+            },
+            f,
+            indent=2,
+        )
+
+
+def load_baseline(path: str, /) -> Dict[str, Dict]:
+    """
+    Load benchmark results saved with :func:`save_baseline`.
+
+    Parameters
+    ----------
+    path
+        path of the JSON file.
+
+    Returns
+    -------
+    ret
+        the results, with their measurements.
+    """
+    with open(path) as f:
+        baseline = json.load(f)
+    return {name: _decode(r) for name, r in baseline["results"].items()}
+
+
+class Comparison(NamedTuple):
+    """Median latencies of a case in the baseline and the current results."""
+
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    status: str
+
+
+def compare(
+    results: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    /,
+    *,
+    threshold: float = 0.1,
+) -> List[Comparison]:
+    """
+    Compare the median latencies of benchmark results with those of a baseline.
+
+    A case is a regression when its median is slower than the baseline median by
+    more than the threshold, and the confidence intervals of the two medians don't
+    overlap, so that changes within the noise of either measurement are never
+    flagged. Improvements are detected symmetrically.
+
+    Parameters
+    ----------
+    results
+        results of :func:`run_suites`.
+    baseline
+        results to compare against, for example loaded with :func:`load_baseline`.
+    threshold
+        relative change of the median beyond which a case has changed.
+
+    Returns
+    -------
+    ret
+        the comparison of each case measured in both, with a status of
+        "regression", "improvement" or "unchanged".
+
+    Examples
+    --------
+    >>> from ivy.utils.benchmark import Measurement, compare
+    >>> fast = Measurement.from_samples([100, 101, 102, 103, 104, 105, 106])
+    >>> slow = Measurement.from_samples([150, 151, 152, 153, 154, 155, 156])
+    >>> compare({"add": {"time": slow}}, {"add": {"time": fast}})[0].status
+    'regression'
+    """
+    comparisons = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]["time"], result["time"]
+        ratio = new.median / old.median
+        if ratio > 1 + threshold and new.ci_low > old.ci_high:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold) and new.ci_high < old.ci_low:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparisons.append(Comparison(name, old.median, new.median, ratio, status))
+    return comparisons
+
+
+def format_comparisons(
+    comparisons: List[Comparison], /, *, only_changes: bool = False
+) -> str:
+    """Format comparisons as a table of the median latencies in microseconds."""
+    width = max([len(c.name) for c in comparisons] + [4])
+    lines = [f"{'case':<{width}}{'baseline':>12}{'current':>12}{'ratio':>8}  status"]
+    for c in comparisons:
+        if only_changes and c.status == "unchanged":
+            continue
+        lines.append(
+            f"{c.name:<{width}}{c.baseline / 1e3:>12.2f}{c.current / 1e3:>12.2f}"
+            f"{c.ratio:>8.2f}  {c.status}"
+        )
+    return "\n".join(lines)
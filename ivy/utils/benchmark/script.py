@@ -0,0 +1,148 @@
+"""Helpers shared by the benchmark scripts in scripts/*_benchmark, each of which
+times a few cases of one feature and prints them as a table."""
+
+import argparse
+import inspect
+import sys
+import timeit
+from typing import Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+import ivy
+
+
+def best_time(fn: Callable, /, *, number: int = 1, repeat: int = 3) -> float:
+    """
+    Time fn as :func:`timeit.repeat` does, and keep the fastest of the repetitions.
+
+    Parameters
+    ----------
+    fn
+        callable taking no arguments.
+    number
+        number of calls per repetition.
+    repeat
+        number of repetitions.
+
+    Returns
+    -------
+    ret
+        the best per-call latency in seconds.
+    """
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def _add_arguments(parser, suite):
+    # every keyword argument of the suite with a plain default can be set from the
+    # command line, as --some-name or --some_name
+    for name, param in inspect.signature(suite).parameters.items():
+        default = param.default
+        flags = ["--" + name.replace("_", "-")]
+        if "_" in name:
+            flags.append("--" + name)
+        if isinstance(default, (list, tuple)) and default:
+            parser.add_argument(
+                *flags, dest=name, type=type(default[0]), nargs="+", default=default
+            )
+        elif isinstance(default, (int, float, str)) and not isinstance(default, bool):
+            parser.add_argument(*flags, dest=name, type=type(default), default=default)
+
+
+def format_rows(
+    results: Dict, /, *, unit: Union[str, Sequence[str]] = "ms", precision: int = 2
+) -> str:
+    """
+    Format the results of a benchmark as a table with one case per row.
+
+    Parameters
+    ----------
+    results
+        dict mapping each case to its value, or to a tuple of the values of its
+        columns. Tuple keys are spread over several columns.
+    unit
+        unit of the values, or of the values of each column.
+    precision
+        number of decimals of the values.
+
+    Returns
+    -------
+    ret
+        the table.
+    """
+    keys = [k if isinstance(k, tuple) else (k,) for k in results]
+    widths = [max(len(str(k[i])) for k in keys) + 2 for i in range(len(keys[0]))]
+    lines = []
+    for key, values in zip(keys, results.values()):
+        values = values if isinstance(values, tuple) else (values,)
+        units = [unit] * len(values) if isinstance(unit, str) else unit
+        cells = "".join(f"{str(k):<{w}}" for k, w in zip(key, widths))
+        cells += "".join(
+            f"{'-' if v is None else f'{v:.{precision}f}':>10} {u}"
+            for v, u in zip(values, units)
+        )
+        lines.append(cells)
+    return "\n".join(lines)
+
+
+def run_script(
+    suite: Callable,
+    /,
+    *,
+    description: Optional[str] = None,
+    backend: Optional[str] = None,
+    report: Optional[Callable] = None,
+    unit: Union[str, Sequence[str]] = "ms",
+    argv: Optional[Sequence[str]] = None,
+) -> Dict:
+    """
+    Run a benchmark suite from the command line, and print its results.
+
+    The command line arguments are those of the keyword arguments of the suite,
+    with their defaults. With a default backend, --backend selects the backend the
+    suite runs on.
+
+    Parameters
+    ----------
+    suite
+        function running the benchmark and returning its results.
+    description
+        description of the script, shown by --help.
+    backend
+        default backend to run the suite on, or None for suites setting the
+        backends they need themselves.
+    report
+        function printing the results, called with them and the parsed arguments,
+        :func:`format_rows` of the results by default.
+    unit
+        unit of the results for the default report.
+    argv
+        command line arguments, those of the script by default.
+
+    Returns
+    -------
+    ret
+        the results of the suite.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    if backend is not None:
+        parser.add_argument("--backend", type=str, default=backend)
+    _add_arguments(parser, suite)
+    args = parser.parse_args(argv)
+    kwargs = {k: v for k, v in vars(args).items() if k != "backend"}
+    header = f"python {sys.version.split()[0]}, numpy {np.__version__}"
+    if backend is not None:
+        header += f", backend {args.backend}"
+        ivy.set_backend(args.backend)
+        try:
+            results = suite(**kwargs)
+        finally:
+            ivy.previous_backend()
+    else:
+        results = suite(**kwargs)
+    print(header)
+    if report is None:
+        print(format_rows(results, unit=unit))
+    else:
+        report(results, args)
+    return results
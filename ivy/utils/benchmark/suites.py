@@ -0,0 +1,241 @@
+"""Benchmark suites measuring the dispatch overhead of ivy functions, the throughput
+of core kernels and the training step of a module on each backend."""
+
+import logging
+from typing import Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+import ivy
+from .timer import measure
+
+
+def _uniform(*shape):
+    rng = np.random.default_rng(0)
+    return ivy.array(rng.uniform(-1, 1, size=shape).astype("float32"))
+
+
+def _run_cases(cases, run_case):
+    # cases the backend doesn't support are logged and skipped
+    results = {}
+    for name, case in cases.items():
+        try:
+            results[name] = run_case(case)
+        except Exception as e:
+            # ivy exceptions hold the stack trace, followed by the message
+            message = str(e).strip().splitlines()[-1] if str(e).strip() else repr(e)
+            backend = ivy.current_backend_str()
+            logging.warning(f"skipping {name} on {backend}: {message}")
+    return results
+
+
+# Dispatch #
+# -------- #
+
+# functions called on tiny inputs, for which the time is dominated by dispatch
+DISPATCH_CASES = {
+    "add": lambda: ((_uniform(4), _uniform(4)), {}),
+    "multiply": lambda: ((_uniform(4), 2.0), {}),
+    "exp": lambda: ((_uniform(4),), {}),
+    "sum": lambda: ((_uniform(4, 4),), {"axis": 0}),
+    "matmul": lambda: ((_uniform(4, 4), _uniform(4, 4)), {}),
+    "reshape": lambda: ((_uniform(4, 4),), {"shape": (2, 8)}),
+    "concat": lambda: (([_uniform(4), _uniform(4)],), {"axis": 0}),
+    "astype": lambda: ((_uniform(4), "float64"), {}),
+}
+
+
+def dispatch_suite(**measure_kwargs) -> Dict[str, Dict]:
+    """
+    Measure the latency of ivy functions called on tiny ivy arrays, and break it
+    down into the time spent in the backend implementation, called directly on
+    the native arrays, and the time spent in the ivy wrappers around it.
+
+    Parameters
+    ----------
+    measure_kwargs
+        keyword arguments of :func:`measure`.
+
+    Returns
+    -------
+    ret
+        dict mapping each function name to a dict holding its measurement under
+        "time", the measurement of the backend implementation under "backend" and
+        the median wrapper overhead in nanoseconds under "wrapper_ns".
+    """
+
+    def _run_case(name):
+        args, kwargs = DISPATCH_CASES[name]()
+        fn = ivy.__dict__[name]
+        backend_fn = getattr(ivy.current_backend(), name)
+        native_args, native_kwargs = ivy.to_native([args, kwargs], nested=True)
+        total = measure(lambda: fn(*args, **kwargs), **measure_kwargs)
+        backend = measure(
+            lambda: backend_fn(*native_args, **native_kwargs), **measure_kwargs
+        )
+        return {
+            "time": total,
+            "backend": backend,
+            "wrapper_ns": total.median - backend.median,
+        }
+
+    return _run_cases({name: name for name in DISPATCH_CASES}, _run_case)
+
+
+# Kernels #
+# ------- #
+
+
+def _conv2d_inputs():
+    return (_uniform(8, 32, 32, 16), _uniform(3, 3, 16, 32), 1, "SAME"), {}
+
+
+# functions called on large inputs, with the units of work they perform
+KERNEL_CASES = {
+    "add": (lambda: ((_uniform(2**20), _uniform(2**20)), {}), 2**20, "elem"),
+    "multiply": (lambda: ((_uniform(2**20), _uniform(2**20)), {}), 2**20, "elem"),
+    "exp": (lambda: ((_uniform(2**20),), {}), 2**20, "elem"),
+    "sum": (lambda: ((_uniform(2**20),), {}), 2**20, "elem"),
+    "sort": (lambda: ((_uniform(2**18),), {}), 2**18, "elem"),
+    "softmax": (lambda: ((_uniform(1024, 1024),), {"axis": -1}), 2**20, "elem"),
+    "matmul": (
+        lambda: ((_uniform(512, 512), _uniform(512, 512)), {}),
+        2 * 512**3,
+        "flop",
+    ),
+    "conv2d": (_conv2d_inputs, 2 * 8 * 32 * 32 * 32 * 3 * 3 * 16, "flop"),
+}
+
+
+def kernel_suite(**measure_kwargs) -> Dict[str, Dict]:
+    """
+    Measure the throughput of core ivy functions on large inputs.
+
+    Parameters
+    ----------
+    measure_kwargs
+        keyword arguments of :func:`measure`.
+
+    Returns
+    -------
+    ret
+        dict mapping each function name to a dict holding its measurement under
+        "time", and the units of work per second at the median latency under
+        "throughput", with the unit of work under "unit".
+    """
+
+    def _run_case(name):
+        make_inputs, work, unit = KERNEL_CASES[name]
+        args, kwargs = make_inputs()
+        fn = ivy.__dict__[name]
+        time = measure(lambda: fn(*args, **kwargs), **measure_kwargs)
+        return {
+            "time": time,
+            "throughput": work / (time.median * 1e-9),
+            "unit": unit,
+        }
+
+    return _run_cases({name: name for name in KERNEL_CASES}, _run_case)
+
+
+# Module #
+# ------ #
+
+
+def module_suite(batch_size=64, width=256, **measure_kwargs) -> Dict[str, Dict]:
+    """
+    Measure the forward pass, the forward and backward pass, and the optimizer
+    steps of a multilayer perceptron.
+
+    The backward pass is skipped on backends without automatic differentiation,
+    and the optimizer steps are applied to constant gradients. As in the other
+    suites, cases which fail on the backend are logged and skipped.
+
+    Parameters
+    ----------
+    batch_size
+        number of examples per batch.
+    width
+        number of features of the input and hidden layers.
+    measure_kwargs
+        keyword arguments of :func:`measure`.
+
+    Returns
+    -------
+    ret
+        dict mapping each step to a dict holding its measurement under "time".
+    """
+    model = ivy.Sequential(
+        ivy.Linear(width, width),
+        ivy.ReLU(),
+        ivy.Linear(width, width),
+        ivy.ReLU(),
+        ivy.Linear(width, 10),
+    )
+    x = _uniform(batch_size, width)
+
+    def loss_fn(v):
+        return ivy.mean(model(x, v=v) ** 2)
+
+    cases = {"mlp_forward": lambda: model(x)}
+    if ivy.execute_with_gradients(loss_fn, model.v)[1] is not None:
+        cases["mlp_backward"] = lambda: ivy.execute_with_gradients(loss_fn, model.v)
+    grads = model.v.cont_map(lambda v, _: ivy.ones_like(v))
+    for name, optimizer in (("sgd_step", ivy.SGD), ("adam_step", ivy.Adam)):
+        cases[name] = (lambda opt: lambda: opt.step(model.v, grads))(optimizer(lr=1e-4))
+    return _run_cases(cases, lambda fn: {"time": measure(fn, **measure_kwargs)})
+
+
+SUITES = {
+    "dispatch": dispatch_suite,
+    "kernel": kernel_suite,
+    "module": module_suite,
+}
+
+
+def run_suites(
+    backends: Iterable[str] = ("numpy",),
+    suites: Optional[Iterable[str]] = None,
+    *,
+    callback: Optional[Callable] = None,
+    **measure_kwargs,
+) -> Dict[str, Dict]:
+    """
+    Run the benchmark suites on each of the backends.
+
+    Parameters
+    ----------
+    backends
+        backends to benchmark.
+    suites
+        names of the suites to run, among "dispatch", "kernel" and "module", all of
+        them by default.
+    callback
+        function called with the name of each suite and its results once it has
+        run.
+    measure_kwargs
+        keyword arguments of :func:`measure`.
+
+    Returns
+    -------
+    ret
+        dict mapping the names "<backend>/<suite>/<case>" to the results of each
+        case.
+    """
+    suites = list(SUITES) if suites is None else list(suites)
+    results = {}
+    for backend in backends:
+        ivy.set_backend(backend)
+        try:
+            for suite in suites:
+                suite_results = SUITES[suite](**measure_kwargs)
+                suite_results = {
+                    f"{backend}/{suite}/{case}": result
+                    for case, result in suite_results.items()
+                }
+                if callback is not None:
+                    callback(f"{backend}/{suite}", suite_results)
+                results.update(suite_results)
+        finally:
+            ivy.previous_backend()
+    return results
@@ -0,0 +1,222 @@
+"""Timing of callables with warmup, adaptive repetition and order statistics."""
+
+import gc
+import math
+import time
+from typing import Callable, NamedTuple, Optional, Sequence
+
+import ivy
+
+
+class Measurement(NamedTuple):
+    """
+    Statistics of the per-call latency of a callable, in nanoseconds.
+
+    Each of the ``repeats`` samples is the mean latency of ``number`` consecutive
+    calls, so that calls much shorter than the resolution of the clock are still
+    measured accurately. ``ci_low`` and ``ci_high`` bound the 95% confidence
+    interval of the median.
+    """
+
+    median: float
+    mean: float
+    stdev: float
+    min: float
+    max: float
+    p5: float
+    p25: float
+    p75: float
+    p95: float
+    ci_low: float
+    ci_high: float
+    repeats: int
+    number: int
+
+    @property
+    def iqr(self) -> float:
+        """Interquartile range of the samples."""
+        return self.p75 - self.p25
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float], number: int = 1):
+        """
+        Compute the statistics of the per-call latencies sampled.
+
+        Parameters
+        ----------
+        samples
+            per-call latencies in nanoseconds.
+        number
+            number of calls averaged in each sample.
+
+        Returns
+        -------
+        ret
+            the measurement.
+        """
+        samples = sorted(samples)
+        n = len(samples)
+        mean = math.fsum(samples) / n
+        stdev = (
+            math.sqrt(math.fsum((s - mean) ** 2 for s in samples) / (n - 1))
+            if n > 1
+            else 0.0
+        )
+        # distribution-free interval of the median, from the order statistics whose
+        # ranks are binomially distributed around n / 2
+        half_width = 1.96 * math.sqrt(n) / 2
+        low = max(int(math.floor(n / 2 - half_width)), 0)
+        high = min(int(math.ceil(n / 2 + half_width)), n - 1)
+        return cls(
+            median=_percentile(samples, 50),
+            mean=mean,
+            stdev=stdev,
+            min=samples[0],
+            max=samples[-1],
+            p5=_percentile(samples, 5),
+            p25=_percentile(samples, 25),
+            p75=_percentile(samples, 75),
+            p95=_percentile(samples, 95),
+            ci_low=samples[low],
+            ci_high=samples[high],
+            repeats=n,
+            number=number,
+        )
+
+
+def _percentile(sorted_samples, q):
+    position = (len(sorted_samples) - 1) * q / 100
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    weight = position - lower
+    return sorted_samples[lower] * (1 - weight) + sorted_samples[upper] * weight
+
+
+def synchronize(ret=None):
+    """
+    Wait until the computation of the native arrays in ret, or of all the pending
+    work on the devices of the current backend, has finished.
+
+    Parameters
+    ----------
+    ret
+        nest of the arrays to wait for.
+    """
+    backend = ivy.current_backend_str()
+    if backend == "jax":
+        ivy.nested_map(
+            ret,
+            lambda x: x.block_until_ready() if hasattr(x, "block_until_ready") else x,
+            shallow=False,
+        )
+    elif backend == "torch":
+        import torch
+
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
+            torch.cuda.synchronize()
+    elif backend == "tensorflow":
+        import tensorflow as tf
+
+        sync_devices = getattr(tf.test.experimental, "sync_devices", None)
+        if sync_devices is not None and tf.config.list_logical_devices("GPU"):
+            sync_devices()
+    elif backend == "paddle":
+        import paddle
+
+        if paddle.device.is_compiled_with_cuda():
+            paddle.device.cuda.synchronize()
+
+
+def _native_outputs(ret):
+    return ivy.nested_map(
+        ret,
+        lambda x: x.data if isinstance(x, ivy.Array) else x,
+        include_derived=True,
+        shallow=False,
+    )
+
+
+def _time_calls(fn, number, sync):
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        ret = fn()
+    if sync:
+        synchronize(_native_outputs(ret))
+    return time.perf_counter_ns() - start
+
+
+def measure(
+    fn: Callable,
+    /,
+    *,
+    warmup: int = 3,
+    min_run_time: float = 0.2,
+    min_repeats: int = 7,
+    max_repeats: int = 1000,
+    min_sample_time: float = 1e-3,
+    sync: bool = True,
+    number: Optional[int] = None,
+) -> Measurement:
+    """
+    Measure the per-call latency of fn.
+
+    fn is first called ``warmup`` times, so that caches, lazy initialization and
+    compilation don't distort the samples. The number of calls per sample is then
+    doubled until a sample takes at least ``min_sample_time``, and samples are taken
+    until both ``min_run_time`` and ``min_repeats`` have been reached, or
+    ``max_repeats`` samples have been taken. The garbage collector is disabled
+    while sampling, and the device is synchronized at the end of each sample.
+
+    Parameters
+    ----------
+    fn
+        callable taking no arguments.
+    warmup
+        number of calls before sampling.
+    min_run_time
+        minimum total time in seconds spent sampling.
+    min_repeats
+        minimum number of samples.
+    max_repeats
+        maximum number of samples.
+    min_sample_time
+        minimum duration in seconds of each sample.
+    sync
+        whether to wait for the device at the end of each sample, without which
+        only the time to launch asynchronous computations is measured.
+    number
+        number of calls per sample, which is otherwise chosen adaptively.
+
+    Returns
+    -------
+    ret
+        the statistics of the per-call latency.
+
+    Examples
+    --------
+    >>> x = ivy.array([1., 2., 3.])
+    >>> m = ivy.utils.benchmark.measure(lambda: ivy.add(x, x), min_run_time=0.01)
+    >>> m.median > 0
+    True
+    """
+    for _ in range(warmup):
+        _time_calls(fn, 1, sync)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if number is None:
+            number = 1
+            while _time_calls(fn, number, sync) < min_sample_time * 1e9:
+                number *= 2
+        samples = []
+        elapsed = 0
+        while len(samples) < max_repeats and (
+            len(samples) < min_repeats or elapsed < min_run_time * 1e9
+        ):
+            sample = _time_calls(fn, number, sync)
+            elapsed += sample
+            samples.append(sample / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return Measurement.from_samples(samples, number)
@@ -0,0 +1,455 @@
+"""
+Contraction planner for einsum and multi_dot, shared by the backends.
+
+An einsum equation with several operands is planned once for each set of operand
+shapes: the equation is parsed, the order of pairwise contractions with the fewest
+operations is found, and each pairwise contraction is lowered to a matmul (or to a
+broadcast multiply when nothing is summed over) with the transposes and reshapes it
+needs worked out up front. Each backend then runs the cached plan with its own
+native functions, so that contractions with more than two operands never run as a
+single loop nest, and the plan is the same for every backend.
+"""
+
+import functools
+import itertools
+import math
+import string
+
+# the number of operands up to which every order of contractions is searched, above
+# which the cheapest contraction is picked at each step
+_OPTIMAL_LIMIT = 6
+
+
+# Parsing #
+# ------- #
+
+
+def _parse(equation, shapes):
+    # the subscripts of each input and of the output, with the ellipses replaced by
+    # unused letters, and the size of each letter, or None if the equation can't be
+    # planned (the native einsum then raises or broadcasts as it does otherwise)
+    equation = equation.replace(" ", "")
+    if "->" in equation:
+        lhs, output = equation.split("->")
+    else:
+        lhs, output = equation, None
+    inputs = lhs.split(",")
+    if len(inputs) != len(shapes):
+        return None
+    unused = iter([c for c in string.ascii_letters if c not in equation][::-1])
+    ellipsis_ndim = max(
+        (
+            len(shape) - len(term) + 3
+            for term, shape in zip(inputs, shapes)
+            if "..." in term
+        ),
+        default=0,
+    )
+    ellipsis = "".join(next(unused) for _ in range(ellipsis_ndim))[::-1]
+    for i, (term, shape) in enumerate(zip(inputs, shapes)):
+        if "..." in term:
+            ndim = len(shape) - len(term) + 3
+            if ndim < 0:
+                return None
+            term = term.replace("...", ellipsis[len(ellipsis) - ndim :])
+            inputs[i] = term
+        if len(term) != len(shape) or not term.isalpha():
+            return None
+    if output is None:
+        counts = "".join(inputs)
+        output = ellipsis + "".join(
+            sorted(c for c in set(counts) if counts.count(c) == 1 and c not in ellipsis)
+        )
+    else:
+        output = output.replace("...", ellipsis)
+    if not output.isalpha() and output:
+        return None
+    if len(set(output)) != len(output) or not set(output) <= set("".join(inputs)):
+        return None
+    sizes = {}
+    for term, shape in zip(inputs, shapes):
+        for c, size in zip(term, shape):
+            # letters broadcast against each other are left to the native einsum
+            if sizes.setdefault(c, size) != size:
+                return None
+    return inputs, output, sizes
+
+
+# Contraction order #
+# ----------------- #
+
+
+def _pair_cost(a, b, remaining, output, sizes):
+    # the subscripts of the contraction of a and b, and the number of operations
+    kept = set(output).union(*remaining)
+    result = frozenset(c for c in a | b if c in kept)
+    return result, math.prod(sizes[c] for c in a | b)
+
+
+def _optimal_path(terms, output, sizes):
+    # every order of contractions, with the cheapest found by a depth first search
+    best = [math.inf, None]
+
+    def _search(terms, path, cost):
+        if cost >= best[0]:
+            return
+        if len(terms) == 1:
+            best[:] = [cost, path]
+            return
+        for i, j in itertools.combinations(range(len(terms)), 2):
+            remaining = [t for k, t in enumerate(terms) if k not in (i, j)]
+            result, step_cost = _pair_cost(terms[i], terms[j], remaining, output, sizes)
+            _search(remaining + [result], path + [(i, j)], cost + step_cost)
+
+    _search(terms, [], 0)
+    return best[1]
+
+
+def _greedy_path(terms, output, sizes):
+    # the cheapest contraction at each step, the smallest result breaking ties
+    path = []
+    while len(terms) > 1:
+        candidates = []
+        for i, j in itertools.combinations(range(len(terms)), 2):
+            remaining = [t for k, t in enumerate(terms) if k not in (i, j)]
+            result, cost = _pair_cost(terms[i], terms[j], remaining, output, sizes)
+            size = math.prod(sizes[c] for c in result)
+            candidates.append((cost, size, i, j, remaining, result))
+        _, _, i, j, remaining, result = min(candidates, key=lambda c: c[:4])
+        path.append((i, j))
+        terms = remaining + [result]
+    return path
+
+
+# Lowering #
+# -------- #
+
+
+def _permutation(term, order):
+    perm = tuple(term.index(c) for c in order)
+    return None if perm == tuple(range(len(term))) else perm
+
+
+def _reshape(shape, new_shape):
+    return None if tuple(shape) == tuple(new_shape) else tuple(new_shape)
+
+
+def _lower_pair(a, b, kept, sizes):
+    # the transposes, reshapes and the product computing the contraction of the
+    # operands with subscripts a and b, along with the subscripts of the result
+    batch = [c for c in a if c in b and c in kept]
+    summed = [c for c in a if c in b and c not in kept]
+    left = [c for c in a if c not in b]
+    right = [c for c in b if c not in a]
+    # the summed letters are ordered as in whichever operand that spares a transpose
+    if _permutation(a, batch + left + summed) is not None:
+        b_summed = [c for c in b if c in summed]
+        if _permutation(a, batch + left + b_summed) is None:
+            summed = b_summed
+    result = "".join(batch + left + right)
+    batch_shape = [sizes[c] for c in batch]
+    left_shape = [sizes[c] for c in left]
+    right_shape = [sizes[c] for c in right]
+    a_order, b_order = batch + left + summed, batch + summed + right
+    if summed:
+        m = math.prod(left_shape)
+        k = math.prod(sizes[c] for c in summed)
+        n = math.prod(right_shape)
+        prefix = [math.prod(batch_shape)] if batch else []
+        a_shape, b_shape = prefix + [m, k], prefix + [k, n]
+        product = "matmul"
+        out_shape = _reshape(prefix + [m, n], batch_shape + left_shape + right_shape)
+    else:
+        # nothing is summed over, so the operands are multiplied with broadcasting
+        a_shape = batch_shape + left_shape + [1] * len(right)
+        b_shape = batch_shape + [1] * len(left) + right_shape
+        product = "multiply"
+        out_shape = None
+    step = (
+        _permutation(a, a_order),
+        _reshape([sizes[c] for c in a_order], a_shape),
+        _permutation(b, b_order),
+        _reshape([sizes[c] for c in b_order], b_shape),
+        product,
+        out_shape,
+    )
+    return result, step
+
+
+class EinsumPlan:
+    """
+    The contractions computing an einsum equation for given operand shapes.
+
+    Attributes
+    ----------
+    equation
+        the equation, with the ellipses replaced by letters and the output explicit.
+    path
+        the pairs of operands contracted at each step, as indices into the list of
+        operands left, the result of each step being appended to the list (the same
+        format as ``numpy.einsum_path``).
+    flops
+        the number of multiply-adds of the planned contractions.
+    naive_flops
+        the number of multiply-adds of computing the equation as a single loop nest.
+    """
+
+    __slots__ = (
+        "equation",
+        "path",
+        "flops",
+        "naive_flops",
+        "_reductions",
+        "_steps",
+        "_output_perm",
+    )
+
+    def __init__(self, inputs, output, sizes):
+        self.equation = ",".join(inputs) + "->" + output
+        self.naive_flops = math.prod(sizes.values())
+        # letters which only appear in one operand, or appear several times in it,
+        # are summed over or taken the diagonal of before contracting the operands
+        self._reductions = []
+        terms = []
+        for i, term in enumerate(inputs):
+            others = set(output).union(*(t for k, t in enumerate(inputs) if k != i))
+            reduced = "".join(dict.fromkeys(c for c in term if c in others))
+            if reduced != term:
+                self._reductions.append((i, f"{term}->{reduced}"))
+            terms.append(reduced)
+        sets = [frozenset(t) for t in terms]
+        if len(terms) <= _OPTIMAL_LIMIT:
+            self.path = _optimal_path(sets, output, sizes)
+        else:
+            self.path = _greedy_path(sets, output, sizes)
+        self.flops = 0
+        self._steps = []
+        for i, j in self.path:
+            a, b = terms[i], terms[j]
+            remaining = [t for k, t in enumerate(terms) if k not in (i, j)]
+            kept = set(output).union(*remaining)
+            self.flops += math.prod(sizes[c] for c in set(a + b))
+            result, step = _lower_pair(a, b, kept, sizes)
+            self._steps.append((i, j) + step)
+            terms = remaining + [result]
+        self._output_perm = _permutation(terms[0], output)
+
+    def contract(self, operands, *, transpose, reshape, matmul, multiply, einsum):
+        """
+        Compute the equation with the native functions of a backend.
+
+        Parameters
+        ----------
+        operands
+            the native arrays, with the shapes the plan was made for.
+        transpose
+            function permuting the dimensions of an array, as numpy.transpose.
+        reshape
+            function reshaping an array, as numpy.reshape.
+        matmul
+            function multiplying (batches of) matrices, as numpy.matmul.
+        multiply
+            function multiplying arrays elementwise with broadcasting.
+        einsum
+            the native einsum, used to sum over the letters of a single operand.
+
+        Returns
+        -------
+        ret
+            the result of the equation.
+        """
+        operands = list(operands)
+        for i, equation in self._reductions:
+            operands[i] = einsum(equation, operands[i])
+        for i, j, a_perm, a_shape, b_perm, b_shape, product, out_shape in self._steps:
+            a, b = operands[i], operands[j]
+            operands = [x for k, x in enumerate(operands) if k not in (i, j)]
+            if a_perm is not None:
+                a = transpose(a, a_perm)
+            if a_shape is not None:
+                a = reshape(a, a_shape)
+            if b_perm is not None:
+                b = transpose(b, b_perm)
+            if b_shape is not None:
+                b = reshape(b, b_shape)
+            ret = matmul(a, b) if product == "matmul" else multiply(a, b)
+            if out_shape is not None:
+                ret = reshape(ret, out_shape)
+            operands.append(ret)
+        ret = operands[0]
+        if self._output_perm is not None:
+            ret = transpose(ret, self._output_perm)
+        return ret
+
+
+@functools.lru_cache(maxsize=1024)
+def einsum_plan(equation, shapes):
+    """
+    Plan the contractions of an einsum equation, for operands of the given shapes.
+
+    The plans are cached, so that each equation is only parsed and planned once for
+    each set of shapes.
+
+    Parameters
+    ----------
+    equation
+        the einsum equation, in the same format as numpy.einsum.
+    shapes
+        tuple with the shape of each operand, as a tuple of ints.
+
+    Returns
+    -------
+    ret
+        the plan, or None if the equation has fewer than two operands, or broadcasts
+        operands against each other, in which case it's left to the native einsum.
+
+    Examples
+    --------
+    >>> plan = einsum_plan("ij,jk,kl->il", ((100, 2), (2, 100), (100, 2)))
+    >>> plan.path
+    [(1, 2), (0, 1)]
+    >>> plan.flops < plan.naive_flops
+    True
+    """
+    if len(shapes) < 2:
+        return None
+    parsed = _parse(equation, shapes)
+    if parsed is None:
+        return None
+    return EinsumPlan(*parsed)
+
+
+def contract(equation, *operands, transpose, reshape, matmul, multiply, einsum):
+    """
+    Compute an einsum equation through its cached plan, or with the native einsum if
+    it can't be planned.
+
+    The operands must share a floating point or complex dtype to be contracted with
+    matmuls, the native einsum computing the equation otherwise.
+
+    Parameters
+    ----------
+    equation
+        the einsum equation, in the same format as numpy.einsum.
+    operands
+        the native arrays.
+    transpose, reshape, matmul, multiply, einsum
+        the native functions of the backend, see :meth:`EinsumPlan.contract`.
+
+    Returns
+    -------
+    ret
+        the result of the equation.
+    """
+    plan = None
+    dtypes = {x.dtype for x in operands}
+    dtype = str(next(iter(dtypes))) if len(dtypes) == 1 else ""
+    if "float" in dtype or "complex" in dtype:
+        try:
+            shapes = tuple(tuple(int(d) for d in x.shape) for x in operands)
+        except TypeError:
+            # dimensions which are unknown until the graph runs
+            shapes = None
+        if shapes is not None:
+            plan = einsum_plan(equation, shapes)
+    if plan is None:
+        return einsum(equation, *operands)
+    return plan.contract(
+        operands,
+        transpose=transpose,
+        reshape=reshape,
+        matmul=matmul,
+        multiply=multiply,
+        einsum=einsum,
+    )
+
+
+# Matrix chains #
+# ------------- #
+
+
+@functools.lru_cache(maxsize=1024)
+def matrix_chain_order(shapes):
+    """
+    Find the order of the products of a chain of matrices with the fewest operations.
+
+    Parameters
+    ----------
+    shapes
+        tuple with the shape of each matrix, as a tuple of two ints.
+
+    Returns
+    -------
+    ret
+        the index in the chain of the first matrix of each product, the product
+        replacing both matrices in the chain.
+
+    Examples
+    --------
+    >>> matrix_chain_order(((10, 100), (100, 5), (5, 50)))
+    [0, 0]
+    >>> matrix_chain_order(((50, 5), (5, 100), (100, 10)))
+    [1, 0]
+    """
+    dims = [shapes[0][0]] + [shape[1] for shape in shapes]
+    n = len(shapes)
+    # the fewest operations, and the split, of the product of each range of matrices
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            cost[i][j] = math.inf
+            for k in range(i, j):
+                c = cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                if c < cost[i][j]:
+                    cost[i][j], split[i][j] = c, k
+    order = []
+
+    def _order(i, j):
+        # the products of the range are numbered by the position of their first
+        # matrix in the chain once the products before them are done
+        if i == j:
+            return
+        k = split[i][j]
+        _order(i, k)
+        _order(k + 1, j)
+        order.append(i)
+
+    _order(0, n - 1)
+    return _shrink(order, n)
+
+
+def _shrink(order, n):
+    # the ranges multiplied at each step are identified by their first matrix, whose
+    # position in the chain is the number of ranges still before it
+    chain = list(range(n))
+    ret = []
+    for i in order:
+        position = chain.index(i)
+        ret.append(position)
+        del chain[position + 1]
+    return ret
+
+
+def multi_dot(arrays, *, matmul):
+    """
+    Multiply a chain of matrices in the order with the fewest operations.
+
+    Parameters
+    ----------
+    arrays
+        the native matrices.
+    matmul
+        the native function multiplying two matrices.
+
+    Returns
+    -------
+    ret
+        the product of the matrices.
+    """
+    shapes = tuple(tuple(int(d) for d in x.shape) for x in arrays)
+    arrays = list(arrays)
+    for i in matrix_chain_order(shapes):
+        arrays[i : i + 2] = [matmul(arrays[i], arrays[i + 1])]
+    return arrays[0]
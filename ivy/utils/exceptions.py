@@ -249,3 +249,42 @@ def handle_exceptions(fn: Callable) -> Callable:
 
     _handle_exceptions.handle_exceptions = True
     return _handle_exceptions
+
+
+# the errors raised by the native vmaps and loops when tracing functions which need
+# the values of the arrays, such as python control flow on them
+_TRACER_ERRORS = (
+    "ConcretizationTypeError",
+    "TracerBoolConversionError",
+    "TracerIntegerConversionError",
+    "TracerArrayConversionError",
+)
+
+
+def is_tracer_error(e: Exception) -> bool:
+    """
+    Check whether an exception was raised by a native vmap or loop tracing a function
+    which needs the values of the arrays, in which case the function can still be
+    called eagerly.
+
+    The errors of the backends raised through ivy functions are found in the context
+    of the ivy exceptions.
+
+    Parameters
+    ----------
+    e
+        the exception raised.
+
+    Returns
+    -------
+    ret
+        whether the exception, or one of the exceptions it was raised from, is a
+        tracer error.
+    """
+    while e is not None:
+        if type(e).__name__ in _TRACER_ERRORS or str(e).startswith(
+            "vmap: It looks like you're"
+        ):
+            return True
+        e = e.__cause__ or e.__context__
+    return False
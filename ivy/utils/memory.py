@@ -0,0 +1,342 @@
+"""Registry of the live ivy arrays, and accounting of the memory they hold."""
+
+import math
+import sys
+import weakref
+
+import ivy
+
+
+# Registry #
+# -------- #
+
+# weak references to the live arrays, keyed by the id of each array, which every
+# array adds itself to when its data is set, and which the garbage collector removes
+# it from once it's freed
+_live = {}
+
+_active_tracker = None
+
+
+class _Ref(weakref.ref):
+    # like weakref.KeyedRef, without its constructors written in python
+    __slots__ = ("key",)
+
+
+def _release(ref):
+    if _live.get(ref.key) is ref:
+        del _live[ref.key]
+    if _active_tracker is not None:
+        _active_tracker._free(ref.key)
+
+
+def register(array, /, *, site=...):
+    """
+    Add an array to the registry of live arrays, or account for its new data if
+    it's already registered.
+
+    This is called by :class:`ivy.Array` whenever its data is set, and only costs a
+    weak reference until a :class:`MemoryTracker` is started.
+
+    Parameters
+    ----------
+    array
+        the ivy array.
+    site
+        the allocation site of the array, found from the stack by default.
+    """
+    key = id(array)
+    ref = _live.get(key)
+    if ref is None or ref() is not array:
+        ref = _live[key] = _Ref(array, _release)
+        ref.key = key
+    if _active_tracker is not None:
+        _active_tracker._allocate(key, array, site=site)
+
+
+def live_arrays():
+    """Return the ivy arrays which are currently alive."""
+    arrays = (ref() for ref in list(_live.values()))
+    return [x for x in arrays if x is not None]
+
+
+def num_live_arrays():
+    """Return the number of ivy arrays which are currently alive."""
+    return len(_live)
+
+
+# Accounting #
+# ---------- #
+
+
+def active_tracker():
+    """Return the tracker accounting for the memory of the arrays, or None if
+    tracking is off."""
+    return _active_tracker
+
+
+def start_tracking(tracker=None):
+    """
+    Start accounting for the memory held by the ivy arrays.
+
+    The arrays which are already alive are accounted for straight away, without an
+    allocation site.
+
+    Parameters
+    ----------
+    tracker
+        the tracker accounting for the arrays, a new one by default.
+
+    Returns
+    -------
+    ret
+        the tracker.
+    """
+    global _active_tracker
+    stop_tracking()
+    tracker = MemoryTracker() if tracker is None else tracker
+    for key, ref in list(_live.items()):
+        x = ref()
+        if x is not None:
+            tracker._allocate(key, x, site=None)
+    _active_tracker = tracker
+    return tracker
+
+
+def stop_tracking():
+    """
+    Stop accounting for the memory held by the ivy arrays.
+
+    Returns
+    -------
+    ret
+        the tracker which was active, or None.
+    """
+    global _active_tracker
+    tracker, _active_tracker = _active_tracker, None
+    return tracker
+
+
+class MemoryUsage:
+    """
+    Number and bytes of the live arrays of a group, along with their high-water
+    marks.
+
+    Attributes
+    ----------
+    count
+        number of live arrays.
+    nbytes
+        bytes held by the live arrays.
+    peak_count
+        highest number of live arrays so far.
+    peak_nbytes
+        highest number of bytes held so far.
+    """
+
+    __slots__ = ("count", "nbytes", "peak_count", "peak_nbytes")
+
+    def __init__(self):
+        self.count = 0
+        self.nbytes = 0
+        self.peak_count = 0
+        self.peak_nbytes = 0
+
+    def _add(self, nbytes):
+        self.count += 1
+        self.nbytes += nbytes
+        if self.count > self.peak_count:
+            self.peak_count = self.count
+        if self.nbytes > self.peak_nbytes:
+            self.peak_nbytes = self.nbytes
+
+    def _remove(self, nbytes):
+        self.count -= 1
+        self.nbytes -= nbytes
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "nbytes": self.nbytes,
+            "peak_count": self.peak_count,
+            "peak_nbytes": self.peak_nbytes,
+        }
+
+
+def _allocation_site():
+    # the innermost ivy function being called is found from the wrappers around it,
+    # which all hold the function they wrap as fn
+    func_wrapper_file = sys.modules["ivy.func_wrapper"].__file__
+    frame = sys._getframe(3)
+    while frame is not None:
+        if frame.f_code.co_filename == func_wrapper_file:
+            fn = frame.f_locals.get("fn")
+            if callable(fn):
+                return getattr(fn, "__name__", None)
+        frame = frame.f_back
+    return None
+
+
+def _describe(array):
+    # the data slot is read directly, so that deferred arrays aren't evaluated
+    from ivy.data_classes.array.deferred import DeferredArray
+
+    try:
+        data = ivy.Array.__dict__["_data"].__get__(array)
+    except AttributeError:
+        data = None
+    if data is None:
+        node = array._node if isinstance(array, DeferredArray) else None
+        if node is None:
+            return None, None, 0
+        return "cpu", node.dtype.name, math.prod(node.shape) * node.dtype.itemsize
+    backend = ivy.current_backend()
+    try:
+        device = str(backend.dev(data))
+    except Exception:
+        device = str(getattr(data, "device", None))
+    try:
+        dtype = str(backend.as_ivy_dtype(data.dtype))
+    except Exception:
+        dtype = str(getattr(data, "dtype", None))
+    nbytes = getattr(data, "nbytes", None)
+    if not isinstance(nbytes, int):
+        try:
+            nbytes = math.prod(data.shape) * backend.dtype_bits(data.dtype) // 8
+        except Exception:
+            nbytes = 0
+    return device, dtype, nbytes
+
+
+class MemoryTracker:
+    """
+    Tracker accounting for the memory held by the live ivy arrays.
+
+    The usage is updated as arrays are created and freed, so that querying it costs
+    nothing however many arrays are alive. It's broken down by device, by dtype and
+    by allocation site, which is the ivy function whose call created the array, or
+    None for arrays created otherwise.
+
+    Parameters
+    ----------
+    record_sites
+        whether to record the allocation site of each array, which requires walking
+        the stack whenever an array is created.
+
+    Attributes
+    ----------
+    total
+        the usage of all the live arrays.
+    devices
+        dict mapping each device to the usage of the arrays on it.
+    dtypes
+        dict mapping each dtype to the usage of the arrays of it.
+    sites
+        dict mapping each allocation site to the usage of the arrays created there.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> with ivy.utils.memory.MemoryTracker() as tracker:
+    ...     x = ivy.zeros((256, 256), dtype="float32")
+    ...     y = x + 1
+    ...     del y
+    >>> tracker.sites["zeros"].nbytes
+    262144
+    >>> tracker.sites["add"].peak_nbytes
+    262144
+    >>> tracker.sites["add"].nbytes
+    0
+    """
+
+    def __init__(self, *, record_sites=True):
+        self.record_sites = record_sites
+        self.total = MemoryUsage()
+        self.devices = {}
+        self.dtypes = {}
+        self.sites = {}
+        self._entries = {}
+
+    def _allocate(self, key, array, site=...):
+        if key in self._entries:
+            self._free(key)
+        device, dtype, nbytes = _describe(array)
+        if site is ...:
+            site = _allocation_site() if self.record_sites else None
+        self._entries[key] = (device, dtype, site, nbytes)
+        self.total._add(nbytes)
+        for groups, group in (
+            (self.devices, device),
+            (self.dtypes, dtype),
+            (self.sites, site),
+        ):
+            usage = groups.get(group)
+            if usage is None:
+                usage = groups[group] = MemoryUsage()
+            usage._add(nbytes)
+
+    def _free(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        device, dtype, site, nbytes = entry
+        self.total._remove(nbytes)
+        self.devices[device]._remove(nbytes)
+        self.dtypes[dtype]._remove(nbytes)
+        self.sites[site]._remove(nbytes)
+
+    def reset_peaks(self):
+        """Reset the high-water marks to the current usage."""
+        for usage in (
+            self.total,
+            *self.devices.values(),
+            *self.dtypes.values(),
+            *self.sites.values(),
+        ):
+            usage.peak_count = usage.count
+            usage.peak_nbytes = usage.nbytes
+
+    def to_dict(self):
+        """Return the usage as a nest of dicts, for example to be serialized."""
+        return {
+            "total": self.total.to_dict(),
+            "devices": {k: v.to_dict() for k, v in self.devices.items()},
+            "dtypes": {k: v.to_dict() for k, v in self.dtypes.items()},
+            "sites": {str(k): v.to_dict() for k, v in self.sites.items()},
+        }
+
+    def table(self, *, by="sites", limit=None):
+        """
+        Format the usage of each group as a table.
+
+        Parameters
+        ----------
+        by
+            the groups to show, among "sites", "devices" and "dtypes".
+        limit
+            maximum number of groups to show, the largest first.
+
+        Returns
+        -------
+        ret
+            the table, with sizes in megabytes.
+        """
+        rows = sorted(
+            getattr(self, by).items(), key=lambda item: item[1].nbytes, reverse=True
+        )[:limit]
+        width = max([len(str(name)) for name, _ in rows] + [8])
+        lines = [f"{by[:-1]:<{width}}{'count':>9}{'MB':>11}{'peak':>9}{'peak MB':>11}"]
+        for name, usage in rows:
+            lines.append(
+                f"{str(name):<{width}}{usage.count:>9}{usage.nbytes / 1e6:>11.3f}"
+                f"{usage.peak_count:>9}{usage.peak_nbytes / 1e6:>11.3f}"
+            )
+        return "\n".join(lines)
+
+    def __enter__(self):
+        start_tracking(self)
+        return self
+
+    def __exit__(self, *exc):
+        if _active_tracker is self:
+            stop_tracking()
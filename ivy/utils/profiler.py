@@ -1,10 +1,17 @@
 import cProfile
+import functools
+import json
+import os
 import pstats
 import subprocess
 import logging
+import threading
+import time
 from tempfile import NamedTemporaryFile
 from importlib.util import find_spec
 
+import ivy
+
 is_snakeviz = find_spec("snakeviz")
 
 
@@ -54,3 +61,428 @@ class Profiler(cProfile.Profile):
 
             if self.print_stats:
                 stats.print_stats()
+
+
+# Tracing #
+# ------- #
+
+_active_tracer = None
+
+
+def active_tracer():
+    """Return the tracer instrumenting the functions wrapped when setting a backend,
+    or None if tracing is off."""
+    return _active_tracer
+
+
+def start_tracing(tracer=None):
+    """
+    Instrument the ivy functions of every backend set from now on with the tracer.
+
+    The functions of a backend set before tracing started aren't instrumented, so
+    tracing costs nothing until it's started. :class:`Tracer` used as a context
+    manager also instruments the current backend.
+
+    Parameters
+    ----------
+    tracer
+        the tracer recording the calls, a new one by default.
+
+    Returns
+    -------
+    ret
+        the tracer.
+    """
+    global _active_tracer
+    _active_tracer = Tracer() if tracer is None else tracer
+    _active_tracer.enabled = True
+    return _active_tracer
+
+
+def stop_tracing():
+    """
+    Stop recording calls, and stop instrumenting the functions of the backends set
+    from now on.
+
+    Returns
+    -------
+    ret
+        the tracer which was active, or None.
+    """
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    if tracer is not None:
+        tracer.enabled = False
+    return tracer
+
+
+def _dtype_name(dtype):
+    name = getattr(dtype, "name", None)
+    return name if isinstance(name, str) else str(dtype).rpartition(".")[-1]
+
+
+def _native(x):
+    if not isinstance(x, ivy.Array):
+        return x
+    # the data slot is read directly, so that no ivy function is called from the
+    # tracer, and deferred arrays and stale views aren't evaluated
+    try:
+        return ivy.Array.__dict__["_data"].__get__(x)
+    except AttributeError:
+        return None
+
+
+def _is_native_array(x):
+    return hasattr(x, "shape") and hasattr(x, "dtype") and not isinstance(x, type)
+
+
+def _describe(x):
+    x = _native(x)
+    if not _is_native_array(x):
+        return None
+    return f"{_dtype_name(x.dtype)}[{','.join(str(d) for d in x.shape)}]"
+
+
+def _nbytes(x):
+    x = _native(x)
+    if not _is_native_array(x):
+        return 0
+    nbytes = getattr(x, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = 1
+    for dim in x.shape:
+        size *= int(dim)
+    itemsize = getattr(x.dtype, "itemsize", None) or getattr(x.dtype, "size", 0)
+    return size * int(itemsize)
+
+
+def _output_bytes(ret):
+    if isinstance(ret, (list, tuple)):
+        return sum(_nbytes(x) for x in ret)
+    return _nbytes(ret)
+
+
+class FunctionStats:
+    """
+    Statistics of the calls of an ivy function recorded by a :class:`Tracer`.
+
+    Attributes
+    ----------
+    calls
+        number of calls.
+    total_ns
+        time spent in the calls, including the calls of other traced functions.
+    self_ns
+        time spent in the calls, excluding the calls of other traced functions.
+    kernel_ns
+        time spent in the backend implementation, or None for compositional
+        functions, which have none.
+    output_bytes
+        bytes of the arrays returned.
+    signatures
+        number of calls with each string of the dtypes and shapes of the array
+        arguments.
+    """
+
+    __slots__ = (
+        "calls",
+        "total_ns",
+        "self_ns",
+        "kernel_ns",
+        "output_bytes",
+        "signatures",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.self_ns = 0
+        self.kernel_ns = None
+        self.output_bytes = 0
+        self.signatures = {}
+
+    @property
+    def overhead_ns(self):
+        """Time spent outside of the backend implementation, for primary functions,
+        or in the function itself for compositional ones."""
+        if self.kernel_ns is None:
+            return self.self_ns
+        return self.total_ns - self.kernel_ns
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "self_ns": self.self_ns,
+            "kernel_ns": self.kernel_ns,
+            "overhead_ns": self.overhead_ns,
+            "output_bytes": self.output_bytes,
+            "signatures": dict(self.signatures),
+        }
+
+
+class _Frame:
+    __slots__ = ("name", "start", "children_ns", "kernel_ns")
+
+    def __init__(self, name, start):
+        self.name = name
+        self.start = start
+        self.children_ns = 0
+        self.kernel_ns = None
+
+
+class Tracer:
+    """
+    Tracer recording the calls of the ivy functions.
+
+    While the tracer is active, setting a backend wraps each ivy function in two
+    more layers: one around all of its wrappers, recording the calls, and one
+    around the backend implementation, recording the time spent in the backend.
+    The difference is the overhead of the ivy wrappers. Once tracing stops, newly
+    set backends aren't instrumented, so tracing costs nothing while it's off.
+
+    Parameters
+    ----------
+    record_events
+        whether to record every call as an event, for :meth:`export_chrome_trace`.
+    record_signatures
+        whether to count the dtypes and shapes of the array arguments of the calls.
+    max_events
+        maximum number of events recorded, past which further calls are only
+        counted in the statistics.
+    functions
+        names of the only functions to trace, all of them by default.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> x = ivy.array([1., 2., 3.])
+    >>> with ivy.utils.profiler.Tracer() as tracer:
+    ...     y = ivy.exp(x) + 1
+    >>> tracer.stats["exp"].calls
+    1
+    >>> print(tracer.table(limit=3))  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        *,
+        record_events=True,
+        record_signatures=True,
+        max_events=1_000_000,
+        functions=None,
+    ):
+        self.record_events = record_events
+        self.record_signatures = record_signatures
+        self.max_events = max_events
+        self.functions = None if functions is None else frozenset(functions)
+        self.enabled = False
+        self.stats = {}
+        self.events = []
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+        self._num_backends = None
+
+    # Instrumentation #
+    # --------------- #
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def traces(self, name):
+        """Whether calls of the function are traced."""
+        return not name.startswith("_") and (
+            self.functions is None or name in self.functions
+        )
+
+    def wrap_call(self, name, fn, /):
+        """Wrap fn, the ivy function including all of its wrappers, to record its
+        calls."""
+
+        @functools.wraps(fn)
+        def _traced_call(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            stack = self._stack()
+            frame = _Frame(name, time.perf_counter_ns())
+            stack.append(frame)
+            try:
+                ret = fn(*args, **kwargs)
+            finally:
+                end = time.perf_counter_ns()
+                stack.pop()
+                total = end - frame.start
+                if stack:
+                    stack[-1].children_ns += total
+            self._record(frame, end, total, args, kwargs, ret)
+            return ret
+
+        return _traced_call
+
+    def wrap_kernel(self, name, fn, /):
+        """Wrap fn, the backend implementation of the ivy function, to record the
+        time spent in it."""
+
+        @functools.wraps(fn)
+        def _traced_kernel(*args, **kwargs):
+            stack = self._stack()
+            if not self.enabled or not stack or stack[-1].name != name:
+                return fn(*args, **kwargs)
+            frame = stack[-1]
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                frame.kernel_ns = (frame.kernel_ns or 0) + (
+                    time.perf_counter_ns() - start
+                )
+
+        return _traced_kernel
+
+    def _record(self, frame, end, total, args, kwargs, ret):
+        stats = self.stats.get(frame.name)
+        if stats is None:
+            stats = self.stats[frame.name] = FunctionStats()
+        stats.calls += 1
+        stats.total_ns += total
+        stats.self_ns += total - frame.children_ns
+        if frame.kernel_ns is not None:
+            stats.kernel_ns = (stats.kernel_ns or 0) + frame.kernel_ns
+        stats.output_bytes += _output_bytes(ret)
+        signature = None
+        if self.record_signatures:
+            inputs = [_describe(x) for x in args]
+            inputs += [_describe(x) for x in kwargs.values()]
+            signature = ", ".join(x for x in inputs if x is not None)
+            stats.signatures[signature] = stats.signatures.get(signature, 0) + 1
+        if self.record_events and len(self.events) < self.max_events:
+            self.events.append(
+                (
+                    frame.name,
+                    frame.start,
+                    total,
+                    frame.kernel_ns,
+                    threading.get_ident(),
+                    signature,
+                )
+            )
+
+    # Context Manager #
+    # --------------- #
+
+    def __enter__(self):
+        from ivy.utils.backend import handler
+
+        start_tracing(self)
+        # the current backend is set again, to wrap its functions with the tracer, and
+        # the implicit backend is set when none was set explicitly
+        self._num_backends = len(handler.backend_stack)
+        if handler.backend_stack:
+            ivy.set_backend(handler.backend_stack[-1])
+        else:
+            ivy.set_backend(ivy.current_backend().current_backend_str())
+        return self
+
+    def __exit__(self, *exc):
+        from ivy.utils.backend import handler
+
+        stop_tracing()
+        while len(handler.backend_stack) > self._num_backends:
+            ivy.previous_backend()
+
+    # Reports #
+    # ------- #
+
+    def reset(self):
+        """Discard the calls recorded so far."""
+        self.stats = {}
+        self.events = []
+        self._origin = time.perf_counter_ns()
+
+    def table(self, *, sort_by="self_ns", limit=None):
+        """
+        Format the statistics of the traced functions as a table.
+
+        Parameters
+        ----------
+        sort_by
+            statistic to sort the functions by, in decreasing order.
+        limit
+            maximum number of functions to show.
+
+        Returns
+        -------
+        ret
+            the table, with times in milliseconds.
+        """
+        rows = sorted(
+            self.stats.items(),
+            key=lambda item: getattr(item[1], sort_by) or 0,
+            reverse=True,
+        )[:limit]
+        width = max([len(name) for name, _ in rows] + [8])
+        lines = [
+            f"{'function':<{width}}{'calls':>9}{'total':>11}{'self':>11}"
+            f"{'kernel':>11}{'overhead':>11}{'%':>6}{'out MB':>9}  top signature"
+        ]
+        for name, stats in rows:
+            kernel = "-" if stats.kernel_ns is None else f"{stats.kernel_ns / 1e6:.3f}"
+            share = 100 * stats.overhead_ns / stats.total_ns if stats.total_ns else 0
+            top = max(stats.signatures.items(), key=lambda s: s[1], default=("", 0))
+            lines.append(
+                f"{name:<{width}}{stats.calls:>9}{stats.total_ns / 1e6:>11.3f}"
+                f"{stats.self_ns / 1e6:>11.3f}{kernel:>11}"
+                f"{stats.overhead_ns / 1e6:>11.3f}{share:>6.0f}"
+                f"{stats.output_bytes / 1e6:>9.2f}  {top[0]}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """
+        Return the recorded calls in the Chrome trace event format, which
+        chrome://tracing and Perfetto can open.
+
+        Each call is a complete event, enclosing an event for the time spent in the
+        backend implementation.
+        """
+        pid = os.getpid()
+        trace_events = []
+        for name, start, total, kernel, tid, signature in self.events:
+            ts = (start - self._origin) / 1e3
+            trace_events.append(
+                {
+                    "name": name,
+                    "cat": "ivy",
+                    "ph": "X",
+                    "ts": ts,
+                    "dur": total / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {} if signature is None else {"inputs": signature},
+                }
+            )
+            if kernel is not None:
+                # the wrappers run around the backend implementation, which is
+                # shown ending with the call as its exact position isn't recorded
+                trace_events.append(
+                    {
+                        "name": f"{name} (backend)",
+                        "cat": "backend",
+                        "ph": "X",
+                        "ts": ts + (total - kernel) / 1e3,
+                        "dur": kernel / 1e3,
+                        "pid": pid,
+                        "tid": tid,
+                    }
+                )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ns"}
+
+    def export_chrome_trace(self, path):
+        """Write the recorded calls to a JSON file in the Chrome trace event
+        format."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
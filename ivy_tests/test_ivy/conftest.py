@@ -1,5 +1,6 @@
 # global
 import os
+import time
 import pytest
 from typing import Dict
 
@@ -8,6 +9,7 @@ import ivy_tests.test_ivy.helpers.test_parameter_flags as pf
 from ivy import DefaultDevice
 from ivy import set_exception_trace_mode
 from ivy_tests.test_ivy.helpers import globals as test_globals
+from ivy_tests.test_ivy.helpers import backend_workers
 from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
 
 available_frameworks = available_frameworks()
@@ -91,6 +93,30 @@ def pytest_configure(config):
 
     process_cl_flags(config)
 
+    # ground truth worker processes
+    if config.getoption("--backend-workers"):
+        backend_workers.enable()
+
+
+def pytest_unconfigure(config):
+    backend_workers.shutdown()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    backend_workers.current_test = item.nodeid
+    start = time.perf_counter()
+    yield
+    backend_workers.record_test(time.perf_counter() - start)
+    backend_workers.current_test = None
+
+
+def pytest_terminal_summary(terminalreporter):
+    limit = terminalreporter.config.getoption("--test-timings")
+    if limit and backend_workers.timings:
+        terminalreporter.section(f"slowest {limit} tests")
+        terminalreporter.write_line(backend_workers.format_timings(limit))
+
 
 @pytest.fixture(autouse=True)
 def run_around_tests(request, on_device, backend_fw, compile_graph, implicit):
@@ -210,6 +236,18 @@ def pytest_addoption(parser):
     parser.addoption("--with-instance-method-testing", action="store_true")
     parser.addoption("--with-gradient-testing", action="store_true")
     parser.addoption("--no-extra-testing", action="store_true")
+    parser.addoption(
+        "--backend-workers",
+        action="store_true",
+        help="compute the ground truth in a worker process per backend",
+    )
+    parser.addoption(
+        "--test-timings",
+        action="store",
+        type=int,
+        default=0,
+        help="report the time spent on the N slowest tests",
+    )
     parser.addoption(
         "--my_test_dump",
         action="store",
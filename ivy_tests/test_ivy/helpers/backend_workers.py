@@ -0,0 +1,392 @@
+"""
+Long-lived worker processes computing the ground truth of the function tests.
+
+With ``--backend-workers``, each ground truth backend (or frontend framework) gets
+its own worker process, which imports the backend once as a local ivy instance with
+``ivy.with_backend``. The tests then send each example to the worker before running
+the target backend, so that the two run in parallel and the global backend is never
+switched back and forth. The worker flattens the returns to NumPy arrays and writes
+them to a shared memory buffer, which the test reads them back from without copying
+them through a pipe.
+
+The time spent on each test is also recorded, split into the time spent running the
+target backend and waiting for the ground truth, and the slowest tests are reported
+at the end of the session.
+"""
+
+# global
+import atexit
+import multiprocessing
+import pickle
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_ALIGNMENT = 64
+_MIN_BUFFER_SIZE = 1 << 20
+
+_enabled = False
+_workers = {}
+
+
+def enable():
+    """Compute the ground truth of the function tests in the worker processes."""
+    global _enabled
+    _enabled = True
+
+
+def is_enabled():
+    return _enabled
+
+
+def shutdown():
+    """Stop all the worker processes."""
+    for worker in list(_workers.values()):
+        worker.close()
+    _workers.clear()
+
+
+atexit.register(shutdown)
+
+
+# Worker #
+# ------ #
+
+
+class _SharedBuffer:
+    """Shared memory written by a worker, which grows to fit the largest return."""
+
+    def __init__(self):
+        self.shm = None
+
+    def write(self, arrays):
+        specs, offset = [], 0
+        for i, x in enumerate(arrays):
+            x = np.ascontiguousarray(x)
+            arrays[i] = x
+            if x.dtype.hasobject:
+                # arrays of python objects can't be shared, and are sent pickled
+                specs.append(x)
+                continue
+            offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+            specs.append((x.dtype.str, x.shape, offset))
+            offset += x.nbytes
+        if self.shm is None or self.shm.size < offset:
+            size = max(offset, _MIN_BUFFER_SIZE, 2 * getattr(self.shm, "size", 0))
+            self.close()
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        for x, spec in zip(arrays, specs):
+            if isinstance(spec, tuple):
+                dtype, shape, start = spec
+                view = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=start)
+                view[...] = x
+        return self.shm.name, specs
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+def _function_ground_truth(
+    ivy_backend, *, fn_name, args_np, kwargs_np, input_dtypes, on_device
+):
+    # the arrays are created from the numpy inputs with the local ivy instance, as
+    # the test does with the ground truth backend set globally
+    def _create(nest, offset):
+        nest = ivy_backend.copy_nest(nest, to_mutable=False)
+        idxs = ivy_backend.nested_argwhere(nest, lambda x: isinstance(x, np.ndarray))
+        values = ivy_backend.multi_index_nest(nest, idxs)
+        ivy_backend.set_nest_at_indices(
+            nest,
+            idxs,
+            [
+                ivy_backend.array(x, dtype=input_dtypes[i], device=on_device)
+                for i, x in enumerate(values, start=offset)
+            ],
+        )
+        return nest, len(values)
+
+    args, num_args_arrays = _create(args_np, 0)
+    kwargs, _ = _create(kwargs_np, num_args_arrays)
+    ret = ivy_backend.__dict__[fn_name](*args, **kwargs)
+    ret = ivy_backend.nested_map(
+        ret,
+        lambda x: (
+            ivy_backend.to_ivy(x)
+            if ivy_backend.is_native_array(x) or isinstance(x, np.ndarray)
+            else x
+        ),
+        include_derived={tuple: True},
+    )
+    device = str(ivy_backend.dev(ret)) if isinstance(ret, ivy_backend.Array) else None
+    if not isinstance(ret, tuple):
+        ret = (ret,)
+    ret_idxs = ivy_backend.nested_argwhere(ret, ivy_backend.is_ivy_array)
+    if len(ret_idxs) == 0:
+        ret_idxs = ivy_backend.nested_argwhere(ret, ivy_backend.isscalar)
+        ret_flat = [np.asarray(x) for x in ivy_backend.multi_index_nest(ret, ret_idxs)]
+    else:
+        ret_flat = [
+            ivy_backend.to_numpy(x) for x in ivy_backend.multi_index_nest(ret, ret_idxs)
+        ]
+    return ret_flat, device
+
+
+def _frontend_ground_truth(ivy_backend, *, fn_tree, args_np, kwargs_np):
+    from .function_testing import get_frontend_ground_truth_ret
+
+    _, ret_np_flat = get_frontend_ground_truth_ret(
+        ivy_backend, fn_tree=fn_tree, args_np=args_np, kwargs_np=kwargs_np
+    )
+    return ret_np_flat, None
+
+
+_TASKS = {
+    "function": _function_ground_truth,
+    "frontend": _frontend_ground_truth,
+}
+
+
+def _worker_main(backend, conn):
+    import ivy
+
+    try:
+        ivy_backend, startup_error = ivy.with_backend(backend), None
+    except Exception as e:
+        # raised by each example, rather than starting the worker again each time
+        ivy_backend, startup_error = None, e
+    buffer = _SharedBuffer()
+    try:
+        while True:
+            try:
+                message = conn.recv_bytes()
+            except EOFError:
+                break
+            try:
+                # unpickled here, so that arguments the worker can't load only fail
+                # their own example
+                task = pickle.loads(message)
+                if task is None:
+                    break
+                if startup_error is not None:
+                    raise startup_error
+                kind, kwargs = task
+                ret_flat, device = _TASKS[kind](ivy_backend, **kwargs)
+                name, specs = buffer.write(ret_flat)
+                reply = (True, (name, specs, device))
+            except Exception as e:
+                try:
+                    # some exceptions can be pickled but not constructed again
+                    reply = (False, pickle.dumps(e))
+                    pickle.loads(reply[1])
+                except Exception:
+                    reply = (False, pickle.dumps(RuntimeError(traceback.format_exc())))
+            conn.send(reply)
+    finally:
+        buffer.close()
+        conn.close()
+
+
+# Parent #
+# ------ #
+
+
+class _Worker:
+    """A worker process computing the ground truth with one backend."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        ctx = multiprocessing.get_context("spawn")
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(backend, child_conn), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.shm = None
+        self.pending = None
+
+    def submit(self, kind, kwargs):
+        # a previous example whose test failed before reading its ground truth
+        if self.pending is not None:
+            self.pending.result(discard=True)
+        self.conn.send((kind, kwargs))
+        self.pending = _PendingResult(self)
+        return self.pending
+
+    def _read(self, name, specs):
+        if self.shm is None or self.shm.name != name:
+            if self.shm is not None:
+                self.shm.close()
+            # the worker owns the buffer and unlinks it, the spawned workers share
+            # the resource tracker of the parent, which attaching registers again
+            self.shm = shared_memory.SharedMemory(name=name)
+        ret = []
+        for spec in specs:
+            if isinstance(spec, tuple):
+                dtype, shape, start = spec
+                spec = np.ndarray(
+                    shape, dtype=dtype, buffer=self.shm.buf, offset=start
+                ).copy()
+            ret.append(spec)
+        return ret
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm = None
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=10)
+        except (BrokenPipeError, OSError):
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+class _PendingResult:
+    """The ground truth of an example being computed by a worker."""
+
+    def __init__(self, worker):
+        self.worker = worker
+
+    def result(self, discard=False):
+        """
+        Wait for the ground truth.
+
+        Returns
+        -------
+        ret
+            the flattened return as NumPy arrays, and the device of the return if
+            it's a single array, or None.
+        """
+        worker = self.worker
+        worker.pending = None
+        try:
+            ok, value = worker.conn.recv()
+        except (EOFError, OSError):
+            # the worker died, and is started again for the next example
+            _workers.pop(worker.backend, None)
+            worker.close()
+            if discard:
+                return None
+            raise RuntimeError(f"the {worker.backend} ground truth worker died")
+        if discard:
+            return None
+        if not ok:
+            raise pickle.loads(value)
+        name, specs, device = value
+        return worker._read(name, specs), device
+
+
+def _submit(backend, kind, kwargs):
+    worker = _workers.get(backend)
+    if worker is None:
+        worker = _workers[backend] = _Worker(backend)
+    try:
+        return worker.submit(kind, kwargs)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # the arguments can't be sent, the test computes the ground truth itself
+        worker.pending = None
+        return None
+
+
+def submit_function(backend, *, fn_name, args_np, kwargs_np, input_dtypes, on_device):
+    """
+    Start computing the return of an ivy function with the ground truth backend.
+
+    Returns
+    -------
+    ret
+        the pending result, or None if the arguments can't be sent to the worker.
+    """
+    return _submit(
+        backend,
+        "function",
+        dict(
+            fn_name=fn_name,
+            args_np=args_np,
+            kwargs_np=kwargs_np,
+            input_dtypes=list(input_dtypes),
+            on_device=on_device,
+        ),
+    )
+
+
+def submit_frontend(frontend, *, fn_tree, args_np, kwargs_np):
+    """
+    Start computing the return of the native function of a frontend with the
+    frontend framework.
+
+    Returns
+    -------
+    ret
+        the pending result, or None if the arguments can't be sent to the worker.
+    """
+    return _submit(
+        frontend,
+        "frontend",
+        dict(fn_tree=fn_tree, args_np=args_np, kwargs_np=kwargs_np),
+    )
+
+
+# Timings #
+# ------- #
+
+
+class TestTiming:
+    """Time spent on a test, in seconds."""
+
+    __slots__ = ("total", "examples", "target", "ground_truth")
+
+    def __init__(self):
+        self.total = 0.0
+        self.examples = 0
+        self.target = 0.0
+        self.ground_truth = 0.0
+
+
+current_test = None
+timings = {}
+
+
+def _timing():
+    timing = timings.get(current_test)
+    if timing is None:
+        timing = timings[current_test] = TestTiming()
+    return timing
+
+
+def record_example(target, ground_truth):
+    """Record the time spent on the target backend and waiting for the ground truth
+    of an example of the current test."""
+    timing = _timing()
+    timing.examples += 1
+    timing.target += target
+    timing.ground_truth += ground_truth
+
+
+def record_test(total):
+    """Record the total time spent on the current test."""
+    _timing().total += total
+
+
+def format_timings(limit=20):
+    """Format the timings of the slowest tests as a table."""
+    rows = sorted(timings.items(), key=lambda item: item[1].total, reverse=True)
+    rows = rows[:limit]
+    width = max([len(str(name)) for name, _ in rows] + [4])
+    lines = [
+        f"{'test':<{width}}{'total s':>10}{'examples':>10}{'target s':>10}"
+        f"{'gt wait s':>11}"
+    ]
+    for name, t in rows:
+        lines.append(
+            f"{str(name):<{width}}{t.total:>10.2f}{t.examples:>10}{t.target:>10.2f}"
+            f"{t.ground_truth:>11.2f}"
+        )
+    return "\n".join(lines)
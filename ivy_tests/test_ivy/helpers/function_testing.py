@@ -5,6 +5,7 @@ import numpy as np
 import types
 import importlib
 import inspect
+import time
 from collections import OrderedDict
 
 from ivy import frontend_outputs_to_ivy_arrays, output_to_native_arrays
@@ -28,6 +29,7 @@ from ivy.functional.ivy.gradients import _variable
 from ivy.functional.ivy.data_type import _get_function_list, _get_functions_from_string
 from ivy_tests.test_ivy.test_frontends import NativeClass
 from ivy_tests.test_ivy.helpers.structs import FrontendMethodData
+from . import backend_workers
 from .assertions import (
     value_test,
     check_unsupported_dtype,
@@ -254,6 +256,28 @@ def test_function(
         not test_flags.native_arrays[0] or test_flags.container[0]
     )
 
+    # start computing the ground truth in its worker process, while the target
+    # backend runs, unless the flags need the ground truth to be computed with
+    # containers, an out argument or compilation, which only the in-process
+    # computation does
+    ground_truth = None
+    if (
+        backend_workers.is_enabled()
+        and (test_values or return_flat_np_arrays)
+        and not any(test_flags.container)
+        and not test_flags.with_out
+        and not test_flags.test_compile
+    ):
+        ground_truth = backend_workers.submit_function(
+            ground_truth_backend,
+            fn_name=fn_name,
+            args_np=args_np,
+            kwargs_np=kwargs_np,
+            input_dtypes=input_dtypes,
+            on_device=on_device,
+        )
+    start = time.perf_counter()
+
     args, kwargs = create_args_kwargs(
         args_np=args_np,
         arg_np_vals=arg_np_arrays,
@@ -354,54 +378,64 @@ def test_function(
                 f" returned: {out}"
             )
     # compute the return with a Ground Truth backend
-
-    ivy.set_backend(ground_truth_backend)
-    ivy.set_default_device(on_device)
-    try:
-        args, kwargs = create_args_kwargs(
-            args_np=args_np,
-            arg_np_vals=arg_np_arrays,
-            args_idxs=arrays_args_indices,
-            kwargs_np=kwargs_np,
-            kwargs_idxs=arrays_kwargs_indices,
-            kwarg_np_vals=kwarg_np_arrays,
-            input_dtypes=input_dtypes,
-            test_flags=test_flags,
-            on_device=on_device,
-        )
-        ret_from_gt, ret_np_from_gt_flat = get_ret_and_flattened_np_array(
-            ivy.__dict__[fn_name],
-            *args,
-            test_compile=test_flags.test_compile,
-            **kwargs,
-        )
-        if test_flags.with_out and not test_flags.test_compile:
-            test_ret_from_gt = (
-                ret_from_gt[getattr(ivy.__dict__[fn_name], "out_index")]
-                if hasattr(ivy.__dict__[fn_name], "out_index")
-                else ret_from_gt
-            )
-            out_from_gt = ivy.nested_map(
-                test_ret_from_gt,
-                ivy.zeros_like,
-                to_mutable=True,
-                include_derived=True,
+    target_time = time.perf_counter() - start
+    if ground_truth is not None:
+        ret_np_from_gt_flat, ret_from_gt_device = ground_truth.result()
+        ret_from_gt = ret_np_from_gt_flat
+        gt_returned_array = ret_from_gt_device is not None
+        # only computed for the gradient test, as reading the sources is slow
+        fw_list = None
+    else:
+        ivy.set_backend(ground_truth_backend)
+        ivy.set_default_device(on_device)
+        try:
+            args, kwargs = create_args_kwargs(
+                args_np=args_np,
+                arg_np_vals=arg_np_arrays,
+                args_idxs=arrays_args_indices,
+                kwargs_np=kwargs_np,
+                kwargs_idxs=arrays_kwargs_indices,
+                kwarg_np_vals=kwarg_np_arrays,
+                input_dtypes=input_dtypes,
+                test_flags=test_flags,
+                on_device=on_device,
             )
             ret_from_gt, ret_np_from_gt_flat = get_ret_and_flattened_np_array(
                 ivy.__dict__[fn_name],
                 *args,
                 test_compile=test_flags.test_compile,
                 **kwargs,
-                out=out_from_gt,
             )
-    except Exception as e:
+            if test_flags.with_out and not test_flags.test_compile:
+                test_ret_from_gt = (
+                    ret_from_gt[getattr(ivy.__dict__[fn_name], "out_index")]
+                    if hasattr(ivy.__dict__[fn_name], "out_index")
+                    else ret_from_gt
+                )
+                out_from_gt = ivy.nested_map(
+                    test_ret_from_gt,
+                    ivy.zeros_like,
+                    to_mutable=True,
+                    include_derived=True,
+                )
+                ret_from_gt, ret_np_from_gt_flat = get_ret_and_flattened_np_array(
+                    ivy.__dict__[fn_name],
+                    *args,
+                    test_compile=test_flags.test_compile,
+                    **kwargs,
+                    out=out_from_gt,
+                )
+        except Exception as e:
+            ivy.previous_backend()
+            raise e
+        fw_list = gradient_unsupported_dtypes(fn=ivy.__dict__[fn_name])
+        gt_returned_array = isinstance(ret_from_gt, ivy.Array)
+        if gt_returned_array:
+            ret_from_gt_device = ivy.dev(ret_from_gt)
         ivy.previous_backend()
-        raise e
-    fw_list = gradient_unsupported_dtypes(fn=ivy.__dict__[fn_name])
-    gt_returned_array = isinstance(ret_from_gt, ivy.Array)
-    if gt_returned_array:
-        ret_from_gt_device = ivy.dev(ret_from_gt)
-    ivy.previous_backend()
+    backend_workers.record_example(
+        target_time, time.perf_counter() - start - target_time
+    )
 
     # Gradient test
     if (
@@ -410,6 +444,8 @@ def test_function(
         and "bool" not in input_dtypes
         and not any(ivy.is_complex_dtype(d) for d in input_dtypes)
     ):
+        if fw_list is None:
+            fw_list = gradient_unsupported_dtypes(fn=ivy.__dict__[fn_name])
         if fw.backend not in fw_list or not ivy.nested_argwhere(
             all_as_kwargs_np,
             lambda x: (
@@ -604,6 +640,23 @@ def test_frontend_function(
             "jax_enable_x64", True
         )
 
+    def arrays_to_numpy(x):
+        if test_flags.generate_frontend_arrays:
+            return ivy.to_numpy(x.ivy_array) if _is_frontend_array(x) else x
+        return ivy.to_numpy(x._data) if isinstance(x, ivy.Array) else x
+
+    # start computing the ground truth in its worker process, while the target
+    # backend runs, unless the target updates the arguments inplace
+    ground_truth = None
+    if backend_workers.is_enabled() and test_values and not test_flags.inplace:
+        ground_truth = backend_workers.submit_frontend(
+            frontend,
+            fn_tree=fn_tree,
+            args_np=ivy.nested_map(args_for_test, arrays_to_numpy, shallow=False),
+            kwargs_np=ivy.nested_map(kwargs_for_test, arrays_to_numpy, shallow=False),
+        )
+    start = time.perf_counter()
+
     _as_ivy_arrays = not test_flags.generate_frontend_arrays
     ret = get_frontend_ret(
         frontend_fn, *args_for_test, as_ivy_arrays=_as_ivy_arrays, **kwargs_for_test
@@ -704,12 +757,7 @@ def test_frontend_function(
             assert first_array is ret_
             args, kwargs = copy_args, copy_kwargs
     # create NumPy args
-
-    def arrays_to_numpy(x):
-        if test_flags.generate_frontend_arrays:
-            return ivy.to_numpy(x.ivy_array) if _is_frontend_array(x) else x
-        return ivy.to_numpy(x._data) if isinstance(x, ivy.Array) else x
-
+    target_time = time.perf_counter() - start
     args_np = ivy.nested_map(
         args_for_test,
         arrays_to_numpy,
@@ -721,69 +769,23 @@ def test_frontend_function(
         shallow=False,
     )
 
-    # temporarily set frontend framework as backend
-    ivy.set_backend(frontend)
-    try:
-        # create frontend framework args
-        args_frontend = ivy.nested_map(
-            args_np,
-            lambda x: (
-                ivy.native_array(x)
-                if isinstance(x, np.ndarray)
-                else ivy.as_native_dtype(x) if isinstance(x, ivy.Dtype) else x
-            ),
-            shallow=False,
-        )
-        kwargs_frontend = ivy.nested_map(
-            kwargs_np,
-            lambda x: ivy.native_array(x) if isinstance(x, np.ndarray) else x,
-            shallow=False,
-        )
-
-        # change ivy dtypes to native dtypes
-        if "dtype" in kwargs_frontend:
-            kwargs_frontend["dtype"] = ivy.as_native_dtype(kwargs_frontend["dtype"])
-
-        # change ivy device to native devices
-        if "device" in kwargs_frontend:
-            kwargs_frontend["device"] = ivy.as_native_dev(kwargs_frontend["device"])
-
-        # check and replace the NativeClass objects in arguments
-        # with true counterparts
-        args_frontend = ivy.nested_map(
-            args_frontend, fn=convtrue, include_derived=True, max_depth=10
-        )
-        kwargs_frontend = ivy.nested_map(
-            kwargs_frontend, fn=convtrue, include_derived=True, max_depth=10
-        )
-
-        # wrap the frontend function objects in arguments to return native arrays
-        args_frontend = ivy.nested_map(
-            args_frontend, fn=wrap_frontend_function_args, max_depth=10
-        )
-        kwargs_frontend = ivy.nested_map(
-            kwargs_frontend, fn=wrap_frontend_function_args, max_depth=10
-        )
-
-        # compute the return via the frontend framework
-        module_name = fn_tree[25 : fn_tree.rfind(".")]
-        frontend_fw = importlib.import_module(module_name)
-        frontend_ret = frontend_fw.__dict__[fn_name](*args_frontend, **kwargs_frontend)
-
-        if ivy.isscalar(frontend_ret):
-            frontend_ret_np_flat = [np.asarray(frontend_ret)]
-        else:
-            # tuplify the frontend return
-            if not isinstance(frontend_ret, tuple):
-                frontend_ret = (frontend_ret,)
-            frontend_ret_idxs = ivy.nested_argwhere(frontend_ret, ivy.is_native_array)
-            frontend_ret_flat = ivy.multi_index_nest(frontend_ret, frontend_ret_idxs)
-            frontend_ret_np_flat = [ivy.to_numpy(x) for x in frontend_ret_flat]
-        # unset frontend framework from backend
-        ivy.previous_backend()
-    except Exception as e:
-        ivy.previous_backend()
-        raise e
+    if ground_truth is not None:
+        frontend_ret_np_flat, _ = ground_truth.result()
+    else:
+        # temporarily set frontend framework as backend
+        ivy.set_backend(frontend)
+        try:
+            frontend_ret, frontend_ret_np_flat = get_frontend_ground_truth_ret(
+                ivy, fn_tree=fn_tree, args_np=args_np, kwargs_np=kwargs_np
+            )
+            # unset frontend framework from backend
+            ivy.previous_backend()
+        except Exception as e:
+            ivy.previous_backend()
+            raise e
+    backend_workers.record_example(
+        target_time, time.perf_counter() - start - target_time
+    )
 
     if test_flags.generate_frontend_arrays:
         ret_np_flat = flatten_frontend_to_np(
@@ -1765,6 +1767,90 @@ def get_ret_and_flattened_np_array(fn, *args, test_compile: bool = False, **kwar
     return ret, flatten_and_to_np(ret=ret)
 
 
+def get_frontend_ground_truth_ret(ivy_backend, *, fn_tree, args_np, kwargs_np):
+    """
+    Run the native function of a frontend with the frontend framework.
+
+    Parameters
+    ----------
+    ivy_backend
+        ivy with the frontend framework as its backend, either the global ivy module
+        with the backend set, or a local instance returned by `ivy.with_backend`.
+    fn_tree
+        Path to function in frontend framework namespace.
+    args_np
+        positional arguments, with NumPy arrays.
+    kwargs_np
+        keyword arguments, with NumPy arrays.
+
+    Returns
+    -------
+    ret
+        the return of the native function, and its flattened NumPy arrays.
+    """
+    # create frontend framework args
+    args_frontend = ivy_backend.nested_map(
+        args_np,
+        lambda x: (
+            ivy_backend.native_array(x)
+            if isinstance(x, np.ndarray)
+            else ivy_backend.as_native_dtype(x) if isinstance(x, ivy.Dtype) else x
+        ),
+        shallow=False,
+    )
+    kwargs_frontend = ivy_backend.nested_map(
+        kwargs_np,
+        lambda x: ivy_backend.native_array(x) if isinstance(x, np.ndarray) else x,
+        shallow=False,
+    )
+
+    # change ivy dtypes to native dtypes
+    if "dtype" in kwargs_frontend:
+        kwargs_frontend["dtype"] = ivy_backend.as_native_dtype(kwargs_frontend["dtype"])
+
+    # change ivy device to native devices
+    if "device" in kwargs_frontend:
+        kwargs_frontend["device"] = ivy_backend.as_native_dev(kwargs_frontend["device"])
+
+    # check and replace the NativeClass objects in arguments
+    # with true counterparts
+    args_frontend = ivy_backend.nested_map(
+        args_frontend, fn=convtrue, include_derived=True, max_depth=10
+    )
+    kwargs_frontend = ivy_backend.nested_map(
+        kwargs_frontend, fn=convtrue, include_derived=True, max_depth=10
+    )
+
+    # wrap the frontend function objects in arguments to return native arrays
+    args_frontend = ivy_backend.nested_map(
+        args_frontend, fn=wrap_frontend_function_args, max_depth=10
+    )
+    kwargs_frontend = ivy_backend.nested_map(
+        kwargs_frontend, fn=wrap_frontend_function_args, max_depth=10
+    )
+
+    # compute the return via the frontend framework
+    split_index = fn_tree.rfind(".")
+    module_name, fn_name = fn_tree[25:split_index], fn_tree[split_index + 1 :]
+    frontend_fw = importlib.import_module(module_name)
+    frontend_ret = frontend_fw.__dict__[fn_name](*args_frontend, **kwargs_frontend)
+
+    if ivy_backend.isscalar(frontend_ret):
+        frontend_ret_np_flat = [np.asarray(frontend_ret)]
+    else:
+        # tuplify the frontend return
+        if not isinstance(frontend_ret, tuple):
+            frontend_ret = (frontend_ret,)
+        frontend_ret_idxs = ivy_backend.nested_argwhere(
+            frontend_ret, ivy_backend.is_native_array
+        )
+        frontend_ret_flat = ivy_backend.multi_index_nest(
+            frontend_ret, frontend_ret_idxs
+        )
+        frontend_ret_np_flat = [ivy_backend.to_numpy(x) for x in frontend_ret_flat]
+    return frontend_ret, frontend_ret_np_flat
+
+
 def get_frontend_ret(
     frontend_fn,
     *args,
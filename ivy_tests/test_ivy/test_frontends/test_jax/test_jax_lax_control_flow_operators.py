@@ -79,6 +79,42 @@ def test_jax_map(
     )
 
 
+@handle_frontend_test(
+    fn_tree="jax.lax.map",
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float"),
+        num_arrays=2,
+        shared_dtype=True,
+        min_num_dims=1,
+        min_dim_size=1,
+        max_value=100,
+        min_value=-100,
+    ),
+    test_with_out=st.just(False),
+)
+def test_jax_map_nest(
+    *,
+    dtype_and_x,
+    test_flags,
+    on_device,
+    fn_tree,
+    frontend,
+):
+    def _test_map_fn(xs):
+        return {"sum": xs[0] + xs[1], "first": xs[0]}
+
+    input_dtype, x = dtype_and_x
+    helpers.test_frontend_function(
+        input_dtypes=input_dtype,
+        test_flags=test_flags,
+        frontend=frontend,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        f=_test_map_fn,
+        xs=(x[0], x[1]),
+    )
+
+
 @handle_frontend_test(
     fn_tree="jax.lax.switch",
     dtype_and_x=helpers.dtype_and_values(
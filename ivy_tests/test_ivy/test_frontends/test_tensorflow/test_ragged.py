@@ -0,0 +1,67 @@
+# global
+import numpy as np
+from hypothesis import strategies as st
+
+# local
+import ivy_tests.test_ivy.helpers as helpers
+from ivy_tests.test_ivy.helpers import handle_frontend_test
+
+
+@st.composite
+def _row_lengths(draw):
+    return draw(
+        st.lists(helpers.ints(min_value=0, max_value=5), min_size=1, max_size=10)
+    )
+
+
+# row_splits_to_segment_ids
+@handle_frontend_test(
+    fn_tree="tensorflow.ragged.row_splits_to_segment_ids",
+    row_lengths=_row_lengths(),
+    test_with_out=st.just(False),
+)
+def test_tensorflow_row_splits_to_segment_ids(
+    *,
+    row_lengths,
+    frontend,
+    test_flags,
+    fn_tree,
+    on_device,
+):
+    splits = np.concatenate([[0], np.cumsum(row_lengths)]).astype("int64")
+    helpers.test_frontend_function(
+        input_dtypes=["int64"],
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        splits=splits,
+    )
+
+
+# segment_ids_to_row_splits
+@handle_frontend_test(
+    fn_tree="tensorflow.ragged.segment_ids_to_row_splits",
+    row_lengths=_row_lengths(),
+    extra_segments=helpers.ints(min_value=0, max_value=3),
+    test_with_out=st.just(False),
+)
+def test_tensorflow_segment_ids_to_row_splits(
+    *,
+    row_lengths,
+    extra_segments,
+    frontend,
+    test_flags,
+    fn_tree,
+    on_device,
+):
+    segment_ids = np.repeat(np.arange(len(row_lengths)), row_lengths).astype("int64")
+    helpers.test_frontend_function(
+        input_dtypes=["int64"],
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        segment_ids=segment_ids,
+        num_segments=len(row_lengths) + extra_segments,
+    )
@@ -0,0 +1,61 @@
+"""Collection of tests for unified control flow functions."""
+
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+# for_loop
+@pytest.mark.parametrize(
+    "iterable", [range(4), range(7, 0, -3), range(0), [3, 1, 4], ()]
+)
+def test_for_loop(iterable):
+    def _body_fn(i, vars):
+        x, y = vars
+        return x + i, y * 2
+
+    x, y = ivy.for_loop(iterable, _body_fn, (ivy.array(1.0), ivy.array([1, 2])))
+    assert isinstance(x, ivy.Array) and isinstance(y, ivy.Array)
+    assert np.allclose(ivy.to_numpy(x), 1.0 + sum(iterable))
+    assert np.array_equal(ivy.to_numpy(y), np.array([1, 2]) * 2 ** len(iterable))
+    # the loop keeps the dtypes of the variables
+    assert x.dtype == ivy.default_float_dtype()
+    assert y.dtype == ivy.default_int_dtype()
+
+
+@pytest.mark.parametrize("native", [False, True])
+def test_for_loop_index(native):
+    indices = []
+
+    def _body_fn(i, vars):
+        indices.append(i)
+        return vars
+
+    ivy.for_loop(range(2), _body_fn, (ivy.array(0.0),), native=native)
+    if native and ivy.current_backend_str() in ("jax", "tensorflow"):
+        # the loop runs natively, with the index carried as an array
+        assert all(ivy.is_array(i) for i in indices)
+    else:
+        assert indices == [0, 1]
+
+
+def test_for_loop_python_index():
+    # the body can index python sequences with the index of the loop
+    xs = [ivy.array(1.0), ivy.array(2.0), ivy.array(3.0)]
+    (ret,) = ivy.for_loop(range(3), lambda i, v: (v[0] + xs[i],), (ivy.array(0.0),))
+    assert np.allclose(ivy.to_numpy(ret), 6.0)
+
+
+def test_for_loop_nested_vars():
+    def _body_fn(i, vars):
+        x, nest = vars
+        return x + 1, {"a": nest["a"] * i, "b": [nest["b"][0] - x]}
+
+    vars = (ivy.array(0), {"a": ivy.array([1.0, 2.0]), "b": [ivy.array(10.0)]})
+    x, nest = ivy.for_loop(range(1, 4), _body_fn, vars)
+    assert ivy.to_numpy(x).item() == 3
+    assert np.allclose(ivy.to_numpy(nest["a"]), [6.0, 12.0])
+    assert np.allclose(ivy.to_numpy(nest["b"][0]), 10.0 - 0 - 1 - 2)
@@ -284,6 +284,7 @@ def _axis(draw):
     dtype=helpers.get_dtypes("numeric", full=False),
     chunk_size=helpers.ints(min_value=1, max_value=3),
     axis=_axis(),
+    num_workers=helpers.ints(min_value=1, max_value=3),
 )
 def test_split_func_call(
     *,
@@ -291,6 +292,7 @@ def test_split_func_call(
     dtype,
     chunk_size,
     axis,
+    num_workers,
     test_flags,
 ):
     # inputs
@@ -309,7 +311,12 @@ def test_split_func_call(
 
     # predictions
     a, b, c = ivy.split_func_call(
-        func, [x1, x2], "concat", chunk_size=chunk_size, input_axes=axis
+        func,
+        [x1, x2],
+        "concat",
+        chunk_size=chunk_size,
+        input_axes=axis,
+        num_workers=num_workers,
     )
 
     # true
@@ -374,6 +381,103 @@ def test_split_func_call_with_cont_input(
     helpers.assert_all_close(ivy.to_numpy(c.cont_key), ivy.to_numpy(c_true.cont_key))
 
 
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    mode=st.sampled_from(["concat", "mean", "sum"]),
+)
+def test_split_func_call_out_of_memory(*, mode):
+    x = ivy.arange(10.0)
+    chunk_sizes = []
+
+    # function running out of memory for chunks larger than 3
+    def func(t):
+        chunk_sizes.append(t.shape[0])
+        if t.shape[0] > 3:
+            raise MemoryError()
+        if mode == "concat":
+            return t * 2
+        return ivy.sum(t) if mode == "sum" else ivy.mean(t)
+
+    ret = ivy.split_func_call(func, [x], mode, chunk_size=8)
+    # the chunks are halved until they fit in memory
+    assert chunk_sizes == [8, 4, 2, 2, 4, 2, 2, 2]
+    if mode == "concat":
+        assert np.allclose(ivy.to_numpy(ret), np.arange(10.0) * 2)
+    elif mode == "sum":
+        assert np.allclose(ivy.to_numpy(ret), 45.0)
+    else:
+        # the mean over the chunks, weighted by their sizes
+        assert np.allclose(ivy.to_numpy(ret), 4.5)
+        # whatever the sizes of the chunks
+        ret = ivy.split_func_call(ivy.mean, [x], mode, chunk_size=3)
+        assert np.allclose(ivy.to_numpy(ret), 4.5)
+    # the chunk size was specified, so the smaller chunk size isn't cached
+    assert (
+        func,
+        str(x.shape),
+        None,
+    ) not in ivy.functional.ivy.device.memory_chunk_sizes
+
+
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    memory_fraction=st.sampled_from([None, 0.5]),
+)
+def test_split_func_call_cached_chunk_size(*, memory_fraction):
+    x = ivy.arange(10.0)
+    chunk_sizes = []
+
+    # function running out of memory for chunks larger than 3
+    def func(t):
+        chunk_sizes.append(t.shape[0])
+        if t.shape[0] > 3:
+            raise MemoryError()
+        return t * 2
+
+    split_factor = ivy.split_factor()
+    ivy.set_split_factor(1.0)
+    try:
+        ivy.split_func_call(func, [x], "concat", memory_fraction=memory_fraction)
+        key = (func, str(x.shape), memory_fraction)
+        assert ivy.functional.ivy.device.memory_chunk_sizes[key] == 2
+        # the chunk size is reused for the same function and memory fraction only
+        chunk_sizes.clear()
+        ivy.split_func_call(func, [x], "concat", memory_fraction=memory_fraction)
+        assert set(chunk_sizes) == {2}
+        chunk_sizes.clear()
+        ivy.split_func_call(func, [x], "concat", memory_fraction=0.25)
+        assert chunk_sizes[0] == 10
+        ret = ivy.split_func_call(ivy.mean, [x], "mean")
+        assert np.allclose(ivy.to_numpy(ret), 4.5)
+    finally:
+        ivy.set_split_factor(split_factor)
+
+
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+)
+def test_split_func_call_memory_fraction_exceeded():
+    x = ivy.arange(10.0)
+    split_factor = ivy.split_factor()
+    ivy.set_split_factor(0.3)
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            ret = ivy.split_func_call(lambda t: t * 2, [x], "concat", memory_fraction=0)
+    finally:
+        ivy.set_split_factor(split_factor)
+    assert np.allclose(ivy.to_numpy(ret), np.arange(10.0) * 2)
+    # the device always uses more memory than a fraction of 0, so the chunk size of
+    # the probe is kept rather than dropping to single elements
+    assert len(caught) == 1
+    cached = [
+        v
+        for k, v in ivy.functional.ivy.device.memory_chunk_sizes.items()
+        if k[1:] == (str(x.shape), 0)
+    ]
+    assert cached[-1] == 4
+
+
 # profiler
 @handle_test(
     fn_tree="functional.ivy.Profiler",
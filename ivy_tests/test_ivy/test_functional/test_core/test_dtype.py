@@ -733,6 +733,43 @@ def test_promote_types(
     )
 
 
+# promote_types_of_inputs
+@handle_test(
+    fn_tree="functional.ivy.promote_types_of_inputs",
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("valid"),
+        min_value=0,
+        max_value=100,
+    ),
+    scalar=st.one_of(
+        st.integers(min_value=0, max_value=100),
+        st.floats(min_value=0, max_value=100),
+        st.complex_numbers(max_magnitude=100),
+        st.booleans(),
+    ),
+)
+def test_promote_types_of_inputs(*, dtype_and_x, scalar):
+    dtype, x = dtype_and_x
+    x = ivy.native_array(x[0], dtype=dtype[0])
+    try:
+        x1, x2 = ivy.promote_types_of_inputs(x, scalar)
+    except ivy.utils.exceptions.IvyException:
+        return
+    for ret in (
+        ivy.promote_types_of_inputs(x, scalar, weak_scalars=True),
+        ivy.promote_types_of_inputs(scalar, x, weak_scalars=True)[::-1],
+    ):
+        if ivy.is_native_array(ret[1]):
+            assert ret[0].dtype == x1.dtype and ret[1].dtype == x2.dtype
+        else:
+            # the scalar is only left as it is when it would have the array dtype
+            assert ivy.native_weak_scalars and ret[1] is scalar
+            assert ret[0].dtype == x1.dtype == x2.dtype == x.dtype
+    assert ivy.promote_types(x1.dtype, x.dtype) == ivy.promote_types(
+        ivy.as_ivy_dtype(x1.dtype), ivy.as_ivy_dtype(x.dtype)
+    )
+
+
 # type_promote_arrays
 # TODO: fix container method
 @handle_test(
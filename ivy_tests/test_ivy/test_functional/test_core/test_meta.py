@@ -597,6 +597,64 @@ def test_reptile_step(
             assert list(inner_v_rets.cont_shape) == [1, 1]
 
 
+# fomaml step with the tasks vectorized
+@pytest.mark.parametrize("inner_grad_steps", [1, 3])
+@pytest.mark.parametrize("with_outer_cost_fn", [True, False])
+@pytest.mark.parametrize("average_across_steps", [True, False])
+@pytest.mark.parametrize("num_tasks", [1, 3])
+def test_fomaml_step_vectorized_tasks(
+    on_device, inner_grad_steps, with_outer_cost_fn, average_across_steps, num_tasks
+):
+    if ivy.current_backend_str() == "numpy":
+        # Numpy does not support gradients
+        pytest.skip()
+
+    # create variables
+    variables = ivy.Container(
+        {
+            "latent": _variable(ivy.array([0.5], device=on_device)),
+            "weight": _variable(ivy.array([1.0], device=on_device)),
+        }
+    )
+
+    # batch
+    batch = ivy.Container({"x": ivy.arange(1, num_tasks + 1, dtype="float32")})
+
+    # cost functions of a single task
+    def inner_cost_fn(batch_in, v):
+        return -(v["latent"] * batch_in["x"] * v["weight"] ** 2)[0]
+
+    def outer_cost_fn(batch_in, v):
+        return ((v["latent"] - batch_in["x"]) * v["weight"])[0] ** 2
+
+    # the per-task inner variables make the step loop over the tasks, and the inner
+    # variables shared by all the tasks let the step vectorize them
+    rets = [
+        ivy.fomaml_step(
+            batch,
+            inner_cost_fn,
+            outer_cost_fn if with_outer_cost_fn else None,
+            variables,
+            inner_grad_steps,
+            1e-2,
+            average_across_steps=average_across_steps,
+            batched=False,
+            inner_v=inner_v,
+            outer_v="weight",
+            return_inner_v="all",
+        )
+        for inner_v in ([["latent"]] * num_tasks, "latent")
+    ]
+    looped_cost, looped_grads, looped_inner_v = rets[0]
+    cost, grads, inner_v_rets = rets[1]
+    assert np.allclose(ivy.to_scalar(cost), ivy.to_scalar(looped_cost))
+    assert np.allclose(ivy.to_numpy(grads.weight), ivy.to_numpy(looped_grads.weight))
+    assert list(inner_v_rets.cont_shape) == [num_tasks, 1]
+    assert np.allclose(
+        ivy.to_numpy(inner_v_rets.latent), ivy.to_numpy(looped_inner_v.latent)
+    )
+
+
 # Second Order #
 # -------------#
 
@@ -1,6 +1,9 @@
 """Collection of tests for unified reduction functions."""
 
 # global
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from hypothesis import strategies as st
 
 # local
@@ -343,3 +346,82 @@ def test_shuffle(
     ret_gt = helpers.flatten_and_to_np(ret=ret_gt)
     for u, v in zip(ret, ret_gt):
         assert ivy.all(ivy.sort(u, axis=0) == ivy.sort(v, axis=0))
+
+
+# Generator
+@handle_test(
+    fn_tree="functional.ivy.Generator",
+    seed=helpers.ints(min_value=0, max_value=100),
+    buffer_size=st.sampled_from([0, 7, 64]),
+    shape=helpers.get_shape(min_num_dims=1, max_num_dims=3, max_dim_size=5),
+)
+def test_generator(*, seed, buffer_size, shape, on_device):
+    def draw(rng):
+        return [
+            rng.random_uniform(low=-2.0, high=3.0, shape=shape, device=on_device),
+            rng.random_normal(mean=1.0, std=2.0, shape=shape, device=on_device),
+            rng.randint(-5, 5, shape=shape, device=on_device),
+            rng.random_uniform(shape=shape, device=on_device, dtype="float64"),
+        ]
+
+    rng = ivy.random.Generator(seed, buffer_size=buffer_size)
+    ret = draw(rng)
+    assert [tuple(r.shape) for r in ret] == [tuple(shape)] * 4
+    assert ret[0].dtype == ivy.default_float_dtype()
+    assert ret[2].dtype == ivy.default_int_dtype()
+    assert ret[3].dtype == "float64"
+    assert ivy.all(ret[0] >= -2.0) and ivy.all(ret[0] < 3.0)
+    assert ivy.all(ret[2] >= -5) and ivy.all(ret[2] < 5)
+
+    # the same seed gives the same stream
+    ret_again = draw(ivy.random.Generator(seed, buffer_size=buffer_size))
+    for u, v in zip(ret, ret_again):
+        assert np.array_equal(ivy.to_numpy(u), ivy.to_numpy(v))
+
+    # forked streams are independent, but reproducible
+    forks = [draw(f) for f in rng.fork(2)]
+    forks_again = [
+        draw(f) for f in ivy.random.Generator(seed, buffer_size=buffer_size).fork(2)
+    ]
+    assert not np.array_equal(ivy.to_numpy(forks[0][3]), ivy.to_numpy(forks[1][3]))
+    for fork, fork_again in zip(forks, forks_again):
+        for u, v in zip(fork, fork_again):
+            assert np.array_equal(ivy.to_numpy(u), ivy.to_numpy(v))
+
+
+@handle_test(
+    fn_tree="functional.ivy.Generator",
+    seed=helpers.ints(min_value=0, max_value=100),
+    num_threads=helpers.ints(min_value=1, max_value=4),
+)
+def test_generator_threads(*, seed, num_threads):
+    def draw(rng):
+        return [ivy.to_numpy(rng.random_normal(shape=(3,))) for _ in range(20)]
+
+    # each thread draws from its own stream, so the numbers it draws don't depend
+    # on the scheduling of the threads
+    streams = ivy.random.Generator(seed, buffer_size=16).fork(num_threads)
+    with ThreadPoolExecutor(num_threads) as executor:
+        ret = list(executor.map(draw, streams))
+    expected = [draw(s) for s in ivy.random.Generator(seed, buffer_size=16).fork(4)]
+    for u, v in zip(ret, expected):
+        assert np.array_equal(np.stack(u), np.stack(v))
+
+
+@handle_test(
+    fn_tree="functional.ivy.Generator",
+    seed=helpers.ints(min_value=0, max_value=100),
+    axis=helpers.ints(min_value=0, max_value=1),
+)
+def test_generator_shuffle_and_dropout(*, seed, axis):
+    x = ivy.reshape(ivy.arange(12.0), (3, 4))
+    ret = ivy.shuffle(x, axis, rng=ivy.random.Generator(seed))
+    ret_again = ivy.shuffle(x, axis, rng=ivy.random.Generator(seed))
+    assert np.array_equal(ivy.to_numpy(ret), ivy.to_numpy(ret_again))
+    assert np.array_equal(np.sort(ivy.to_numpy(ret), axis=axis), ivy.to_numpy(x))
+
+    ret = ivy.dropout(x, 0.5, rng=ivy.random.Generator(seed))
+    ret_again = ivy.dropout(x, 0.5, rng=ivy.random.Generator(seed))
+    assert np.array_equal(ivy.to_numpy(ret), ivy.to_numpy(ret_again))
+    ret = ivy.to_numpy(ret)
+    assert np.all((ret == 0) | np.isclose(ret, ivy.to_numpy(x) * 2))
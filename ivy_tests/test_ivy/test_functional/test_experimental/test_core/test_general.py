@@ -67,3 +67,48 @@ def test_reduce(
         axes=axes,
         keepdims=keepdims,
     )
+
+
+@st.composite
+def _reduce_tree_helper(draw):
+    dtype = draw(st.sampled_from(["bool", "int32", "int64", "float32", "float64"]))
+    if dtype == "bool":
+        func = draw(st.sampled_from([ivy.logical_and, ivy.logical_or]))
+    else:
+        func = draw(st.sampled_from([ivy.add, ivy.maximum, ivy.minimum, ivy.multiply]))
+    dtype, values, shape = draw(
+        helpers.dtype_and_values(
+            num_arrays=2,
+            dtype=[dtype] * 2,
+            min_num_dims=1,
+            max_num_dims=3,
+            max_dim_size=5,
+            min_value=-2,
+            max_value=2,
+            ret_shape=True,
+        )
+    )
+    axes = draw(helpers.get_axis(shape=shape))
+    return values[0], values[1].flatten()[0], func, axes
+
+
+@handle_test(
+    fn_tree="functional.ivy.experimental.reduce",
+    args=_reduce_tree_helper(),
+    keepdims=st.booleans(),
+)
+def test_reduce_tree_reduction(*, args, keepdims):
+    operand, init_value, func, axes = args
+    operand = ivy.array(operand)
+    init_value = init_value.item()
+    # the native reduction of the standard computation, and the tree reduction of an
+    # equivalent callable, give the same result
+    ret = ivy.reduce(operand, init_value, func, axes=axes, keepdims=keepdims)
+    ret_tree = ivy.reduce(
+        operand, init_value, lambda x, y: func(x, y), axes=axes, keepdims=keepdims
+    )
+    assert ret.shape == ret_tree.shape
+    assert ret.dtype == ret_tree.dtype == operand.dtype
+    helpers.assert_all_close(
+        ivy.to_numpy(ret), ivy.to_numpy(ret_tree), rtol=1e-5, atol=1e-5
+    )
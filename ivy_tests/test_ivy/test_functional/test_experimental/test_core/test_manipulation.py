@@ -1124,6 +1124,54 @@ def test_associative_scan(
     )
 
 
+@st.composite
+def _associative_scan_blocked_helper(draw):
+    dtype = draw(st.sampled_from(["int32", "int64", "float32", "float64"]))
+    func = draw(st.sampled_from([ivy.add, ivy.maximum, ivy.minimum, ivy.multiply]))
+    dtype, values, shape = draw(
+        helpers.dtype_and_values(
+            dtype=[dtype],
+            min_num_dims=1,
+            max_num_dims=3,
+            min_dim_size=1,
+            max_dim_size=40,
+            min_value=-2,
+            max_value=2,
+            ret_shape=True,
+        )
+    )
+    axis = draw(helpers.get_axis(shape=shape, force_int=True))
+    return values[0], func, axis
+
+
+@handle_test(
+    fn_tree="functional.ivy.experimental.associative_scan",
+    args=_associative_scan_blocked_helper(),
+    reverse=st.booleans(),
+)
+def test_associative_scan_blocked(*, args, reverse):
+    x, func, axis = args
+    x = ivy.array(x)
+    # the native scan of the standard function, and the blocked scan of an
+    # equivalent callable, give the same result, also when scanning a nest
+    ret = ivy.associative_scan(x, func, reverse=reverse, axis=axis)
+    ret_blocked = ivy.associative_scan(
+        x, lambda a, b: func(a, b), reverse=reverse, axis=axis
+    )
+    ret_nest = ivy.associative_scan(
+        {"a": [x], "b": x},
+        lambda a, b: {"a": [func(a["a"][0], b["a"][0])], "b": func(a["b"], b["b"])},
+        reverse=reverse,
+        axis=axis,
+    )
+    assert ret.shape == ret_blocked.shape == x.shape
+    assert ret.dtype == ret_blocked.dtype == x.dtype
+    for ret_other in (ret_blocked, ret_nest["a"][0], ret_nest["b"]):
+        helpers.assert_all_close(
+            ivy.to_numpy(ret), ivy.to_numpy(ret_other), rtol=1e-5, atol=1e-5
+        )
+
+
 # unique_consecutive
 @handle_test(
     fn_tree="unique_consecutive",
@@ -173,6 +173,23 @@ def _sparse_bsc_indices_values_shape(draw):
     return ccol_indices, row_indices, value_dtype, values, shape
 
 
+@st.composite
+def _sparse_csr_matmul_data(draw):
+    crow_indices, col_indices, value_dtype, values, shape = draw(
+        _sparse_csr_indices_values_shape()
+    )
+    num_cols = draw(helpers.ints(min_value=1, max_value=3))
+    x = draw(
+        helpers.array_values(
+            dtype=value_dtype,
+            shape=(shape[1], num_cols),
+            min_value=-10,
+            max_value=10,
+        )
+    )
+    return crow_indices, col_indices, value_dtype, values, shape, x
+
+
 # coo - to_dense_array
 @handle_method(
     method_tree="SparseArray.to_dense_array",
@@ -355,3 +372,40 @@ def test_sparse_bsr(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+# csr - matmul
+@handle_method(
+    method_tree="SparseArray.matmul",
+    sparse_data=_sparse_csr_matmul_data(),
+    method_num_positional_args=st.just(0),  # TODO should not be hardcoded
+    init_num_positional_args=st.just(0),  # TODO should not be hardcoded
+)
+def test_sparse_csr_matmul(
+    sparse_data,
+    class_name,
+    method_name,
+    on_device,
+    ground_truth_backend,
+    init_flags,
+    method_flags,
+):
+    crow_indices, col_indices, value_dtype, values, shape, x = sparse_data
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_flags=init_flags,
+        on_device=on_device,
+        method_flags=method_flags,
+        init_input_dtypes=["int64", "int64", value_dtype],
+        init_all_as_kwargs_np={
+            "crow_indices": crow_indices,
+            "col_indices": col_indices,
+            "values": values,
+            "dense_shape": shape,
+            "format": "csr",
+        },
+        method_input_dtypes=[value_dtype],
+        method_all_as_kwargs_np={"x": x},
+        class_name=class_name,
+        method_name=method_name,
+    )
@@ -975,7 +975,7 @@ def test_reduce_window(
         window_strides=others[1],
         padding=padding,
         base_dilation=others[2],
-        window_dilation=None,
+        window_dilation=others[2],
     )
 
 
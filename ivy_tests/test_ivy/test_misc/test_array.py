@@ -70,6 +70,40 @@ def test_array_function():
     assert all(y1 == ivy.array([1, 1]))
 
 
+def test_array_slots():
+    native = ivy.native_array([1.0, 2.0])
+    x = ivy.Array(native)
+    y = Array._from_native(native)
+    for arr in (x, y):
+        # all the attributes set at construction live in slots
+        assert arr.__dict__ == {}
+        assert arr.data is native
+        assert arr._base is None
+        assert len(arr._view_refs) == 0
+    assert x.shape == y.shape == (2,)
+    assert x.dtype == y.dtype
+
+
+def test_array_deferred_elementwise():
+    x_np = np.random.uniform(1.0, 2.0, (64, 300)).astype("float32")
+    y_np = np.random.uniform(1.0, 2.0, (300,)).astype("float32")
+    x, y = ivy.array(x_np), ivy.array(y_np)
+    with ivy.DeferredElementwiseMode(True):
+        t = x * y
+        ret = -(t + t) / 2.0 + y**2 - 1
+        if ivy.current_backend_str() == "numpy":
+            # nothing is computed until the data is needed
+            assert ret._node is not None
+        assert ret.shape == (64, 300)
+        assert ret.dtype == "float32"
+        ret_np = ivy.to_numpy(ret)
+    assert ivy.deferred_elementwise_mode is False
+    t_np = x_np * y_np
+    expected = -(t_np + t_np) / np.float32(2.0) + y_np**2 - np.float32(1)
+    assert ret_np.dtype == expected.dtype
+    assert np.allclose(ret_np, expected, rtol=1e-5)
+
+
 # TODO: avoid using dummy fn_tree in property tests
 
 
@@ -2,6 +2,9 @@
 from packaging import version
 import pytest
 import importlib
+import os
+import subprocess
+import sys
 import types
 
 
@@ -83,7 +86,9 @@ if "paddle" in available_frameworks():
 def test_set_backend(backend, array_type):
     # recording data before backend change
     stack_before = []
-    func_address_before = id(ivy.sum)
+    # the function is kept alive, so that its address can't be reused by the new one
+    func_before = ivy.sum
+    func_address_before = id(func_before)
     stack_before.extend(ivy.backend_stack)
 
     ivy.set_backend(backend)
@@ -291,3 +296,18 @@ def test_dynamic_backend_context_manager():
     assert b.dynamic_backend is True
     assert c.dynamic_backend is False
     assert d.dynamic_backend is False
+
+
+def test_lazy_import():
+    code = (
+        "import sys, ivy\n"
+        "assert ivy.lazy_import\n"
+        "assert 'ivy.stateful' not in sys.modules\n"
+        "assert ivy.array([1.0, 2.0]).cumsum().shape == (2,)\n"
+        "assert issubclass(ivy.Linear, ivy.Module)\n"
+        "assert ivy.activations.__name__ == 'ivy.functional.ivy.activations'\n"
+        "ivy.set_backend('numpy')\n"
+        "assert hasattr(ivy.abs, 'array_spec')\n"
+    )
+    env = {**os.environ, "IVY_LAZY_IMPORT": "true"}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
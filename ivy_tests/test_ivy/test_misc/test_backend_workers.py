@@ -0,0 +1,102 @@
+# global
+import numpy as np
+import pytest
+
+# local
+from ivy_tests.test_ivy.helpers import backend_workers
+
+
+def test_backend_workers():
+    try:
+        x = np.arange(6, dtype="float32").reshape(2, 3)
+        ret, device = backend_workers.submit_function(
+            "numpy",
+            fn_name="matmul",
+            args_np=[x, x.T],
+            kwargs_np={},
+            input_dtypes=["float32", "float32"],
+            on_device="cpu",
+        ).result()
+        assert device == "cpu"
+        assert np.allclose(ret[0], x @ x.T)
+
+        # a return larger than the shared buffer, after an abandoned example
+        backend_workers.submit_function(
+            "numpy",
+            fn_name="exp",
+            args_np=[x],
+            kwargs_np={},
+            input_dtypes=["float32"],
+            on_device="cpu",
+        )
+        ret, _ = backend_workers.submit_function(
+            "numpy",
+            fn_name="ones",
+            args_np=[],
+            kwargs_np={"shape": (1024, 1024), "dtype": "float64"},
+            input_dtypes=[],
+            on_device="cpu",
+        ).result()
+        assert ret[0].shape == (1024, 1024) and np.all(ret[0] == 1)
+
+        # errors of the ground truth are raised by the test
+        with pytest.raises(Exception):
+            backend_workers.submit_function(
+                "numpy",
+                fn_name="reshape",
+                args_np=[x],
+                kwargs_np={"shape": (4,)},
+                input_dtypes=["float32"],
+                on_device="cpu",
+            ).result()
+    finally:
+        backend_workers.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("flags", "in_worker"),
+    [
+        ({}, True),
+        ({"container": [True]}, False),
+        ({"with_out": True}, False),
+    ],
+)
+def test_backend_workers_test_flags(flags, in_worker, monkeypatch):
+    import ivy
+    from ivy_tests.test_ivy.helpers.function_testing import test_function
+    from ivy_tests.test_ivy.helpers.test_parameter_flags import FunctionTestFlags
+
+    submitted = []
+    submit_function = backend_workers.submit_function
+
+    def _submit_function(*args, **kwargs):
+        submitted.append(args)
+        return submit_function(*args, **kwargs)
+
+    monkeypatch.setattr(backend_workers, "_enabled", True)
+    monkeypatch.setattr(backend_workers, "submit_function", _submit_function)
+    test_flags = dict(
+        num_positional_args=1,
+        with_out=False,
+        instance_method=False,
+        as_variable=[False],
+        native_arrays=[False],
+        container=[False],
+        test_gradients=False,
+        test_compile=False,
+    )
+    test_flags.update(flags)
+    try:
+        # the ground truth is only computed in the worker when it honours the flags
+        test_function(
+            input_dtypes=["float32"],
+            test_flags=FunctionTestFlags(**test_flags),
+            fw=ivy.current_backend_str(),
+            fn_name="exp",
+            ground_truth_backend="numpy",
+            on_device="cpu",
+            x=np.array([0.0, 1.0], dtype="float32"),
+        )
+    finally:
+        backend_workers.shutdown()
+    assert bool(submitted) is in_worker
@@ -0,0 +1,73 @@
+# global
+import pytest
+
+# local
+import ivy
+from ivy.utils.benchmark import (
+    Measurement,
+    best_time,
+    compare,
+    format_rows,
+    load_baseline,
+    measure,
+    run_script,
+    save_baseline,
+)
+
+
+def test_measurement_statistics():
+    m = Measurement.from_samples([5.0, 1.0, 4.0, 2.0, 3.0], number=10)
+    assert m.median == 3.0 and m.min == 1.0 and m.max == 5.0
+    assert m.p25 == 2.0 and m.p75 == 4.0 and m.iqr == 2.0
+    assert m.ci_low <= m.median <= m.ci_high
+    assert m.repeats == 5 and m.number == 10
+
+
+def test_measure():
+    x = ivy.array([1.0, 2.0, 3.0])
+    m = measure(lambda: ivy.add(x, x), warmup=1, min_run_time=0.01, min_repeats=5)
+    assert m.repeats >= 5 and m.number >= 1
+    assert 0 < m.min <= m.median <= m.max
+
+
+@pytest.mark.parametrize(
+    ("shift", "status"),
+    [(0.0, "unchanged"), (50.0, "regression"), (-50.0, "improvement")],
+)
+def test_compare(shift, status, tmp_path):
+    samples = [100.0 + i for i in range(20)]
+    baseline = {"add": {"time": Measurement.from_samples(samples)}}
+    path = str(tmp_path / "baseline.json")
+    save_baseline(baseline, path)
+    baseline = load_baseline(path)
+    results = {"add": {"time": Measurement.from_samples([s + shift for s in samples])}}
+    (comparison,) = compare(results, baseline, threshold=0.1)
+    assert comparison.status == status
+
+
+def test_best_time():
+    calls = []
+    assert best_time(lambda: calls.append(0), number=4, repeat=2) >= 0
+    assert len(calls) == 8
+
+
+def test_format_rows():
+    table = format_rows({("a", 1): (1.0, None), ("bcd", 10): (2.5, 3.25)}, unit="us")
+    assert table.splitlines() == [
+        "a    1         1.00 us         - us",
+        "bcd  10        2.50 us      3.25 us",
+    ]
+
+
+def test_run_script(capsys):
+    def suite(sizes=(1, 2), scale=1.0, label="x", dtype=None):
+        assert dtype is None and ivy.current_backend_str() == "numpy"
+        return {(label, n): n * scale for n in sizes}
+
+    results = run_script(
+        suite, backend="numpy", argv=["--sizes", "3", "4", "--scale", "0.5"]
+    )
+    assert results == {("x", 3): 1.5, ("x", 4): 2.0}
+    header, row = capsys.readouterr().out.splitlines()[:2]
+    assert header.endswith("backend numpy")
+    assert row.split() == ["x", "3", "1.50", "ms"]
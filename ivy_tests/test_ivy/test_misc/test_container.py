@@ -2123,6 +2123,100 @@ def test_container_multi_map(on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f), 3)
 
 
+def test_container_multi_map_in_function(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1.0], device=on_device),
+            "b": {
+                "c": ivy.array([2.0], device=on_device),
+                "d": ivy.array([3.0], device=on_device),
+            },
+        }
+    )
+    container1 = Container(
+        {
+            "a": ivy.array([3.0], device=on_device),
+            "b": {
+                "c": ivy.array([4.0], device=on_device),
+                "d": ivy.array([5.0], device=on_device),
+            },
+        }
+    )
+
+    # identically structured containers, as args and kwargs
+    def _fn(x, y, *, z):
+        return (x + y) * z
+
+    container_mapped = ivy.Container.cont_multi_map_in_function(
+        _fn, container0, container1, z=container0
+    )
+    assert np.allclose(ivy.to_numpy(container_mapped.a), np.array([4.0]))
+    assert np.allclose(ivy.to_numpy(container_mapped.b.c), np.array([12.0]))
+    assert np.allclose(ivy.to_numpy(container_mapped.b.d), np.array([24.0]))
+
+    # containers with leaves at different places
+    container2 = Container(a=ivy.array([1.0], device=on_device), b=10.0)
+    container_mapped = ivy.Container.cont_multi_map_in_function(
+        "add", container0, container2
+    )
+    assert np.allclose(ivy.to_numpy(container_mapped.a), np.array([2.0]))
+    assert np.allclose(ivy.to_numpy(container_mapped.b.c), np.array([12.0]))
+    assert np.allclose(ivy.to_numpy(container_mapped.b.d), np.array([13.0]))
+
+    # containers nested in the args
+    container_mapped = ivy.Container.cont_multi_map_in_function(
+        "concat", [container0, container1]
+    )
+    assert np.allclose(ivy.to_numpy(container_mapped.a), np.array([1.0, 3.0]))
+    assert np.allclose(ivy.to_numpy(container_mapped.b.c), np.array([2.0, 4.0]))
+    assert np.allclose(ivy.to_numpy(container_mapped.b.d), np.array([3.0, 5.0]))
+
+
+def test_container_pack(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {
+                "c": ivy.array([[3.0]], device=on_device),
+                "d": ivy.array([1, 2], dtype="int32", device=on_device),
+                "e": "string",
+            },
+        }
+    )
+    packed = container.cont_pack()
+    assert packed.num_leaves == 3
+    assert len(packed.buffers) == 2
+
+    # lossless round trip
+    unpacked = packed.unpack()
+    assert unpacked.cont_all_key_chains() == container.cont_all_key_chains()
+    assert unpacked.b.e == "string"
+    for key_chain, value in container.cont_to_iterator():
+        if ivy.is_array(value):
+            assert unpacked[key_chain].shape == value.shape
+            assert unpacked[key_chain].dtype == value.dtype
+            assert np.allclose(ivy.to_numpy(unpacked[key_chain]), ivy.to_numpy(value))
+
+    # elementwise operations, including between packed containers
+    ret = (packed * 2 - packed).unpack()
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([1.0, 2.0]))
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([[3.0]]))
+    assert np.allclose(ivy.to_numpy(ret.b.d), np.array([1, 2]))
+
+    # casts and reductions over all leaves
+    cast = packed.astype("float32")
+    assert list(cast.buffers) == [("float32", ivy.dev(container.a))]
+    assert ivy.to_numpy(cast.unpack().b.d).dtype == np.float32
+    assert np.allclose(ivy.to_numpy(packed.sum()), 9.0)
+    assert np.allclose(ivy.to_numpy(packed.vector_norm()), np.sqrt(19.0))
+
+    # reductions without any array leaves
+    packed = Container({"a": "string", "b": {}}).cont_pack()
+    assert packed.num_leaves == 0
+    assert np.allclose(ivy.to_numpy(packed.sum()), 0.0)
+    assert np.allclose(ivy.to_numpy(packed.vector_norm()), 0.0)
+
+
 def test_container_common_key_chains(on_device):
     arr1 = ivy.array([1], device=on_device)
     arr2 = ivy.array([2], device=on_device)
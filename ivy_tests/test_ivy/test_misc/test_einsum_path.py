@@ -0,0 +1,62 @@
+# global
+import numpy as np
+import pytest
+
+# local
+from ivy.utils.einsum_path import contract, einsum_plan, matrix_chain_order, multi_dot
+
+_NUMPY_FUNCTIONS = dict(
+    transpose=np.transpose,
+    reshape=np.reshape,
+    matmul=np.matmul,
+    multiply=np.multiply,
+    einsum=np.einsum,
+)
+
+
+@pytest.mark.parametrize(
+    ("equation", "shapes"),
+    [
+        ("ij,jk,kl->il", [(30, 2), (2, 30), (30, 2)]),
+        ("ij,jk", [(3, 4), (4, 5)]),
+        ("ij,jk->ki", [(3, 4), (4, 5)]),
+        ("i,j->ij", [(3,), (4,)]),
+        ("i,i->", [(5,), (5,)]),
+        ("ii,ij->j", [(3, 3), (3, 2)]),
+        ("bhqd,bhkd->bhqk", [(2, 3, 4, 5), (2, 3, 6, 5)]),
+        ("...ij,jk->...ik", [(6, 2, 3, 4), (4, 5)]),
+        ("abc,cd,dbe->ae", [(2, 3, 4), (4, 5), (5, 3, 6)]),
+        (
+            "i,jk,kl,lm,mn,no,op->ijp",
+            [(2,), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9)],
+        ),
+    ],
+)
+def test_contract(equation, shapes):
+    operands = [np.random.uniform(size=shape) for shape in shapes]
+    assert einsum_plan(equation, tuple(shapes)) is not None
+    ret = contract(equation, *operands, **_NUMPY_FUNCTIONS)
+    assert np.allclose(ret, np.einsum(equation, *operands))
+
+
+def test_einsum_plan():
+    plan = einsum_plan("ij,jk,kl->il", ((100, 2), (2, 100), (100, 2)))
+    assert plan.path == [(1, 2), (0, 1)]
+    assert plan.flops == 2 * 100 * 2 + 100 * 2 * 2
+    assert plan.flops < plan.naive_flops
+    assert einsum_plan("ij,jk,kl->il", ((100, 2), (2, 100), (100, 2))) is plan
+    # single operands and broadcasting are left to the native einsum
+    assert einsum_plan("ii->i", ((3, 3),)) is None
+    assert einsum_plan("...ij,...jk->...ik", ((1, 3, 4), (2, 4, 5))) is None
+    operands = [np.ones((1, 3, 4)), np.ones((2, 4, 5))]
+    ret = contract("...ij,...jk->...ik", *operands, **_NUMPY_FUNCTIONS)
+    assert ret.shape == (2, 3, 5)
+
+
+def test_multi_dot():
+    assert matrix_chain_order(((10, 100), (100, 5), (5, 50))) == [0, 0]
+    assert matrix_chain_order(((50, 5), (5, 100), (100, 10))) == [1, 0]
+    shapes = [(3, 7), (7, 2), (2, 9), (9, 4), (4, 5)]
+    arrays = [np.random.uniform(size=shape) for shape in shapes]
+    ret = multi_dot(arrays, matmul=np.matmul)
+    assert np.allclose(ret, np.linalg.multi_dot(arrays))
@@ -0,0 +1,68 @@
+# global
+import pytest
+
+# local
+import ivy
+from ivy.stateful.initializers import VariableSpec
+
+
+@pytest.mark.parametrize(
+    ("fn", "shapes"),
+    [
+        (lambda x, y: x + y * 2, [(4, 1, 3), (5, 3)]),
+        (lambda x: ivy.softmax(ivy.relu(x), axis=-1) > 0.5, [(2, 3)]),
+        (lambda x: ivy.astype(x, "int32").sum(axis=(0, 2), keepdims=True), [(2, 3, 4)]),
+        (lambda x: ivy.argmax(x, axis=1), [(2, 3, 4)]),
+        (lambda x, y: ivy.matmul(x, y, transpose_b=True), [(5, 2, 3), (4, 3)]),
+        (lambda x, y: ivy.matmul(x, y), [(3,), (2, 3, 4)]),
+        (lambda x, w, b: ivy.linear(x, w, bias=b), [(8, 3), (4, 3), (4,)]),
+        (lambda x: ivy.reshape(x, (2, -1)), [(4, 6)]),
+        (lambda x: ivy.expand_dims(x, axis=(0, -1)).squeeze(0), [(4, 6)]),
+        (lambda x: ivy.swapaxes(ivy.permute_dims(x, (2, 0, 1)), 0, -1), [(2, 3, 4)]),
+        (lambda x, y: ivy.stack([ivy.concat([x, y], axis=1)] * 3), [(2, 3), (2, 1)]),
+        (lambda x: ivy.broadcast_to(x, (5, 2, 3)), [(2, 1)]),
+        (lambda x: (x[0, :2], ivy.flip(x, axis=0)), [(3, 4)]),
+        (lambda x: ivy.zeros((3, 4), dtype="float16") + ivy.full((4,), 1), [(1,)]),
+    ],
+)
+def test_eval_shape(fn, shapes):
+    args = [ivy.random_uniform(shape=shape) for shape in shapes]
+    ret = ivy.eval_shape(fn, *args)
+    expected = fn(*args)
+    if not isinstance(expected, tuple):
+        ret, expected = (ret,), (expected,)
+    for x, y in zip(ret, expected):
+        assert isinstance(x, ivy.MetaArray)
+        assert x.shape == y.shape
+        assert x.dtype == y.dtype
+        assert x.device == y.device
+    # the functions are restored afterwards
+    assert not isinstance(fn(*args), ivy.MetaArray)
+
+
+def test_eval_shape_errors():
+    x = ivy.MetaArray((2, 3))
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.eval_shape(lambda x, y: x + y, x, ivy.MetaArray((4,)))
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.eval_shape(lambda x: ivy.reshape(x, (4, -1)), x)
+    assert ivy.add(ivy.ones((2,)), 1).shape == (2,)
+
+
+def test_module_eval_shape():
+    class _MLP(ivy.Module):
+        def __init__(self):
+            self._layers = [ivy.Linear(3, 8), ivy.Linear(8, 2)]
+            ivy.Module.__init__(self)
+
+        def _forward(self, x):
+            for layer in self._layers:
+                x = ivy.relu(layer(x))
+            return x
+
+    with ivy.DeferredInitMode(True):
+        module = _MLP()
+    ret = module.eval_shape(ivy.MetaArray((5, 3)))
+    assert ret.shape == (5, 2)
+    assert isinstance(module.v.layers.v0.w, VariableSpec)
+    assert module(ivy.ones((5, 3))).shape == ret.shape
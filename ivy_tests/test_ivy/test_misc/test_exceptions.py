@@ -82,3 +82,34 @@ def test_get_trace_mode(trace_mode):
     ivy.set_exception_trace_mode(trace_mode)
     ivy.set_exception_trace_mode("ivy")
     ivy.utils.assertions.check_equal(ivy.exception_trace_mode, "ivy", as_array=False)
+
+
+class ConcretizationTypeError(TypeError):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (ConcretizationTypeError("abstract tracer value"), True),
+        (RuntimeError("vmap: It looks like you're calling .item() on a Tensor"), True),
+        (ValueError("bad value"), False),
+    ],
+)
+def test_is_tracer_error(error, expected):
+    @ivy.utils.exceptions.handle_exceptions
+    def fn():
+        raise error
+
+    # the errors are also found when raised through ivy functions
+    ivy.set_exception_trace_mode("full")
+    ivy.set_show_func_wrapper_trace_mode(True)
+    try:
+        with pytest.raises(Exception) as e:
+            fn()
+    finally:
+        ivy.unset_exception_trace_mode()
+        ivy.unset_show_func_wrapper_trace_mode()
+    assert isinstance(e.value, ivy.utils.exceptions.IvyException)
+    assert ivy.utils.exceptions.is_tracer_error(e.value) is expected
+    assert ivy.utils.exceptions.is_tracer_error(error) is expected
@@ -145,3 +145,25 @@ def test_views(array_to_update):
     assert np.allclose(c, c_copy + 1)
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
+
+
+def test_views_refreshed_lazily():
+    if ivy.current_backend_str() not in ("jax", "tensorflow"):
+        pytest.skip("views are only copies on the functional backends")
+    expected = np.arange(12.0).reshape(3, 4)
+    a = ivy.array(expected.reshape(-1))
+    b = ivy.reshape(a, (3, 4))
+    c = ivy.permute_dims(b, axes=(1, 0))[1:, ::-1]
+    ivy.inplace_update(a, a + 1)
+    expected += 1
+    # the views are only gathered from the base once they're read
+    assert b._stale and c._stale
+    assert np.allclose(b, expected)
+    assert np.allclose(c, expected.T[1:, ::-1])
+    assert not b._stale and not c._stale
+    ivy.inplace_update(c, c + 1)
+    expected.T[1:, ::-1] += 1
+    assert b._stale and not c._stale
+    assert np.allclose(a, expected.reshape(-1))
+    assert np.allclose(b, expected)
+    assert np.allclose(c, expected.T[1:, ::-1])
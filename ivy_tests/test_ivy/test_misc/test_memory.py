@@ -0,0 +1,42 @@
+# global
+import gc
+
+# local
+import ivy
+from ivy.utils.memory import MemoryTracker, active_tracker
+
+
+def test_registry():
+    gc.collect()
+    num_arrays = ivy.num_arrays_in_memory()
+    x = ivy.array([1.0, 2.0])
+    assert ivy.num_arrays_in_memory() == num_arrays + 1
+    assert any(a is x for a in ivy.get_all_arrays_in_memory())
+    del x
+    gc.collect()
+    assert ivy.num_arrays_in_memory() == num_arrays
+
+
+def test_memory_tracker():
+    with MemoryTracker() as tracker:
+        assert active_tracker() is tracker
+        gc.collect()
+        total = tracker.total.nbytes
+        x = ivy.zeros((16, 16), dtype="float32")
+        y = x + 1
+        assert tracker.sites["zeros"].count == 1
+        assert tracker.sites["add"].nbytes == 16 * 16 * 4
+        assert tracker.dtypes["float32"].nbytes >= 2 * 16 * 16 * 4
+        assert tracker.total.nbytes == total + 2 * 16 * 16 * 4
+        device = ivy.dev(x)
+        assert ivy.num_ivy_arrays_on_dev(device) == tracker.devices[device].count
+        del y
+        gc.collect()
+        assert tracker.sites["add"].count == 0
+        assert tracker.sites["add"].peak_nbytes == 16 * 16 * 4
+        assert tracker.total.nbytes == total + 16 * 16 * 4
+        tracker.reset_peaks()
+        assert tracker.sites["add"].peak_nbytes == 0
+    assert active_tracker() is None
+    del x
+    assert tracker.sites["zeros"].count == 1
@@ -0,0 +1,69 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+def _ragged_arrays(inner_shape):
+    rng = np.random.default_rng(0)
+    return [
+        rng.normal(size=(length,) + inner_shape).astype("float32")
+        for length in (3, 0, 5, 1)
+    ]
+
+
+@pytest.mark.parametrize("inner_shape", [(), (2,), (2, 3)])
+def test_nested_array_packed_elementwise(inner_shape):
+    arrays = _ragged_arrays(inner_shape)
+    x = ivy.NestedArray.from_row_lengths(
+        ivy.array(np.concatenate(arrays)), [len(a) for a in arrays]
+    )
+    x_list = ivy.NestedArray.nested_array([ivy.array(a) for a in arrays])
+    assert x.is_packed and not x_list.is_packed
+    assert x.shape == x_list.shape == [4, None] + list(inner_shape)
+    # packed operands share their offsets, so the ops run once on the values
+    y = 2.0 * x + x
+    assert y.is_packed
+    # mixing in a list mode nested array falls back to one op per array
+    z = x - x_list
+    for i, a in enumerate(arrays):
+        assert np.allclose(y[i], 3 * a)
+        assert np.allclose(z[i], np.zeros_like(a))
+
+
+@pytest.mark.parametrize("inner_shape", [(), (2,), (2, 3)])
+@pytest.mark.parametrize("reduction", ["sum", "mean", "max", "min"])
+def test_nested_array_segment_reductions(inner_shape, reduction):
+    arrays = [a for a in _ragged_arrays(inner_shape) if len(a)]
+    x = ivy.NestedArray.from_row_lengths(
+        ivy.array(np.concatenate(arrays)), [len(a) for a in arrays]
+    )
+    np_fn = getattr(np, reduction)
+    ret = getattr(x, reduction)(axis=1)
+    assert np.allclose(ret, np.stack([np_fn(a, axis=0) for a in arrays]), atol=1e-5)
+    ret = getattr(x, reduction)()
+    assert np.allclose(ret, np_fn(np.concatenate(arrays)), atol=1e-5)
+    # the result doesn't depend on whether the arrays are packed
+    x_list = ivy.NestedArray.nested_array([ivy.array(a) for a in arrays])
+    assert np.allclose(getattr(x_list, reduction)(), ret, atol=1e-5)
+    if inner_shape:
+        ret = getattr(x, reduction)(axis=-1)
+        for i, a in enumerate(arrays):
+            assert np.allclose(ret[i], np_fn(a, axis=-1), atol=1e-5)
+
+
+def test_nested_array_padding():
+    arrays = _ragged_arrays((2,))
+    lengths = [len(a) for a in arrays]
+    x = ivy.NestedArray.nested_array([ivy.array(a) for a in arrays]).pack()
+    padded, mask = x.to_padded(padding_value=-1.0, return_mask=True)
+    expected = np.full((4, 5, 2), -1.0, dtype="float32")
+    for i, a in enumerate(arrays):
+        expected[i, : len(a)] = a
+    assert np.allclose(padded, expected)
+    assert np.array_equal(mask, np.arange(5)[None] < np.array(lengths)[:, None])
+    y = ivy.NestedArray.from_padded(padded, lengths)
+    assert np.allclose(y.values, np.concatenate(arrays))
+    assert np.array_equal(y.row_lengths, lengths)
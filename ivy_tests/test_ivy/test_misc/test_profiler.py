@@ -0,0 +1,71 @@
+# global
+import json
+
+# local
+import ivy
+from ivy.utils.profiler import Tracer, active_tracer
+
+
+def test_tracer_stats():
+    x = ivy.array([[1.0, 2.0, 3.0]])
+    with Tracer() as tracer:
+        assert active_tracer() is tracer
+        for _ in range(3):
+            ivy.exp(x)
+        ivy.add(x, x)
+    assert active_tracer() is None
+    exp = tracer.stats["exp"]
+    assert exp.calls == 3
+    assert exp.kernel_ns is not None and 0 < exp.kernel_ns <= exp.total_ns
+    assert 0 < exp.self_ns <= exp.total_ns
+    assert exp.overhead_ns == exp.total_ns - exp.kernel_ns
+    assert exp.output_bytes == 3 * 3 * ivy.dtype_bits(x.dtype) // 8
+    assert exp.signatures == {f"{ivy.as_ivy_dtype(x.dtype)}[1,3]": 3}
+    assert tracer.stats["add"].calls == 1
+    assert "exp" in tracer.table()
+
+
+def test_tracer_functions_and_stop():
+    x = ivy.array([1.0, 2.0])
+    with Tracer(functions=["exp"]) as tracer:
+        ivy.exp(x)
+        ivy.add(x, x)
+    assert set(tracer.stats) == {"exp"}
+    # functions are no longer recorded once the tracer has exited
+    ivy.exp(x)
+    assert tracer.stats["exp"].calls == 1
+
+
+def test_tracer_chrome_trace(tmp_path):
+    x = ivy.array([1.0, 2.0])
+    with Tracer() as tracer:
+        ivy.exp(x)
+    path = str(tmp_path / "trace.json")
+    tracer.export_chrome_trace(path)
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    names = [e["name"] for e in events]
+    assert "exp" in names and "exp (backend)" in names
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    tracer.reset()
+    assert not tracer.stats and not tracer.chrome_trace()["traceEvents"]
+
+
+def test_tracer_implicit_backend():
+    from ivy.utils.backend import handler
+
+    # the backends set by the test setup are unset, to trace the implicit backend
+    backends = []
+    while handler.backend_stack:
+        backends.append(ivy.current_backend_str())
+        ivy.previous_backend()
+    try:
+        x = ivy.array([1.0, 2.0])
+        with Tracer() as tracer:
+            ivy.exp(x)
+        assert tracer.stats["exp"].calls == 1
+        # the implicit backend is unset again on exit
+        assert not handler.backend_stack
+    finally:
+        for backend in reversed(backends):
+            ivy.set_backend(backend)
@@ -0,0 +1,110 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+def _leaves(x):
+    if isinstance(x, (list, tuple)):
+        return [v for item in x for v in _leaves(item)]
+    if isinstance(x, dict):
+        return [v for item in x.values() for v in _leaves(item)]
+    return [x]
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        lambda x: ivy.tanh(x * 2 + 1).sum(axis=-1),
+        lambda x: ivy.softmax(ivy.gelu(x), axis=-1) - ivy.mean(x, keepdims=True),
+        lambda x: (x[0, :2], ivy.flip(x, axis=0)),
+        lambda x: {"a": ivy.matmul(x, ivy.ones((3, 4))) + ivy.arange(4), "n": len(x)},
+        lambda x: [ivy.relu(x), ivy.concat([x, x], axis=1)],
+        # full reductions, returning scalars with some backends
+        lambda x: ivy.mean(x),
+        lambda x: (ivy.var(x), ivy.max(x)),
+        lambda x: ivy.matmul(x, ivy.ones((3, 4))) + ivy.mean(x),
+    ],
+)
+def test_trace_graph(fn):
+    graph = ivy.trace_graph(fn)
+    x = ivy.random_uniform(shape=(3, 3))
+    graph(x)
+    # replayed on new values with the same signature
+    x = ivy.random_uniform(shape=(3, 3))
+    expected, ret = _leaves(fn(x)), _leaves(graph(x))
+    assert graph.num_traces == 1
+    assert graph.traces[0] is not None
+    assert [type(a) for a in ret] == [type(b) for b in expected]
+    for a, b in zip(ret, expected):
+        assert np.allclose(ivy.to_numpy(a), ivy.to_numpy(b))
+
+
+def test_trace_graph_retrace():
+    graph = ivy.trace_graph(lambda x, n: x * n, max_cache_size=2)
+    graph(ivy.ones((2,)), 2)
+    graph(ivy.ones((2,)), 2)
+    assert graph.num_traces == 1
+    # new shapes, dtypes and constants trace again, evicting the oldest trace
+    assert graph(ivy.ones((3,)), 2).shape == (3,)
+    assert ivy.to_numpy(graph(ivy.ones((2,)), 3)).tolist() == [3.0, 3.0]
+    assert graph.num_traces == 3
+    assert len(graph.traces) == 2
+    graph(ivy.ones((2,)), 2)
+    assert graph.num_traces == 4
+
+
+def test_trace_graph_constants():
+    c = ivy.array([1.0, 2.0])
+    graph = ivy.trace_graph(lambda x: x + ivy.exp(c) * 2)
+    graph(ivy.ones((2,)))
+    # only the addition depends on the input
+    assert graph.traces[0].count(" = ") == 1
+    expected = ivy.to_numpy(ivy.exp(c) * 2 + 3)
+    assert np.allclose(ivy.to_numpy(graph(ivy.full((2,), 3.0))), expected)
+
+
+def test_trace_graph_eager():
+    graph = ivy.trace_graph(lambda x: x * 2 if bool(ivy.sum(x) > 0) else x)
+    x = ivy.ones((2,))
+    assert ivy.to_numpy(graph(x)).tolist() == [2.0, 2.0]
+    # the control flow depends on the values, so the trace isn't replayed
+    assert graph.traces == [None]
+    assert ivy.to_numpy(graph(-x)).tolist() == [-1.0, -1.0]
+    graph = ivy.trace_graph(lambda x: x * 2 if ivy.array_equal(x, x * 0 + 1) else x)
+    assert ivy.to_numpy(graph(x)).tolist() == [2.0, 2.0]
+    assert graph.traces == [None]
+    assert ivy.to_numpy(graph(x * 3)).tolist() == [3.0, 3.0]
+    graph = ivy.trace_graph(lambda x: ivy.dropout(x, 0.5))
+    graph(ivy.ones((64,)))
+    assert not np.array_equal(
+        ivy.to_numpy(graph(ivy.ones((64,)))), ivy.to_numpy(graph(ivy.ones((64,))))
+    )
+
+
+def test_module_trace_graph():
+    class _MLP(ivy.Module):
+        def __init__(self):
+            self._layers = [ivy.Linear(3, 8), ivy.Linear(8, 2)]
+            ivy.Module.__init__(self)
+
+        def _forward(self, x):
+            for layer in self._layers:
+                x = ivy.relu(layer(x))
+            return x
+
+    module = _MLP()
+    x = ivy.random_uniform(shape=(5, 3))
+    module.trace_graph()
+    module(x)
+    expected = ivy.to_numpy(module._call(x))
+    assert np.allclose(ivy.to_numpy(module(x)), expected)
+    # the variables are inputs of the trace
+    v = module.v.cont_map(lambda w, _: w * 2)
+    assert np.allclose(ivy.to_numpy(module(x, v=v)), ivy.to_numpy(module._call(x, v=v)))
+    assert module._replay_graph.num_traces == 1
+    # the trace isn't a compiled graph, which could be shown
+    with pytest.raises(ValueError):
+        module.show_graph()
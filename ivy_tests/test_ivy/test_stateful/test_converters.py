@@ -358,3 +358,32 @@ def test_from_jax_module(bs_ic_oc, from_class_and_args, module_type):
     assert loss.shape == ()
     # value test
     assert (abs(grads).max() > 0).cont_all_true()
+
+
+@pytest.mark.parametrize("inplace_update", [True, False])
+def test_from_torch_module_update_v(inplace_update):
+    if ivy.current_backend_str() != "torch":
+        pytest.skip()
+    x = ivy.astype(ivy.linspace(ivy.zeros([1, 2]), ivy.ones([1, 2]), 4), "float32")
+    native_module = TorchModule(in_size=4, out_size=5)
+    ivy_module = ivy.Module.from_torch_module(
+        native_module, inplace_update=inplace_update
+    )
+    weight = native_module._linear0._linear.weight
+    weight_data_ptr = weight.data_ptr()
+
+    # unchanged variables are not pushed to the native module again
+    ret = ivy_module(x)
+    assert native_module._linear0._linear.weight is weight
+    assert weight.data_ptr() == weight_data_ptr
+    assert ivy.to_numpy(ret).shape == (1, 2, 5)
+
+    # the variables passed in place of the module's are pushed
+    v = ivy_module.v.cont_map(lambda p, _: torch.zeros_like(p))
+    ret = ivy_module(x, v=v)
+    assert not ivy.to_numpy(ret).any()
+    if inplace_update:
+        assert native_module._linear0._linear.weight is weight
+    else:
+        assert native_module._linear0._linear.weight is not weight
+        assert not native_module._linear0._linear.weight.detach().numpy().any()
@@ -1009,3 +1009,72 @@ def test_module_track_submod_call_order(
             module._dl0._l0.v.cont_flatten_key_chains().to_numpy(),
         ]
     )
+
+
+# deferred init
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+    num_threads=st.sampled_from([None, 4]),
+)
+def test_module_deferred_init(
+    batch_shape, input_channels, output_channels, num_threads, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    with ivy.DeferredInitMode(True):
+        module = WithNestedModules(input_channels, output_channels, device=on_device)
+    assert ivy.deferred_init_mode is False
+    spec = module.v.dl0.l0.w
+    assert isinstance(spec, ivy.VariableSpec)
+    assert spec.shape == (64, input_channels)
+    assert spec.dtype == ivy.default_float_dtype()
+    assert module._dl0._l0.v.w is spec
+
+    # materialized from a checkpoint
+    reference = WithNestedModules(input_channels, output_channels, device=on_device)
+    v = module.materialize(reference.v, num_threads=num_threads)
+    assert ivy.Container.cont_multi_map(
+        lambda xs, _: np.array_equal(*xs), [v.to_numpy(), reference.v.to_numpy()]
+    ).cont_all_true()
+    assert module._dl0._l0.v.w is v.dl0.l0.w
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(reference(x)))
+
+    # materialized on first use
+    with ivy.DeferredInitMode(True):
+        module = WithNestedModules(input_channels, output_channels, device=on_device)
+    ret = module(x)
+    assert ret.shape == tuple(list(batch_shape) + [64])
+    assert ivy.is_array(module.v.dl1.l1.w)
+    assert module._dl1._l1.v.w is module.v.dl1.l1.w
+
+
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_deferred_init_submodule_first(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    with ivy.DeferredInitMode(True):
+        module = WithNestedModules(input_channels, output_channels, device=on_device)
+    # the submodule creates its variables, the others remaining deferred
+    ret = module._dl0(x)
+    assert ret.shape == tuple(list(batch_shape) + [64])
+    assert ivy.is_array(module._dl0._l0.v.w)
+    assert isinstance(module.v.dl1.l0.w, ivy.VariableSpec)
+    assert module(x).shape == tuple(list(batch_shape) + [64])
+    assert module.v.dl0.l0.w is module._dl0._l0.v.w
+    assert ivy.is_array(module._dl1._l0.v.w)
@@ -0,0 +1,63 @@
+"""Benchmark the allocation size and latency of `ivy.Array` construction."""
+
+import gc
+import tracemalloc
+
+import numpy as np
+import ivy
+from ivy.utils.benchmark import best_time, format_rows, run_script
+
+
+def _bytes_per_array(num_arrays):
+    natives = [np.zeros(()) for _ in range(num_arrays)]
+    gc.collect()
+    tracemalloc.start()
+    arrays = [ivy.Array(x) for x in natives]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del arrays
+    return current / num_arrays
+
+
+def array_benchmark(num_arrays=10000, number=10000, repeat=5):
+    """
+    Measure the memory and time taken to construct and operate on small arrays.
+
+    Parameters
+    ----------
+    num_arrays
+        number of arrays allocated when measuring the memory per array.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict with the bytes allocated per array (excluding the native data), and the
+        best per-call latency in microseconds for each benchmarked operation.
+    """
+    native = ivy.native_array([1.0, 2.0, 3.0])
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.array([4.0, 5.0, 6.0])
+    statements = {
+        "Array(native)": lambda: ivy.Array(native),
+        "Array._from_native": lambda: ivy.Array._from_native(native),
+        "x.shape": lambda: x.shape,
+        "x + y": lambda: x + y,
+        "ivy.abs(x)": lambda: ivy.abs(x),
+    }
+    results = {"bytes_per_array": _bytes_per_array(num_arrays)}
+    for name, stmt in statements.items():
+        results[name] = best_time(stmt, number=number, repeat=repeat) * 1e6
+    return results
+
+
+def _report(results, args):
+    print(f"{'bytes per array':<24}{results.pop('bytes_per_array'):>10.1f}")
+    print(format_rows(results, unit="us"))
+
+
+if __name__ == "__main__":
+    run_script(array_benchmark, description=__doc__, backend="numpy", report=_report)
@@ -0,0 +1,73 @@
+"""Benchmark ivy functions mapped over the leaves of large ivy.Container trees."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def _parameter_tree(num_layers, leaves_per_layer, size):
+    return ivy.Container(
+        {
+            f"layer{i}": {
+                f"w{j}": ivy.random_uniform(shape=(size,))
+                for j in range(leaves_per_layer)
+            }
+            for i in range(num_layers)
+        }
+    )
+
+
+def container_benchmark(
+    num_layers=100, leaves_per_layer=10, size=16, number=5, repeat=3
+):
+    """
+    Measure the latency of container arithmetic over a large parameter tree, both
+    leaf by leaf and on the packed container.
+
+    Parameters
+    ----------
+    num_layers
+        number of sub-containers in the parameter tree.
+    leaves_per_layer
+        number of arrays in each sub-container.
+    size
+        number of elements of each array.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each benchmarked operation to its best latency per call in
+        milliseconds, and to its best latency per leaf in microseconds.
+    """
+    params = _parameter_tree(num_layers, leaves_per_layer, size)
+    grads = _parameter_tree(num_layers, leaves_per_layer, size)
+    packed_params = params.cont_pack()
+    packed_grads = grads.cont_pack()
+    num_leaves = num_layers * leaves_per_layer
+    statements = {
+        "params + grads": lambda: params + grads,
+        "params - 0.1 * grads": lambda: params - 0.1 * grads,
+        "ivy.multiply(params, grads)": lambda: ivy.multiply(params, grads),
+        "ivy.add(params, 1.0)": lambda: ivy.add(params, 1.0),
+        "ivy.sum(params, axis=0)": lambda: ivy.sum(params, axis=0),
+        "packed: params - 0.1 * grads": lambda: packed_params - 0.1 * packed_grads,
+        "packed: global norm": lambda: packed_grads.vector_norm(),
+        "pack + unpack": lambda: params.cont_pack().unpack(),
+    }
+    results = dict()
+    for name, stmt in statements.items():
+        latency = best_time(stmt, number=number, repeat=repeat)
+        results[name] = (latency * 1e3, latency / num_leaves * 1e6)
+    return results
+
+
+if __name__ == "__main__":
+    run_script(
+        container_benchmark,
+        description=__doc__,
+        backend="numpy",
+        unit=("ms", "us/leaf"),
+    )
@@ -0,0 +1,70 @@
+"""Benchmark loop-heavy kernels written with ivy.for_loop, ivy.while_loop and the
+jax.lax control flow frontends, which run natively on backends with loop primitives
+and as python loops otherwise."""
+
+import numpy as np
+import ivy
+import ivy.functional.frontends.jax as jax_frontend
+from ivy.utils.benchmark import best_time, run_script
+
+
+def control_flow_benchmark(num_iterations=1000, size=64, number=3, repeat=3):
+    """
+    Measure the latency per iteration of a damped update loop, and of mapping a
+    function over the rows of a matrix.
+
+    Parameters
+    ----------
+    num_iterations
+        number of iterations of each loop, and number of mapped rows.
+    size
+        number of elements updated by each iteration.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each kernel to the best latency per iteration in microseconds.
+    """
+    lax = jax_frontend.lax
+    x = ivy.array(np.random.uniform(size=(size,)).astype("float32"))
+    rows = ivy.array(np.random.uniform(size=(num_iterations, size)).astype("float32"))
+    kernels = {
+        "ivy.for_loop": lambda: ivy.for_loop(
+            range(num_iterations),
+            lambda i, v: (v[0] * 0.5 + 1.0,),
+            (x,),
+            native=True,
+        ),
+        "ivy.while_loop": lambda: ivy.while_loop(
+            lambda i, v: i < num_iterations,
+            lambda i, v: (i + 1, v * 0.5 + 1.0),
+            (ivy.to_native(ivy.array(0)), ivy.to_native(x)),
+        ),
+        "jax.lax.fori_loop": lambda: lax.fori_loop(
+            0, num_iterations, lambda i, v: v * 0.5 + 1.0, x
+        ),
+        "jax.lax.while_loop": lambda: lax.while_loop(
+            lambda v: v[0] < num_iterations,
+            lambda v: (v[0] + 1, v[1] * 0.5 + 1.0),
+            (ivy.array(0), x),
+        ),
+        "jax.lax.map": lambda: lax.map(lambda row: row * 0.5 + 1.0, rows),
+    }
+    results = {}
+    for name, kernel in kernels.items():
+        latency = best_time(kernel, number=number, repeat=repeat)
+        results[name] = latency / num_iterations * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    run_script(
+        control_flow_benchmark,
+        description=__doc__,
+        backend="numpy",
+        unit="us/iteration",
+    )
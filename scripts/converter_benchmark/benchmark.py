@@ -0,0 +1,95 @@
+"""Benchmark the forward latency of native modules converted to ivy.Module."""
+
+import numpy as np
+
+import ivy
+from ivy.stateful.converters import _ParamSync
+from ivy.utils.benchmark import best_time, run_script
+
+
+def _torch_modules(num_layers, width):
+    import torch
+
+    native_module = torch.nn.Sequential(
+        *[torch.nn.Linear(width, width) for _ in range(num_layers)]
+    )
+    return native_module, torch.ones((1, width))
+
+
+def _keras_modules(num_layers, width):
+    import tensorflow as tf
+
+    native_module = tf.keras.Sequential(
+        [tf.keras.layers.Dense(width) for _ in range(num_layers)]
+    )
+    native_module.build((None, width))
+    return native_module, tf.ones((1, width))
+
+
+_FRAMEWORKS = {
+    "torch": (_torch_modules, "from_torch_module"),
+    "tensorflow": (_keras_modules, "from_keras_module"),
+}
+
+
+def converter_benchmark(num_layers=32, width=16, number=1000, repeat=5):
+    """
+    Measure the forward latency of small native torch and keras modules, called
+    natively and through the ivy.Module they are converted to, along with the time
+    taken to check which variables of such a module need to be synchronised with the
+    native parameters.
+
+    Parameters
+    ----------
+    num_layers
+        number of linear layers of the modules.
+    width
+        number of input and output channels of each layer.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict with the best per-call latency in microseconds for each benchmarked
+        case, the frameworks which aren't installed being skipped.
+    """
+    results = {}
+
+    def _time(name, stmt):
+        results[name] = best_time(stmt, number=number, repeat=repeat) * 1e6
+
+    for backend, (create, converter) in _FRAMEWORKS.items():
+        try:
+            native_module, x = create(num_layers, width)
+        except ImportError:
+            continue
+        ivy.set_backend(backend)
+        ivy_module = getattr(ivy.Module, converter)(native_module)
+        _time(f"{backend} native", lambda: native_module(x))
+        _time(f"{backend} converted", lambda: ivy_module(x))
+        ivy.previous_backend()
+
+    # the synchronisation of the variables, on a container of numpy parameters
+    ivy.set_backend("numpy")
+    params = ivy.Container(
+        {
+            "layer{}".format(i): {"b": np.zeros(width), "w": np.zeros((width, width))}
+            for i in range(num_layers)
+        },
+        dynamic_backend=False,
+    )
+    params_sync = _ParamSync(params)
+    _time(
+        "sync all variables",
+        lambda: ivy.Container.cont_multi_map(lambda xs, kc: None, [params, params]),
+    )
+    _time("sync changed variables", lambda: params_sync(params))
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    run_script(converter_benchmark, description=__doc__, unit="us")
@@ -0,0 +1,64 @@
+"""Benchmark building an ivy.Module and loading its weights with deferred init."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+class _MLP(ivy.Module):
+    def __init__(self, num_layers, width, v=None):
+        self._layers = [ivy.Linear(width, width) for _ in range(num_layers)]
+        ivy.Module.__init__(self, v=v)
+
+    def _forward(self, x):
+        for layer in self._layers:
+            x = layer(x)
+        return x
+
+
+def deferred_init_benchmark(num_layers=8, width=1024, num_threads=4, repeat=3):
+    """
+    Measure the time taken to build an MLP of ivy.Linear layers, and to build it
+    with its weights loaded from a checkpoint, with and without ivy.DeferredInitMode.
+
+    Parameters
+    ----------
+    num_layers
+        number of layers of the MLP.
+    width
+        number of input and output channels of each layer.
+    num_threads
+        number of threads materializing the weights from the checkpoint.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict with the best time in milliseconds for each benchmarked case.
+    """
+    weights = _MLP(num_layers, width).v
+
+    def _deferred(weights=None, num_threads=None):
+        with ivy.DeferredInitMode(True):
+            module = _MLP(num_layers, width)
+        if weights is not None:
+            module.materialize(weights, num_threads=num_threads)
+
+    results = {
+        "build": best_time(lambda: _MLP(num_layers, width), repeat=repeat) * 1e3,
+        "build deferred": best_time(_deferred, repeat=repeat) * 1e3,
+        "build with checkpoint": (
+            best_time(lambda: _MLP(num_layers, width, v=weights), repeat=repeat) * 1e3
+        ),
+        "build deferred with checkpoint": (
+            best_time(lambda: _deferred(weights), repeat=repeat) * 1e3
+        ),
+        "build deferred with checkpoint, {} threads".format(num_threads): (
+            best_time(lambda: _deferred(weights, num_threads), repeat=repeat) * 1e3
+        ),
+    }
+    return results
+
+
+if __name__ == "__main__":
+    run_script(deferred_init_benchmark, description=__doc__, backend="numpy")
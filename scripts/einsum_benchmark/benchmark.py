@@ -0,0 +1,57 @@
+"""Benchmark `ivy.einsum` and `ivy.multi_dot` contractions against their plans."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+from ivy.utils.einsum_path import einsum_plan
+
+
+def einsum_benchmark(number=5, repeat=3):
+    """
+    Measure the time taken by einsum contractions and chains of matrix products.
+
+    Parameters
+    ----------
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each contraction to the best latency in milliseconds, and to the
+        ratio of the multiply-adds of a single loop nest to those of the plan.
+    """
+    cases = {
+        "ij,jk,kl->il": [(256, 8), (8, 256), (256, 8)],
+        "bhqd,bhkd->bhqk": [(8, 8, 128, 64), (8, 8, 128, 64)],
+        "abc,cd,dbe->ae": [(32, 16, 64), (64, 64), (64, 16, 32)],
+        "ij,jk->ik": [(512, 512), (512, 512)],
+    }
+    results = {}
+    for equation, shapes in cases.items():
+        operands = [ivy.random_normal(shape=shape) for shape in shapes]
+        plan = einsum_plan(equation, tuple(shapes))
+        results[equation] = (
+            best_time(
+                lambda: ivy.einsum(equation, *operands), number=number, repeat=repeat
+            )
+            * 1e3,
+            plan.naive_flops / plan.flops,
+        )
+    chain = [ivy.random_normal(shape=s) for s in [(512, 8), (8, 512), (512, 8)]]
+    results["multi_dot"] = (
+        best_time(lambda: ivy.multi_dot(chain), number=number, repeat=repeat) * 1e3,
+        None,
+    )
+    return results
+
+
+def _report(results, args):
+    for name, (latency, saving) in results.items():
+        saving = f"{saving:>10.1f}x" if saving is not None else ""
+        print(f"{name:<20}{latency:>10.3f} ms{saving}")
+
+
+if __name__ == "__main__":
+    run_script(einsum_benchmark, description=__doc__, backend="numpy", report=_report)
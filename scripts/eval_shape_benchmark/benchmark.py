@@ -0,0 +1,71 @@
+"""Benchmark computing the output shapes of an ivy.Module with ivy.eval_shape."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+class _MLP(ivy.Module):
+    def __init__(self, num_layers, width):
+        self._layers = [ivy.Linear(width, width) for _ in range(num_layers)]
+        ivy.Module.__init__(self)
+
+    def _forward(self, x):
+        for layer in self._layers:
+            x = ivy.relu(layer(x))
+        return ivy.softmax(x, axis=-1)
+
+
+def eval_shape_benchmark(num_layers=8, width=1024, batch_size=256, repeat=5):
+    """
+    Measure the time taken to compute the output shape of an MLP of ivy.Linear
+    layers with a forward pass, and with ivy.Module.eval_shape on the module built
+    with and without ivy.DeferredInitMode.
+
+    Parameters
+    ----------
+    num_layers
+        number of layers of the MLP.
+    width
+        number of input and output channels of each layer.
+    batch_size
+        number of rows of the input.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict with the best time in milliseconds for each benchmarked case.
+    """
+    module = _MLP(num_layers, width)
+    with ivy.DeferredInitMode(True):
+        deferred = _MLP(num_layers, width)
+    x = ivy.random_uniform(shape=(batch_size, width))
+    meta = ivy.MetaArray((batch_size, width))
+
+    results = {
+        "forward": best_time(lambda: module(x).shape, repeat=repeat) * 1e3,
+        "eval_shape": (
+            best_time(lambda: module.eval_shape(x).shape, repeat=repeat) * 1e3
+        ),
+        "eval_shape deferred": (
+            best_time(lambda: deferred.eval_shape(meta).shape, repeat=repeat) * 1e3
+        ),
+        "build deferred and eval_shape": (
+            best_time(
+                lambda: _deferred_eval_shape(num_layers, width, meta), repeat=repeat
+            )
+            * 1e3
+        ),
+    }
+    return results
+
+
+def _deferred_eval_shape(num_layers, width, x):
+    with ivy.DeferredInitMode(True):
+        module = _MLP(num_layers, width)
+    return module.eval_shape(x).shape
+
+
+if __name__ == "__main__":
+    run_script(eval_shape_benchmark, description=__doc__, backend="numpy")
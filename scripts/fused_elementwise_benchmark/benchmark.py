@@ -0,0 +1,78 @@
+"""Benchmark eager against deferred evaluation of chained elementwise ivy.Array
+arithmetic on the NumPy backend."""
+
+import tracemalloc
+
+import numpy as np
+import ivy
+from ivy.data_classes.array import deferred
+from ivy.utils.benchmark import best_time, run_script
+
+
+def _expression(x, y, z):
+    return (x * y + z) * 0.5 - x / (y + 1.0) + z**2
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def fused_elementwise_benchmark(size=1000000, dtype="float32", number=10, repeat=5):
+    """
+    Measure the latency and peak memory of a chain of elementwise operators, with
+    and without ivy.deferred_elementwise_mode.
+
+    Parameters
+    ----------
+    size
+        number of elements of each operand.
+    dtype
+        floating point dtype of the operands.
+    number
+        number of evaluations per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping the mode to the best latency in milliseconds and the peak
+        memory allocated while evaluating the expression, in bytes.
+    """
+    ivy.set_backend("numpy")
+    x, y, z = (
+        ivy.array(np.random.uniform(1.0, 2.0, (size // 1000, 1000)).astype(dtype))
+        for _ in range(3)
+    )
+    results = {}
+    for deferred_mode in (False, True):
+        ivy.set_deferred_elementwise_mode(deferred_mode)
+
+        def fn():
+            return _expression(x, y, z).data
+
+        results["deferred" if deferred_mode else "eager"] = (
+            best_time(fn, number=number, repeat=repeat) * 1e3,
+            _peak_bytes(fn),
+        )
+        ivy.unset_deferred_elementwise_mode()
+    ivy.previous_backend()
+    return results
+
+
+def _report(results, args):
+    print(f"numexpr {'available' if deferred.numexpr is not None else 'unavailable'}")
+    output_bytes = args.size * np.dtype(args.dtype).itemsize
+    for mode, (latency, peak) in results.items():
+        print(
+            f"{mode:<10}{latency:>10.2f} ms{peak / 2**20:>10.1f} MiB peak"
+            f"{peak / output_bytes:>8.1f}x output"
+        )
+
+
+if __name__ == "__main__":
+    run_script(fused_elementwise_benchmark, description=__doc__, report=_report)
@@ -0,0 +1,85 @@
+"""Benchmark the time and memory taken by `import ivy` in each import configuration."""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from ivy.utils.benchmark import run_script
+
+CONFIGURATIONS = {
+    "eager": {"IVY_LAZY_IMPORT": "false"},
+    "lazy": {"IVY_LAZY_IMPORT": "true"},
+}
+
+_CHILD_CODE = """
+import json, resource, time
+start = time.perf_counter()
+import ivy
+{after_import}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"time": elapsed, "rss_kb": rss_kb}}))
+"""
+
+
+def _run_child(env_vars, after_import=""):
+    env = {**os.environ, **env_vars}
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD_CODE.format(after_import=after_import)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def import_benchmark(num_runs=10, configurations=None, after_import=""):
+    """
+    Time `import ivy` in fresh interpreters, once per run and configuration.
+
+    Parameters
+    ----------
+    num_runs
+        number of fresh interpreters to start for each configuration.
+    configurations
+        mapping from configuration name to the environment variables defining it.
+        Default is ``CONFIGURATIONS``.
+    after_import
+        optional code to run right after the import and include in the timing, e.g.
+        ``"ivy.Module"`` to also measure the cost of loading the deferred modules.
+
+    Returns
+    -------
+    ret
+        dict mapping each configuration to its median and minimum import time in
+        seconds, and its median peak RSS in MB.
+    """
+    configurations = CONFIGURATIONS if configurations is None else configurations
+    results = {}
+    for name, env_vars in configurations.items():
+        # the first run warms up the filesystem and bytecode caches
+        _run_child(env_vars, after_import)
+        runs = [_run_child(env_vars, after_import) for _ in range(num_runs)]
+        times = [run["time"] for run in runs]
+        results[name] = {
+            "median_time": statistics.median(times),
+            "min_time": min(times),
+            "median_rss_mb": statistics.median(run["rss_kb"] for run in runs) / 1024,
+        }
+    return results
+
+
+def _report(results, args):
+    print(f"{'config':<10}{'median (s)':>12}{'min (s)':>12}{'rss (MB)':>12}")
+    for name, res in results.items():
+        print(
+            f"{name:<10}{res['median_time']:>12.4f}{res['min_time']:>12.4f}"
+            f"{res['median_rss_mb']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run_script(import_benchmark, description=__doc__, report=_report)
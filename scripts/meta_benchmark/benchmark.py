@@ -0,0 +1,91 @@
+"""Benchmark the throughput of unbatched first order MAML steps, with the inner loops
+of the tasks run one task after another, and vectorized across the tasks."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def _cost_fn(batch, v):
+    # a linear regression on the task sub-batch
+    pred = ivy.matmul(batch.x[0], v.w) + v.b
+    return ivy.mean((pred - batch.y[0]) ** 2)
+
+
+def meta_benchmark(
+    task_counts=(1, 4, 16, 64),
+    inner_step_counts=(1, 5),
+    features=32,
+    samples=16,
+    number=3,
+    repeat=3,
+):
+    """
+    Measure the tasks per second of ivy.fomaml_step with unbatched variables.
+
+    Parameters
+    ----------
+    task_counts
+        numbers of tasks per meta step.
+    inner_step_counts
+        numbers of inner loop gradient steps per task.
+    features
+        number of input features of the regression of each task.
+    samples
+        number of samples of each task.
+    number
+        number of meta steps per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping the execution, number of tasks and number of inner steps to the
+        tasks per second.
+    """
+    variables = ivy.Container(
+        w=ivy.random_normal(shape=(features, 1)),
+        b=ivy.zeros((1,)),
+    )
+    results = {}
+    for num_tasks in task_counts:
+        batch = ivy.Container(
+            x=ivy.random_normal(shape=(num_tasks, samples, features)),
+            y=ivy.random_normal(shape=(num_tasks, samples, 1)),
+        )
+        for inner_grad_steps in inner_step_counts:
+            # variables chosen per task make the meta step loop over the tasks, and
+            # the same variables for every task let it vectorize the tasks
+            for name, inner_v in (("loop", [None] * num_tasks), ("vectorized", None)):
+
+                def fn():
+                    return ivy.fomaml_step(
+                        batch,
+                        _cost_fn,
+                        None,
+                        variables,
+                        inner_grad_steps,
+                        1e-2,
+                        batched=False,
+                        inner_v=inner_v,
+                        num_tasks=num_tasks,
+                    )
+
+                fn()
+                results[(name, num_tasks, inner_grad_steps)] = num_tasks / best_time(
+                    fn, number=number, repeat=repeat
+                )
+    return results
+
+
+def _report(results, args):
+    for (name, num_tasks, inner_grad_steps), tasks_per_second in results.items():
+        print(
+            f"{name:<12}{num_tasks:>6} tasks{inner_grad_steps:>4} steps"
+            f"{tasks_per_second:>12.1f} tasks/s"
+        )
+
+
+if __name__ == "__main__":
+    # the backend needs to support gradients
+    run_script(meta_benchmark, description=__doc__, backend="torch", report=_report)
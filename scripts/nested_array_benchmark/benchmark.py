@@ -0,0 +1,62 @@
+"""Benchmark ivy.NestedArray on batches of variable length sequences, packed in a
+single values buffer against stored as a list of arrays."""
+
+import numpy as np
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def nested_array_benchmark(
+    batch_sizes=(100, 1000, 5000), features=16, number=3, repeat=3
+):
+    """
+    Measure the latency of an elementwise op, a sum over the ragged dimension and
+    padding to a dense array, for nested arrays of sequences of 1 to 64 rows.
+
+    Parameters
+    ----------
+    batch_sizes
+        numbers of sequences to measure.
+    features
+        size of the dimension following the ragged one.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each (batch size, storage) to the latencies in milliseconds of
+        x * 2 + x, x.sum(axis=1) and x.to_padded(), with the storage being
+        "packed" or "list".
+    """
+    rng = np.random.default_rng(0)
+    results = {}
+    for batch_size in batch_sizes:
+        lengths = rng.integers(1, 65, size=batch_size)
+        values = rng.normal(size=(int(lengths.sum()), features)).astype("float32")
+        packed = ivy.NestedArray.from_row_lengths(ivy.array(values), lengths.tolist())
+        listed = ivy.NestedArray.nested_array(
+            [ivy.array(a) for a in np.split(values, np.cumsum(lengths)[:-1])]
+        )
+        for storage, x in (("packed", packed), ("list", listed)):
+            results[(batch_size, storage)] = tuple(
+                best_time(fn, number=number, repeat=repeat) * 1e3
+                for fn in (lambda: x * 2.0 + x, lambda: x.sum(axis=1), x.to_padded)
+            )
+    return results
+
+
+def _report(results, args):
+    print(f"{args.features} float32 features")
+    print(f"{'batch':>7}{'storage':>9}{'x * 2 + x':>12}{'sum':>10}{'pad':>10}  (ms)")
+    for (batch_size, storage), timings in results.items():
+        cells = "".join(f"{t:>{w}.2f}" for t, w in zip(timings, (12, 10, 10)))
+        print(f"{batch_size:>7}{storage:>9}{cells}")
+
+
+if __name__ == "__main__":
+    run_script(
+        nested_array_benchmark, description=__doc__, backend="numpy", report=_report
+    )
@@ -0,0 +1,46 @@
+"""Benchmark the per-call overhead of dtype promotion in binary functions."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def promotion_benchmark(number=10000, repeat=5):
+    """
+    Measure the time taken to promote the dtypes of the inputs of binary functions.
+
+    Parameters
+    ----------
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict with the best per-call latency in microseconds for each benchmarked
+        operation, the backend functions being called without the ivy wrappers to
+        isolate the promotion from the rest of the overhead of a call.
+    """
+    backend_fns = ivy.current_backend()
+    x = ivy.native_array([1.0, 2.0, 3.0], dtype="float32")
+    y = ivy.native_array([1, 2, 3], dtype="int32")
+    statements = {
+        "promote_types(str)": lambda: ivy.promote_types("float32", "int32"),
+        "promote_types(native)": lambda: ivy.promote_types(x.dtype, y.dtype),
+        "promote_types_of_inputs(x, y)": lambda: ivy.promote_types_of_inputs(x, y),
+        "promote_types_of_inputs(x, 2.0)": lambda: ivy.promote_types_of_inputs(x, 2.0),
+        "multiply(x, x)": lambda: backend_fns.multiply(x, x),
+        "multiply(x, y)": lambda: backend_fns.multiply(x, y),
+        "multiply(x, 2.0)": lambda: backend_fns.multiply(x, 2.0),
+        "add(2, y)": lambda: backend_fns.add(2, y),
+        "less(x, 2.0)": lambda: backend_fns.less(x, 2.0),
+    }
+    results = {}
+    for name, stmt in statements.items():
+        results[name] = best_time(stmt, number=number, repeat=repeat) * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    run_script(promotion_benchmark, description=__doc__, backend="numpy", unit="us")
@@ -0,0 +1,64 @@
+"""Benchmark building, padding and reducing the ragged tensors of the TensorFlow
+frontend for large batches of variable length rows."""
+
+import numpy as np
+import ivy
+import ivy.functional.frontends.tensorflow as tf_frontend
+from ivy.utils.benchmark import best_time, run_script
+
+
+def ragged_benchmark(nrows=(1000, 10000, 100000), number=3, repeat=3):
+    """
+    Measure the latency of the ragged tensor constructors, of to_tensor and of
+    summing each row, for rows of 0 to 16 values of 8 features.
+
+    Parameters
+    ----------
+    nrows
+        numbers of rows to measure.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each number of rows to a dict of the latencies in milliseconds
+        of each operation.
+    """
+    RaggedTensor = tf_frontend.RaggedTensor
+    rng = np.random.default_rng(0)
+    results = {}
+    for n in nrows:
+        lengths = rng.integers(0, 17, size=n)
+        row_splits = np.concatenate([[0], np.cumsum(lengths)])
+        value_rowids = np.repeat(np.arange(n), lengths)
+        values = ivy.array(rng.normal(size=(int(row_splits[-1]), 8)).astype("float32"))
+        rt = RaggedTensor.from_row_splits(values, row_splits)
+        calls = {
+            "from_row_splits": lambda: RaggedTensor.from_row_splits(values, row_splits),
+            "from_row_lengths": lambda: RaggedTensor.from_row_lengths(values, lengths),
+            "from_value_rowids": lambda: RaggedTensor.from_value_rowids(
+                values, value_rowids
+            ),
+            "to_tensor": rt.to_tensor,
+            "reduce_sum": lambda: tf_frontend.math.reduce_sum(rt, axis=1),
+        }
+        results[n] = {
+            name: best_time(fn, number=number, repeat=repeat) * 1e3
+            for name, fn in calls.items()
+        }
+    return results
+
+
+def _report(results, args):
+    print("0-16 rows of 8 float32 features")
+    ops = list(next(iter(results.values())))
+    print(f"{'rows':>8}" + "".join(f"{op:>19}" for op in ops) + "  (ms)")
+    for n, timings in results.items():
+        print(f"{n:>8}" + "".join(f"{timings[op]:>19.2f}" for op in ops))
+
+
+if __name__ == "__main__":
+    run_script(ragged_benchmark, description=__doc__, backend="numpy", report=_report)
@@ -0,0 +1,49 @@
+"""Benchmark many small random draws from the global random state against draws
+from an ivy.random.Generator, with and without buffering."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def random_benchmark(size=16, number=1000, repeat=5, buffer_size=1 << 16):
+    """
+    Measure the latency of drawing small uniform and normal samples.
+
+    Parameters
+    ----------
+    size
+        number of samples drawn per call.
+    number
+        number of draws per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+    buffer_size
+        buffer size of the buffered generator.
+
+    Returns
+    -------
+    ret
+        dict mapping the source of the samples to the best latency per draw of
+        uniform and of normal samples, in microseconds.
+    """
+    sources = {
+        "global": ivy,
+        "generator": ivy.random.Generator(0),
+        "buffered": ivy.random.Generator(0, buffer_size=buffer_size),
+    }
+    results = {}
+    for name, rng in sources.items():
+        results[name] = tuple(
+            best_time(lambda: draw(shape=(size,)), number=number, repeat=repeat) * 1e6
+            for draw in (rng.random_uniform, rng.random_normal)
+        )
+    return results
+
+
+if __name__ == "__main__":
+    run_script(
+        random_benchmark,
+        description=__doc__,
+        backend="numpy",
+        unit=("us uniform", "us normal"),
+    )
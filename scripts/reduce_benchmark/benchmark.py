@@ -0,0 +1,49 @@
+"""Benchmark ivy.reduce and ivy.reduce_window with a standard computation, which is
+lowered to a native reduction, against an equivalent callable, which is reduced in a
+pairwise tree."""
+
+import numpy as np
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def reduce_benchmark(size=1000000, window=3, number=5, repeat=3):
+    """
+    Measure the latency of reducing a long axis, and of reducing windows of an image.
+
+    Parameters
+    ----------
+    size
+        length of the reduced axis, and number of pixels of the image.
+    window
+        size of the square windows.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each function and computation to the best latency in
+        milliseconds.
+    """
+    x = ivy.array(np.random.uniform(size=(size,)).astype("float32"))
+    side = int(size**0.5)
+    image = ivy.reshape(x[: side * side], (side, side))
+    computations = {"ivy.add": ivy.add, "callable": lambda a, b: a + b}
+    results = {}
+    for name, computation in computations.items():
+        calls = {
+            "reduce": lambda: ivy.reduce(x, 0.0, computation, axes=0),
+            "reduce_window": lambda: ivy.reduce_window(
+                image, 0.0, computation, (window, window)
+            ),
+        }
+        for fn_name, fn in calls.items():
+            results[(fn_name, name)] = best_time(fn, number=number, repeat=repeat) * 1e3
+    return results
+
+
+if __name__ == "__main__":
+    run_script(reduce_benchmark, description=__doc__, backend="numpy")
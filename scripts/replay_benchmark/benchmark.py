@@ -0,0 +1,59 @@
+"""Benchmark replaying the trace of an ivy.Module made of many small operations."""
+
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+class _MLP(ivy.Module):
+    def __init__(self, num_layers, width):
+        self._layers = [ivy.Linear(width, width) for _ in range(num_layers)]
+        ivy.Module.__init__(self)
+
+    def _forward(self, x):
+        for layer in self._layers:
+            y = ivy.gelu(layer(x))
+            mean = ivy.mean(y, axis=-1, keepdims=True)
+            var = ivy.var(y, axis=-1, keepdims=True)
+            x = x + (y - mean) / ivy.sqrt(var + 1e-5)
+        return ivy.softmax(x, axis=-1)
+
+
+def replay_benchmark(num_layers=16, width=32, batch_size=8, repeat=20):
+    """
+    Measure the time taken by the forward pass of a residual MLP of small ivy.Linear
+    layers, each followed by a normalization written with elementwise functions,
+    when run eagerly and when replayed from an ivy.Module.trace_graph trace.
+
+    Parameters
+    ----------
+    num_layers
+        number of layers of the MLP.
+    width
+        number of input and output channels of each layer.
+    batch_size
+        number of rows of the input.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict with the best time in milliseconds for each benchmarked case.
+    """
+    module = _MLP(num_layers, width)
+    x = ivy.random_uniform(shape=(batch_size, width))
+
+    results = {"eager": best_time(lambda: module(x), repeat=repeat) * 1e3}
+    module.trace_graph()
+    results["trace"] = best_time(lambda: _retrace(module, x), repeat=1) * 1e3
+    results["replay"] = best_time(lambda: module(x), repeat=repeat) * 1e3
+    return results
+
+
+def _retrace(module, x):
+    module._replay_graph.clear_cache()
+    return module(x)
+
+
+if __name__ == "__main__":
+    run_script(replay_benchmark, description=__doc__, backend="numpy")
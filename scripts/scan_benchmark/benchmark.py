@@ -0,0 +1,55 @@
+"""Benchmark how ivy.associative_scan scales with the number of elements, for a
+standard function, which is scanned with the native cumulative function, and for an
+equivalent callable, which is scanned in blocks."""
+
+import numpy as np
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def scan_benchmark(
+    sizes=(10**3, 10**4, 10**5, 10**6, 10**7),
+    number=3,
+    repeat=3,
+):
+    """
+    Measure the latency of scanning arrays of increasing size.
+
+    Parameters
+    ----------
+    sizes
+        numbers of elements of the scanned arrays.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each function and size to the best latency in milliseconds.
+    """
+    functions = {"ivy.add": ivy.add, "callable": lambda a, b: a + b}
+    results = {}
+    for size in sizes:
+        x = ivy.array(np.random.uniform(size=(size,)).astype("float32"))
+        for name, fn in functions.items():
+            results[(name, size)] = (
+                best_time(
+                    lambda: ivy.associative_scan(x, fn), number=number, repeat=repeat
+                )
+                * 1e3
+            )
+    return results
+
+
+def _report(results, args):
+    for (name, size), latency in results.items():
+        print(
+            f"{name:<10}{size:>10}{latency:>12.2f} ms"
+            f"{latency * 1e6 / size:>10.1f} ns/element"
+        )
+
+
+if __name__ == "__main__":
+    run_script(scan_benchmark, description=__doc__, backend="numpy", report=_report)
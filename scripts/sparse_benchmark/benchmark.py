@@ -0,0 +1,90 @@
+"""Benchmark the conversions and kernels of ivy.SparseArray across densities, against
+the equivalent dense operations."""
+
+import numpy as np
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def sparse_benchmark(
+    size=2000,
+    densities=(0.0001, 0.001, 0.01, 0.1),
+    formats=("coo", "csr", "bsr"),
+    number=3,
+    repeat=3,
+):
+    """
+    Measure the latency of converting a square matrix to and from each sparse
+    format, and of multiplying it by a dense vector.
+
+    Parameters
+    ----------
+    size
+        number of rows and columns of the matrix.
+    densities
+        fractions of nonzero elements to measure.
+    formats
+        sparse formats to measure, the block formats using 4x4 blocks.
+    number
+        number of calls per timing repetition.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each (density, format) to the latencies in milliseconds of
+        from_dense_array, to_dense_array, conversion to COO and matmul with a
+        vector, with the format "dense" holding the latency of the dense matmul.
+    """
+    rng = np.random.default_rng(0)
+
+    def best_ms(fn):
+        return best_time(fn, number=number, repeat=repeat) * 1e3
+
+    results = {}
+    for density in densities:
+        dense = rng.normal(size=(size, size)).astype("float32")
+        dense[rng.random((size, size)) >= density] = 0
+        x = ivy.array(dense)
+        v = ivy.array(rng.normal(size=(size,)).astype("float32"))
+        results[(density, "dense")] = (
+            None,
+            None,
+            None,
+            best_ms(lambda: ivy.matmul(x, v)),
+        )
+        for format in formats:
+            blocksize = (4, 4) if format in ("bsr", "bsc") else None
+
+            def from_dense():
+                return ivy.SparseArray.from_dense_array(
+                    x, format=format, blocksize=blocksize
+                )
+
+            sparse = from_dense()
+            results[(density, format)] = (
+                best_ms(from_dense),
+                best_ms(sparse.to_dense_array),
+                best_ms(lambda: sparse.to_format("coo")),
+                best_ms(lambda: sparse.matmul(v)),
+            )
+    return results
+
+
+def _report(results, args):
+    print(f"{args.size}x{args.size} float32")
+    print(
+        f"{'density':>9}{'format':>8}{'from_dense':>12}{'to_dense':>10}"
+        f"{'to_coo':>10}{'matmul':>10}  (ms)"
+    )
+    for (density, format), timings in results.items():
+        cells = "".join(
+            f"{'-' if t is None else f'{t:.2f}':>{width}}"
+            for t, width in zip(timings, (12, 10, 10, 10))
+        )
+        print(f"{density:>9.2%}{format:>8}{cells}")
+
+
+if __name__ == "__main__":
+    run_script(sparse_benchmark, description=__doc__, backend="numpy", report=_report)
@@ -0,0 +1,91 @@
+"""Benchmark the throughput and peak memory of ivy.split_func_call."""
+
+import tracemalloc
+
+import numpy as np
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def _sequential_concat(func, x, chunk_size):
+    # the previous behaviour, keeping every chunk output and concatenating at the end
+    num_chunks = -(-x.shape[0] // chunk_size)
+    remainder = x.shape[0] - chunk_size * (num_chunks - 1)
+    sizes = [chunk_size] * (num_chunks - 1) + [remainder]
+    chunks = ivy.split(x, num_or_size_splits=sizes, axis=0, with_remainder=True)
+    return ivy.concat([func(chunk) for chunk in chunks], axis=0)
+
+
+def _measure(fn, repeat):
+    latency = best_time(fn, repeat=repeat)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return latency, peak
+
+
+def split_func_call_benchmark(
+    batch_size=16384, features=512, chunk_size=1024, num_workers=4, repeat=5
+):
+    """
+    Measure the throughput and peak memory of a chunked matmul with the previous
+    sequential split and concat, and with the variants of ivy.split_func_call.
+
+    Parameters
+    ----------
+    batch_size
+        size of the input along the split axis.
+    features
+        size of the other input and output axis.
+    chunk_size
+        size of the chunks.
+    num_workers
+        number of threads for the concurrent variant.
+    repeat
+        number of timing repetitions, of which the fastest is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping each variant to its throughput in rows per second and the peak
+        memory allocated during the call in bytes.
+    """
+    ivy.set_backend("numpy")
+    x = ivy.array(np.random.uniform(size=(batch_size, features)).astype("float32"))
+    w = ivy.array(np.random.uniform(size=(features, features)).astype("float32"))
+
+    def func(t):
+        return ivy.tanh(ivy.matmul(t, w))
+
+    variants = {
+        "previous (split + concat)": lambda: _sequential_concat(func, x, chunk_size),
+        "sequential": lambda: ivy.split_func_call(
+            func, [x], "concat", chunk_size=chunk_size
+        ),
+        f"{num_workers} workers": lambda: ivy.split_func_call(
+            func, [x], "concat", chunk_size=chunk_size, num_workers=num_workers
+        ),
+        f"{num_workers} workers, memory_fraction=0.5": lambda: ivy.split_func_call(
+            func, [x], "concat", num_workers=num_workers, memory_fraction=0.5
+        ),
+    }
+    results = dict()
+    for name, fn in variants.items():
+        latency, peak = _measure(fn, repeat)
+        results[name] = (batch_size / latency, peak)
+    ivy.previous_backend()
+    return results
+
+
+def _report(results, args):
+    output_bytes = args.batch_size * args.features * 4
+    for name, (throughput, peak) in results.items():
+        print(
+            f"{name:<42}{throughput:>12.0f} rows/s"
+            f"{peak / 2**20:>10.1f} MiB peak{peak / output_bytes:>6.2f}x output"
+        )
+
+
+if __name__ == "__main__":
+    run_script(split_func_call_benchmark, description=__doc__, report=_report)
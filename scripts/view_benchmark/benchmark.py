@@ -0,0 +1,60 @@
+"""Benchmark inplace updates of an ivy.Array against the number of its live views,
+which are copies refreshed from the base on the functional backends."""
+
+import numpy as np
+import ivy
+from ivy.utils.benchmark import best_time, run_script
+
+
+def _make_views(x, num_views):
+    # every view goes through a chain of reshapes, transposes and slices
+    views = []
+    for i in range(num_views):
+        view = ivy.reshape(x, (64, -1))
+        view = ivy.permute_dims(view, axes=(1, 0))
+        views.append(view[i % 8 :: 2, ::-1])
+    return views
+
+
+def view_benchmark(size=2**16, num_views=(0, 1, 4, 16, 64), number=20):
+    """
+    Measure the latency of an inplace update of an array with live views, and of
+    then reading one of the views.
+
+    Parameters
+    ----------
+    size
+        number of elements of the array.
+    num_views
+        numbers of live views to measure.
+    number
+        number of updates per measurement, of which the mean is reported.
+
+    Returns
+    -------
+    ret
+        dict mapping the number of views to the mean latency of the update and of
+        the first read of a view afterwards, in microseconds.
+    """
+    results = {}
+    for n in num_views:
+        x = ivy.array(np.random.uniform(size=(size,)).astype("float32"))
+        views = _make_views(x, n)
+        val = ivy.array(np.random.uniform(size=(size,)).astype("float32"))
+        update = best_time(lambda: ivy.inplace_update(x, val), number=number, repeat=1)
+        read = 0.0
+        for _ in range(number if n else 0):
+            ivy.inplace_update(x, val)
+            read += best_time(lambda: views[-1].data, repeat=1)
+        results[n] = (update * 1e6, read / number * 1e6)
+    return results
+
+
+def _report(results, args):
+    print(f"{'views':>6}{'update (us)':>14}{'first read (us)':>18}")
+    for n, (update, read) in results.items():
+        print(f"{n:>6}{update:>14.1f}{read:>18.1f}")
+
+
+if __name__ == "__main__":
+    run_script(view_benchmark, description=__doc__, backend="jax", report=_report)